@@ -17,35 +17,76 @@
 #
 
 
-import traceback
 import os.path
 import threading
+import warnings
+import contextlib
+import copy
+import sys
+import mmap
+import binascii
+import zlib
+import queue
+import io
 from contextlib import contextmanager
 
+try:
+    import contextvars
+except ImportError:
+    contextvars = None
 
-class TLSDefaults:
+
+class ChipyThreadVar:
+    # Stand-in for contextvars.ContextVar on Python versions without the
+    # contextvars module: the value is local to the current thread only.
+    def __init__(self, name):
+        self.name = name
+        self.local = threading.local()
+
+    def get(self):
+        try:
+            return self.local.value
+        except AttributeError:
+            raise LookupError(self.name)
+
+    def set(self, value):
+        self.local.value = value
+
+
+class ContextDefaults:
     def __init__(self, **defaults):
         # Use self.__dict__ to circumvent __setattr__ below.
         self.__dict__['_defaults'] = defaults
-        self.__dict__['_tls'] = threading.local()
-        # NOTE: We cannot initialize the attributes of self._tls from defaults
-        # here as __init__ may be called on a different thread than __getattr__
+        newvar = ChipyThreadVar if contextvars is None else contextvars.ContextVar
+        self.__dict__['_vars'] = {name: newvar(name) for name in defaults}
 
     def __getattr__(self, name):
-        # In case this is the first access to {name} on this thread and name is
-        # in _defaults, initialize it in _tls.
-        if name in self._defaults and not hasattr(self._tls, name):
-            setattr(self._tls, name, self._defaults[name])
-        return getattr(self._tls, name)
+        # The design state is local to the current thread or asyncio task
+        # (contextvars context). In case this is the first access to {name}
+        # in this context, initialize it with a copy of the default, so that
+        # contexts never share a mutable default such as the modules dict.
+        if name not in self._vars:
+            raise AttributeError(name)
+        try:
+            return self._vars[name].get()
+        except LookupError:
+            value = copy.copy(self._defaults[name])
+            self._vars[name].set(value)
+            return value
 
     def __setattr__(self, name, value):
-        setattr(self._tls, name, value)
+        if name not in self._vars:
+            raise AttributeError(name)
+        self._vars[name].set(value)
 
 
-tls = TLSDefaults(
+tls = ContextDefaults(
         ChipyModulesDict={},
         ChipyCurrentContext=None,
         ChipyElseContext=None,
+        ChipyCodeLocOverride=None,
+        ChipyWidthMode="max",
+        ChipyParams={},
         ChipyIdCounter=0)
 
 
@@ -62,6 +103,29 @@ class ChipyError(ValueError):
     pass
 
 
+def Param(name, default=None):
+    if name not in tls.ChipyParams:
+        if default is None:
+            raise ChipyError('Parameter {} is not set'.format(name))
+        return default
+    value = tls.ChipyParams[name]
+    if default is None or not isinstance(value, str) or isinstance(default, str):
+        return value
+    if isinstance(default, bool):
+        return value.lower() in ("1", "true", "yes", "on")
+    if isinstance(default, int):
+        return int(value, 0)
+    return type(default)(value)
+
+
+class ChipyLatchWarning(UserWarning):
+    pass
+
+
+class ChipyLoopWarning(UserWarning):
+    pass
+
+
 def raiseOutsideContext(name):
     if tls.ChipyCurrentContext is None:
         raise ChipyError('{} called outside chipy context'.format(name))
@@ -76,28 +140,110 @@ def ChipySameModule(modules):
     return mods.pop()
 
 
-def ChipyAutoName():
-    tls.ChipyIdCounter += 1
-    return "__%d" % tls.ChipyIdCounter
+def ChipyAutoName(module=None, key=None):
+    # Names are derived from key (the operator and the operand names), so
+    # that they only change if the expression changes, and are made unique
+    # within the module with a per-module counter. Without a module or key,
+    # a global counter is used.
+    if module is None or key is None:
+        tls.ChipyIdCounter += 1
+        return "__%d" % tls.ChipyIdCounter
+    base = "__%08x" % zlib.crc32(repr(key).encode())
+    count = module.autonames.get(base, 0)
+    module.autonames[base] = count + 1
+    if count != 0:
+        base = "%s_%d" % (base, count)
+    return sys.intern(base)
 
 
-def ChipyCodeLoc():
-    stack = traceback.extract_stack()
+ChipyPackageDir = os.path.dirname(os.path.abspath(__file__))
+
+# Frames in these files are skipped when looking for the code location, so
+# that If, Switch, etc. (which are context managers) report the caller.
+ChipySkipFiles = {os.path.abspath(contextlib.__file__)}
+
+ChipyInitChunkWords = 65536
+
 
-    for frame in reversed(stack):
-        filename = os.path.basename(frame[0])
-        lineno = frame[1]
+def ChipySidecarPath(f, name):
+    # Returns the path (next to the output file f) and the name to use in
+    # the Verilog code for an additional file written along with f.
+    filename = getattr(f, "name", None)
+    if not isinstance(filename, str) or filename.startswith("<"):
+        return name, name
+    # The absolute path is used in the Verilog code, as tools resolve it
+    # relative to their working directory, not to the Verilog file.
+    name = "%s_%s" % (os.path.splitext(os.path.basename(filename))[0], name)
+    path = os.path.join(os.path.dirname(os.path.abspath(filename)), name)
+    return path, path
 
-        if filename != "Chipy.py":
-            return "%s:%d" % (filename, lineno)
+
+# Maps the file names of code objects to their base name, or None for
+# files that are skipped
+ChipyCodeLocFiles = dict()
+
+
+def ChipyCodeLoc():
+    if tls.ChipyCodeLocOverride is not None:
+        return tls.ChipyCodeLocOverride
+
+    frame = sys._getframe(1)
+
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename not in ChipyCodeLocFiles:
+            path = os.path.abspath(filename)
+            skip = os.path.dirname(path) == ChipyPackageDir or path in ChipySkipFiles
+            ChipyCodeLocFiles[filename] = None if skip else os.path.basename(filename)
+        basename = ChipyCodeLocFiles[filename]
+        if basename is not None:
+            return "%s:%d" % (basename, frame.f_lineno)
+        frame = frame.f_back
 
     return "Unkown location"
 
 
+@contextmanager
+def ChipyCodeLocAt(codeloc):
+    # Attribute everything created in this block to codeloc, e.g. when
+    # re-creating the contents of a module in a transformation pass.
+    saved = tls.ChipyCodeLocOverride
+    tls.ChipyCodeLocOverride = codeloc
+    try:
+        yield
+    finally:
+        tls.ChipyCodeLocOverride = saved
+
+
+# "max": results are as wide as the widest operand and integer constants are
+# 32 bits wide, "full": results of + - * / % are wide enough for every result,
+# "wrap": like "max" with minimal width constants, "sat": like "wrap" with
+# results clamped to the smallest or largest value instead of wrapping around.
+ChipyWidthModes = ("max", "full", "wrap", "sat")
+
+ChipyArithOps = ("+", "-", "*", "/", "%")
+
+
+@contextmanager
+def WidthMode(mode):
+    if mode not in ChipyWidthModes:
+        raise ChipyError('Unknown width mode {}, expected one of {}'.format(mode, ", ".join(ChipyWidthModes)))
+    saved = tls.ChipyWidthMode
+    tls.ChipyWidthMode = mode
+    try:
+        yield
+    finally:
+        tls.ChipyWidthMode = saved
+
+
 class ChipyContext:
     def __init__(self, newmod=None):
         self.module = newmod
         self.snippet = None
+        self.body = None
+        self.stmt = None
+        # conditions of the enclosing If/ElseIf/Switch/Case blocks
+        self.conds = None
 
     def add_line(self, line, lvalues=None):
         if getattr(self, 'parent') is None:
@@ -107,10 +253,19 @@ class ChipyContext:
             self.module.code_snippets.append(self.snippet)
 
         if lvalues is not None:
-            self.snippet.lvalue_signals.update(lvalues)
+            for name, mask in lvalues.items():
+                self.snippet.lvalue_signals[name] = self.snippet.lvalue_signals.get(name, 0) | mask
 
         self.snippet.text_lines.append(self.snippet.indent_str + line)
 
+    def add_stmt(self, stmt):
+        if getattr(self, 'parent') is None:
+            raise ValueError('Trying to add statement to closed context.')
+        if self.body is not None:
+            self.body.append(stmt)
+        else:
+            self.snippet.stmts.append(stmt)
+
     def add_indent(self):
         if getattr(self, 'parent') is None:
             raise ValueError('Trying to add indent to closed context.')
@@ -135,12 +290,22 @@ class ChipyContext:
         if self.module is None:
             self.module = self.parent.module
             self.snippet = self.parent.snippet
+            self.body = self.parent.body
         tls.ChipyCurrentContext = self
 
     @contextmanager
-    def block(self, begin, end='end'):
+    def block(self, begin, end='end', stmt=None):
         self.pushctx()
         self.add_line(begin)
+        if stmt is not None:
+            self.add_stmt(stmt)
+            self.stmt = stmt
+            self.body = stmt.body
+            if self.conds is None:
+                self.conds = ChipyContextConds(self.parent)
+            cond = {"if": "cond", "switch": "expr", "case": "label"}[stmt.kind]
+            if getattr(stmt, cond) is not None:
+                self.conds = self.conds + [getattr(stmt, cond)]
         self.add_indent()
 
         yield self
@@ -158,11 +323,309 @@ class ChipyContext:
         self.popctx()
 
 
+def ChipyContextConds(ctx):
+    while ctx is not None:
+        if ctx.conds is not None:
+            return ctx.conds
+        ctx = getattr(ctx, 'parent', None)
+    return []
+
+
 class ChipySnippet:
     def __init__(self):
         self.indent_str = "    "
         self.text_lines = list()
+        # Maps the names of the assigned signals to masks of the assigned bits.
         self.lvalue_signals = dict()
+        self.stmts = list()
+
+
+class ChipyStmt:
+    # Structured form of the behavioral code in a snippet, for analysis passes.
+    #   kind "assign": lhs, rhs (rhs is None for an assignment of 'bx)
+    #   kind "if":     cond, body, orelse (None if there is no else branch),
+    #                  else_codeloc, elseif (True if created by ElseIf)
+    #   kind "switch": expr, body (list of "case" stmts), parallel, full
+    #   kind "case":   label (None for default), body
+    def __init__(self, kind, codeloc, **kwargs):
+        self.kind = kind
+        self.codeloc = codeloc
+        self.body = list() if kind != "assign" else None
+        self.__dict__.update(kwargs)
+
+
+def ChipyLvalueBits(lhs):
+    # Returns the bits written by an assignment to lhs as a dict that maps the
+    # names of the assigned signals to (signal, may, must) bit masks, where
+    # must only contains the bits that are not selected by a dynamic index,
+    # and the list of signals used to compute the bit positions.
+    bits = dict()
+    indices = list()
+    stack = [(lhs, (1 << lhs.width) - 1, True)]
+    while stack:
+        sig, mask, static = stack.pop()
+        if sig.op == "[:]" and sig.memory is None:
+            stack.append((sig.args[0], mask << sig.param[1], static))
+        elif sig.op in ("[]", "+:", "-:") and sig.memory is None:
+            base = sig.args[0]
+            indices.append(sig.args[1])
+            stack.append((base, (1 << base.width) - 1, False))
+        elif sig.op == "{}":
+            offset = 0
+            for arg in reversed(sig.args):
+                stack.append((arg, (mask >> offset) & ((1 << arg.width) - 1), static))
+                offset += arg.width
+        else:
+            _, may, must = bits.get(sig.name, (sig, 0, 0))
+            bits[sig.name] = (sig, may | mask, must | (mask if static else 0))
+    return bits, indices
+
+
+def ChipyAssignedBits(stmts):
+    # Returns a dict that maps signal names to the masks of the bits that are
+    # assigned on every path through stmts. Assignments of 'bx (the defaults
+    # of AddAsync registers) do not count.
+    assigned = dict()
+
+    def merge(paths):
+        common = paths[0]
+        for path in paths[1:]:
+            common = {name: mask & path[name] for name, mask in common.items() if name in path}
+        for name, mask in common.items():
+            assigned[name] = assigned.get(name, 0) | mask
+
+    for stmt in stmts:
+        if stmt.kind == "assign" and stmt.rhs is not None:
+            for name, (sig, may, must) in ChipyLvalueBits(stmt.lhs)[0].items():
+                assigned[name] = assigned.get(name, 0) | must
+        elif stmt.kind == "if":
+            merge([ChipyAssignedBits(stmt.body), ChipyAssignedBits(stmt.orelse or [])])
+        elif stmt.kind == "switch":
+            paths = [ChipyAssignedBits(case.body) for case in stmt.body]
+            labels = {case.label.param for case in stmt.body if case.label is not None and case.label.op == "const"}
+            if not stmt.full and all(case.label is not None for case in stmt.body) and \
+                    len({label & ((1 << stmt.expr.width) - 1) for label in labels}) < (1 << stmt.expr.width):
+                paths.append(dict())
+            if paths:
+                merge(paths)
+    return assigned
+
+
+def ChipyUnassignedBits(module):
+    # Returns (signal, mask) for all combinational registers (AddAsync) of
+    # module with bits that are not assigned on every path. The memory port
+    # address and data registers are don't-care while the port is disabled.
+    dontcare = set()
+    for memory in module.memories.values():
+        for port in memory.ports:
+            if port.kind == "write":
+                dontcare.update((port.addr.name, port.data.name))
+
+    assigned = dict()
+    for snippet in module.init_snippets + module.code_snippets:
+        for name, mask in ChipyAssignedBits(snippet.stmts).items():
+            assigned[name] = assigned.get(name, 0) | mask
+
+    unassigned = list()
+    for name, signal in sorted(module.signals.items()):
+        if signal.regkind != "async" or name in dontcare:
+            continue
+        mask = ((1 << signal.width) - 1) & ~assigned.get(name, 0)
+        if mask:
+            unassigned.append((signal, mask))
+    return unassigned
+
+
+def ChipyBitRanges(mask):
+    # Formats a bit mask as a list of bit ranges, e.g. "7:4,1".
+    ranges = list()
+    bit = 0
+    while mask >> bit:
+        if (mask >> bit) & 1:
+            msb = bit
+            while (mask >> (msb + 1)) & 1:
+                msb += 1
+            ranges.append("%d:%d" % (msb, bit) if msb != bit else "%d" % bit)
+            bit = msb
+        bit += 1
+    return ",".join(reversed(ranges))
+
+
+def ChipySCCs(nodes, edges):
+    # Tarjan's algorithm (iterative): returns the strongly connected components
+    # of the graph given by nodes and edges(node) that contain a cycle.
+    index = dict()
+    lowlink = dict()
+    onstack = set()
+    stack = list()
+    result = list()
+    for root in nodes:
+        if root in index:
+            continue
+        work = [(root, iter(edges(root)))]
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        onstack.add(root)
+        while work:
+            node, it = work[-1]
+            for succ in it:
+                if succ not in index:
+                    index[succ] = lowlink[succ] = len(index)
+                    stack.append(succ)
+                    onstack.add(succ)
+                    work.append((succ, iter(edges(succ))))
+                    break
+                if succ in onstack:
+                    lowlink[node] = min(lowlink[node], index[succ])
+            else:
+                work.pop()
+                if work:
+                    lowlink[work[-1][0]] = min(lowlink[work[-1][0]], lowlink[node])
+                if lowlink[node] == index[node]:
+                    scc = list()
+                    while True:
+                        member = stack.pop()
+                        onstack.discard(member)
+                        scc.append(member)
+                        if member == node:
+                            break
+                    if len(scc) > 1 or node in edges(node):
+                        result.append(scc[::-1])
+    return result
+
+
+def ChipyCombEdges(module, sig):
+    # Combinational dependencies of sig as a list of (signal, codeloc, mask)
+    # where mask contains the bits of sig that depend on the signal.
+    if sig.regkind == "ff":
+        return []
+    edges = list(module.depgraph.get(sig.name, {}).values())
+    if sig.op is not None and sig.op != "const":
+        mask = (1 << sig.width) - 1
+        edges.extend((dep, sig.codeloc, mask) for dep in sig.deps.values() if dep.module is module)
+    return edges
+
+
+def ChipyBitEdges(sig, bit, edges):
+    # Bits (signal, bit, codeloc) that bit of sig depends on
+    result = list()
+    for dep, codeloc, mask in edges:
+        if not (mask >> bit) & 1:
+            continue
+        if sig.op == "[:]" and sig.memory is None and dep is sig.args[0]:
+            result.append((dep, bit + sig.param[1], codeloc))
+        elif sig.op == "{}" and sig.deps.get(dep.name) is dep:
+            offset = 0
+            for arg in reversed(sig.args):
+                if arg is dep and offset <= bit < offset + arg.width:
+                    result.append((dep, bit - offset, codeloc))
+                offset += arg.width
+        elif sig.op in ("&", "|", "^", "~") and sig.width == max(arg.width for arg in sig.args) and \
+                any(arg is dep for arg in sig.args):
+            if bit < dep.width:
+                result.append((dep, bit, codeloc))
+            elif dep.signed:
+                result.append((dep, dep.width - 1, codeloc))
+        else:
+            result.extend((dep, i, codeloc) for i in range(dep.width))
+    return result
+
+
+def ChipyCombLoops(module):
+    # Returns the combinational loops of module, each as a list of (signal
+    # name, bit, codeloc) tuples, one for each bit on the loop and the
+    # location where its dependency on the next bit was created. Candidates
+    # are found with Tarjan's algorithm on the signal dependency graph that
+    # is maintained by Assign and Connect, and then checked per bit.
+    adj = dict()
+    for name, sig in module.signals.items():
+        adj[name] = ChipyCombEdges(module, sig)
+    sccs = ChipySCCs(list(adj), lambda name: [dep.name for dep, codeloc, mask in adj[name] if dep.name in adj])
+
+    loops = list()
+    for scc in sccs:
+        members = set(scc)
+        bitadj = dict()
+        for name in scc:
+            sig = module.signals[name]
+            for bit in range(sig.width):
+                bitadj[(name, bit)] = [((dep.name, i), codeloc) for dep, i, codeloc in
+                        ChipyBitEdges(sig, bit, adj[name]) if dep.name in members]
+        for bitscc in ChipySCCs(sorted(bitadj), lambda node: [dep for dep, codeloc in bitadj[node]]):
+            loop = ChipyFindCycle(set(bitscc), bitadj)
+            loops.append([(name, bit, codeloc) for (name, bit), codeloc in loop])
+    return loops
+
+
+def ChipyFindCycle(members, adj):
+    # Shortest cycle through one node of members (a strongly connected set),
+    # starting at a named signal if possible
+    start = min(members, key=lambda node: (node[0].startswith("__"), node))
+    pred = {start: None}
+    queue = [start]
+    for node in queue:
+        for dep, codeloc in adj[node]:
+            if dep == start:
+                loop = [(node, codeloc)]
+                while pred[loop[-1][0]] is not None:
+                    loop.append(pred[loop[-1][0]])
+                return loop[::-1]
+            if dep in members and dep not in pred:
+                pred[dep] = (node, codeloc)
+                queue.append(dep)
+
+
+def ChipyLoopText(module, loop):
+    names = list()
+    for name, bit, codeloc in loop + loop[:1]:
+        sig = module.signals[name]
+        if name.startswith("__") and sig.vlog_rvalue:
+            name = "(%s)" % sig.vlog_rvalue
+        names.append("%s[%d]" % (name, bit) if sig.width > 1 else name)
+    codelocs = list()
+    for name, bit, codeloc in loop:
+        if codeloc not in codelocs:
+            codelocs.append(codeloc)
+    return "%s (%s)" % (" -> ".join(names), ", ".join(codelocs))
+
+
+class ChipyReset:
+    def __init__(self, signal, sync=True, activelow=False):
+        self.signal = signal
+        self.sync = sync
+        self.activelow = activelow
+        self.key = (signal.name, sync, activelow)
+        self.active = ("!%s" if activelow else "%s") % signal.name
+        self.name = "%s %s" % ("negedge" if activelow else "posedge", signal.name)
+
+
+class ChipyClockDomain:
+    def __init__(self, module, edge, clock, reset=None):
+        self.module = module
+        self.edge = edge
+        self.clock = clock
+        self.reset = reset
+        self.name = "%s %s" % (edge, clock.name)
+        self.registers = list()
+
+    def write_verilog(self, f):
+        if self.reset is not None and not self.reset.sync:
+            print("  always @(%s or %s) begin" % (self.name, self.reset.name), file=f)
+        else:
+            print("  always @(%s) begin" % self.name, file=f)
+        indent = "    "
+        if self.reset is not None:
+            print("    if (%s) begin" % self.reset.active, file=f)
+            for signal, codeloc in self.registers:
+                value = signal.reset_value & ((1 << signal.width) - 1)
+                print("      %s <= %d'h%x; // %s" % (signal.name, signal.width, value, codeloc), file=f)
+            print("    end else begin", file=f)
+            indent = "      "
+        for signal, codeloc in self.registers:
+            print("%s%s <= %s; // %s" % (indent, signal.name, signal.vlog_lvalue, codeloc), file=f)
+        if self.reset is not None:
+            print("    end", file=f)
+        print("  end", file=f)
 
 
 class ChipyModule:
@@ -171,8 +634,15 @@ class ChipyModule:
         self.signals = dict()
         self.memories = dict()
         self.regactions = list()
+        self.clock_domains = dict()
+        self.default_reset = None
         self.instances = list()
+        self.autonames = dict()
         self.codeloc = ChipyCodeLoc()
+        # Maps the names of assigned and connected signals to dicts that map
+        # the names of the signals they depend on to (signal, codeloc, mask),
+        # where mask contains the assigned bits that depend on the signal.
+        self.depgraph = dict()
 
         self.init_snippets = list()
         self.code_snippets = list()
@@ -191,6 +661,12 @@ class ChipyModule:
                     addport(signame[len(prefix):], signal.width, output=output)
         return callback
 
+    def clock_domain(self, edge, clock, reset=None):
+        key = (edge, clock.name, None if reset is None else reset.key)
+        if key not in self.clock_domains:
+            self.clock_domains[key] = ChipyClockDomain(self, edge, clock, reset)
+        return self.clock_domains[key]
+
     def bundle(self, prefix=""):
         ret = Bundle()
         for signame, signal in sorted(self.signals.items()):
@@ -205,7 +681,7 @@ class ChipyModule:
         instance_lines = list()
 
         for memname, memory in sorted(self.memories.items()):
-            wirelist.append("  %sreg [%d:0] %s [0:%d]; // %s" % ("signed " if memory.signed else "", memory.width-1, memory.name, memory.depth-1, memory.codeloc))
+            wirelist.append("  reg %s[%d:0] %s [0:%d]; // %s" % ("signed " if memory.signed else "", memory.width-1, memory.name, memory.depth-1, memory.codeloc))
 
         for signame, signal in sorted(self.signals.items()):
             if not signal.materialize:
@@ -214,8 +690,8 @@ class ChipyModule:
                 port_type = "inout"
                 if not signal.inport: port_type = "output"
                 if not signal.outport: port_type = "input"
-                if signal.signed: port_type = "signed " + port_type
                 if signal.vlog_reg: port_type = port_type + " reg"
+                if signal.signed: port_type = port_type + " signed"
                 if signal.width > 1:
                     portlist.append("  %s [%d:0] %s /* %s */" % (port_type, signal.width-1, signal.name, signal.codeloc))
                 else:
@@ -260,6 +736,8 @@ class ChipyModule:
 
         snippet_db = self.init_snippets + self.code_snippets
         snippet_parent = list()
+        # For each signal a list of [bit mask, snippet index] entries, one
+        # for each group of snippets assigning overlapping bits.
         lvalue_idx = dict()
 
         def UnionFind_Find(idx):
@@ -274,11 +752,16 @@ class ChipyModule:
 
         for idx in range(len(snippet_db)):
             snippet_parent.append(idx)
-            for lval in snippet_db[idx].lvalue_signals.keys():
-                if lval not in lvalue_idx:
-                    lvalue_idx[lval] = idx
-                else:
-                    UnionFind_Union(idx, lvalue_idx[lval])
+            for lval, mask in snippet_db[idx].lvalue_signals.items():
+                entries = list()
+                for entry in lvalue_idx.get(lval, []):
+                    if entry[0] & mask:
+                        UnionFind_Union(entry[1], idx)
+                        mask |= entry[0]
+                    else:
+                        entries.append(entry)
+                entries.append([mask, idx])
+                lvalue_idx[lval] = entries
 
         snippet_groups = dict()
 
@@ -291,7 +774,7 @@ class ChipyModule:
         for snippets in snippet_groups.values():
             print("  always @* begin", file=f)
             for snippet in snippets:
-                # print("    // -- %s --" % (" ".join([sig.name for sig in snippet.lvalue_signals.keys()])), file=f)
+                # print("    // -- %s --" % (" ".join(snippet.lvalue_signals.keys())), file=f)
                 for line in snippet.text_lines:
                     print(line, file=f)
             print("  end", file=f)
@@ -299,17 +782,15 @@ class ChipyModule:
         for line in self.regactions:
             print(line, file=f)
 
+        for domain in self.clock_domains.values():
+            if len(domain.registers) != 0:
+                domain.write_verilog(f)
+
         for line in instance_lines:
             print(line, file=f)
 
         for memory in self.memories.values():
-            if memory.posedge is not None:
-                print("  always @(posedge %s) begin" % memory.posedge.name, file=f)
-            if memory.negedge is not None:
-                print("  always @(negedge %s) begin" % memory.negedge.name, file=f)
-            for line in memory.regactions:
-                print("    " + line, file=f)
-            print("  end", file=f)
+            memory.write_verilog(f)
 
         print("endmodule", file=f)
 
@@ -318,39 +799,110 @@ class ChipyModule:
 
     def __exit__(self, type, value, traceback):
         tls.ChipyCurrentContext.popctx()
+        if type is None:
+            for signal, mask in ChipyUnassignedBits(self):
+                warnings.warn("Bits %s of %s.%s are not assigned on every path (latch without 'bx default)" % (
+                        ChipyBitRanges(mask), self.name, signal.name), ChipyLatchWarning, stacklevel=2)
+            for loop in ChipyCombLoops(self):
+                warnings.warn("Combinational loop in module %s: %s" % (self.name, ChipyLoopText(self, loop)),
+                        ChipyLoopWarning, stacklevel=2)
 
 
 def ChipyUnaryOp(vlogop, a, signprop=True, logicout=False):
     a = Sig(a)
 
     module = ChipySameModule([a.module])
-    signal = ChipySignal(module)
+    signal = ChipySignal(module, key=(vlogop, a.name, signprop, logicout))
 
     signal.signed = a.signed and signprop
     if not logicout:
         signal.width = a.width
 
     signal.vlog_rvalue = "%s %s" % (vlogop, a.name)
+    signal.op = vlogop
+    signal.args = (a,)
     signal.deps[a.name] = a
 
     return signal
 
 
-def ChipyBinaryOp(vlogop, a, b, signprop=True, leftwidth=False):
-    a = Sig(a)
-    b = Sig(b)
+def ChipyMinimalConst(value, signed=False):
+    # The narrowest constant with the given value, signed if the value is
+    # negative or signed is set.
+    if value < 0 or signed:
+        width = (value if value >= 0 else ~value).bit_length() + 1
+        return Sig(value & ((1 << width) - 1), -width)
+    return Sig(value, max(value.bit_length(), 1))
+
+
+def ChipyOperands(a, b):
+    # Integer operands become minimal width constants (with the signedness of
+    # the other operand) in all width modes but "max".
+    if tls.ChipyWidthMode != "max":
+        if isinstance(a, int) and not isinstance(b, int):
+            b = Sig(b)
+            a = ChipyMinimalConst(a, b.signed)
+        elif isinstance(b, int) and not isinstance(a, int):
+            a = Sig(a)
+            b = ChipyMinimalConst(b, a.signed)
+    return Sig(a), Sig(b)
+
+
+def ChipyFullWidth(vlogop, a, b):
+    if vlogop in ("+", "-"):
+        return max(a.width, b.width) + 1
+    if vlogop == "*":
+        return a.width + b.width
+    if vlogop == "/":
+        return a.width + (a.signed and b.signed)
+    if vlogop == "%":
+        return min(a.width, b.width)
+    return max(a.width, b.width)
+
+
+def ChipySaturate(sig, width, floor=False):
+    # Clamps sig to the range of width bits wide values. Unsigned results
+    # with floor set (differences) have the borrow in the MSB and clamp to 0.
+    if sig.width <= width:
+        return sig
+    low = sig[width-1:0]
+    if sig.signed:
+        high = sig[sig.width-1:width-1]
+        overflow = high.reduce_or() & ~high.reduce_and()
+        limit = Cond(sig[sig.width-1], Sig(1 << (width-1), width), Sig((1 << (width-1)) - 1, width))
+        return Sig(Cond(overflow, limit, low), -width)
+    if floor:
+        return Cond(sig[sig.width-1], Sig(0, width), low)
+    return Cond(sig[sig.width-1:width].reduce_or(), Sig((1 << width) - 1, width), low)
+
+
+def ChipyBinaryOp(vlogop, a, b, signprop=True, leftwidth=False, width=None):
+    a, b = ChipyOperands(a, b)
+
+    mode = tls.ChipyWidthMode
+    full = width is None and not leftwidth and vlogop in ChipyArithOps and mode == "full"
+    if width is None and not leftwidth and vlogop in ChipyArithOps and mode in ("full", "sat"):
+        width = ChipyFullWidth(vlogop, a, b)
+        if mode == "sat":
+            signal = ChipyBinaryOp(vlogop, a, b, signprop, width=width)
+            return ChipySaturate(signal, max(a.width, b.width), vlogop == "-" and not signal.signed)
 
     module = ChipySameModule([a.module, b.module])
-    signal = ChipySignal(module)
+    signal = ChipySignal(module, key=(vlogop, a.name, b.name, signprop, leftwidth))
 
     if leftwidth:
         signal.width = a.width
         signal.signed = a.signed and signprop
     else:
-        signal.width = max(a.width, b.width)
+        signal.width = max(a.width, b.width) if width is None else width
         signal.signed = a.signed and b.signed and signprop
+        if full and vlogop == "-":
+            # a full precision difference of unsigned operands can be negative
+            signal.signed = signprop
 
     signal.vlog_rvalue = "%s %s %s" % (a.name, vlogop, b.name)
+    signal.op = vlogop
+    signal.args = (a, b)
     signal.deps[a.name] = a
     signal.deps[b.name] = b
 
@@ -358,13 +910,14 @@ def ChipyBinaryOp(vlogop, a, b, signprop=True, leftwidth=False):
 
 
 def ChipyCmpOp(vlogop, a, b):
-    a = Sig(a)
-    b = Sig(b)
+    a, b = ChipyOperands(a, b)
 
     module = ChipySameModule([a.module, b.module])
-    signal = ChipySignal(module)
+    signal = ChipySignal(module, key=(vlogop, a.name, b.name))
 
     signal.vlog_rvalue = "%s %s %s" % (a.name, vlogop, b.name)
+    signal.op = vlogop
+    signal.args = (a, b)
     signal.deps[a.name] = a
     signal.deps[b.name] = b
 
@@ -372,9 +925,11 @@ def ChipyCmpOp(vlogop, a, b):
 
 
 class ChipySignal:
-    def __init__(self, module, name=None, const=False):
+    def __init__(self, module, name=None, const=False, key=None):
         if name is None:
-            name = ChipyAutoName()
+            name = ChipyAutoName(module, key)
+        else:
+            name = sys.intern(name)
 
         self.name = name
         self.module = module
@@ -392,8 +947,18 @@ class ChipySignal:
         self.materialize = False
         self.gotassign = False
         self.portalias = None
+        self.portmaster = None
+        self.regkind = None
+        self.domain = None
+        self.reset_value = None
         self.deps = dict()
 
+        # Structured form of vlog_rvalue: operator, operand signals and an
+        # optional operator parameter (e.g. the bit range of a slice).
+        self.op = None
+        self.args = ()
+        self.param = None
+
         if not const:
             if name in module.signals:
                 raise ChipyError(
@@ -424,7 +989,7 @@ class ChipySignal:
             self_deps = {self.name: self}
         else:
             self_name = self.vlog_rvalue
-            self_deps = dict()
+            self_deps = self.deps
 
         if isinstance(index, tuple):
             index, width = index
@@ -437,15 +1002,25 @@ class ChipySignal:
             updown = "+" if width >= 0 else "-"
             width = abs(width)
 
-            signal = ChipySignal(self.module)
+            index_key = index.name if isinstance(index, ChipySignal) else index
+            signal = ChipySignal(self.module, key=(updown + ":", self_name, index_key, width))
             signal.memory = self.memory
             signal.width = width
             signal.deps.update(self_deps)
 
             if isinstance(index, ChipySignal):
                 index.set_materialize()
+                signal.op = updown + ":"
+                signal.args = (self, index)
+                signal.param = width
                 index = index.name
             elif isinstance(index, int):
+                signal.op = "[:]"
+                signal.args = (self,)
+                if updown == "+":
+                    signal.param = (index + width - 1, index)
+                else:
+                    signal.param = (index, index - width + 1)
                 index = "%d" % index
             else:
                 raise TypeError(
@@ -460,24 +1035,29 @@ class ChipySignal:
             msb = max(index.start, index.stop)
             lsb = min(index.start, index.stop)
 
-            signal = ChipySignal(self.module)
+            signal = ChipySignal(self.module, key=("[:]", self_name, msb, lsb))
             signal.memory = self.memory
             signal.width = msb - lsb + 1
             signal.deps.update(self_deps)
 
             signal.vlog_rvalue = "%s[%d:%d]" % (self_name, msb, lsb)
+            signal.op = "[:]"
+            signal.args = (self,)
+            signal.param = (msb, lsb)
             if self.vlog_lvalue is not None:
                 signal.vlog_lvalue = "%s[%d:%d]" % (self.vlog_lvalue, msb, lsb)
 
             return signal
 
         if isinstance(index, ChipySignal):
-            signal = ChipySignal(self.module)
+            signal = ChipySignal(self.module, key=("[]", self_name, index.name))
             signal.memory = self.memory
             signal.width = 1
             signal.deps.update(self_deps)
 
             signal.vlog_rvalue = "%s[%s]" % (self_name, index.name)
+            signal.op = "[]"
+            signal.args = (self, index)
             if self.vlog_lvalue is not None:
                 signal.vlog_lvalue = "%s[%s]" % (self.vlog_lvalue, index.name)
 
@@ -485,12 +1065,15 @@ class ChipySignal:
             return signal
 
         if isinstance(index, int):
-            signal = ChipySignal(self.module)
+            signal = ChipySignal(self.module, key=("[:]", self_name, index, index))
             signal.memory = self.memory
             signal.width = 1
             signal.deps.update(self_deps)
 
             signal.vlog_rvalue = "%s[%d]" % (self_name, index)
+            signal.op = "[:]"
+            signal.args = (self,)
+            signal.param = (index, index)
             if self.vlog_lvalue is not None:
                 signal.vlog_lvalue = "%s[%d]" % (self.vlog_lvalue, index)
 
@@ -602,12 +1185,53 @@ class ChipySignal:
         return ChipyUnaryOp("|", self, signprop=False, logicout=True)
 
 
+class ChipyMemoryPort:
+    def __init__(self, memory, kind, edge, clock):
+        self.memory = memory
+        self.kind = kind
+        self.edge = edge
+        self.clock = clock
+        self.codeloc = ChipyCodeLoc()
+        self.addr = None
+        self.data = None
+        self.enable = None
+        self.lanewidth = memory.width
+
+    def write(self, addr, data, enable=None):
+        if self.kind != "write":
+            raise ChipyError('write() called on memory read port')
+        if enable is None:
+            enable = Sig((1 << self.enable.width) - 1, self.enable.width)
+        Assign(self.addr, addr)
+        Assign(self.data, data)
+        Assign(self.enable, enable)
+
+    def text_lines(self):
+        memory = self.memory
+        if self.kind == "read":
+            line = "%s <= %s[%s]; // %s" % (self.data.name, memory.name, self.addr.name, self.codeloc)
+            if self.enable is not None:
+                line = "if (%s) %s" % (self.enable.name, line)
+            return [line]
+
+        if self.lanewidth == memory.width:
+            return ["if (%s) %s[%s] <= %s; // %s" % (self.enable.name, memory.name, self.addr.name, self.data.name, self.codeloc)]
+
+        lines = list()
+        for lane in range(self.enable.width):
+            lsb = lane * self.lanewidth
+            width = min(self.lanewidth, memory.width - lsb)
+            lines.append("if (%s[%d]) %s[%s][%d +: %d] <= %s[%d +: %d]; // %s" % (self.enable.name, lane,
+                    memory.name, self.addr.name, lsb, width, self.data.name, lsb, width, self.codeloc))
+        return lines
+
+
 class ChipyMemory:
-    def __init__(self, module, width, depth, name=None, posedge=None, negedge=None, signed=False):
+    def __init__(self, module, width, depth, name=None, posedge=None, negedge=None, signed=False, init=None):
         if name is None:
-            name = ChipyAutoName()
+            name = ChipyAutoName(module, ("memory", width, depth))
 
-        if (posedge is None) == (negedge is None):
+        if posedge is not None and negedge is not None:
             raise ValueError('posedge XOR negedge must be given')
 
         self.name = name
@@ -618,7 +1242,10 @@ class ChipyMemory:
         self.posedge = posedge
         self.negedge = negedge
         self.signed = signed
+        self.init = init
         self.regactions = list()
+        self.writes = list()
+        self.ports = list()
 
         if name in module.memories:
             raise ChipyError('Memory name {} already in use'.format(name))
@@ -626,20 +1253,214 @@ class ChipyMemory:
 
     def __getitem__(self, index):
         index = Sig(index)
-        signal = ChipySignal(self.module)
+        signal = ChipySignal(self.module, key=("mem", self.name, index.name))
         signal.width = self.width
+        signal.signed = self.signed
         signal.vlog_rvalue = "%s[%s]" % (self.name, index.name)
-        signal.deps.update(index.deps)
+        signal.op = "mem"
+        signal.args = (index,)
+        signal.deps[index.name] = index
         signal.memory = self
         return signal
 
+    def addrbits(self):
+        return max(1, (self.depth - 1).bit_length())
+
+    def port_clock(self, posedge, negedge):
+        if posedge is not None and negedge is not None:
+            raise ValueError('posedge XOR negedge must be given')
+        if posedge is not None:
+            return "posedge", posedge
+        if negedge is not None:
+            return "negedge", negedge
+        if self.posedge is not None:
+            return "posedge", self.posedge
+        if self.negedge is not None:
+            return "negedge", self.negedge
+        raise ChipyError('Memory {} has no clock, posedge or negedge must be given'.format(self.name))
+
+    def clock_names(self):
+        names = list()
+        if self.posedge is not None or self.negedge is not None:
+            edge, clock = self.port_clock(None, None)
+            names.append("%s %s" % (edge, clock.name))
+        for port in self.ports:
+            name = "%s %s" % (port.edge, port.clock.name)
+            if port.kind == "write" and name not in names:
+                names.append(name)
+        return names
+
+    def read_port(self, addr, posedge=None, negedge=None, enable=None):
+        addr = Sig(addr)
+        if posedge is None and negedge is None:
+            return self[addr]
+
+        edge, clock = self.port_clock(posedge, negedge)
+        port = ChipyMemoryPort(self, "read", edge, clock)
+        port.addr = addr
+        addr.set_materialize()
+        if enable is not None:
+            port.enable = Sig(enable)
+            port.enable.set_materialize()
+
+        data = ChipySignal(self.module, "%s__rd%d" % (self.name, len(self.ports)))
+        data.width = self.width
+        data.signed = self.signed
+        data.vlog_reg = True
+        data.regkind = "ff"
+        data.domain = ChipyClockDomain(self.module, edge, clock)
+        data.set_materialize()
+        port.data = data
+
+        self.ports.append(port)
+        return data
+
+    def write_port(self, posedge=None, negedge=None, byteenable=False):
+        edge, clock = self.port_clock(posedge, negedge)
+        port = ChipyMemoryPort(self, "write", edge, clock)
+        prefix = "%s__wr%d__" % (self.name, len(self.ports))
+        lanes = (self.width + 7) // 8 if byteenable else 1
+        if byteenable:
+            port.lanewidth = 8
+
+        with ChipyContext(newmod=self.module):
+            port.addr = AddReg(prefix + "addr", self.addrbits())
+            port.data = AddReg(prefix + "data", -self.width if self.signed else self.width)
+            port.enable = AddReg(prefix + "en", lanes)
+            for signal in (port.addr, port.data, port.enable):
+                AddAsync(signal)
+            # Address and data default to 'bx, they are don't-care while the
+            # port is not enabled.
+            port.addr.gotassign = True
+            port.data.gotassign = True
+            port.enable.gotassign = True
+
+        codeloc = ChipyCodeLoc()
+        snippet = ChipySnippet()
+        snippet.text_lines.append(snippet.indent_str + "%s = %d'd0; // %s" % (port.enable.vlog_lvalue, lanes, codeloc))
+        snippet.stmts.append(ChipyStmt("assign", codeloc, lhs=port.enable, rhs=Sig(0, lanes)))
+        snippet.lvalue_signals[port.enable.name] = (1 << lanes) - 1
+        self.module.init_snippets.append(snippet)
+
+        self.ports.append(port)
+        return port
+
+    def init_buffer(self):
+        # Returns (bytes, bytes per word, byteorder) if init is a binary file
+        # name or a buffer object, or None otherwise. Untyped (byte) buffers
+        # and files are little endian, typed buffers (e.g. array or NumPy
+        # arrays) use the native byte order of their items.
+        init = self.init
+        if isinstance(init, str):
+            if os.path.splitext(init)[1].lower() in (".hex", ".mem"):
+                return None
+            with open(init, "rb") as fbin:
+                if os.fstat(fbin.fileno()).st_size == 0:
+                    return memoryview(b""), 1, "little"
+                init = mmap.mmap(fbin.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            data = memoryview(init)
+        except TypeError:
+            return None
+
+        if data.itemsize > 1:
+            wordbytes, byteorder = data.itemsize, sys.byteorder
+        else:
+            wordbytes, byteorder = (self.width + 7) // 8, "little"
+
+        if not data.c_contiguous:
+            data = memoryview(data.tobytes())
+        data = data.cast("B")
+
+        if len(data) % wordbytes != 0:
+            raise ChipyError('Initial data for memory {} is not a multiple of {} bytes'.format(self.name, wordbytes))
+        if len(data) // wordbytes > self.depth:
+            raise ChipyError('Too many initial values for memory {}'.format(self.name))
+        return data, wordbytes, byteorder
+
+    def write_init_hex(self, fhex, data, wordbytes, byteorder):
+        # Streams the binary init data to a $readmemh file, one chunk at a
+        # time, by re-ordering the bytes of all words in a chunk into big
+        # endian order using strided slice assignments.
+        nbytes = (self.width + 7) // 8
+        topmask = (1 << (self.width - 8*(nbytes-1))) - 1
+        table = bytes(i & topmask for i in range(256))
+        chunksize = ChipyInitChunkWords * wordbytes
+
+        for offset in range(0, len(data), chunksize):
+            src = data[offset:offset+chunksize]
+            buf = bytearray(len(src) // wordbytes * nbytes)
+            for i in range(min(nbytes, wordbytes)):
+                j = i if byteorder == "little" else wordbytes-1-i
+                buf[nbytes-1-i::nbytes] = src[j::wordbytes]
+            if topmask != 255:
+                buf[0::nbytes] = buf[0::nbytes].translate(table)
+            text = binascii.hexlify(buf).decode()
+            step = 2 * nbytes
+            fhex.write("\n".join(text[i:i+step] for i in range(0, len(text), step)))
+            fhex.write("\n")
+
+    def write_verilog(self, f):
+        blocks = dict()
+        if len(self.regactions) != 0:
+            edge, clock = self.port_clock(None, None)
+            blocks["%s %s" % (edge, clock.name)] = list(self.regactions)
+        for port in self.ports:
+            blocks.setdefault("%s %s" % (port.edge, port.clock.name), list()).extend(port.text_lines())
+
+        for name, lines in blocks.items():
+            print("  always @(%s) begin" % name, file=f)
+            for line in lines:
+                print("    " + line, file=f)
+            print("  end", file=f)
+
+        if self.init is None:
+            return
+
+        data = self.init_buffer()
+        if data is not None:
+            path, name = ChipySidecarPath(f, "%s_%s.hex" % (self.module.name, self.name))
+            words = len(data[0]) // data[1]
+            if words != 0:
+                # Writers that collect additional files in a sidecars dict
+                # (path -> text) write them along with the Verilog code.
+                sidecars = getattr(f, "sidecars", None)
+                if sidecars is None:
+                    with open(path, "w") as fhex:
+                        self.write_init_hex(fhex, *data)
+                else:
+                    fhex = io.StringIO()
+                    self.write_init_hex(fhex, *data)
+                    sidecars[path] = fhex.getvalue()
+                print("  initial $readmemh(\"%s\", %s, 0, %d); // %s" % (name, self.name, words-1, self.codeloc), file=f)
+            return
+
+        if isinstance(self.init, str):
+            print("  initial $readmemh(\"%s\", %s); // %s" % (self.init, self.name, self.codeloc), file=f)
+            return
+
+        print("  initial begin // %s" % self.codeloc, file=f)
+        mask = (1 << self.width) - 1
+        for index, value in enumerate(self.init):
+            if index >= self.depth:
+                raise ChipyError('Too many initial values for memory {}'.format(self.name))
+            print("    %s[%d] = %d'h%x;" % (self.name, index, self.width, int(value) & mask), file=f)
+        print("  end", file=f)
+
 
 class ChipyBundle:
+    # members maps member names to signals (or nested bundles) in insertion
+    # order, fields maps the attribute names ("name_") to the same members.
+    __slots__ = ("members", "fields")
+
     def __init__(self):
         self.members = dict()
+        self.fields = dict()
 
     def add(self, name, member):
         self.members[name] = member
+        self.fields[name + "_"] = member
 
     def regs(self):
         bundle = ChipyBundle()
@@ -671,11 +1492,35 @@ class ChipyBundle:
     def get(self, name):
         return self.members[name]
 
+    def leaves(self):
+        for member in self.members.values():
+            if isinstance(member, ChipyBundle):
+                yield from member.leaves()
+            else:
+                yield member
+
+    def width(self):
+        return sum(member.width for member in self.leaves())
+
+    def flat(self):
+        return Concat(self.leaves())
+
+    def unflat(self, sig):
+        sig = Sig(sig)
+        if sig.width != self.width():
+            raise ChipyError('Cannot unflat {} bits wide signal {} into {} bits wide bundle'.format(
+                    sig.width, sig.name, self.width()))
+        msb = [sig.width]
+
+        def slice(member):
+            msb[0] -= member.width
+            value = sig[msb[0] + member.width - 1:msb[0]]
+            return Sig(value, -member.width) if member.signed else value
+
+        return ChipyBundleMap(slice, [self])
+
     def __getitem__(self, index):
-        bundle = Bundle()
-        for key in self.keys():
-            bundle.add(key, self.get(key)[index])
-        return bundle
+        return ChipyBundleMap(lambda member: member[index], [self])
 
     def __setattr__(self, name, value):
         if name == "next":
@@ -684,9 +1529,38 @@ class ChipyBundle:
             super().__setattr__(name, value)
 
     def __getattr__(self, name):
-        if name.endswith("_") and name[:-1] in self.members:
-            return self.members[name[:-1]]
-        raise AttributeError
+        if name in ChipyBundle.__slots__:
+            raise AttributeError(name)
+        try:
+            return self.fields[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+def ChipyBundleKeys(bundles, what, exact=True):
+    # Returns the member names of the first bundle. The other bundles must
+    # have the same members, or at least these members if exact is not set.
+    keys = bundles[0].members.keys()
+    for bundle in bundles[1:]:
+        if not isinstance(bundle, ChipyBundle):
+            raise ChipyError('Can only {} bundles with other bundles'.format(what))
+        if bundle.members.keys() != keys and (exact or not keys <= bundle.members.keys()):
+            raise ChipyError('Cannot {} bundles with different members: {} vs. {}'.format(
+                    what, ", ".join(keys), ", ".join(bundle.members.keys())))
+    return keys
+
+
+def ChipyBundleMap(func, bundles, what="combine"):
+    # Applies func to the corresponding (leaf) members of bundles and returns
+    # a bundle with the results
+    result = ChipyBundle()
+    for name in ChipyBundleKeys(bundles, what):
+        members = [bundle.members[name] for bundle in bundles]
+        if isinstance(members[0], ChipyBundle):
+            result.add(name, ChipyBundleMap(func, members, what))
+        else:
+            result.add(name, func(*members))
+    return result
 
 
 def Bundle(arg=None, **kwargs):
@@ -697,7 +1571,8 @@ def Bundle(arg=None, **kwargs):
             bundle.add(name, member)
 
     for name, member in kwargs.items():
-        assert name.endswith("_")
+        if not name.endswith("_"):
+            raise ChipyError('Bundle member keyword argument {} must end in "_"'.format(name))
         bundle.add(name[:-1], member)
 
     return bundle
@@ -718,17 +1593,17 @@ def Zip(bundles, recursive=False):
     if len(bundles_list) == 0:
         return ret
 
-    for bundle in bundles_list:
-        assert bundles_list[0].members.keys() == bundle.members.keys()
-
-    for name in bundles_list[0].members.keys():
+    for name in ChipyBundleKeys(bundles_list, "zip"):
         if list_mode:
             value = [None] * len(bundles)
         else:
             value = dict()
 
         for key in bundles_keys:
-            value[key] = bundles[key][name]
+            value[key] = bundles[key].members[name]
+
+        if recursive and isinstance(bundles_list[0].members[name], ChipyBundle):
+            value = Zip(value, recursive)
 
         ret[name] = value
 
@@ -771,17 +1646,18 @@ def AddInput(name, type=1):
     return signal
 
 
-def AddOutput(name, type=1, posedge=None, negedge=None, nodefault=False, async=False):
+def AddOutput(name, type=1, posedge=None, negedge=None, nodefault=False, async_=False, reset=None, reset_value=0):
     raiseOutsideContext('AddOutput')
 
     names = name.split()
     if len(names) > 1:
-        return [AddOutput(n, type, posedge, negedge, nodefault, async) for n in names]
+        return [AddOutput(n, type, posedge, negedge, nodefault, async_, reset, reset_value) for n in names]
     assert len(names) == 1
     name = names[0]
 
     if not isinstance(type, int):
-        return AddPort(name, type, "output", posedge=posedge, negedge=negedge, nodefault=nodefault, async=async)
+        return AddPort(name, type, "output", posedge=posedge, negedge=negedge, nodefault=nodefault, async_=async_,
+                reset=reset, reset_value=reset_value)
 
     module = tls.ChipyCurrentContext.module
 
@@ -794,15 +1670,15 @@ def AddOutput(name, type=1, posedge=None, negedge=None, nodefault=False, async=F
     signal.set_materialize()
 
     if posedge is not None or negedge is not None:
-        AddFF(signal, posedge=posedge, negedge=negedge, nodefault=nodefault)
+        AddFF(signal, posedge=posedge, negedge=negedge, nodefault=nodefault, reset=reset, reset_value=reset_value)
 
-    if async:
+    if async_:
         AddAsync(signal)
 
     return signal
 
 
-def AddPort(name, type, role, posedge=None, negedge=None, nodefault=False, async=None):
+def AddPort(name, type, role, posedge=None, negedge=None, nodefault=False, async_=None, reset=None, reset_value=0):
     bundle = ChipyBundle()
 
     def addport(port_name, port_type, port_role=None, output=False):
@@ -819,29 +1695,33 @@ def AddPort(name, type, role, posedge=None, negedge=None, nodefault=False, async
 
         if isinstance(port_type, int):
             if role == "register":
-                bundle.add(port_name, AddReg(prefix + port_name, port_type, posedge=posedge, negedge=negedge, nodefault=nodefault, async=async))
+                bundle.add(port_name, AddReg(prefix + port_name, port_type, posedge=posedge, negedge=negedge, nodefault=nodefault, async_=async_,
+                        reset=reset, reset_value=reset_value))
             elif output:
-                bundle.add(port_name, AddOutput(prefix + port_name, port_type, posedge=posedge, negedge=negedge, nodefault=nodefault, async=async))
+                bundle.add(port_name, AddOutput(prefix + port_name, port_type, posedge=posedge, negedge=negedge, nodefault=nodefault, async_=async_,
+                        reset=reset, reset_value=reset_value))
             else:
                 bundle.add(port_name, AddInput(prefix + port_name, port_type))
         else:
-            bundle.add(port_name, AddPort(prefix + port_name, port_type, port_role, posedge=posedge, negedge=negedge, nodefault=nodefault, async=async))
+            bundle.add(port_name, AddPort(prefix + port_name, port_type, port_role, posedge=posedge, negedge=negedge, nodefault=nodefault, async_=async_,
+                    reset=reset, reset_value=reset_value))
 
     type(addport, role)
     return bundle
 
 
-def AddReg(name, type=1, posedge=None, negedge=None, nodefault=False, async=None):
+def AddReg(name, type=1, posedge=None, negedge=None, nodefault=False, async_=None, reset=None, reset_value=0):
     raiseOutsideContext('AddReg')
 
     names = name.split()
     if len(names) > 1:
-        return [AddReg(n, type, posedge, negedge, nodefault, async) for n in names]
+        return [AddReg(n, type, posedge, negedge, nodefault, async_, reset, reset_value) for n in names]
     assert len(names) == 1
     name = names[0]
 
     if not isinstance(type, int):
-        return AddPort(name, type, "register", posedge=posedge, negedge=negedge, nodefault=nodefault, async=async)
+        return AddPort(name, type, "register", posedge=posedge, negedge=negedge, nodefault=nodefault, async_=async_,
+                reset=reset, reset_value=reset_value)
 
     module = tls.ChipyCurrentContext.module
 
@@ -853,42 +1733,57 @@ def AddReg(name, type=1, posedge=None, negedge=None, nodefault=False, async=None
     signal.set_materialize()
 
     if posedge is not None or negedge is not None:
-        AddFF(signal, posedge=posedge, negedge=negedge, nodefault=nodefault)
+        AddFF(signal, posedge=posedge, negedge=negedge, nodefault=nodefault, reset=reset, reset_value=reset_value)
 
-    if async:
+    if async_:
         AddAsync(signal)
 
     return signal
 
 
-def AddMemory(name, type, depth, posedge=None, negedge=None):
+def AddMemory(name, type, depth, posedge=None, negedge=None, init=None):
     raiseOutsideContext('AddMemory')
 
     names = name.split()
     if len(names) > 1:
-        return [AddMemory(n, type, depth, posedge, negedge) for n in names]
+        return [AddMemory(n, type, depth, posedge, negedge, init) for n in names]
     assert len(names) == 1
     name = names[0]
 
     module = tls.ChipyCurrentContext.module
 
     if isinstance(type, int):
-        return ChipyMemory(module, abs(type), depth, name, posedge=posedge, negedge=negedge, signed=(type < 0))
+        return ChipyMemory(module, abs(type), depth, name, posedge=posedge, negedge=negedge, signed=(type < 0), init=init)
+
+    if init is not None and not isinstance(init, dict):
+        raise ChipyError('Initial contents of memory bundle {} must be a dict'.format(name))
 
     bundle = Bundle()
     prefix = (name + "__") if name != "" else ""
 
     def addport(port_name, port_type, port_role=None, output=False):
-        bundle.add(port_name, AddMemory(prefix + port_name, port_type, depth, posedge=posedge, negedge=negedge))
+        port_init = None if init is None else init.get(port_name)
+        bundle.add(port_name, AddMemory(prefix + port_name, port_type, depth, posedge=posedge, negedge=negedge, init=port_init))
 
     type(addport, "memory")
     return bundle
 
 
-def AddFF(signal, posedge=None, negedge=None, nodefault=False):
+def Reset(signal, sync=True, activelow=False):
+    return ChipyReset(Sig(signal), sync=sync, activelow=activelow)
+
+
+def DefaultReset(reset):
+    raiseOutsideContext('DefaultReset')
+    if isinstance(reset, ChipySignal):
+        reset = Reset(reset)
+    tls.ChipyCurrentContext.module.default_reset = reset
+
+
+def AddFF(signal, posedge=None, negedge=None, nodefault=False, reset=None, reset_value=0):
     if isinstance(signal, ChipyBundle):
         for member in signal.members.values():
-            AddFF(member, posedge=posedge, negedge=negedge, nodefault=nodefault)
+            AddFF(member, posedge=posedge, negedge=negedge, nodefault=nodefault, reset=reset, reset_value=reset_value)
         return
 
     if not signal.register:
@@ -896,26 +1791,39 @@ def AddFF(signal, posedge=None, negedge=None, nodefault=False):
     if signal.regaction:
         raise ChipyError('AddFF called on register with regaction already set')
 
+    codeloc = ChipyCodeLoc()
     snippet = ChipySnippet()
     if nodefault:
-        snippet.text_lines.append(snippet.indent_str + "%s = %d'bx; // %s" % (signal.vlog_lvalue, signal.width, ChipyCodeLoc()))
+        snippet.text_lines.append(snippet.indent_str + "%s = %d'bx; // %s" % (signal.vlog_lvalue, signal.width, codeloc))
+        snippet.stmts.append(ChipyStmt("assign", codeloc, lhs=signal, rhs=None))
     else:
-        snippet.text_lines.append(snippet.indent_str + "%s = %s; // %s" % (signal.vlog_lvalue, signal.name, ChipyCodeLoc()))
-    snippet.lvalue_signals[signal.name] = signal
+        snippet.text_lines.append(snippet.indent_str + "%s = %s; // %s" % (signal.vlog_lvalue, signal.name, codeloc))
+        snippet.stmts.append(ChipyStmt("assign", codeloc, lhs=signal, rhs=signal))
+    snippet.lvalue_signals[signal.name] = (1 << signal.width) - 1
     signal.module.init_snippets.append(snippet)
 
     if (posedge is None) == (negedge is None):
         raise ValueError('posedge XOR negedge must be given')
 
-    if posedge is not None:
-        signal.module.regactions.append("  always @(posedge %s) %s <= %s; // %s" % (posedge.name, signal.name, signal.vlog_lvalue, ChipyCodeLoc()))
-        signal.vlog_reg = True
+    if reset is None:
+        reset = signal.module.default_reset
+    elif reset is False:
+        reset = None
+    elif isinstance(reset, ChipySignal):
+        reset = Reset(reset)
 
-    if negedge is not None:
-        signal.module.regactions.append("  always @(negedge %s) %s <= %s; // %s" % (posedge.name, signal.name, signal.vlog_lvalue, ChipyCodeLoc()))
-        signal.vlog_reg = True
+    if posedge is not None:
+        domain = signal.module.clock_domain("posedge", posedge, reset)
+    else:
+        domain = signal.module.clock_domain("negedge", negedge, reset)
 
+    domain.registers.append((signal, ChipyCodeLoc()))
+    if reset is not None:
+        signal.reset_value = reset_value
+    signal.vlog_reg = True
     signal.regaction = True
+    signal.regkind = "ff"
+    signal.domain = domain
 
 
 def AddAsync(signal):
@@ -929,13 +1837,16 @@ def AddAsync(signal):
     if signal.regaction:
         raise ChipyError('AddAsync called on register with regaction already set')
 
+    codeloc = ChipyCodeLoc()
     snippet = ChipySnippet()
-    snippet.text_lines.append(snippet.indent_str + "%s = %d'bx; // %s" % (signal.vlog_lvalue, signal.width, ChipyCodeLoc()))
-    snippet.lvalue_signals[signal.name] = signal
+    snippet.text_lines.append(snippet.indent_str + "%s = %d'bx; // %s" % (signal.vlog_lvalue, signal.width, codeloc))
+    snippet.stmts.append(ChipyStmt("assign", codeloc, lhs=signal, rhs=None))
+    snippet.lvalue_signals[signal.name] = (1 << signal.width) - 1
     signal.module.init_snippets.append(snippet)
 
     signal.module.regactions.append("  assign %s = %s; // %s" % (signal.name, signal.vlog_lvalue, ChipyCodeLoc()))
     signal.regaction = True
+    signal.regkind = "async"
 
 
 def AddInst(name, type):
@@ -959,12 +1870,17 @@ def AddInst(name, type):
 
 
 def Cond(cond, if_val, else_val):
+    if isinstance(if_val, ChipyBundle):
+        return ChipyBundleMap(lambda if_member, else_member: Cond(cond, if_member, else_member), [if_val, else_val])
+
     module = ChipySameModule([cond.module, if_val.module, else_val.module])
 
-    signal = ChipySignal(module)
+    signal = ChipySignal(module, key=("?:", cond.name, if_val.name, else_val.name))
     signal.signed = if_val.signed and else_val.signed
     signal.width = max(if_val.width, else_val.width)
     signal.vlog_rvalue = "%s ? %s : %s" % (cond.name, if_val.name, else_val.name)
+    signal.op = "?:"
+    signal.args = (cond, if_val, else_val)
     signal.deps[cond.name] = cond
     signal.deps[if_val.name] = if_val
     signal.deps[else_val.name] = else_val
@@ -972,10 +1888,15 @@ def Cond(cond, if_val, else_val):
 
 
 def Concat(sigs):
+    sigs = list(sigs)
+    if sigs and isinstance(sigs[0], ChipyBundle):
+        return ChipyBundleMap(lambda *members: Concat(members), sigs, "concat")
+
     module = None
     width = 0
     rvalues = list()
     lvalues = list()
+    args = list()
     deps = dict()
 
     if tls.ChipyCurrentContext is not None:
@@ -999,15 +1920,18 @@ def Concat(sigs):
 
         width += sig.width
         rvalues.append(sig.name)
+        args.append(sig)
         deps[sig.name] = sig
 
     if module is None:
         raise ChipyError('Cannot infer module in Concat. Make sure this is either called from within a module context '
                 'or one of the concatenated signals is from within a module.')
 
-    signal = ChipySignal(module)
+    signal = ChipySignal(module, key=("{}",) + tuple(rvalues))
     signal.width = width
     signal.vlog_rvalue = "{%s}" % ",".join(rvalues)
+    signal.op = "{}"
+    signal.args = tuple(args)
     if lvalues is not None:
         signal.vlog_lvalue = "{%s}" % ",".join(lvalues)
     signal.deps.update(deps)
@@ -1021,9 +1945,12 @@ def Repeat(num, sig):
     if tls.ChipyCurrentContext is not None:
         module = tls.ChipyCurrentContext.module
 
-    signal = ChipySignal(module)
+    signal = ChipySignal(module, key=("{{}}", num, sig.name))
     signal.width = num * sig.width
     signal.vlog_rvalue = "{%d{%s}}" % (num, sig.name)
+    signal.op = "{{}}"
+    signal.args = (sig,)
+    signal.param = num
     signal.deps[sig.name] = sig
 
     return signal
@@ -1035,11 +1962,8 @@ def Connect(first, second, *rest):
     sigs = [first, second, *rest]
 
     if isinstance(first, ChipyBundle):
-        for sig in sigs:
-            if not isinstance(sig, ChipyBundle):
-                raise ValueError('Can only connect bundles with other bundles')
-        for member in first.keys():
-            Connect(*[sig.get(member) for sig in sigs])
+        for member in ChipyBundleKeys(sigs, "connect", exact=False):
+            Connect(*[sig.members[member] for sig in sigs])
         return
 
     checkreg = lambda sig: not sig.register or sig.regaction or sig.gotassign
@@ -1054,24 +1978,27 @@ def Connect(first, second, *rest):
             ','.join(sig.name for sig in masters)))
 
     master_sig, = masters
+    master_sig.set_materialize()
 
     module = tls.ChipyCurrentContext.module
 
+    codeloc = ChipyCodeLoc()
     for sig in slave_sigs:
-        module.regactions.append("  assign %s = %s; // %s" % (sig.name, master_sig.name, ChipyCodeLoc()))
+        module.regactions.append("  assign %s = %s; // %s" % (sig.name, master_sig.name, codeloc))
+        module.depgraph.setdefault(sig.name, dict())[master_sig.name] = (master_sig, codeloc, (1 << sig.width) - 1)
         sig.portalias = master_sig.name
+        sig.portmaster = master_sig
         sig.register = False
         sig.regaction = False
+        sig.regkind = None
         sig.gotassign = False
         sig.vlog_reg = False
 
 
 def Assign(lhs, rhs):
     if isinstance(lhs, ChipyBundle):
-        if not isinstance(rhs, ChipyBundle):
-            raise ValueError('Can only assign bundles with other bundles')
-        for member in lhs.members.keys():
-            Assign(lhs.get(member), rhs.get(member))
+        for member in ChipyBundleKeys([lhs, rhs], "assign", exact=False):
+            Assign(lhs.members[member], rhs.members[member])
         return
 
     lhs = Sig(lhs)
@@ -1080,42 +2007,67 @@ def Assign(lhs, rhs):
     rhs.set_materialize()
 
     if lhs.memory is not None:
+        if lhs.memory.posedge is None and lhs.memory.negedge is None:
+            raise ChipyError('Memory {} has no clock, use a write port to write to it'.format(lhs.memory.name))
         module = lhs.module
-        wen = ChipySignal(module)
+        wen = ChipySignal(module, key=("wen", lhs.vlog_rvalue))
         wen.vlog_reg = True
+        wen.vlog_lvalue = wen.name
         wen.gotassign = True
         wen.set_materialize()
+        for dep in lhs.deps.values():
+            dep.set_materialize()
 
+        codeloc = ChipyCodeLoc()
         snippet = ChipySnippet()
-        snippet.text_lines.append(snippet.indent_str + "%s = 1'b0; // %s" % (wen.name, ChipyCodeLoc()))
-        snippet.lvalue_signals[wen.name] = wen
+        snippet.text_lines.append(snippet.indent_str + "%s = 1'b0; // %s" % (wen.name, codeloc))
+        snippet.stmts.append(ChipyStmt("assign", codeloc, lhs=wen, rhs=Sig(0, 1)))
+        snippet.lvalue_signals[wen.name] = 1
         module.init_snippets.append(snippet)
 
         with ChipyContext() as ctx:
-            ctx.add_line("%s = 1'b1; // %s" % (wen.name, ChipyCodeLoc()), wen.get_deps())
+            ctx.add_line("%s = 1'b1; // %s" % (wen.name, codeloc), {wen.name: 1})
+            ctx.add_stmt(ChipyStmt("assign", codeloc, lhs=wen, rhs=Sig(1, 1)))
 
-        lhs.memory.regactions.append("if (%s) %s <= %s; // %s" % (wen.name, lhs.vlog_rvalue, rhs.name, ChipyCodeLoc()))
+        lhs.memory.regactions.append("if (%s) %s <= %s; // %s" % (wen.name, lhs.vlog_rvalue, rhs.name, codeloc))
+        lhs.memory.writes.append((wen, lhs, rhs))
 
         return
 
     with ChipyContext() as ctx:
         if lhs.vlog_lvalue is None:
             raise ValueError('Trying to assign to signal with unset lvalue')
-        lhs_deps = lhs.get_deps()
-        for lhs_dep in lhs_deps.values():
-            lhs_dep.gotassign = True
-
-        ctx.add_line("%s = %s; // %s" % (lhs.vlog_lvalue, rhs.name, ChipyCodeLoc()), lhs_deps)
+        # Only the assigned signals count as lvalues, not the signals used
+        # to compute the bit positions.
+        bits, indices = ChipyLvalueBits(lhs)
+        lhs.gotassign = True
+        for base, may, must in bits.values():
+            base.gotassign = True
+
+        codeloc = ChipyCodeLoc()
+        deps = [rhs] + indices + ChipyContextConds(ctx.parent)
+        for name, (base, may, must) in bits.items():
+            edges = lhs.module.depgraph.setdefault(name, dict())
+            for dep in deps:
+                if dep.module is lhs.module:
+                    dep, loc, mask = edges.get(dep.name, (dep, codeloc, 0))
+                    edges[dep.name] = (dep, loc, mask | may)
+
+        ctx.add_line("%s = %s; // %s" % (lhs.vlog_lvalue, rhs.name, codeloc),
+                {name: may for name, (base, may, must) in bits.items()})
+        ctx.add_stmt(ChipyStmt("assign", codeloc, lhs=lhs, rhs=rhs))
 
 
 def Sig(arg, width=None):
     if isinstance(arg, ChipySignal,):
         if width is not None:
             module = ChipySameModule([arg.module])
-            signal = ChipySignal(module)
+            signal = ChipySignal(module, key=("cast", arg.name, width))
             signal.signed = width < 0
             signal.width = abs(width)
             signal.vlog_rvalue = arg.name
+            signal.op = "cast"
+            signal.args = (arg,)
             signal.deps[arg.name] = arg
             return signal
         return arg
@@ -1138,6 +2090,8 @@ def Sig(arg, width=None):
         signal = ChipySignal(None, "%s'%sd%d" % (abs(width), "s" if width < 0 else "", arg), True)
         signal.signed = width < 0
         signal.width = abs(width)
+        signal.op = "const"
+        signal.param = arg
         return signal
 
     raise TypeError('Cannot construct Sig from object of type {}'.format(type(arg)))
@@ -1145,9 +2099,13 @@ def Sig(arg, width=None):
 
 @contextmanager
 def If(cond):
+    cond = Sig(cond)
+
     tls.ChipyElseContext = None
     cond.set_materialize()
-    with ChipyContext().block("if (%s) begin // %s" % (cond.name, ChipyCodeLoc())) as ctx:
+    codeloc = ChipyCodeLoc()
+    stmt = ChipyStmt("if", codeloc, cond=cond, orelse=None, else_codeloc=None, elseif=False)
+    with ChipyContext().block("if (%s) begin // %s" % (cond.name, codeloc), stmt=stmt) as ctx:
         yield
         tls.ChipyElseContext = ctx
 
@@ -1156,9 +2114,16 @@ def If(cond):
 def ElseIf(cond):
     cond = Sig(cond)
 
+    ctx = tls.ChipyElseContext
+    if ctx is None:
+        raise ChipyError('Cannot find matching If/IfElse for ElseIf')
     tls.ChipyElseContext = None
     cond.set_materialize()
-    with tls.ChipyElseContext.block("else if (%s) begin // %s" % (cond.name, ChipyCodeLoc())) as ctx:
+    codeloc = ChipyCodeLoc()
+    ctx.stmt.orelse = list()
+    ctx.body = ctx.stmt.orelse
+    stmt = ChipyStmt("if", codeloc, cond=cond, orelse=None, else_codeloc=None, elseif=True)
+    with ctx.block("else if (%s) begin // %s" % (cond.name, codeloc), stmt=stmt) as ctx:
         yield
         tls.ChipyElseContext = ctx
 
@@ -1168,7 +2133,11 @@ def Else():
     if tls.ChipyElseContext is None:
         raise ChipyError('Cannot find matching If/IfElse for Else')
     with tls.ChipyElseContext as ctx:
-        ctx.add_line("else begin // %s" % ChipyCodeLoc())
+        codeloc = ChipyCodeLoc()
+        ctx.add_line("else begin // %s" % codeloc)
+        ctx.stmt.orelse = list()
+        ctx.stmt.else_codeloc = codeloc
+        ctx.body = ctx.stmt.orelse
         ctx.add_indent()
 
         yield
@@ -1178,30 +2147,193 @@ def Else():
         ctx.add_line("end")
 
 
+# Limits for lowering Switch blocks: maximum number of bits in a lookup
+# table and maximum selector width for a balanced mux tree. Wider selectors
+# use an AND-OR one-hot mux.
+ChipySwitchRomBits = 1 << 16
+ChipySwitchMuxBits = 6
+
+
+def ChipyVlogSigned(sig):
+    # Only ports and constants are declared signed in the generated code.
+    return sig.signed and (sig.op == "const" or sig.inport or sig.outport)
+
+
+def ChipyConstValue(sig, width):
+    value = sig.param & ((1 << sig.width) - 1)
+    if sig.signed and value >> (sig.width - 1):
+        value -= 1 << sig.width
+    return value & ((1 << width) - 1)
+
+
+def ChipyFitExpr(sig, width):
+    # Returns a width bits wide expression with the value that an assignment
+    # of sig to a width bits wide lvalue would assign.
+    if sig.op == "const":
+        return "%d'h%x" % (width, ChipyConstValue(sig, width))
+    if sig.width == width:
+        return sig.name
+    if sig.width > width:
+        return "%s[%d:0]" % (sig.name, width-1)
+    if ChipyVlogSigned(sig):
+        msb = sig.name if sig.width == 1 else "%s[%d]" % (sig.name, sig.width-1)
+        return "{{%d{%s}},%s}" % (width - sig.width, msb, sig.name)
+    return "{%d'd0,%s}" % (width - sig.width, sig.name)
+
+
+def ChipyCaseTable(stmt):
+    # Returns the list of case bodies selected by each value of the switch
+    # expression (None if no case matches) if all case labels are constants.
+    expr = stmt.expr
+    if ChipyVlogSigned(expr) or expr.width > 16:
+        return None
+    table = [None] * (1 << expr.width)
+    default = None
+    for case in stmt.body:
+        if case.label is None:
+            if default is None:
+                default = case.body
+            continue
+        if case.label.op != "const":
+            return None
+        index = case.label.param & ((1 << case.label.width) - 1)
+        if index < len(table) and table[index] is None:
+            table[index] = case.body
+    return [default if body is None else body for body in table]
+
+
+def ChipyParallelCase(stmt):
+    labels = [case.label for case in stmt.body if case.label is not None]
+    if not all(label.op == "const" for label in labels):
+        return False
+    values = {label.param & ((1 << label.width) - 1) for label in labels}
+    return len(values) == len(labels)
+
+
+def ChipyLowerSwitch(stmt):
+    # Returns a list of (lvalue, expression) assignments that implement the
+    # switch statement, or None if it can not be lowered. This is possible if
+    # all case labels are constants and the case bodies only contain plain
+    # assignments to non-overlapping lvalues.
+    table = ChipyCaseTable(stmt)
+    if table is None:
+        return None
+
+    targets = dict()
+    bases = set()
+    for case in stmt.body:
+        for s in case.body:
+            if s.kind != "assign" or s.rhs is None:
+                return None
+            key = s.lhs.vlog_lvalue
+            if key in targets:
+                continue
+            bits, indices = ChipyLvalueBits(s.lhs)
+            if indices or not bases.isdisjoint(bits):
+                return None
+            bases.update(bits)
+            targets[key] = s.lhs
+
+    module = stmt.expr.module
+    sel = stmt.expr.name
+    selbits = stmt.expr.width
+    assignments = list()
+
+    for key, lhs in targets.items():
+        width = lhs.width
+        values = list()
+        for body in table:
+            value = None
+            for s in body or []:
+                if s.lhs.vlog_lvalue == key:
+                    value = s.rhs
+            values.append(value)
+
+        if all(v is not None and v.op == "const" for v in values) and len(values) * width <= ChipySwitchRomBits:
+            data = 0
+            for index, value in enumerate(values):
+                data |= ChipyConstValue(value, width) << (index * width)
+            rom = ChipySignal(module, key=("rom", selbits, width, data))
+            rom.width = len(values) * width
+            rom.vlog_rvalue = "%d'h%x" % (rom.width, data)
+            rom.op = "const"
+            rom.param = data
+            rom.set_materialize()
+            if width == 1:
+                assignments.append((key, "%s[%s]" % (rom.name, sel)))
+            else:
+                assignments.append((key, "%s[%s * %d +: %d]" % (rom.name, sel, width, width)))
+            continue
+
+        exprs = [key if v is None else ChipyFitExpr(v, width) for v in values]
+
+        if selbits <= ChipySwitchMuxBits:
+            def tree(lo, bit):
+                if bit < 0:
+                    return exprs[lo]
+                a = tree(lo, bit-1)
+                b = tree(lo + (1 << bit), bit-1)
+                if a == b:
+                    return a
+                cond = sel if selbits == 1 else "%s[%d]" % (sel, bit)
+                return "(%s ? %s : %s)" % (cond, b, a)
+            assignments.append((key, tree(0, selbits-1)))
+            continue
+
+        terms = list()
+        for case in stmt.body:
+            if case.label is None:
+                continue
+            index = case.label.param & ((1 << case.label.width) - 1)
+            if index >= len(exprs) or exprs[index] is None:
+                continue
+            terms.append(("%s == %d'h%x" % (sel, selbits, index), exprs[index]))
+            exprs[index] = None
+        fallback = [e for e in exprs if e is not None]
+        if fallback:
+            terms.append(("!(%s)" % " || ".join(cond for cond, e in terms) if terms else "1'b1", fallback[0]))
+        assignments.append((key, " | ".join("({%d{%s}} & %s)" % (width, cond, e) for cond, e in terms)))
+
+    return assignments
+
+
 @contextmanager
-def Switch(expr, parallel=False, full=False):
+def Switch(expr, parallel=False, full=False, lower=True):
     expr = Sig(expr)
 
     tls.ChipyElseContext = None
-    ctx = ChipyContext()
     expr.set_materialize()
-    if parallel:
-        ctx.add_line("(* parallel_case *)")
+    codeloc = ChipyCodeLoc()
+    begin = "case (%s) // %s" % (expr.name, codeloc)
     if full:
-        ctx.add_line("(* full_case *)")
-    with ctx.block(
-            begin="case (%s) // %s" % (expr.name, ChipyCodeLoc()),
-            end='endcase'):
+        begin = "(* full_case *) " + begin
+    if parallel:
+        begin = "(* parallel_case *) " + begin
+    stmt = ChipyStmt("switch", codeloc, expr=expr, parallel=parallel, full=full)
+    with ChipyContext().block(begin=begin, end='endcase', stmt=stmt) as ctx:
+        snippet = ctx.snippet
+        start = len(snippet.text_lines) - 1
+        indent = snippet.indent_str[:-2]
         yield
         tls.ChipyElseContext = None
 
+    # Replace the case statement with mux trees or lookup tables if possible,
+    # otherwise mark it parallel_case if the case labels are distinct constants.
+    assignments = ChipyLowerSwitch(stmt) if lower else None
+    if assignments is not None:
+        snippet.text_lines[start:] = ["%s%s = %s; // %s" % (indent, key, value, codeloc) for key, value in assignments]
+    elif not parallel and ChipyParallelCase(stmt):
+        snippet.text_lines[start] = indent + "(* parallel_case *) " + begin
+
 
 @contextmanager
 def Case(expr):
     expr = Sig(expr)
     expr.set_materialize()
     tls.ChipyElseContext = None
-    with ChipyContext().block("%s: begin // %s" % (expr.name, ChipyCodeLoc())) as ctx:
+    codeloc = ChipyCodeLoc()
+    stmt = ChipyStmt("case", codeloc, label=expr)
+    with ChipyContext().block("%s: begin // %s" % (expr.name, codeloc), stmt=stmt) as ctx:
         yield
         tls.ChipyElseContext = None
 
@@ -1209,7 +2341,9 @@ def Case(expr):
 @contextmanager
 def Default():
     tls.ChipyElseContext = None
-    with ChipyContext().block("default: begin // %s" % ChipyCodeLoc()) as ctx:
+    codeloc = ChipyCodeLoc()
+    stmt = ChipyStmt("case", codeloc, label=None)
+    with ChipyContext().block("default: begin // %s" % codeloc, stmt=stmt) as ctx:
         yield
         tls.ChipyElseContext = None
 
@@ -1226,7 +2360,171 @@ def Stream(data_type, last=False, destbits=0):
     return callback
 
 
-def WriteVerilog(f):
+class ChipyBackgroundWriter:
+    # File-like object that collects the written text in chunks and writes
+    # them to the (compressed) file f in a background thread, so that code
+    # generation and compression run in parallel.
+    def __init__(self, f, name, chunksize=1 << 20):
+        self.f = f
+        self.name = name
+        self.chunksize = chunksize
+        self.chunk = list()
+        self.chunklen = 0
+        self.error = None
+        self.queue = queue.Queue(maxsize=16)
+        self.thread = threading.Thread(target=self.worker, daemon=True)
+        self.thread.start()
+
+    def worker(self):
+        while True:
+            data = self.queue.get()
+            if data is None:
+                break
+            if self.error is None:
+                try:
+                    self.f.write(data)
+                except BaseException as e:
+                    self.error = e
+
+    def write(self, text):
+        self.chunk.append(text)
+        self.chunklen += len(text)
+        if self.chunklen >= self.chunksize:
+            self.flush()
+        return len(text)
+
+    def flush(self):
+        if self.error is not None:
+            raise self.error
+        if len(self.chunk) != 0:
+            self.queue.put("".join(self.chunk).encode())
+            self.chunk = list()
+            self.chunklen = 0
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            self.queue.put(None)
+            self.thread.join()
+            self.f.close()
+        if self.error is not None:
+            raise self.error
+
+
+def ChipyOpenCompressed(path, level=None):
+    # Opens path for writing, compressed according to its suffix (.gz, .xz or
+    # .zst), in a background writer. Returns None for uncompressed files.
+    base, ext = os.path.splitext(path)
+
+    if ext == ".gz":
+        import gzip
+        f = gzip.open(path, "wb", compresslevel=(9 if level is None else level))
+    elif ext == ".xz":
+        import lzma
+        f = lzma.open(path, "wb", preset=level)
+    elif ext == ".zst":
+        try:
+            import zstandard
+        except ImportError:
+            raise ChipyError('Writing {} requires the zstandard module'.format(path))
+        cctx = zstandard.ZstdCompressor(level=(3 if level is None else level))
+        f = cctx.stream_writer(open(path, "wb"))
+    else:
+        return None
+
+    return ChipyBackgroundWriter(f, base)
+
+
+def WriteVerilog(f, level=None):
+    if isinstance(f, (str, os.PathLike)):
+        path = os.fspath(f)
+        f = ChipyOpenCompressed(path, level)
+        if f is None:
+            f = open(path, "w")
+        # A partially written file would still be a valid (compressed) file,
+        # so it is removed when writing fails.
+        try:
+            try:
+                WriteVerilog(f)
+            finally:
+                f.close()
+        except BaseException:
+            os.remove(path)
+            raise
+        return
+
     print("// Generated using Chipy (Constructing Hardware In PYthon)", file=f)
     for modname, module in tls.ChipyModulesDict.items():
         module.write_verilog(f)
+
+
+def ChipyModuleOrder():
+    # Returns the module names in dependency order, i.e. each module after
+    # all modules instantiated by it.
+    order = list()
+    done = set()
+    for top in tls.ChipyModulesDict:
+        stack = [(top, False)]
+        while stack:
+            modname, expanded = stack.pop()
+            if modname in done or modname not in tls.ChipyModulesDict:
+                continue
+            if expanded:
+                done.add(modname)
+                order.append(modname)
+                continue
+            stack.append((modname, True))
+            for inst in reversed(tls.ChipyModulesDict[modname].instances):
+                stack.append((inst[1], False))
+    return order
+
+
+def ChipyWriteIfChanged(filename, text):
+    if os.path.exists(filename):
+        with open(filename) as f:
+            if f.read() == text:
+                return False
+    with open(filename, "w") as f:
+        f.write(text)
+    return True
+
+
+def WriteVerilogDir(path, filelist="files.f"):
+    path = os.path.abspath(path)
+    os.makedirs(path, exist_ok=True)
+
+    # modules listed by the previous run, whose files may be stale now
+    modnames = list(ChipyModuleOrder())
+    oldnames = set()
+    if os.path.exists(os.path.join(path, filelist)):
+        with open(os.path.join(path, filelist)) as f:
+            for line in f:
+                if line.strip().endswith(".v"):
+                    oldnames.add(os.path.basename(line.strip())[:-2])
+
+    files = dict()
+    sidecars = dict()
+    for modname in modnames:
+        buf = io.StringIO()
+        buf.name = os.path.join(path, modname + ".v")
+        buf.sidecars = sidecars
+        print("// Generated using Chipy (Constructing Hardware In PYthon)", file=buf)
+        tls.ChipyModulesDict[modname].write_verilog(buf)
+        files[buf.name] = buf.getvalue()
+
+    files[os.path.join(path, filelist)] = "".join(filename + "\n" for filename in files)
+    files.update(sidecars)
+
+    stale = [os.path.join(path, name + ".v") for name in oldnames]
+    prefixes = tuple("%s_%s_" % (name, name) for name in oldnames.union(modnames))
+    stale += [os.path.join(path, filename) for filename in os.listdir(path)
+            if filename.startswith(prefixes) and filename.endswith(".hex")]
+    for filename in stale:
+        if filename not in files and os.path.exists(filename):
+            os.remove(filename)
+
+    import concurrent.futures
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        changed = executor.map(lambda item: ChipyWriteIfChanged(*item), files.items())
+        return [filename for filename, written in zip(files, list(changed)) if written]
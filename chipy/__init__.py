@@ -1 +1,67 @@
+#
+#  Chipy -- Constructing Hardware In PYthon
+#
+#  Copyright (C) 2016  Clifford Wolf <clifford@clifford.at>
+#
+#  Permission to use, copy, modify, and/or distribute this software for any
+#  purpose with or without fee is hereby granted, provided that the above
+#  copyright notice and this permission notice appear in all copies.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+#  WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+#  MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+#  ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+#  WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+#  ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+#  OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+#
+
+# Only the core API in chipy.Chipy is imported with the package. The other
+# modules are imported when one of their names is first accessed.
+
+import importlib
+import sys
+
+__version__ = "0.1.1"
+
 from chipy.Chipy import *
+
+# The documented entry points of the other modules
+_lazy_modules = {
+    "chipy.analysis": ("TimingWeights", "ClockDomainCrossings", "WriteCDCReport", "TimingAnalysis", "WriteTimingReport",
+            "CheckLatches", "CheckDesign", "CheckCombLoops"),
+    "chipy.transform": ("Pipeline", "Flatten", "Uniquify", "ShareModules"),
+    "chipy.export": ("WriteJSON", "WriteBLIF"),
+    "chipy.aio": ("NewDesign", "ElaborateAsync", "WriteVerilogAsync"),
+    "chipy.sim": ("CheckEquiv", "Simulation", "MergeCoverage", "Waveform"),
+    "chipy.aig": ("WriteAIGER", "WriteDIMACS", "AIGSize"),
+}
+
+_lazy_names = {name: modname for modname, names in _lazy_modules.items() for name in names}
+
+# The public core API, without the Chipy* helpers and the modules imported by
+# chipy.Chipy. The lazily imported names are not part of it, so that
+# "from chipy import *" does not import the other modules; import them by name
+# (e.g. "from chipy import Simulation") instead.
+__all__ = ["ChipyError", "ChipyLatchWarning", "ChipyLoopWarning", "ResetDesign", "Param", "WidthMode", "Bundle",
+        "Zip", "Module", "AddModule", "AddInput", "AddOutput", "AddPort", "AddReg", "AddMemory", "Reset",
+        "DefaultReset", "AddFF", "AddAsync", "AddInst", "Cond", "Concat", "Repeat", "Connect", "Assign", "Sig", "If",
+        "ElseIf", "Else", "Switch", "Case", "Default", "Stream", "WriteVerilog", "WriteVerilogDir"]
+
+
+def __getattr__(name):
+    if name not in _lazy_names:
+        raise AttributeError("module 'chipy' has no attribute '%s'" % name)
+    value = getattr(importlib.import_module(_lazy_names[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_names))
+
+
+# Module __getattr__ requires Python 3.7, older versions import all names now.
+if sys.version_info < (3, 7):
+    for _name in _lazy_names:
+        __getattr__(_name)
@@ -0,0 +1,270 @@
+#
+#  Chipy -- Constructing Hardware In PYthon
+#
+#  Copyright (C) 2016  Clifford Wolf <clifford@clifford.at>
+#
+#  Permission to use, copy, modify, and/or distribute this software for any
+#  purpose with or without fee is hereby granted, provided that the above
+#  copyright notice and this permission notice appear in all copies.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+#  WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+#  MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+#  ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+#  WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+#  ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+#  OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+#
+
+import os
+
+from chipy.Chipy import tls, ChipyError, ChipyModule, Module
+from chipy.sim import ChipyBlaster, ChipyClockInputs
+
+
+class ChipyAIG:
+    # And-Inverter Graph with structural hashing. Literals are 2*node+inverted,
+    # node 0 is constant false. 'bx constants become 0; registers without
+    # reset value are uninitialized latches. With a second module gate the
+    # graph is a miter with one output that is 1 when the outputs differ.
+    def __init__(self, module, gate=None):
+        self.nodes = [("0",)]
+        self.hash = dict()
+        self.inputs = dict()
+        self.symbols = dict()
+        self.latches = list()
+        self.outputs = list()
+
+        modules = [module] if gate is None else [module, gate]
+        modules = [m if isinstance(m, ChipyModule) else tls.ChipyModulesDict[m] for m in modules]
+        blasters = [ChipyBlaster(m) for m in modules]
+        clocks = set()
+        for blaster in blasters:
+            clocks |= ChipyClockInputs(blaster)
+
+        for name, nodes in sorted(blasters[0].inputs):
+            if name in clocks:
+                continue
+            for i in range(len(nodes)):
+                self.inputs["%s[%d]" % (name, i)] = self.leaf("input")
+                self.symbols["%s[%d]" % (name, i)] = name if len(nodes) == 1 else "%s[%d]" % (name, i)
+
+        outputs = list()
+        for idx, blaster in enumerate(blasters):
+            prefix = "" if gate is None else ("gold.", "gate.")[idx]
+            outputs.append(self.add(blaster, prefix))
+
+        if gate is None:
+            for name, lits in sorted(outputs[0].items()):
+                for i, lit in enumerate(lits):
+                    self.outputs.append((name if len(lits) == 1 else "%s[%d]" % (name, i), lit))
+        else:
+            if set(outputs[0]) != set(outputs[1]):
+                raise ChipyError('Output ports of {} and {} do not match'.format(modules[0].name, modules[1].name))
+            trigger = 0
+            for name in sorted(outputs[0]):
+                for a, b in zip(outputs[0][name], outputs[1][name]):
+                    trigger = self.OR(trigger, self.XOR(a, b))
+            self.outputs.append(("trigger", trigger))
+
+    def leaf(self, kind):
+        self.nodes.append((kind,))
+        return 2 * (len(self.nodes) - 1)
+
+    def AND(self, a, b):
+        if a > b:
+            a, b = b, a
+        if a == 0 or a == (b ^ 1):
+            return 0
+        if a == 1 or a == b:
+            return b
+        key = (b, a)
+        if key not in self.hash:
+            self.nodes.append(("and", b, a))
+            self.hash[key] = 2 * (len(self.nodes) - 1)
+        return self.hash[key]
+
+    def OR(self, a, b):
+        return self.AND(a ^ 1, b ^ 1) ^ 1
+
+    def XOR(self, a, b):
+        return self.OR(self.AND(a, b ^ 1), self.AND(a ^ 1, b))
+
+    def MUX(self, s, a, b):
+        return self.OR(self.AND(s, b), self.AND(s ^ 1, a))
+
+    def add(self, blaster, prefix):
+        lits = [0, 1, 0]
+        latches = dict()
+        for idx in range(3, len(blaster.g.nodes)):
+            node = blaster.g.nodes[idx]
+            kind = node[0]
+            if kind == "input":
+                lits.append(self.inputs.get(node[1], 0))
+            elif kind == "state":
+                lits.append(self.leaf("latch"))
+                latches[idx] = prefix + node[1]
+            elif kind == "not":
+                lits.append(lits[node[1]] ^ 1)
+            else:
+                args = [lits[arg] for arg in node[1:]]
+                lits.append(getattr(self, kind.upper())(*args))
+
+        for name, q, d, init in blaster.states:
+            init = {0: 0, 1: 1}.get(init)
+            self.latches.append((prefix + name, lits[q], lits[d], init))
+
+        return {name: [lits[n] for n in nodes] for name, nodes in blaster.outputs.items()}
+
+    def reachable(self):
+        # Returns the sorted list of nodes in the cone of influence of the
+        # outputs, and the list of latches in it.
+        latch_of = {q >> 1: (name, q, d, init) for name, q, d, init in self.latches}
+        seen = set()
+        stack = [lit >> 1 for name, lit in self.outputs]
+        while stack:
+            node = stack.pop()
+            if node in seen or node == 0:
+                continue
+            seen.add(node)
+            if self.nodes[node][0] == "and":
+                stack.extend(arg >> 1 for arg in self.nodes[node][1:])
+            elif node in latch_of:
+                stack.append(latch_of[node][2] >> 1)
+        latches = [latch for latch in self.latches if (latch[1] >> 1) in seen]
+        return sorted(seen), latches
+
+    def numbering(self):
+        # AIGER variable numbers: inputs, latches, then AND gates in
+        # topological order.
+        nodes, latches = self.reachable()
+        var = {0: 0}
+        for name, lit in sorted(self.inputs.items(), key=lambda item: item[1]):
+            var[lit >> 1] = len(var)
+        for latch in latches:
+            var[latch[1] >> 1] = len(var)
+        ands = [node for node in nodes if self.nodes[node][0] == "and"]
+        for node in ands:
+            var[node] = len(var)
+        lit = lambda l: 2 * var[l >> 1] + (l & 1)
+        return var, lit, latches, ands
+
+    def write(self, f, binary=False):
+        var, lit, latches, ands = self.numbering()
+        inputs = sorted(self.inputs.items(), key=lambda item: item[1])
+        header = "%s %d %d %d %d %d\n" % ("aig" if binary else "aag", len(var) - 1, len(inputs),
+                len(latches), len(self.outputs), len(ands))
+        lines = list()
+        if not binary:
+            lines += ["%d" % lit(l) for name, l in inputs]
+        for name, q, d, init in latches:
+            fields = ["%d" % lit(d), "%d" % (lit(q) if init is None else init)]
+            if not binary:
+                fields.insert(0, "%d" % lit(q))
+            lines.append(" ".join(fields))
+        lines += ["%d" % lit(l) for name, l in self.outputs]
+
+        body = bytearray()
+        for node in ands:
+            a, b = lit(self.nodes[node][1]), lit(self.nodes[node][2])
+            if a < b:
+                a, b = b, a
+            if binary:
+                for delta in (2 * var[node] - a, a - b):
+                    while delta >= 0x80:
+                        body.append((delta & 0x7f) | 0x80)
+                        delta >>= 7
+                    body.append(delta)
+            else:
+                lines.append("%d %d %d" % (2 * var[node], a, b))
+
+        symbols = ["i%d %s" % (i, self.symbols[name]) for i, (name, l) in enumerate(inputs)]
+        symbols += ["l%d %s" % (i, latch[0]) for i, latch in enumerate(latches)]
+        symbols += ["o%d %s" % (i, name) for i, (name, l) in enumerate(self.outputs)]
+        trailer = "\n".join(symbols + ["c", "Generated using Chipy (Constructing Hardware In PYthon)"]) + "\n"
+
+        text = header + "".join(line + "\n" for line in lines)
+        if binary:
+            f.write(text.encode() + bytes(body) + trailer.encode())
+        else:
+            f.write(text + trailer)
+
+    def write_dimacs(self, f, steps=1, init=None):
+        # CNF of the design unrolled for steps cycles from its initial state,
+        # satisfiable iff an output bit is 1 in one of the cycles. Latches
+        # without reset value start with init, or unconstrained if None.
+        var, lit, latches, ands = self.numbering()
+        nvars = len(var)
+        true = steps * nvars + 1
+        clauses = list()
+
+        def cnf(l, frame):
+            if l >> 1 == 0:
+                return -true if l == 0 else true
+            v = frame * nvars + var[l >> 1]
+            return -v if l & 1 else v
+
+        clauses.append([true])
+        for frame in range(steps):
+            for node in ands:
+                y = cnf(2 * node, frame)
+                a, b = cnf(self.nodes[node][1], frame), cnf(self.nodes[node][2], frame)
+                clauses += [[-y, a], [-y, b], [y, -a, -b]]
+            for name, q, d, value in latches:
+                if frame == 0:
+                    value = init if value is None else value
+                    if value is not None:
+                        clauses.append([cnf(q, 0) if value else -cnf(q, 0)])
+                else:
+                    a, b = cnf(q, frame), cnf(d, frame - 1)
+                    clauses += [[-a, b], [a, -b]]
+        clauses.append([cnf(l, frame) for frame in range(steps) for name, l in self.outputs])
+
+        print("c Generated using Chipy (Constructing Hardware In PYthon)", file=f)
+        for name, l in sorted(self.inputs.items(), key=lambda item: item[1]):
+            if (l >> 1) in var:
+                print("c input %s %s" % (self.symbols[name], " ".join("%d" % cnf(l, frame) for frame in range(steps))), file=f)
+        print("p cnf %d %d" % (true, len(clauses)), file=f)
+        for clause in clauses:
+            print(" ".join("%d" % l for l in clause) + " 0", file=f)
+
+    def size(self):
+        nodes, latches = self.reachable()
+        return {"inputs": len(self.inputs), "latches": len(latches), "outputs": len(self.outputs),
+                "ands": sum(1 for node in nodes if self.nodes[node][0] == "and")}
+
+
+def ChipyOutputFile(f, binary):
+    if isinstance(f, (str, os.PathLike)):
+        return open(f, "wb" if binary else "w")
+    return None
+
+
+def WriteAIGER(f, module=None, gate=None, binary=False):
+    if module is None:
+        module = Module()
+    aig = ChipyAIG(module, gate)
+    out = ChipyOutputFile(f, binary)
+    if out is None:
+        aig.write(f, binary)
+        return
+    with out:
+        aig.write(out, binary)
+
+
+def WriteDIMACS(f, module=None, gate=None, steps=1, init=None):
+    if module is None:
+        module = Module()
+    aig = ChipyAIG(module, gate)
+    out = ChipyOutputFile(f, False)
+    if out is None:
+        aig.write_dimacs(f, steps, init)
+        return
+    with out:
+        aig.write_dimacs(out, steps, init)
+
+
+def AIGSize(module=None):
+    if module is None:
+        module = Module()
+    return ChipyAIG(module).size()
@@ -0,0 +1,137 @@
+#
+#  Chipy -- Constructing Hardware In PYthon
+#
+#  Copyright (C) 2016  Clifford Wolf <clifford@clifford.at>
+#
+#  Permission to use, copy, modify, and/or distribute this software for any
+#  purpose with or without fee is hereby granted, provided that the above
+#  copyright notice and this permission notice appear in all copies.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+#  WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+#  MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+#  ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+#  WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+#  ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+#  OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+#
+
+import asyncio
+import inspect
+import weakref
+
+from chipy.Chipy import ChipyError, WriteVerilog
+
+try:
+    import contextvars
+except ImportError:
+    contextvars = None
+
+
+class ChipyAsyncStream:
+    # File-like object used by a WriteVerilog() call running in an executor
+    # thread. Text is collected in chunks that are handed over to the event
+    # loop through a bounded queue, so a slow sink throttles code generation.
+    def __init__(self, loop, queue, name=None, chunksize=1 << 16):
+        self.loop = loop
+        self.queue = queue
+        self.chunksize = chunksize
+        self.chunk = list()
+        self.chunklen = 0
+        if name is not None:
+            self.name = name
+
+    def write(self, text):
+        self.chunk.append(text)
+        self.chunklen += len(text)
+        if self.chunklen >= self.chunksize:
+            self.flush()
+        return len(text)
+
+    def flush(self):
+        if len(self.chunk) != 0:
+            self.put("".join(self.chunk))
+            self.chunk = list()
+            self.chunklen = 0
+
+    def put(self, item):
+        asyncio.run_coroutine_threadsafe(self.queue.put(item), self.loop).result()
+
+
+# asyncio locks of the designs in use by id(design), with the event loop
+# they belong to. A contextvars context can only be entered by one thread
+# at a time, so the calls for the same design run one after the other.
+ChipyDesignLocks = dict()
+
+
+def ChipyDesignLock(design):
+    loop = asyncio.get_running_loop()
+    key = id(design)
+    if key not in ChipyDesignLocks:
+        weakref.finalize(design, ChipyDesignLocks.pop, key, None)
+    elif ChipyDesignLocks[key][0] is loop:
+        return ChipyDesignLocks[key][1]
+    ChipyDesignLocks[key] = (loop, asyncio.Lock())
+    return ChipyDesignLocks[key][1]
+
+
+def NewDesign():
+    # A design is represented by the contextvars context holding its state.
+    # An empty context starts with an empty modules dict.
+    if contextvars is None:
+        raise ChipyError('The async API requires the contextvars module (Python 3.7 or newer)')
+    return contextvars.Context()
+
+
+async def ElaborateAsync(func, *args, design=None, executor=None):
+    if design is None:
+        design = NewDesign()
+    loop = asyncio.get_running_loop()
+    async with ChipyDesignLock(design):
+        await loop.run_in_executor(executor, design.run, func, *args)
+    return design
+
+
+async def WriteVerilogAsync(sink, design=None, encoding=None, executor=None, chunksize=1 << 16):
+    if contextvars is None:
+        raise ChipyError('The async API requires the contextvars module (Python 3.7 or newer)')
+    if design is None:
+        design = contextvars.copy_context()
+
+    async with ChipyDesignLock(design):
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=16)
+        name = getattr(sink, "name", None)
+        stream = ChipyAsyncStream(loop, queue, name if isinstance(name, str) else None, chunksize)
+
+        def worker():
+            try:
+                WriteVerilog(stream)
+                stream.flush()
+            finally:
+                stream.put(None)
+
+        future = loop.run_in_executor(executor, design.run, worker)
+
+        try:
+            while True:
+                data = await queue.get()
+                if data is None:
+                    break
+                if encoding is not None:
+                    data = data.encode(encoding)
+                ret = sink.write(data)
+                if inspect.isawaitable(ret):
+                    await ret
+                elif hasattr(sink, "drain"):
+                    await sink.drain()
+        except BaseException:
+            # Unblock and drain the worker before propagating the error.
+            while not future.done():
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    await asyncio.sleep(0)
+            raise
+
+        await future
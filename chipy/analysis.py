@@ -0,0 +1,524 @@
+#
+#  Chipy -- Constructing Hardware In PYthon
+#
+#  Copyright (C) 2016  Clifford Wolf <clifford@clifford.at>
+#
+#  Permission to use, copy, modify, and/or distribute this software for any
+#  purpose with or without fee is hereby granted, provided that the above
+#  copyright notice and this permission notice appear in all copies.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+#  WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+#  MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+#  ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+#  WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+#  ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+#  OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+#
+
+from chipy.Chipy import tls, ChipyError, ChipyModule, Module, ChipyLvalueBits, ChipyUnassignedBits, ChipyBitRanges
+from chipy.Chipy import ChipyConstValue, ChipyCombLoops, ChipyLoopText
+from chipy.export import ChipyNetlist
+
+
+# Logic levels per operator. Slices, concatenations, casts and constants are
+# just wiring. "mux" is charged once per enclosing If/Case level of an
+# assignment and "mem" for a memory read port.
+TimingWeights = {
+    "+": 4, "-": 4, "*": 8, "/": 16, "%": 16, "**": 16,
+    "<<<": 3, ">>>": 3, "&": 1, "|": 1, "^": 1, "~": 0,
+    "<": 3, "<=": 3, ">": 3, ">=": 3, "==": 2, "!=": 2,
+    "?:": 1, "[]": 2, "+:": 2, "-:": 2,
+    "[:]": 0, "{}": 0, "{{}}": 0, "cast": 0, "const": 0,
+    "mux": 1, "mem": 2,
+}
+
+
+def ChipyLvalueBases(lhs):
+    # Returns the signals written by an assignment to lhs and the signals used
+    # to compute the written bit positions.
+    bits, indices = ChipyLvalueBits(lhs)
+    return [base for base, may, must in bits.values()], indices
+
+
+def ChipyDrivers(module, weights):
+    # Collect the driver edges (source, weight) of all procedurally assigned
+    # signals in module, keyed by the name of the assigned signal.
+    drivers = dict()
+
+    def walk(stmts, conds):
+        for stmt in stmts:
+            if stmt.kind == "assign":
+                bases, indices = ChipyLvalueBases(stmt.lhs)
+                for base in bases:
+                    edges = drivers.setdefault(base.name, list())
+                    if stmt.rhs is not None:
+                        edges.append((stmt.rhs, weights["mux"] * len(conds)))
+                    for cond in conds:
+                        edges.append((cond, weights["mux"]))
+                    for index in indices:
+                        edges.append((index, weights["[]"]))
+            elif stmt.kind == "if":
+                walk(stmt.body, conds + [stmt.cond])
+                if stmt.orelse is not None:
+                    walk(stmt.orelse, conds + [stmt.cond])
+            elif stmt.kind == "switch":
+                for case in stmt.body:
+                    case_conds = conds + [stmt.expr]
+                    if case.label is not None:
+                        case_conds.append(case.label)
+                    walk(case.body, case_conds)
+
+    for snippet in module.init_snippets + module.code_snippets:
+        walk(snippet.stmts, [])
+
+    for memory in module.memories.values():
+        for port in memory.ports:
+            if port.kind == "read":
+                edges = drivers.setdefault(port.data.name, list())
+                edges.append((port.addr, weights["mem"]))
+                if port.enable is not None:
+                    edges.append((port.enable, weights["mux"]))
+
+    return drivers
+
+
+def ChipyFanin(module, drivers, sig, weight):
+    # Combinational fan-in edges of sig, or None for start points (inputs,
+    # flip-flops, instance outputs and constants).
+    if sig.regkind == "ff":
+        return None
+    if sig.name in drivers:
+        return drivers[sig.name]
+    if sig.portalias is not None and sig.portalias in module.signals:
+        return [(module.signals[sig.portalias], 0)]
+    if sig.op is not None and sig.op != "const":
+        w = weight(sig)
+        return [(dep, w) for dep in sig.deps.values()]
+    return None
+
+
+class ChipyTiming:
+    def __init__(self, module, weights=None):
+        self.module = module
+        self.weights = dict(TimingWeights)
+        if weights is not None:
+            self.weights.update(weights)
+
+        self.arrival = dict()
+        self.pred = dict()
+        self.endpoints = list()
+        self.fanouts = dict()
+
+        self.drivers = ChipyDrivers(module, self.weights)
+        self.analyze()
+
+    def weight(self, sig):
+        if sig.memory is not None:
+            return self.weights["mem"]
+        return self.weights.get(sig.op, 1)
+
+    def fanin(self, sig):
+        return ChipyFanin(self.module, self.drivers, sig, self.weight)
+
+    def analyze(self):
+        arrival = self.arrival
+        pred = self.pred
+        onstack = set()
+
+        # Iterative DFS so that deep expression chains do not hit the Python
+        # recursion limit. Every signal and edge is visited exactly once.
+        for root in self.module.signals.values():
+            if root.name in arrival or not root.materialize:
+                continue
+            stack = [(root, None)]
+            while stack:
+                sig, edges = stack[-1]
+                if edges is None:
+                    if sig.name in arrival:
+                        stack.pop()
+                        continue
+                    edges = self.fanin(sig)
+                    if edges is None:
+                        arrival[sig.name] = 0
+                        pred[sig.name] = None
+                        stack.pop()
+                        continue
+                    stack[-1] = (sig, edges)
+                    onstack.add(sig.name)
+                    pending = [src for src, w in edges if src.name not in arrival]
+                    for src in pending:
+                        if src.name in onstack:
+                            raise ChipyError("Combinational loop through %s.%s (%s)" % (
+                                    self.module.name, src.name, src.codeloc))
+                        stack.append((src, None))
+                    if pending:
+                        continue
+                best, best_pred = 0, None
+                for src, w in edges:
+                    t = arrival[src.name] + w
+                    if best_pred is None or t > best:
+                        best, best_pred = t, src.name
+                arrival[sig.name] = best
+                pred[sig.name] = best_pred
+                onstack.discard(sig.name)
+                stack.pop()
+
+        self.find_endpoints()
+        self.count_fanout()
+
+    def find_endpoints(self):
+        module = self.module
+        endpoints = self.endpoints
+
+        def add(kind, name, edges, codeloc):
+            best, best_pred = 0, None
+            for src, w in edges:
+                t = self.arrival.get(src.name, 0) + w
+                if best_pred is None or t > best:
+                    best, best_pred = t, src.name
+            endpoints.append((best, kind, name, best_pred, codeloc))
+
+        for signame, sig in module.signals.items():
+            if sig.regkind == "ff":
+                add("register", signame, self.drivers.get(signame, []), sig.codeloc)
+            elif sig.outport and sig.materialize:
+                endpoints.append((self.arrival[signame], "output", signame, self.pred[signame], sig.codeloc))
+
+        for memname, memory in module.memories.items():
+            for wen, lhs, rhs in memory.writes:
+                add("memory", memname, [(wen, 0), (rhs, 0)] + [(dep, 0) for dep in lhs.deps.values()], memory.codeloc)
+            for port in memory.ports:
+                if port.kind == "write":
+                    add("memory", memname, [(port.addr, 0), (port.data, 0), (port.enable, 0)], port.codeloc)
+
+        for inst_name, inst_type, inst_bundle, inst_codeloc in module.instances:
+            child = Module(inst_type)
+            for port_name, sig in inst_bundle.items():
+                child_sig = child.signals.get(port_name) if child is not None else None
+                if child_sig is not None and child_sig.inport:
+                    endpoints.append((self.arrival[sig.name], "instance", sig.name, self.pred[sig.name], inst_codeloc))
+
+        endpoints.sort(key=lambda ep: -ep[0])
+
+    def count_fanout(self):
+        fanouts = self.fanouts
+        for sig in self.module.signals.values():
+            if not sig.materialize or sig.name in self.drivers:
+                continue
+            for dep in sig.deps.values():
+                if dep.op != "const":
+                    fanouts[dep.name] = fanouts.get(dep.name, 0) + 1
+        for edges in self.drivers.values():
+            for src, w in edges:
+                if src.op != "const":
+                    fanouts[src.name] = fanouts.get(src.name, 0) + 1
+
+    def depth(self):
+        if len(self.endpoints) == 0:
+            return 0
+        return self.endpoints[0][0]
+
+    def paths(self, top=10):
+        # Returns the critical paths to the top endpoints, each as a list of
+        # (signal_name, arrival, codeloc) tuples from start point to endpoint.
+        paths = list()
+        for level, kind, name, pred, codeloc in self.endpoints[:top]:
+            path = [(name, level, codeloc)]
+            while pred is not None:
+                sig = self.module.signals.get(pred)
+                path.append((pred, self.arrival[pred], sig.codeloc if sig is not None else "constant"))
+                pred = self.pred.get(pred)
+            path.reverse()
+            paths.append((kind, path))
+        return paths
+
+    def fanout(self, top=10):
+        items = sorted(self.fanouts.items(), key=lambda item: (-item[1], item[0]))
+        return items[:top]
+
+    def write_report(self, f, top=10):
+        print("", file=f)
+        print("Module %s: %d endpoints, max depth %d" % (self.module.name, len(self.endpoints), self.depth()), file=f)
+
+        for idx, (kind, path) in enumerate(self.paths(top)):
+            name, level, codeloc = path[-1]
+            print("  #%d: %s %s, depth %d" % (idx+1, kind, name, level), file=f)
+            for name, level, codeloc in path:
+                print("    %5d  %-24s %s" % (level, name, codeloc), file=f)
+
+        print("  Highest fan-out:", file=f)
+        for name, count in self.fanout(top):
+            sig = self.module.signals.get(name)
+            print("    %5d  %-24s %s" % (count, name, sig.codeloc if sig is not None else "constant"), file=f)
+
+
+class ChipyCDC:
+    def __init__(self, module):
+        self.module = module
+        self.drivers = ChipyDrivers(module, TimingWeights)
+
+        # For every signal a dict that maps each clock domain in its
+        # combinational fan-in to one example source register (or memory).
+        self.sources = dict()
+        self.crossings = list()
+        self.analyze()
+
+    def start_sources(self, sig):
+        if sig.regkind == "ff":
+            return {sig.domain.name: sig.name}
+        if sig.memory is not None:
+            return {name: sig.memory.name for name in sig.memory.clock_names()}
+        return dict()
+
+    def analyze(self):
+        module = self.module
+        sources = self.sources
+        weight = lambda sig: 0
+
+        for root in module.signals.values():
+            if root.name in sources:
+                continue
+            stack = [(root, None)]
+            while stack:
+                sig, edges = stack[-1]
+                if edges is None:
+                    if sig.name in sources:
+                        stack.pop()
+                        continue
+                    edges = ChipyFanin(module, self.drivers, sig, weight)
+                    if edges is None:
+                        sources[sig.name] = self.start_sources(sig)
+                        stack.pop()
+                        continue
+                    stack[-1] = (sig, edges)
+                    # Mark as in progress, so that combinational loops terminate.
+                    sources[sig.name] = dict()
+                    pending = [src for src, w in edges if src.name not in sources]
+                    stack.extend((src, None) for src in pending)
+                    if pending:
+                        continue
+                srcs = self.start_sources(sig)
+                for src, w in edges:
+                    for domain, name in sources.get(src.name, {}).items():
+                        srcs.setdefault(domain, name)
+                sources[sig.name] = srcs
+                stack.pop()
+
+        for signame, sig in sorted(module.signals.items()):
+            if sig.regkind != "ff":
+                continue
+            edges = [(src, w) for src, w in self.drivers.get(signame, []) if src is not sig]
+            for domain, srcname in sorted(self.collect(edges).items()):
+                if domain == sig.domain.name:
+                    continue
+                src = module.signals.get(srcname)
+                synchronized = len(edges) == 1 and edges[0][0] is src and src.width == 1
+                self.crossings.append((signame, sig.domain.name, srcname, domain, synchronized))
+
+    def collect(self, edges):
+        srcs = dict()
+        for src, w in edges:
+            for domain, name in self.sources.get(src.name, self.start_sources(src)).items():
+                srcs.setdefault(domain, name)
+        return srcs
+
+    def write_report(self, f):
+        print("", file=f)
+        print("Module %s: %d clock domains, %d crossings" % (self.module.name,
+                len(self.module.clock_domains), len(self.crossings)), file=f)
+        for dst, dst_domain, src, src_domain, synchronized in self.crossings:
+            print("  %s %s (%s) -> %s (%s) %s" % ("  " if synchronized else "!!", src, src_domain, dst, dst_domain,
+                    "synchronizer" if synchronized else "UNSYNCHRONIZED"), file=f)
+
+
+def ClockDomainCrossings(module=None):
+    if module is None:
+        module = Module()
+    return ChipyCDC(module).crossings
+
+
+def WriteCDCReport(f):
+    print("// Clock domain crossing report generated using Chipy (Constructing Hardware In PYthon)", file=f)
+    for modname, module in tls.ChipyModulesDict.items():
+        ChipyCDC(module).write_report(f)
+
+
+def TimingAnalysis(module=None, weights=None):
+    if module is None:
+        module = Module()
+    return ChipyTiming(module, weights)
+
+
+def WriteTimingReport(f, top=10, weights=None):
+    print("// Timing report generated using Chipy (Constructing Hardware In PYthon)", file=f)
+    for modname, module in tls.ChipyModulesDict.items():
+        ChipyTiming(module, weights).write_report(f, top)
+
+
+def CheckLatches(module=None):
+    if module is None:
+        module = Module()
+    return [(signal.name, ChipyBitRanges(mask)) for signal, mask in ChipyUnassignedBits(module)]
+
+
+# Operators whose result has the width of the widest operand, the value
+# fits in fewer bits if the operands do.
+ChipyWidthOps = {"+", "-", "*", "/", "%", "&", "|", "^", "~", "?:", "{{}}"}
+
+# Operators for which mixing signed and unsigned operands changes the result
+ChipySignedOps = {"+", "-", "*", "/", "%", "<", "<=", ">", ">=", "==", "!="}
+
+def ChipySignificantWidth(sig, cache):
+    # Number of bits needed for the values of sig, e.g. 4 for a + 1 with a
+    # four bits wide a (even though the constant 1 is 32 bits wide).
+    stack = [sig]
+    while stack:
+        top = stack[-1]
+        if top.name in cache:
+            stack.pop()
+            continue
+        if top.op == "const":
+            value = ChipyConstValue(top, top.width)
+            if top.signed and value >> (top.width - 1):
+                bits = (~(value - (1 << top.width))).bit_length() + 1
+            else:
+                bits = value.bit_length()
+            cache[top.name] = min(top.width, max(1, bits))
+            stack.pop()
+            continue
+        args = list(top.args or ())
+        if top.op == "?:":
+            args = args[1:]
+        if top.op not in ChipyWidthOps or len(args) == 0 or top.width != max(arg.width for arg in args):
+            cache[top.name] = top.width
+            stack.pop()
+            continue
+        pending = [arg for arg in args if arg.name not in cache]
+        if pending:
+            stack.extend(pending)
+            continue
+        cache[top.name] = min(top.width, max(cache[arg.name] for arg in args))
+        stack.pop()
+    return cache[sig.name]
+
+
+class ChipyDesignCheck:
+    # Collects design rule violations of a module in one pass over its
+    # signals, statements and netlist. Issues are (severity, module, kind,
+    # codeloc, message) with severity "error" or "warning".
+    def __init__(self, module):
+        self.module = module
+        self.issues = list()
+        self.check_signals()
+        self.check_stmts()
+        self.check_netlist()
+
+    def issue(self, severity, kind, codeloc, message):
+        self.issues.append((severity, self.module.name, kind, codeloc, message))
+
+    def check_signals(self):
+        module = self.module
+        inst_members = {sig.name: (inst_name, inst_type, member)
+                for inst_name, inst_type, bundle, codeloc in module.instances for member, sig in bundle.items()}
+
+        for signame, sig in sorted(module.signals.items()):
+            if sig.register and sig.materialize:
+                if signame in inst_members:
+                    inst_name, inst_type, member = inst_members[signame]
+                    if not sig.gotassign:
+                        self.issue("error", "undriven", sig.codeloc,
+                                "Input %s of instance %s (%s) is not driven" % (member, inst_name, inst_type))
+                elif not sig.gotassign:
+                    self.issue("error", "unassigned", sig.codeloc, "Register without assignment: %s" % signame)
+                elif not sig.regaction:
+                    self.issue("error", "unsynchronized", sig.codeloc,
+                            "Register without synchronization element: %s" % signame)
+
+            if sig.portmaster is not None and sig.gotassign:
+                self.issue("error", "multidriven", sig.codeloc,
+                        "Signal %s is driven by Connect (from %s) and by an assignment" % (signame, sig.portalias))
+
+            if sig.op in ChipySignedOps and sig.args is not None and len(sig.args) == 2:
+                a, b = sig.args
+                if a.signed != b.signed and a.op != "const" and b.op != "const":
+                    self.issue("warning", "signedness", sig.codeloc,
+                            "Mixing signed and unsigned operands of %s: %s (%s), %s (%s)" % (sig.op,
+                            a.name, "signed" if a.signed else "unsigned", b.name, "signed" if b.signed else "unsigned"))
+
+        for loop in ChipyCombLoops(module):
+            self.issue("error", "loop", loop[0][2], "Combinational loop: %s" % ChipyLoopText(module, loop))
+
+        for signal, mask in ChipyUnassignedBits(module):
+            self.issue("warning", "latch", signal.codeloc, "Bits %s of %s are not assigned on every path" % (
+                    ChipyBitRanges(mask), signal.name))
+
+    def check_stmts(self):
+        cache = dict()
+
+        def walk(stmts):
+            for stmt in stmts:
+                if stmt.kind == "assign":
+                    if stmt.rhs is not None and stmt.lhs.memory is None:
+                        width = ChipySignificantWidth(stmt.rhs, cache)
+                        if width > stmt.lhs.width:
+                            self.issue("warning", "truncation", stmt.codeloc,
+                                    "Assignment of %d bits wide %s to %d bits wide %s" % (width, stmt.rhs.name,
+                                    stmt.lhs.width, stmt.lhs.vlog_lvalue.replace("__next__", "")))
+                else:
+                    walk(stmt.body)
+                    if stmt.kind == "if" and stmt.orelse is not None:
+                        walk(stmt.orelse)
+
+        for snippet in self.module.init_snippets + self.module.code_snippets:
+            walk(snippet.stmts)
+
+    def check_netlist(self):
+        module = self.module
+        try:
+            netlist = ChipyNetlist(module)
+        except ChipyError as e:
+            self.issue("warning", "netlist", module.codeloc, "Skipped netlist checks: %s" % e)
+            netlist = None
+
+        if netlist is None:
+            return
+
+        used = set()
+        for cell in netlist.cells:
+            connections, directions = cell[2], cell[3]
+            for port, bits in connections.items():
+                if directions[port] == "input":
+                    used.update(bits)
+
+        for signame, direction, bits, signed in netlist.ports:
+            if direction == "output":
+                used.update(bits)
+        for signame, direction, bits, signed in netlist.ports:
+            if direction == "input" and used.isdisjoint(bits):
+                self.issue("warning", "unused", module.signals[signame].codeloc, "Input port %s is not used" % signame)
+
+
+def CheckDesign(modules=None, errors=False):
+    # Checks modules (default: all modules) and returns the list of issues.
+    # With errors=True a ChipyError listing all issues is raised if any of
+    # them is an error.
+    if modules is None:
+        modules = list(tls.ChipyModulesDict.values())
+    elif isinstance(modules, (str, ChipyModule)):
+        modules = [modules]
+    issues = list()
+    for module in modules:
+        if isinstance(module, str):
+            module = tls.ChipyModulesDict[module]
+        issues.extend(ChipyDesignCheck(module).issues)
+    if errors and any(issue[0] == "error" for issue in issues):
+        raise ChipyError("Design check failed:\n" + "\n".join("  %s: %s: %s [%s in %s]" % (codeloc, severity,
+                message, kind, modname) for severity, modname, kind, codeloc, message in issues))
+    return issues
+
+
+def CheckCombLoops(module=None):
+    if module is None:
+        module = Module()
+    return ChipyCombLoops(module)
@@ -0,0 +1,269 @@
+#
+#  Chipy -- Constructing Hardware In PYthon
+#
+#  Copyright (C) 2016  Clifford Wolf <clifford@clifford.at>
+#
+#  Permission to use, copy, modify, and/or distribute this software for any
+#  purpose with or without fee is hereby granted, provided that the above
+#  copyright notice and this permission notice appear in all copies.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+#  WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+#  MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+#  ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+#  WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+#  ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+#  OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+#
+
+import argparse
+import collections
+import concurrent.futures
+import hashlib
+import io
+import itertools
+import json
+import os
+import re
+import runpy
+import shutil
+import sys
+import sysconfig
+
+try:
+    import contextvars
+except ImportError:
+    contextvars = None
+
+import chipy
+from chipy.Chipy import tls, ChipyError, WriteVerilog
+
+ChipyFormats = {"verilog": ".v", "json": ".json", "stats": ".stats.json"}
+
+
+def ChipyParseDefines(defines):
+    # Each "-D NAME=VALUE,VALUE,.." adds an axis to the parameter sweep.
+    # Returns one list of (name, value) pairs for each combination.
+    axes = list()
+    for define in defines:
+        name, sep, values = define.partition("=")
+        if not sep or not name:
+            raise ChipyError('Invalid parameter definition {}, expected NAME=VALUE[,VALUE..]'.format(define))
+        axes.append([(name, value) for value in values.split(",")])
+    return [list(combination) for combination in itertools.product(*axes)]
+
+
+def ChipyOutputName(script, params, fmt):
+    name = os.path.splitext(os.path.basename(script))[0]
+    for key, value in params:
+        name += "_%s-%s" % (key, re.sub(r"[^\w.+-]", "_", value))
+    return name + ChipyFormats[fmt]
+
+
+def ChipyVersionKey():
+    # The Chipy version and the sources of the installed package, so that
+    # cached results are not reused with a modified Chipy.
+    digest = hashlib.sha256(chipy.__version__.encode())
+    pkgdir = os.path.dirname(os.path.abspath(chipy.__file__))
+    for filename in sorted(os.listdir(pkgdir)):
+        if filename.endswith(".py"):
+            with open(os.path.join(pkgdir, filename), "rb") as f:
+                digest.update(filename.encode() + b"\0" + f.read())
+    return digest.hexdigest()
+
+
+def ChipyCacheKey(script, params, fmt, outdir, version):
+    # The output directory is part of the key, as the generated Verilog code
+    # refers to the memory init files by their absolute paths.
+    digest = hashlib.sha256()
+    with open(script, "rb") as f:
+        digest.update(f.read())
+    digest.update(json.dumps([version, fmt, os.path.abspath(outdir), sorted(dict(params).items())]).encode())
+    return digest.hexdigest()
+
+
+def ChipyStats():
+    from chipy.export import ChipyNetlist
+    stats = dict()
+    for modname, module in tls.ChipyModulesDict.items():
+        signals = module.signals.values()
+        cells = collections.Counter(cell[0] for cell in ChipyNetlist(module).cells)
+        stats[modname] = {
+            "inputs": sum(sig.width for sig in signals if sig.inport),
+            "outputs": sum(sig.width for sig in signals if sig.outport),
+            "registers": sum(sig.width for sig in signals if sig.regkind == "ff"),
+            "memory_bits": sum(memory.width * memory.depth for memory in module.memories.values()),
+            "instances": len(module.instances),
+            "cells": dict(sorted(cells.items())),
+        }
+    return stats
+
+
+def ChipyFileDigest(filename):
+    with open(filename, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def ChipyForgetModules(saved):
+    # Removes the modules imported since sys.modules had the names saved,
+    # except Chipy and the modules of the Python installation, so that helper
+    # modules of a script are imported again (with the new parameters) by
+    # the next job running in the same process. Returns the files of the
+    # removed modules.
+    libdirs = tuple(os.path.join(os.path.abspath(path), "") for path in
+            {sysconfig.get_paths()[key] for key in ("stdlib", "platstdlib", "purelib", "platlib")})
+    filenames = list()
+    for name in set(sys.modules) - saved:
+        filename = getattr(sys.modules[name], "__file__", None)
+        if name != "chipy" and not name.startswith("chipy.") and isinstance(filename, str) and \
+                not os.path.abspath(filename).startswith(libdirs):
+            del sys.modules[name]
+            filenames.append(os.path.abspath(filename))
+    return filenames
+
+
+def ChipyGenerate(script, params, fmt, outpath):
+    # Runs script with params in a new design and returns the output text,
+    # the additional files (memory init data) as a dict mapping paths to text,
+    # and the digests of the helper modules imported by the script.
+    tls.ChipyParams = dict(params)
+    saved_argv, saved_path, saved_modules = sys.argv, sys.path, set(sys.modules)
+    sys.argv = [script]
+    sys.path = [os.path.dirname(os.path.abspath(script))] + sys.path
+    try:
+        runpy.run_path(script, run_name="__main__")
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            raise ChipyError('{} exited with status {}'.format(script, e.code))
+    finally:
+        sys.argv, sys.path = saved_argv, saved_path
+        deps = {filename: ChipyFileDigest(filename) for filename in ChipyForgetModules(saved_modules)
+                if os.path.isfile(filename)}
+
+    f = io.StringIO()
+    f.name = outpath
+    f.sidecars = dict()
+    if fmt == "verilog":
+        WriteVerilog(f)
+    elif fmt == "json":
+        from chipy.export import WriteJSON
+        WriteJSON(f)
+    else:
+        json.dump(ChipyStats(), f, indent=2)
+        print("", file=f)
+    return f.getvalue(), f.sidecars, deps
+
+
+def ChipyCacheWrite(path, text):
+    tmppath = "%s.%d.tmp" % (path, os.getpid())
+    with open(tmppath, "w") as f:
+        f.write(text)
+    os.replace(tmppath, path)
+
+
+def ChipyRunJob(script, params, fmt, outpath, cachepath):
+    if contextvars is not None:
+        text, sidecars, deps = contextvars.Context().run(ChipyGenerate, script, params, fmt, outpath)
+    else:
+        # The design state is thread-local then, a new thread starts with an
+        # empty design.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            text, sidecars, deps = executor.submit(ChipyGenerate, script, params, fmt, outpath).result()
+    for path, data in sidecars.items():
+        with open(path, "w") as f:
+            f.write(data)
+    with open(outpath, "w") as f:
+        f.write(text)
+    if cachepath is not None:
+        # The additional files are cached by their names relative to the
+        # output directory, together with the digests of the helper modules,
+        # before the output itself marks the entry valid.
+        os.makedirs(os.path.dirname(cachepath), exist_ok=True)
+        outdir = os.path.dirname(outpath)
+        ChipyCacheWrite(cachepath + ".meta.json", json.dumps({"deps": deps,
+                "sidecars": {os.path.relpath(path, outdir): data for path, data in sidecars.items()}}))
+        ChipyCacheWrite(cachepath, text)
+    return outpath
+
+
+def ChipyCacheRead(cachepath, outpath):
+    # Restores a cache entry and returns True, or returns False if there is
+    # no entry or one of the helper modules used for it has changed.
+    try:
+        with open(cachepath + ".meta.json") as f:
+            meta = json.load(f)
+        for filename, digest in meta["deps"].items():
+            if ChipyFileDigest(filename) != digest:
+                return False
+    except FileNotFoundError:
+        return False
+    if not os.path.exists(cachepath):
+        return False
+
+    outdir = os.path.dirname(outpath)
+    for name, data in meta["sidecars"].items():
+        with open(os.path.join(outdir, name), "w") as f:
+            f.write(data)
+    shutil.copyfile(cachepath, outpath)
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="chipy", description="Runs Chipy generator scripts and writes the generated "
+            "designs, once for each combination of the parameter values given with -D.")
+    parser.add_argument("scripts", nargs="+", metavar="script", help="generator script")
+    parser.add_argument("-D", dest="defines", action="append", default=[], metavar="NAME=VALUE[,VALUE..]",
+            help="set the parameter NAME (see Param()), a list of values is a sweep over the values")
+    parser.add_argument("-f", "--format", choices=sorted(ChipyFormats), default="verilog", help="output format")
+    parser.add_argument("-o", "--outdir", default=".", help="output directory")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="number of worker processes")
+    parser.add_argument("--cache", metavar="DIR", default=os.environ.get("CHIPY_CACHE",
+            os.path.join(os.path.expanduser("~"), ".cache", "chipy")), help="cache directory")
+    parser.add_argument("--no-cache", action="store_true", help="do not use the cache")
+    args = parser.parse_args(argv)
+
+    try:
+        sweep = ChipyParseDefines(args.defines)
+    except ChipyError as e:
+        parser.error(str(e))
+    version = None if args.no_cache else ChipyVersionKey()
+    os.makedirs(args.outdir, exist_ok=True)
+
+    jobs = list()
+    for script in args.scripts:
+        for params in sweep:
+            outpath = os.path.join(args.outdir, ChipyOutputName(script, params, args.format))
+            cachepath = None
+            if version is not None:
+                key = ChipyCacheKey(script, params, args.format, args.outdir, version)
+                cachepath = os.path.join(args.cache, key[:2], key + ChipyFormats[args.format])
+            label = " ".join([script] + ["%s=%s" % param for param in params])
+            jobs.append((label, (script, params, args.format, outpath, cachepath)))
+
+    status = 0
+    pending = list()
+    for label, job in jobs:
+        outpath, cachepath = job[3], job[4]
+        if cachepath is not None and ChipyCacheRead(cachepath, outpath):
+            print("%s: %s (cached)" % (label, outpath))
+        else:
+            pending.append((label, job))
+
+    def report(label, run):
+        nonlocal status
+        try:
+            print("%s: %s" % (label, run()))
+        except Exception as e:
+            print("%s: %s: %s" % (label, type(e).__name__, e), file=sys.stderr)
+            status = 1
+
+    if args.jobs > 1 and len(pending) > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=min(args.jobs, len(pending))) as executor:
+            futures = [(label, executor.submit(ChipyRunJob, *job)) for label, job in pending]
+            for label, future in futures:
+                report(label, future.result)
+    else:
+        for label, job in pending:
+            report(label, lambda: ChipyRunJob(*job))
+
+    return status
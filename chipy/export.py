@@ -0,0 +1,616 @@
+#
+#  Chipy -- Constructing Hardware In PYthon
+#
+#  Copyright (C) 2016  Clifford Wolf <clifford@clifford.at>
+#
+#  Permission to use, copy, modify, and/or distribute this software for any
+#  purpose with or without fee is hereby granted, provided that the above
+#  copyright notice and this permission notice appear in all copies.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+#  WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+#  MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+#  ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+#  WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+#  ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+#  OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+#
+
+import json
+
+from chipy.Chipy import tls, ChipyError
+
+
+ChipyArithCells = {
+    "+": "$add", "-": "$sub", "*": "$mul", "/": "$div", "%": "$mod", "**": "$pow",
+    "&": "$and", "|": "$or", "^": "$xor",
+}
+
+ChipyCmpCells = {
+    "<": "$lt", "<=": "$le", "==": "$eq", "!=": "$ne", ">": "$gt", ">=": "$ge",
+}
+
+ChipyReduceCells = {
+    "&": "$reduce_and", "|": "$reduce_or", "^": "$reduce_xor",
+}
+
+
+def ChipyConstBits(value, width):
+    return ["1" if (value >> i) & 1 else "0" for i in range(width)]
+
+
+def ChipyParamBits(bits):
+    return "".join(reversed(bits))
+
+
+def ChipyInitWords(memory):
+    # Returns the initial contents of memory as a list of integers.
+    init = memory.init
+    data = memory.init_buffer()
+    if data is not None:
+        data, wordbytes, byteorder = data
+        mask = (1 << memory.width) - 1
+        return [int.from_bytes(data[i:i+wordbytes], byteorder) & mask for i in range(0, len(data), wordbytes)]
+
+    if isinstance(init, str):
+        words = list()
+        with open(init) as fhex:
+            for line in fhex:
+                for token in line.split("//")[0].split():
+                    if token.startswith("@"):
+                        words += [None] * (int(token[1:], 16) - len(words))
+                    else:
+                        words.append(int(token.replace("_", ""), 16))
+        return words
+
+    return [int(value) for value in init]
+
+
+class ChipyNetlist:
+    # Bit-level netlist of a module, using Yosys internal cells. Bits are
+    # integers (nets) or the strings "0", "1" and "x" (constants). The
+    # semantics follow the Verilog code generated by WriteVerilog, i.e.
+    # only ports, memories and constants are signed, all other wires are not.
+    def __init__(self, module, coverage=False):
+        self.module = module
+        self.nextbit = 2
+        self.cells = list()
+        self.sigbits = dict()
+        self.alias = dict()
+        self.ports = list()
+        # with coverage: (codeloc, kind, bit) for each branch, where bit is 1
+        # in cycles in which the branch is taken
+        self.coverage = coverage
+        self.branches = list()
+        self.build()
+
+    def newbits(self, width):
+        bits = list(range(self.nextbit, self.nextbit + width))
+        self.nextbit += width
+        return bits
+
+    def cell(self, type, params, inputs, outputs, codeloc):
+        connections = dict(inputs)
+        directions = {port: "input" for port in inputs}
+        results = list()
+        for port, width in outputs:
+            connections[port] = self.newbits(width)
+            directions[port] = "output"
+            results.append(connections[port])
+        self.cells.append((type, params, connections, directions, codeloc))
+        return results[0] if len(results) == 1 else results
+
+    def is_signed(self, sig):
+        return sig.signed and (sig.op == "const" or sig.inport or sig.outport)
+
+    def extend(self, bits, width, signed):
+        if len(bits) >= width:
+            return bits[:width]
+        pad = bits[-1] if signed and len(bits) != 0 else "0"
+        return bits + [pad] * (width - len(bits))
+
+    def logic(self, bits, codeloc):
+        if len(bits) == 1:
+            return bits
+        return self.cell("$reduce_bool", {"A_SIGNED": 0, "A_WIDTH": len(bits), "Y_WIDTH": 1},
+                {"A": bits}, [("Y", 1)], codeloc)
+
+    def gate(self, type, a, b, codeloc):
+        params = {"A_SIGNED": 0, "A_WIDTH": 1, "Y_WIDTH": 1}
+        inputs = {"A": [a]}
+        if b is not None:
+            params.update(B_SIGNED=0, B_WIDTH=1)
+            inputs["B"] = [b]
+        return self.cell(type, params, inputs, [("Y", 1)], codeloc)[0]
+
+    def mux(self, sel, a, b, codeloc):
+        # Returns sel ? b : a
+        if a == b:
+            return a
+        return self.cell("$mux", {"WIDTH": len(a)}, {"A": a, "B": b, "S": sel}, [("Y", len(a))], codeloc)
+
+    def eq(self, a, b, signed, codeloc):
+        width = max(len(a), len(b))
+        return self.cell("$eq", {"A_SIGNED": int(signed), "B_SIGNED": int(signed), "A_WIDTH": width,
+                "B_WIDTH": width, "Y_WIDTH": 1}, {"A": self.extend(a, width, signed),
+                "B": self.extend(b, width, signed)}, [("Y", 1)], codeloc)
+
+    def bits(self, sig):
+        if sig.module is None:
+            return ChipyConstBits(sig.param, sig.width)
+        if sig.name in self.sigbits:
+            return self.sigbits[sig.name]
+
+        stack = [(sig, False)]
+        while stack:
+            sig, expanded = stack.pop()
+            if sig.module is None or sig.name in self.sigbits:
+                continue
+            args = sig.args if sig.op is not None else (sig.portmaster,)
+            if not expanded:
+                stack.append((sig, True))
+                stack.extend((arg, False) for arg in args)
+                continue
+            if sig.op is None:
+                self.sigbits[sig.name] = self.bits(sig.portmaster)
+            else:
+                self.sigbits[sig.name] = self.expr(sig, [self.bits(arg) for arg in args])
+
+        return self.sigbits[sig.name]
+
+    def expr(self, sig, args):
+        op = sig.op
+        width = sig.width
+        codeloc = sig.codeloc
+
+        if op in ("-", "~") and len(args) == 1:
+            signed = self.is_signed(sig.args[0])
+            return self.cell("$neg" if op == "-" else "$not", {"A_SIGNED": int(signed), "A_WIDTH": width,
+                    "Y_WIDTH": width}, {"A": self.extend(args[0], width, signed)}, [("Y", width)], codeloc)
+
+        if op in ChipyReduceCells and len(args) == 1:
+            return self.cell(ChipyReduceCells[op], {"A_SIGNED": 0, "A_WIDTH": len(args[0]), "Y_WIDTH": 1},
+                    {"A": args[0]}, [("Y", 1)], codeloc)
+
+        if op in ChipyArithCells:
+            signed = self.is_signed(sig.args[0]) and self.is_signed(sig.args[1])
+            b_width, b_signed = width, signed
+            if op == "**":
+                b_width, b_signed = len(args[1]), self.is_signed(sig.args[1])
+            return self.cell(ChipyArithCells[op], {"A_SIGNED": int(signed), "B_SIGNED": int(b_signed),
+                    "A_WIDTH": width, "B_WIDTH": b_width, "Y_WIDTH": width},
+                    {"A": self.extend(args[0], width, signed), "B": self.extend(args[1], b_width, b_signed)},
+                    [("Y", width)], codeloc)
+
+        if op in ("<<<", ">>>"):
+            signed = self.is_signed(sig.args[0])
+            return self.cell("$sshl" if op == "<<<" else "$sshr", {"A_SIGNED": int(signed), "B_SIGNED": 0,
+                    "A_WIDTH": width, "B_WIDTH": len(args[1]), "Y_WIDTH": width},
+                    {"A": self.extend(args[0], width, signed), "B": args[1]}, [("Y", width)], codeloc)
+
+        if op in ChipyCmpCells:
+            signed = self.is_signed(sig.args[0]) and self.is_signed(sig.args[1])
+            w = max(len(args[0]), len(args[1]))
+            return self.cell(ChipyCmpCells[op], {"A_SIGNED": int(signed), "B_SIGNED": int(signed),
+                    "A_WIDTH": w, "B_WIDTH": w, "Y_WIDTH": 1}, {"A": self.extend(args[0], w, signed),
+                    "B": self.extend(args[1], w, signed)}, [("Y", 1)], codeloc)
+
+        if op == "?:":
+            signed = self.is_signed(sig.args[1]) and self.is_signed(sig.args[2])
+            return self.mux(self.logic(args[0], codeloc), self.extend(args[2], width, signed),
+                    self.extend(args[1], width, signed), codeloc)
+
+        if op == "{}":
+            return [bit for arg in reversed(args) for bit in arg]
+
+        if op == "{{}}":
+            return args[0] * sig.param
+
+        if op == "[:]":
+            msb, lsb = sig.param
+            return self.extend(args[0][lsb:msb+1], msb - lsb + 1, False)
+
+        if op in ("[]", "+:", "-:"):
+            index, index_signed = args[1], False
+            if op == "-:":
+                index = self.cell("$sub", {"A_SIGNED": 1, "B_SIGNED": 1, "A_WIDTH": len(index) + 1,
+                        "B_WIDTH": 32, "Y_WIDTH": len(index) + 1}, {"A": index + ["0"],
+                        "B": ChipyConstBits(width - 1, 32)}, [("Y", len(index) + 1)], codeloc)
+                index_signed = True
+            return self.cell("$shiftx", {"A_SIGNED": 0, "B_SIGNED": int(index_signed), "A_WIDTH": len(args[0]),
+                    "B_WIDTH": len(index), "Y_WIDTH": width}, {"A": args[0], "B": index}, [("Y", width)], codeloc)
+
+        if op == "cast":
+            return self.extend(args[0], width, self.is_signed(sig.args[0]))
+
+        if op == "mem":
+            memory = sig.memory
+            return self.cell("$memrd", {"MEMID": "\\" + memory.name, "ABITS": len(args[0]), "WIDTH": memory.width,
+                    "CLK_ENABLE": 0, "CLK_POLARITY": 1, "TRANSPARENT": 0}, {"CLK": ["x"], "EN": ["1"],
+                    "ADDR": args[0]}, [("DATA", memory.width)], codeloc)
+
+        raise ChipyError('Operator {} not supported by netlist export'.format(op))
+
+    def targets(self, sig):
+        # Returns the list of (register name, bit index) pairs assigned by the
+        # bits of the lvalue sig, or a tuple (base targets, index bits, offset)
+        # for a dynamic part select.
+        if sig.vlog_lvalue in ("__next__" + sig.name, sig.name):
+            if sig.portmaster is not None:
+                raise ChipyError('Assignment to {}, which is driven by {}'.format(sig.name, sig.portalias))
+            return [(sig.name, i) for i in range(sig.width)]
+        if sig.op == "[:]":
+            msb, lsb = sig.param
+            return self.targets(sig.args[0])[lsb:msb+1]
+        if sig.op == "{}":
+            return [target for arg in reversed(sig.args) for target in self.targets(arg)]
+        if sig.op in ("[]", "+:", "-:"):
+            base = self.targets(sig.args[0])
+            offset = 0 if sig.op != "-:" else sig.width - 1
+            return (base, self.bits(sig.args[1]), offset)
+        raise ChipyError('Cannot export assignment to {}'.format(sig.vlog_lvalue))
+
+    def assign(self, env, lhs, rhs, codeloc):
+        targets = self.targets(lhs)
+
+        if isinstance(targets, list):
+            for (name, idx), bit in zip(targets, rhs):
+                env[name][idx] = bit
+            return
+
+        base, index, offset = targets
+        for pos in range(1 - len(rhs), len(base)):
+            if pos + offset < 0:
+                continue
+            value = ChipyConstBits(pos + offset, (pos + offset).bit_length() + 1)
+            sel = self.eq(index, value, False, codeloc)
+            for j in range(len(rhs)):
+                if 0 <= pos + j < len(base):
+                    name, idx = base[pos + j]
+                    env[name][idx] = self.mux(sel, [env[name][idx]], [rhs[j]], codeloc)[0]
+
+    def run(self, env, stmts, active=None):
+        # active is the bit that is 1 when stmts are executed (coverage only)
+        for stmt in stmts:
+            if stmt.kind == "assign":
+                if stmt.rhs is None:
+                    rhs = ["x"] * stmt.lhs.width
+                else:
+                    rhs = self.extend(self.bits(stmt.rhs), stmt.lhs.width, self.is_signed(stmt.rhs))
+                self.assign(env, stmt.lhs, rhs, stmt.codeloc)
+            elif stmt.kind == "if":
+                cases = [(self.logic(self.bits(stmt.cond), stmt.codeloc), stmt.body, stmt.codeloc,
+                        "elseif" if stmt.elseif else "if")]
+                orelse = stmt.orelse or []
+                if len(orelse) == 1 and orelse[0].kind == "if" and orelse[0].elseif:
+                    default = (orelse, None, None)
+                else:
+                    default = (orelse, stmt.else_codeloc or stmt.codeloc, "else")
+                self.branch(env, cases, default, stmt.codeloc, active)
+            elif stmt.kind == "switch":
+                expr = self.bits(stmt.expr)
+                cases = list()
+                default = ([], None if stmt.full else stmt.codeloc, "default")
+                for case in stmt.body:
+                    if case.label is None:
+                        default = (case.body, case.codeloc, "default")
+                        continue
+                    signed = self.is_signed(stmt.expr) and self.is_signed(case.label)
+                    cases.append((self.eq(expr, self.bits(case.label), signed, case.codeloc), case.body,
+                            case.codeloc, "case"))
+                self.branch(env, cases, default, stmt.codeloc, active)
+
+    def branch(self, env, cases, default, codeloc, active=None):
+        # Runs an if/else-if chain and merges the results with muxes, starting
+        # from the last (lowest priority) branch.
+        taken = [None] * len(cases)
+        remaining = active
+        if self.coverage:
+            remaining = "1" if active is None else active
+            for idx, (sel, body, loc, kind) in enumerate(cases):
+                taken[idx] = self.gate("$and", remaining, sel[0], loc)
+                self.branches.append((loc, kind, taken[idx]))
+                remaining = self.gate("$and", remaining, self.gate("$not", sel[0], None, loc), loc)
+            if default[1] is not None:
+                self.branches.append((default[1], default[2], remaining))
+
+        result = {name: list(bits) for name, bits in env.items()}
+        self.run(result, default[0], remaining)
+        for (sel, body, loc, kind), active in reversed(list(zip(cases, taken))):
+            branch_env = {name: list(bits) for name, bits in env.items()}
+            self.run(branch_env, body, active)
+            for name in env:
+                result[name] = self.mux(sel, result[name], branch_env[name], codeloc)
+        env.update(result)
+
+    def build(self):
+        module = self.module
+
+        # Nets driven by ports, registers, instances and registered memory reads
+        lvalues = dict()
+        for signame, signal in module.signals.items():
+            if signal.vlog_lvalue in ("__next__" + signame, signame) and signal.portmaster is None:
+                lvalues[signame] = signal
+            if signal.op is None and signal.portmaster is None:
+                self.sigbits[signame] = self.newbits(signal.width)
+
+        env = {name: ["x"] * signal.width for name, signal in lvalues.items()}
+        for snippet in module.init_snippets + module.code_snippets:
+            self.run(env, snippet.stmts)
+
+        for domain in module.clock_domains.values():
+            clock = self.bits(domain.clock)
+            polarity = int(domain.edge == "posedge")
+            for signal, codeloc in domain.registers:
+                d, q = env[signal.name], self.sigbits[signal.name]
+                reset = domain.reset
+                if reset is None:
+                    self.cells.append(("$dff", {"WIDTH": signal.width, "CLK_POLARITY": polarity},
+                            {"CLK": clock, "D": d, "Q": q}, {"CLK": "input", "D": "input", "Q": "output"}, codeloc))
+                    continue
+                value = ChipyConstBits(signal.reset_value, signal.width)
+                rst = self.bits(reset.signal)[0:1]
+                if reset.sync:
+                    d = self.mux(rst, value, d, codeloc) if reset.activelow else self.mux(rst, d, value, codeloc)
+                    self.cells.append(("$dff", {"WIDTH": signal.width, "CLK_POLARITY": polarity},
+                            {"CLK": clock, "D": d, "Q": q}, {"CLK": "input", "D": "input", "Q": "output"}, codeloc))
+                else:
+                    self.cells.append(("$adff", {"WIDTH": signal.width, "CLK_POLARITY": polarity,
+                            "ARST_POLARITY": int(not reset.activelow), "ARST_VALUE": ChipyParamBits(value)},
+                            {"CLK": clock, "ARST": rst, "D": d, "Q": q},
+                            {"CLK": "input", "ARST": "input", "D": "input", "Q": "output"}, codeloc))
+
+        for name, signal in lvalues.items():
+            if signal.regkind != "ff":
+                for bit, value in zip(self.sigbits[name], env[name]):
+                    self.alias[bit] = value
+
+        for memory in module.memories.values():
+            self.build_memory(memory)
+
+        for inst_name, inst_type, inst_bundle, inst_codeloc in module.instances:
+            child = tls.ChipyModulesDict[inst_type]
+            connections = dict()
+            directions = dict()
+            for member_name, member_sig in inst_bundle.items():
+                connections[member_name] = self.bits(member_sig)
+                directions[member_name] = "output" if child.signals[member_name].outport else "input"
+            self.cells.append((inst_type, dict(), connections, directions, inst_codeloc, inst_name))
+
+        for signame, signal in sorted(module.signals.items()):
+            if signal.inport or signal.outport:
+                direction = "inout"
+                if not signal.inport: direction = "output"
+                if not signal.outport: direction = "input"
+                self.ports.append((signame, direction, self.bits(signal), signal.signed))
+
+        self.resolve()
+
+    def build_memory(self, memory):
+        priority = 0
+        if len(memory.writes) != 0:
+            clock = memory.posedge if memory.posedge is not None else memory.negedge
+            polarity = int(memory.posedge is not None)
+            for wen, lhs, rhs in memory.writes:
+                word, lsb, msb = lhs, 0, lhs.width - 1
+                while word.op == "[:]":
+                    lsb += word.param[1]
+                    msb = lsb + word.width - 1
+                    word = word.args[0]
+                if word.op != "mem":
+                    raise ChipyError('Cannot export write to memory {} with dynamic index'.format(memory.name))
+                data = ["x"] * lsb + self.extend(self.bits(rhs), msb - lsb + 1, self.is_signed(rhs))
+                data += ["x"] * (memory.width - len(data))
+                enable = ["0"] * lsb + self.bits(wen) * (msb - lsb + 1)
+                enable += ["0"] * (memory.width - len(enable))
+                self.memwr(memory, self.bits(clock), polarity, self.bits(word.args[0]), data, enable, priority, lhs.codeloc)
+                priority += 1
+
+        for port in memory.ports:
+            clock = self.bits(port.clock)
+            polarity = int(port.edge == "posedge")
+            if port.kind == "read":
+                enable = ["1"] if port.enable is None else self.logic(self.bits(port.enable), port.codeloc)
+                self.cells.append(("$memrd", {"MEMID": "\\" + memory.name, "ABITS": port.addr.width,
+                        "WIDTH": memory.width, "CLK_ENABLE": 1, "CLK_POLARITY": polarity, "TRANSPARENT": 0},
+                        {"CLK": clock, "EN": enable, "ADDR": self.bits(port.addr), "DATA": self.sigbits[port.data.name]},
+                        {"CLK": "input", "EN": "input", "ADDR": "input", "DATA": "output"}, port.codeloc))
+                continue
+            enable = list()
+            for bit in self.bits(port.enable):
+                enable += [bit] * port.lanewidth
+            self.memwr(memory, clock, polarity, self.bits(port.addr), self.bits(port.data),
+                    enable[:memory.width], priority, port.codeloc)
+            priority += 1
+
+        if memory.init is not None:
+            words = ChipyInitWords(memory)
+            if len(words) > memory.depth:
+                raise ChipyError('Too many initial values for memory {}'.format(memory.name))
+            abits = memory.addrbits()
+            start = 0
+            # One $meminit cell per run of consecutive initialized words
+            for addr in range(len(words) + 1):
+                if addr < len(words) and words[addr] is not None:
+                    continue
+                if addr > start:
+                    data = [bit for value in words[start:addr] for bit in ChipyConstBits(value, memory.width)]
+                    self.cells.append(("$meminit", {"MEMID": "\\" + memory.name, "ABITS": abits,
+                            "WIDTH": memory.width, "WORDS": addr - start, "PRIORITY": start},
+                            {"ADDR": ChipyConstBits(start, abits), "DATA": data},
+                            {"ADDR": "input", "DATA": "input"}, memory.codeloc))
+                start = addr + 1
+
+    def memwr(self, memory, clock, polarity, addr, data, enable, priority, codeloc):
+        self.cells.append(("$memwr", {"MEMID": "\\" + memory.name, "ABITS": len(addr), "WIDTH": memory.width,
+                "CLK_ENABLE": 1, "CLK_POLARITY": polarity, "PRIORITY": priority},
+                {"CLK": clock, "EN": enable, "ADDR": addr, "DATA": data},
+                {"CLK": "input", "EN": "input", "ADDR": "input", "DATA": "input"}, codeloc))
+
+    def resolve(self):
+        # Replace the nets of async registers and enable signals with the
+        # nets or constants driving them.
+        def find(bit):
+            seen = set()
+            while bit in self.alias:
+                if bit in seen:
+                    raise ChipyError('Combinational loop in module {}'.format(self.module.name))
+                seen.add(bit)
+                bit = self.alias[bit]
+            return bit
+
+        remap = lambda bits: [find(bit) for bit in bits]
+        for cell in self.cells:
+            for port, bits in cell[2].items():
+                cell[2][port] = remap(bits)
+        self.ports = [(name, direction, remap(bits), signed) for name, direction, bits, signed in self.ports]
+        self.sigbits = {name: remap(bits) for name, bits in self.sigbits.items()}
+        self.branches = [(codeloc, kind, find(bit)) for codeloc, kind, bit in self.branches]
+
+    def cell_name(self, idx, cell):
+        if len(cell) > 5:
+            return cell[5]
+        return "%s$%s$%d" % (cell[0], cell[4], idx)
+
+    def json(self):
+        module = self.module
+        ports = dict()
+        for name, direction, bits, signed in self.ports:
+            ports[name] = {"direction": direction, "bits": bits}
+            if signed:
+                ports[name]["signed"] = 1
+
+        cells = dict()
+        for idx, cell in enumerate(self.cells):
+            cell_type, params, connections, directions, codeloc = cell[:5]
+            cells[self.cell_name(idx, cell)] = {
+                "hide_name": int(len(cell) == 5),
+                "type": cell_type,
+                "parameters": params,
+                "attributes": {"src": codeloc},
+                "port_directions": directions,
+                "connections": connections,
+            }
+
+        memories = dict()
+        for memname, memory in module.memories.items():
+            memories[memname] = {"hide_name": 0, "attributes": {"src": memory.codeloc},
+                    "width": memory.width, "start_offset": 0, "size": memory.depth}
+
+        netnames = dict()
+        for signame, signal in sorted(module.signals.items()):
+            if signame in self.sigbits:
+                netnames[signame] = {"hide_name": int(signame.startswith("__")), "bits": self.sigbits[signame],
+                        "attributes": {"src": signal.codeloc}}
+
+        return {"attributes": {"src": module.codeloc}, "ports": ports, "cells": cells,
+                "memories": memories, "netnames": netnames}
+
+    def write_blif(self, f):
+        module = self.module
+        names = dict()
+        lines = list()
+
+        def net(bit):
+            if isinstance(bit, str):
+                return {"0": "$false", "1": "$true", "x": "$undef"}.get(bit, bit)
+            return names.get(bit, "n%d" % bit)
+
+        def gate(inputs, output, rows):
+            lines.append(".names %s" % " ".join([net(bit) for bit in inputs] + [output]))
+            lines.extend(rows)
+
+        def portbit(name, bits, idx):
+            return name if len(bits) == 1 else "%s[%d]" % (name, idx)
+
+        inputs, outputs = list(), list()
+        for name, direction, bits, signed in self.ports:
+            if direction == "inout":
+                raise ChipyError('Inout port {} not supported by the BLIF backend'.format(name))
+            for idx, bit in enumerate(bits):
+                if direction == "input":
+                    names[bit] = portbit(name, bits, idx)
+                    inputs.append(names[bit])
+                else:
+                    outputs.append(portbit(name, bits, idx))
+
+        for idx, cell in enumerate(self.cells):
+            cell_type, params, conn = cell[:3]
+            if not cell_type.startswith("$"):
+                pins = ["%s=%s" % (portbit(port, bits, i), net(bit)) for port, bits in sorted(conn.items())
+                        for i, bit in enumerate(bits)]
+                lines.append(".subckt %s %s" % (cell_type, " ".join(pins)))
+            elif cell_type in ("$not", "$and", "$or", "$xor", "$mux"):
+                for i, y in enumerate(conn["Y"]):
+                    if cell_type == "$not":
+                        gate([conn["A"][i]], net(y), ["0 1"])
+                    elif cell_type == "$and":
+                        gate([conn["A"][i], conn["B"][i]], net(y), ["11 1"])
+                    elif cell_type == "$or":
+                        gate([conn["A"][i], conn["B"][i]], net(y), ["1- 1", "-1 1"])
+                    elif cell_type == "$xor":
+                        gate([conn["A"][i], conn["B"][i]], net(y), ["10 1", "01 1"])
+                    else:
+                        gate([conn["A"][i], conn["B"][i], conn["S"][0]], net(y), ["1-0 1", "-11 1"])
+            elif cell_type in ("$reduce_and", "$reduce_or", "$reduce_bool"):
+                n = len(conn["A"])
+                if cell_type == "$reduce_and":
+                    rows = ["1" * n + " 1"]
+                else:
+                    rows = ["-" * i + "1" + "-" * (n-i-1) + " 1" for i in range(n)]
+                gate(conn["A"], net(conn["Y"][0]), rows)
+            elif cell_type in ("$reduce_xor", "$eq", "$ne"):
+                if cell_type == "$reduce_xor":
+                    terms = conn["A"]
+                else:
+                    terms = list()
+                    for i, (a, b) in enumerate(zip(conn["A"], conn["B"])):
+                        terms.append("c%d_%d" % (idx, i))
+                        gate([a, b], terms[-1], ["10 1", "01 1"])
+                if cell_type == "$reduce_xor":
+                    acc = "$false"
+                    for i, term in enumerate(terms):
+                        out = "c%d_x%d" % (idx, i)
+                        gate([acc, term], out, ["10 1", "01 1"])
+                        acc = out
+                    gate([acc], net(conn["Y"][0]), ["1 1"])
+                else:
+                    # a == b iff no bit differs
+                    rows = ["0" * len(terms) + " 1"] if cell_type == "$eq" else \
+                            ["-" * i + "1" + "-" * (len(terms)-i-1) + " 1" for i in range(len(terms))]
+                    gate(terms, net(conn["Y"][0]), rows)
+            elif cell_type == "$dff":
+                edge = "re" if params["CLK_POLARITY"] else "fe"
+                for d, q in zip(conn["D"], conn["Q"]):
+                    lines.append(".latch %s %s %s %s 3" % (net(d), net(q), edge, net(conn["CLK"][0])))
+            else:
+                raise ChipyError('Cell type {} (from {}) not supported by the BLIF backend'.format(cell_type, cell[4]))
+
+        print(".model %s" % module.name, file=f)
+        print(".inputs %s" % " ".join(inputs), file=f)
+        print(".outputs %s" % " ".join(outputs), file=f)
+        print(".names $false", file=f)
+        print(".names $true\n1", file=f)
+        print(".names $undef", file=f)
+        for line in lines:
+            print(line, file=f)
+        for name, direction, bits, signed in self.ports:
+            if direction == "output":
+                for idx, bit in enumerate(bits):
+                    print(".names %s %s\n1 1" % (net(bit), portbit(name, bits, idx)), file=f)
+        print(".end", file=f)
+
+
+def WriteJSON(f):
+    modules = dict()
+    for modname, module in tls.ChipyModulesDict.items():
+        modules[modname] = ChipyNetlist(module).json()
+    json.dump({"creator": "Chipy (Constructing Hardware In PYthon)", "modules": modules}, f, indent=2)
+    print("", file=f)
+
+
+def WriteBLIF(f):
+    print("# Generated using Chipy (Constructing Hardware In PYthon)", file=f)
+    for modname, module in tls.ChipyModulesDict.items():
+        print("", file=f)
+        ChipyNetlist(module).write_blif(f)
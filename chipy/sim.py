@@ -0,0 +1,1024 @@
+#
+#  Chipy -- Constructing Hardware In PYthon
+#
+#  Copyright (C) 2016  Clifford Wolf <clifford@clifford.at>
+#
+#  Permission to use, copy, modify, and/or distribute this software for any
+#  purpose with or without fee is hereby granted, provided that the above
+#  copyright notice and this permission notice appear in all copies.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+#  WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+#  MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+#  ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+#  WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+#  ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+#  OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+#
+
+import array
+import copy
+import fnmatch
+import operator
+import os
+import random
+import shutil
+import subprocess
+import tempfile
+
+from chipy.Chipy import tls, ChipyError, ChipyModule, ChipyBackgroundWriter, ChipyOpenCompressed, ChipyBitRanges
+from chipy.export import ChipyNetlist, ChipyConstBits
+
+
+class ChipyGates:
+    # Bit-level logic network with structural hashing. Nodes are created in
+    # topological order, so that they can be evaluated in a single pass.
+    # Nodes 0, 1 and 2 are the constants 0, 1 and 'bx.
+    def __init__(self):
+        self.nodes = [("0",), ("1",), ("x",)]
+        self.hash = dict()
+
+    def node(self, key):
+        if key not in self.hash:
+            self.hash[key] = len(self.nodes)
+            self.nodes.append(key)
+        return self.hash[key]
+
+    def leaf(self, kind, name):
+        self.nodes.append((kind, name))
+        return len(self.nodes) - 1
+
+    def const(self, bit):
+        return {"0": 0, "1": 1}.get(bit, 2)
+
+    def NOT(self, a):
+        if a < 3:
+            return (1, 0, 2)[a]
+        if self.nodes[a][0] == "not":
+            return self.nodes[a][1]
+        return self.node(("not", a))
+
+    def AND(self, a, b):
+        if a > b:
+            a, b = b, a
+        if a == 0 or a == 1 or a == b:
+            return b if a else 0
+        return self.node(("and", a, b))
+
+    def OR(self, a, b):
+        if a > b:
+            a, b = b, a
+        if a == 0 or a == b:
+            return b
+        if a == 1:
+            return 1
+        return self.node(("or", a, b))
+
+    def XOR(self, a, b):
+        if a > b:
+            a, b = b, a
+        if a == 0:
+            return b
+        if a == 1:
+            return self.NOT(b)
+        if a == b:
+            return 2 if a == 2 else 0
+        return self.node(("xor", a, b))
+
+    def MUX(self, s, a, b):
+        # Returns s ? b : a
+        if a == b or s == 0:
+            return a
+        if s == 1:
+            return b
+        if (a, b) == (0, 1):
+            return s
+        if (a, b) == (1, 0):
+            return self.NOT(s)
+        return self.node(("mux", s, a, b))
+
+
+class ChipyBlaster:
+    # Lowers the netlists of a module and its sub-modules (ChipyNetlist) to a
+    # flat ChipyGates network. All flip-flops and synchronous memory ports
+    # are clocked by one implicit global clock, as in a cycle-based model.
+    # With coverage, branches lists (path, codeloc, kind, net) for the
+    # conditions of all If/Else and Switch branches.
+    def __init__(self, module, coverage=False):
+        self.g = ChipyGates()
+        self.coverage = coverage
+        self.branches = list()
+        self.cells = list()
+        self.alias = dict()
+        self.nextbit = 0
+        self.memsize = dict()
+        self.signals = dict()
+        self.ports = self.flatten(module, "")
+
+        # state elements: (name, state node, next state node or None, init node)
+        self.states = list()
+        self.inputs = list()
+        self.outputs = dict()
+        self.netnode = dict()
+        self.build()
+
+    def flatten(self, module, path):
+        netlist = ChipyNetlist(module, self.coverage)
+        base = self.nextbit
+        self.nextbit += netlist.nextbit
+        mapbits = lambda bits: [bit if isinstance(bit, str) else bit + base for bit in bits]
+
+        for memname, memory in module.memories.items():
+            self.memsize[path + memname] = (memory.width, memory.depth)
+        for signame in module.signals:
+            if signame in netlist.sigbits:
+                self.signals[path + signame] = mapbits(netlist.sigbits[signame])
+        for codeloc, kind, bit in netlist.branches:
+            self.branches.append((path, codeloc, kind, mapbits([bit])[0]))
+
+        for cell in netlist.cells:
+            cell_type, params, connections = cell[:3]
+            connections = {port: mapbits(bits) for port, bits in connections.items()}
+            if cell_type.startswith("$"):
+                if "MEMID" in params:
+                    params = dict(params, MEMID=path + params["MEMID"][1:])
+                self.cells.append((cell_type, params, connections, path))
+                continue
+            child = tls.ChipyModulesDict[cell_type]
+            for name, direction, bits in self.flatten(child, path + cell[5] + "."):
+                for parent_bit, child_bit in zip(connections[name], bits):
+                    if direction == "output":
+                        self.alias[parent_bit] = child_bit
+                    else:
+                        self.alias[child_bit] = parent_bit
+
+        return [(name, direction, mapbits(bits)) for name, direction, bits, signed in netlist.ports]
+
+    def find(self, bit):
+        seen = set()
+        while bit in self.alias:
+            if bit in seen:
+                raise ChipyError('Combinational loop through module ports')
+            seen.add(bit)
+            bit = self.alias[bit]
+        return bit
+
+    def build(self):
+        g = self.g
+        drivers = self.drivers = dict()
+        for idx, cell in enumerate(self.cells):
+            cell_type, params, conn, path = cell
+            for port in ("Y", "Q", "DATA"):
+                if port in conn and not (cell_type in ("$memwr", "$meminit")):
+                    for pos, bit in enumerate(conn[port]):
+                        drivers[bit] = (idx, port, pos)
+
+        for name, direction, bits in self.ports:
+            if direction != "output":
+                nodes = list()
+                for pos, bit in enumerate(bits):
+                    bit = self.find(bit)
+                    if bit not in self.netnode and not isinstance(bit, str):
+                        self.netnode[bit] = g.leaf("input", "%s[%d]" % (name, pos))
+                    nodes.append(self.net(bit, drivers))
+                self.inputs.append((name, nodes))
+
+        # memory contents
+        self.memories = dict()
+        for memid, (width, depth) in sorted(self.memsize.items()):
+            words = list()
+            for addr in range(depth):
+                words.append([g.leaf("state", "%s[%d][%d]" % (memid, addr, i)) for i in range(width)])
+            self.memories[memid] = words
+        meminit = {(memid, addr, i): 2 for memid, words in self.memories.items()
+                for addr in range(len(words)) for i in range(len(words[addr]))}
+        for cell_type, params, conn, path in self.cells:
+            if cell_type == "$meminit":
+                width = params["WIDTH"]
+                start = int("".join(reversed(conn["ADDR"])), 2)
+                for i, bit in enumerate(conn["DATA"]):
+                    meminit[(params["MEMID"], start + i // width, i % width)] = g.const(bit)
+
+        # flip-flops and synchronous read ports
+        for cell_type, params, conn, path in self.cells:
+            port = {"$dff": "Q", "$adff": "Q", "$memrd": "DATA"}.get(cell_type)
+            if port is None or (cell_type == "$memrd" and not params["CLK_ENABLE"]):
+                continue
+            for pos, bit in enumerate(conn[port]):
+                self.netnode[bit] = g.leaf("state", "%sn%d" % (path, bit))
+
+        pending = list()
+        for cell_type, params, conn, path in self.cells:
+            if cell_type in ("$dff", "$adff"):
+                qs = [self.netnode[bit] for bit in conn["Q"]]
+                ds = [self.net(bit, drivers) for bit in conn["D"]]
+                if cell_type == "$adff":
+                    # Like async2sync: the reset also acts on the outputs
+                    rst = self.net(conn["ARST"][0], drivers)
+                    if not params["ARST_POLARITY"]:
+                        rst = g.NOT(rst)
+                    value = [g.const(bit) for bit in reversed(params["ARST_VALUE"])]
+                    ds = [g.MUX(rst, d, v) for d, v in zip(ds, value)]
+                pending.extend((bit, q, d, 2) for bit, q, d in zip(conn["Q"], qs, ds))
+            elif cell_type == "$memrd" and params["CLK_ENABLE"]:
+                qs = [self.netnode[bit] for bit in conn["DATA"]]
+                en = self.net(conn["EN"][0], drivers)
+                data = self.memread(params["MEMID"], [self.net(bit, drivers) for bit in conn["ADDR"]])
+                pending.extend((bit, q, g.MUX(en, q, d), 2) for bit, q, d in zip(conn["DATA"], qs, data))
+
+        for bit, q, d, init in pending:
+            self.states.append(("n%d" % bit, q, d, init))
+
+        # memory writes, in priority order
+        writes = [cell for cell in self.cells if cell[0] == "$memwr"]
+        writes.sort(key=lambda cell: cell[1]["PRIORITY"])
+        nextwords = {memid: [list(word) for word in words] for memid, words in self.memories.items()}
+        for cell_type, params, conn, path in writes:
+            words = nextwords[params["MEMID"]]
+            addr = [self.net(bit, drivers) for bit in conn["ADDR"]]
+            data = [self.net(bit, drivers) for bit in conn["DATA"]]
+            enable = [self.net(bit, drivers) for bit in conn["EN"]]
+            for idx, word in enumerate(words):
+                sel = self.eq(addr, self.constbits(idx, len(addr)))
+                for i in range(len(word)):
+                    word[i] = g.MUX(g.AND(sel, enable[i]), word[i], data[i])
+        for memid, words in self.memories.items():
+            for addr, word in enumerate(words):
+                for i, q in enumerate(word):
+                    self.states.append(("%s[%d][%d]" % (memid, addr, i), q, nextwords[memid][addr][i],
+                            meminit[(memid, addr, i)]))
+
+        for name, direction, bits in self.ports:
+            if direction != "input":
+                self.outputs[name] = [self.net(bit, drivers) for bit in bits]
+
+    def signal(self, name):
+        # Returns the nodes of a signal, hierarchical names are separated by "."
+        if name not in self.signals:
+            raise ChipyError('No signal {} in module'.format(name))
+        return [self.net(bit, self.drivers) for bit in self.signals[name]]
+
+    def constbits(self, value, width):
+        return [self.g.const(bit) for bit in ChipyConstBits(value, width)]
+
+    def net(self, bit, drivers):
+        # Returns the node of a net, lowering the cells driving it as needed.
+        bit = self.find(bit)
+        if isinstance(bit, str):
+            return self.g.const(bit)
+        if bit in self.netnode:
+            return self.netnode[bit]
+
+        start = bit
+        stack = [bit]
+        visiting = set()
+        while stack:
+            bit = stack[-1]
+            if bit in self.netnode:
+                stack.pop()
+                continue
+            if bit not in drivers:
+                self.netnode[bit] = 2
+                stack.pop()
+                continue
+            idx, port, pos = drivers[bit]
+            cell_type, params, conn, path = self.cells[idx]
+            inputs = [self.find(b) for p, bits in conn.items() if p != port for b in bits]
+            missing = [b for b in inputs if not isinstance(b, str) and b not in self.netnode]
+            if missing:
+                if idx in visiting:
+                    raise ChipyError('Combinational loop in module at net %d' % bit)
+                visiting.add(idx)
+                stack.extend(missing)
+                continue
+            visiting.discard(idx)
+            values = {p: [self.node(b) for b in bits] for p, bits in conn.items() if p != port}
+            for b, n in zip(conn[port], self.cell(cell_type, params, values)):
+                self.netnode[self.find(b)] = n
+            stack.pop()
+
+        return self.netnode[start]
+
+    def node(self, bit):
+        bit = self.find(bit)
+        if isinstance(bit, str):
+            return self.g.const(bit)
+        return self.netnode[bit]
+
+    # word-level operations on lists of nodes (LSB first)
+
+    def extend(self, a, width, signed):
+        if len(a) >= width:
+            return a[:width]
+        pad = a[-1] if signed and len(a) != 0 else 0
+        return a + [pad] * (width - len(a))
+
+    def add(self, a, b, carry=0):
+        g = self.g
+        result = list()
+        for x, y in zip(a, b):
+            t = g.XOR(x, y)
+            result.append(g.XOR(t, carry))
+            carry = g.OR(g.AND(x, y), g.AND(carry, t))
+        return result
+
+    def sub(self, a, b):
+        return self.add(a, [self.g.NOT(y) for y in b], 1)
+
+    def neg(self, a):
+        return self.sub([0] * len(a), a)
+
+    def eq(self, a, b):
+        g = self.g
+        result = 1
+        for x, y in zip(a, b):
+            result = g.AND(result, g.NOT(g.XOR(x, y)))
+        return result
+
+    def lt(self, a, b, signed):
+        width = max(len(a), len(b)) + 1
+        return self.sub(self.extend(a, width, signed), self.extend(b, width, signed))[-1]
+
+    def mul(self, a, b):
+        g = self.g
+        acc = [0] * len(a)
+        for i, y in enumerate(b):
+            if y == 0:
+                continue
+            acc = self.add(acc, [0] * i + [g.AND(y, x) for x in a[:len(a)-i]])
+        return acc
+
+    def divmod(self, a, b, signed):
+        g = self.g
+        n = len(a)
+        if signed:
+            sa, sb = a[-1], b[-1]
+            a = self.mux(sa, a, self.neg(a))
+            b = self.mux(sb, b, self.neg(b))
+        q = [0] * n
+        r = [0] * n
+        for i in reversed(range(n)):
+            r2 = [a[i]] + r + [0]
+            d = self.sub(r2, b + [0, 0])
+            ge = g.NOT(d[-1])
+            r = self.mux(ge, r2[:n], d[:n])
+            q[i] = ge
+        if signed:
+            q = self.mux(g.XOR(sa, sb), q, self.neg(q))
+            r = self.mux(sa, r, self.neg(r))
+        zero = self.eq(b, [0] * n)
+        return self.mux(zero, q, [2] * n), self.mux(zero, r, [2] * n)
+
+    def pow(self, a, b, signed, b_signed):
+        n = len(a)
+        result = [1] + [0] * (n - 1)
+        base = a
+        for i, y in enumerate(b[:-1] if b_signed else b):
+            result = self.mux(y, result, self.mul(result, base))
+            if i < len(b) - 1:
+                base = self.mul(base, base)
+        if b_signed:
+            # negative exponents: 1**b = 1, (-1)**b = +-1, 0**b = 'bx, else 0
+            one = [1] + [0] * (n - 1)
+            special = self.mux(self.eq(a, one), [0] * n, one)
+            if signed:
+                odd = b[0]
+                minus = self.mux(odd, one, [1] * n)
+                special = self.mux(self.eq(a, [1] * n), special, minus)
+            special = self.mux(self.eq(a, [0] * n), special, [2] * n)
+            result = self.mux(b[-1], result, special)
+        return result
+
+    def mux(self, s, a, b):
+        return [self.g.MUX(s, x, y) for x, y in zip(a, b)]
+
+    def shift(self, a, amount, left, fill):
+        for i, s in enumerate(amount):
+            k = 1 << i
+            if k >= len(a):
+                shifted = [fill] * len(a)
+            elif left:
+                shifted = [fill] * k + a[:-k]
+            else:
+                shifted = a[k:] + [fill] * k
+            a = self.mux(s, a, shifted)
+        return a
+
+    def shiftx(self, a, b, b_signed, width):
+        # y[j] = a[j + b], 'bx if out of range
+        offset = width - 1
+        padded = [2] * offset + a + [2] * offset
+        bits = max(len(b), (len(padded)).bit_length()) + 2
+        t = self.add(self.extend(b, bits, b_signed), self.constbits(offset, bits))
+        shifted = self.shift(padded, t[:-1], False, 2)[:width]
+        return self.mux(t[-1], shifted, [2] * width)
+
+    def reduce(self, op, a):
+        g = self.g
+        result = {"and": 1, "or": 0, "xor": 0}[op]
+        for x in a:
+            result = getattr(g, op.upper())(result, x)
+        return result
+
+    def cell(self, cell_type, params, values):
+        g = self.g
+        A, B = values.get("A"), values.get("B")
+        if "Y_WIDTH" in params:
+            width = params["Y_WIDTH"]
+            a_signed = bool(params.get("A_SIGNED"))
+            b_signed = bool(params.get("B_SIGNED"))
+
+        if cell_type == "$not":
+            return [g.NOT(x) for x in self.extend(A, width, a_signed)]
+        if cell_type == "$neg":
+            return self.neg(self.extend(A, width, a_signed))
+        if cell_type in ("$and", "$or", "$xor"):
+            op = getattr(g, cell_type[1:].upper())
+            return [op(x, y) for x, y in zip(self.extend(A, width, a_signed), self.extend(B, width, b_signed))]
+        if cell_type in ("$add", "$sub", "$mul", "$div", "$mod"):
+            a, b = self.extend(A, width, a_signed), self.extend(B, width, b_signed)
+            if cell_type == "$add":
+                return self.add(a, b)
+            if cell_type == "$sub":
+                return self.sub(a, b)
+            if cell_type == "$mul":
+                return self.mul(a, b)
+            q, r = self.divmod(a, b, a_signed and b_signed)
+            return q if cell_type == "$div" else r
+        if cell_type == "$pow":
+            return self.pow(self.extend(A, width, a_signed), B, a_signed, b_signed)
+        if cell_type in ("$sshl", "$sshr"):
+            a = self.extend(A, width, a_signed)
+            fill = a[-1] if a_signed and cell_type == "$sshr" else 0
+            return self.shift(a, B, cell_type == "$sshl", fill)
+        if cell_type == "$shiftx":
+            return self.shiftx(A, B, b_signed, width)
+        if cell_type in ("$eq", "$ne", "$lt", "$le", "$gt", "$ge"):
+            w = max(len(A), len(B))
+            a, b = self.extend(A, w, a_signed), self.extend(B, w, b_signed)
+            if cell_type in ("$eq", "$ne"):
+                y = self.eq(a, b)
+                return [y if cell_type == "$eq" else g.NOT(y)]
+            if cell_type in ("$gt", "$le"):
+                a, b = b, a
+            y = self.lt(a, b, a_signed and b_signed)
+            return [y if cell_type in ("$lt", "$gt") else g.NOT(y)]
+        if cell_type in ("$reduce_and", "$reduce_or", "$reduce_xor", "$reduce_bool"):
+            op = {"$reduce_bool": "or"}.get(cell_type, cell_type[8:])
+            return [self.reduce(op, A)] + [0] * (width - 1)
+        if cell_type == "$mux":
+            return self.mux(values["S"][0], A, B)
+        if cell_type == "$memrd":
+            return self.memread(params["MEMID"], values["ADDR"])
+        raise ChipyError('Cell type {} not supported by the simulator'.format(cell_type))
+
+    def memread(self, memid, addr):
+        words = self.memories[memid]
+        width = self.memsize[memid][0]
+        level = words[:1 << len(addr)]
+        for s in addr:
+            if len(level) % 2:
+                level = level + [[2] * width]
+            level = [self.mux(s, level[i], level[i+1]) for i in range(0, len(level), 2)]
+        return level[0] if level else [2] * width
+
+
+class ChipySim:
+    # Cycle-based simulation of a module and its sub-modules. Values are
+    # evaluated for a number of independent test vectors in parallel: each
+    # node holds two integers with one bit per vector, the value and a mask of
+    # the bits that are defined (i.e. not 'bx).
+    def __init__(self, module, vectors=1, blaster=None, coverage=False):
+        if isinstance(module, str):
+            module = tls.ChipyModulesDict[module]
+        self.module = module
+        self.blaster = ChipyBlaster(module, bool(coverage)) if blaster is None else blaster
+        self.nodes = self.blaster.g.nodes
+        self.vectors = vectors
+        self.mask = (1 << vectors) - 1
+        self.inputs = dict(self.blaster.inputs)
+        self.outputs = self.blaster.outputs
+        self.value = [0] * len(self.nodes)
+        self.known = [0] * len(self.nodes)
+        self.value[1] = self.mask
+        self.known[0] = self.known[1] = self.mask
+        self.cycle = 0
+        self.tracers = list()
+        self.coverage = None
+        if coverage:
+            clocks = ChipyClockBits(self.blaster)
+            toggles = [name for name in ChipySelectSignals(self.blaster, None if coverage is True else coverage)
+                    if not {self.blaster.find(bit) for bit in self.blaster.signals[name]} <= clocks]
+            self.setup_coverage(toggles)
+        self.reset()
+
+    def reset(self):
+        self.cycle = 0
+        for name, node, next_node, init in self.blaster.states:
+            self.value[node] = self.value[init]
+            self.known[node] = self.known[init]
+
+    def set(self, name, value):
+        # Sets input port name to value. An int applies to all vectors, a list
+        # gives one value per vector (None for 'bx).
+        nodes = self.inputs[name]
+        if isinstance(value, int):
+            value = [value] * self.vectors
+        for i, node in enumerate(nodes):
+            v, k = 0, 0
+            for vec, word in enumerate(value):
+                if word is not None:
+                    k |= 1 << vec
+                    v |= ((word >> i) & 1) << vec
+            self.value[node] = v
+            self.known[node] = k
+
+    def grow(self):
+        # Allocates values for nodes added to the network after __init__
+        grow = len(self.nodes) - len(self.value)
+        if grow > 0:
+            self.value.extend([0] * grow)
+            self.known.extend([0] * grow)
+
+    def probe(self, name):
+        # Returns the nodes of signal name, adding the logic driving it to
+        # the simulation if it is not part of the network yet.
+        nodes = self.blaster.signal(name)
+        self.grow()
+        return nodes
+
+    def setup_coverage(self, toggles):
+        blaster = self.blaster
+        self.branch_nodes = [blaster.net(bit, blaster.drivers) for path, codeloc, kind, bit in blaster.branches]
+        self.toggle_nodes = [node for name in toggles for node in blaster.signal(name)]
+        self.toggle_prev = [(0, 0)] * len(self.toggle_nodes)
+        self.grow()
+        self.coverage = ChipyCoverage([branch[:3] for branch in blaster.branches],
+                [(name, len(blaster.signals[name])) for name in toggles])
+
+    def sample_coverage(self):
+        value, known, cov = self.value, self.known, self.coverage
+        hits = cov.hits
+        for idx, node in enumerate(self.branch_nodes):
+            if value[node]:
+                hits[idx] += bin(value[node]).count("1")
+        prev = self.toggle_prev
+        for idx, node in enumerate(self.toggle_nodes):
+            v, k = value[node], known[node]
+            pv, pk = prev[idx]
+            if v != pv or k != pk:
+                prev[idx] = (v, k)
+                both = k & pk
+                if both & v & ~pv:
+                    cov.rises[idx] += bin(both & v & ~pv).count("1")
+                if both & pv & ~v:
+                    cov.falls[idx] += bin(both & pv & ~v).count("1")
+        cov.samples += self.vectors
+
+    def set_bits(self, name, values, known=None):
+        # Sets input port name from one integer per bit, with one bit per vector.
+        for node, v in zip(self.inputs[name], values):
+            self.value[node] = v & self.mask
+            self.known[node] = self.mask if known is None else known
+        return self
+
+    def eval(self):
+        value, known, mask = self.value, self.known, self.mask
+        for idx in range(3, len(self.nodes)):
+            node = self.nodes[idx]
+            kind = node[0]
+            if kind == "and":
+                va, ka, vb, kb = value[node[1]], known[node[1]], value[node[2]], known[node[2]]
+                value[idx] = va & vb
+                known[idx] = (ka & kb) | (ka & ~va) | (kb & ~vb)
+            elif kind == "or":
+                va, ka, vb, kb = value[node[1]], known[node[1]], value[node[2]], known[node[2]]
+                value[idx] = va | vb
+                known[idx] = (ka & kb) | va | vb
+            elif kind == "xor":
+                k = known[node[1]] & known[node[2]]
+                value[idx] = (value[node[1]] ^ value[node[2]]) & k
+                known[idx] = k
+            elif kind == "not":
+                k = known[node[1]]
+                value[idx] = ~value[node[1]] & k
+                known[idx] = k
+            elif kind == "mux":
+                vs, ks = value[node[1]], known[node[1]]
+                va, ka, vb, kb = value[node[2]], known[node[2]], value[node[3]], known[node[3]]
+                sn = ks & ~vs
+                su = mask & ~ks
+                k = (vs & kb) | (sn & ka) | (su & ka & kb & ~(va ^ vb))
+                value[idx] = ((vs & vb) | (sn & va) | (su & va & vb)) & k
+                known[idx] = k
+
+    def step(self):
+        # Evaluates the current cycle and advances all state elements.
+        self.eval()
+        for tracer in self.tracers:
+            tracer.sample()
+        if self.coverage is not None:
+            self.sample_coverage()
+        states = self.blaster.states
+        update = [(self.value[d], self.known[d]) for name, q, d, init in states]
+        for (name, q, d, init), (v, k) in zip(states, update):
+            self.value[q] = v
+            self.known[q] = k
+        self.cycle += 1
+
+    def get_bits(self, name):
+        nodes = self.outputs[name] if name in self.outputs else self.probe(name)
+        return [(self.value[n], self.known[n]) for n in nodes]
+
+    def get(self, name, vector=0):
+        # Returns the value of output port or signal name for one vector, None
+        # if any bit is 'bx. Call eval() first.
+        result = 0
+        for i, (v, k) in enumerate(self.get_bits(name)):
+            if not (k >> vector) & 1:
+                return None
+            result |= ((v >> vector) & 1) << i
+        return result
+
+
+class ChipyCoverage:
+    # Branch and toggle coverage counters of a simulation. Only holds plain
+    # data, so that the results of parallel workers can be pickled and merged.
+    #   branches: (instance path, codeloc, kind) with kind "if", "elseif",
+    #             "else", "case" or "default", hits: times taken
+    #   toggles:  (signal name, width), rises and falls: one counter per bit
+    def __init__(self, branches, toggles):
+        self.branches = branches
+        self.toggles = toggles
+        self.hits = array.array("Q", [0] * len(branches))
+        nbits = sum(width for name, width in toggles)
+        self.rises = array.array("Q", [0] * nbits)
+        self.falls = array.array("Q", [0] * nbits)
+        self.samples = 0
+
+    def merge(self, other):
+        if self.branches != other.branches or self.toggles != other.toggles:
+            raise ChipyError('Cannot merge coverage of different designs')
+        for counters, others in ((self.hits, other.hits), (self.rises, other.rises), (self.falls, other.falls)):
+            for idx, count in enumerate(others):
+                counters[idx] += count
+        self.samples += other.samples
+        return self
+
+    def report(self):
+        # Returns (codeloc, kind, hits, missed) for each branch location, where
+        # missed is the number of instances of the branch that were never taken.
+        result = dict()
+        for (path, codeloc, kind), hits in zip(self.branches, self.hits):
+            total, missed = result.get((codeloc, kind), (0, 0))
+            result[(codeloc, kind)] = (total + hits, missed + int(hits == 0))
+        return [(codeloc, kind, hits, missed) for (codeloc, kind), (hits, missed) in result.items()]
+
+    def missed(self):
+        return [(codeloc, kind) for codeloc, kind, hits, missed in self.report() if missed]
+
+    def untoggled(self):
+        # Returns (signal name, bit ranges) for the bits that did not toggle
+        # in both directions.
+        result = list()
+        idx = 0
+        for name, width in self.toggles:
+            mask = 0
+            for bit in range(width):
+                if self.rises[idx + bit] == 0 or self.falls[idx + bit] == 0:
+                    mask |= 1 << bit
+            if mask:
+                result.append((name, ChipyBitRanges(mask)))
+            idx += width
+        return result
+
+
+def ChipySelectSignals(blaster, signals):
+    # Returns the names of the signals matching the glob patterns in signals
+    # (a list or a space-separated string). None selects all signals except
+    # for the ones whose names start with "__".
+    names = sorted(blaster.signals)
+    if signals is None:
+        return [name for name in names if not any(part.startswith("__") for part in name.split("."))]
+    if isinstance(signals, str):
+        signals = signals.split()
+    selected = list()
+    for pattern in signals:
+        matches = fnmatch.filter(names, pattern)
+        if len(matches) == 0:
+            raise ChipyError('No signals match {}'.format(pattern))
+        selected.extend(name for name in matches if name not in selected)
+    return selected
+
+
+class ChipyWaveform:
+    # Writes the values of the selected signals of a ChipySim to a VCD file,
+    # one sample per cycle. Only changed values are written. Files are
+    # written by a ChipyBackgroundWriter, i.e. in a background thread with a
+    # bounded queue, so that memory use does not grow with the trace length.
+    def __init__(self, sim, f, signals=None, vector=0, timescale="1ns", period=10, chunksize=1 << 16):
+        self.sim = sim
+        self.vector = vector
+        self.period = period
+        self.path = None
+        self.fstpath = None
+
+        selected = ChipySelectSignals(sim.blaster, signals)
+
+        if isinstance(f, (str, os.PathLike)):
+            path = os.fspath(f)
+            if path.endswith(".fst"):
+                if shutil.which("vcd2fst") is None:
+                    raise ChipyError('Writing {} requires the vcd2fst tool'.format(path))
+                self.fstpath = path
+                fd, path = tempfile.mkstemp(suffix=".vcd", dir=os.path.dirname(os.path.abspath(path)))
+                os.close(fd)
+            f = ChipyOpenCompressed(path)
+            if f is None:
+                f = ChipyBackgroundWriter(open(path, "wb"), path, chunksize)
+            self.path = path
+        self.f = f
+
+        clocks = ChipyClockBits(sim.blaster)
+        # signals with the same nodes (e.g. connected ports) share one code
+        self.vars = list()
+        self.clocks = list()
+        codes = dict()
+        scopes = dict()
+        for name in selected:
+            bits = sim.blaster.signals[name]
+            nodes = tuple(sim.probe(name))
+            if nodes not in codes:
+                codes[nodes] = ChipyVcdCode(len(codes))
+                if len(bits) == 1 and sim.blaster.find(bits[0]) in clocks:
+                    self.clocks.append(codes[nodes])
+                else:
+                    self.vars.append((codes[nodes], nodes, operator.itemgetter(*nodes)))
+            code = codes[nodes]
+            scope = scopes
+            for part in name.split(".")[:-1]:
+                scope = scope.setdefault(part, dict())
+            scope[name.split(".")[-1]] = (code, len(bits))
+
+        print("$version Chipy $end", file=self.f)
+        print("$timescale %s $end" % timescale, file=self.f)
+        self.write_scope(sim.module.name, scopes)
+        print("$enddefinitions $end", file=self.f)
+
+        self.state = [None] * len(self.vars)
+        self.last = [None] * len(self.vars)
+        self.time = None
+        sim.tracers.append(self)
+
+    def write_scope(self, name, scope):
+        print("$scope module %s $end" % name, file=self.f)
+        for key, item in sorted(scope.items()):
+            if isinstance(item, tuple):
+                code, width = item
+                print("$var wire %d %s %s%s $end" % (width, code, key, " [%d:0]" % (width - 1) if width > 1 else ""),
+                        file=self.f)
+        for key, item in sorted(scope.items()):
+            if isinstance(item, dict):
+                self.write_scope(key, item)
+        print("$upscope $end", file=self.f)
+
+    def sample(self):
+        # Writes the changed values of the current cycle. Call eval() first.
+        value, known, vec = self.sim.value, self.sim.known, self.vector
+        time = self.sim.cycle * self.period
+        if self.time is not None and time <= self.time:
+            return
+        lines = ["#%d" % time]
+        lines.extend("1" + code for code in self.clocks)
+        for idx, (code, nodes, getter) in enumerate(self.vars):
+            state = (getter(value), getter(known))
+            if state == self.state[idx]:
+                continue
+            self.state[idx] = state
+            text = "".join("x?01"[(((known[n] >> vec) & 1) << 1) | ((value[n] >> vec) & 1)] for n in reversed(nodes))
+            if text == self.last[idx]:
+                continue
+            self.last[idx] = text
+            if len(nodes) == 1:
+                lines.append(text + code)
+            else:
+                if text[0] == "0":
+                    text = text.lstrip("0")
+                    if text == "" or text[0] != "1":
+                        text = "0" + text
+                lines.append("b%s %s" % (text, code))
+        if self.clocks:
+            lines.append("#%d" % (time + self.period // 2))
+            lines.extend("0" + code for code in self.clocks)
+        lines.append("")
+        self.f.write("\n".join(lines))
+        self.time = time
+
+    def close(self):
+        if self.sim.cycle * self.period != self.time:
+            self.sim.eval()
+            self.sample()
+        if self in self.sim.tracers:
+            self.sim.tracers.remove(self)
+        if self.time is not None:
+            print("#%d" % (self.time + self.period), file=self.f)
+        if self.path is None:
+            return
+        self.f.close()
+        if self.fstpath is not None:
+            try:
+                subprocess.run(["vcd2fst", self.path, self.fstpath], check=True,
+                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            except subprocess.CalledProcessError:
+                raise ChipyError('Conversion of {} to FST failed'.format(self.fstpath))
+            finally:
+                os.remove(self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def ChipyVcdCode(index):
+    # VCD identifier codes are strings of the printable characters 33..126
+    code = ""
+    while True:
+        code += chr(33 + index % 94)
+        index //= 94
+        if index == 0:
+            return code
+
+
+def ChipyClockInputs(blaster):
+    # Returns the names of input ports that are only used as clocks.
+    clocks = set()
+    used = set()
+    for cell_type, params, conn, path in blaster.cells:
+        for port, bits in conn.items():
+            target = clocks if port == "CLK" else used
+            target.update(blaster.find(bit) for bit in bits)
+    names = set()
+    for name, direction, bits in blaster.ports:
+        if direction == "input":
+            bits = {blaster.find(bit) for bit in bits}
+            if bits <= clocks and bits.isdisjoint(used):
+                names.add(name)
+    return names
+
+
+def ChipyClockBits(blaster):
+    # Returns the nets of input ports that are only used as clocks.
+    clocks = ChipyClockInputs(blaster)
+    return {blaster.find(bit) for name, direction, bits in blaster.ports if name in clocks for bit in bits}
+
+
+def ChipyInputPattern(index, vectors):
+    # Integer with bit i set for all vectors i that have bit index set
+    period = 1 << index
+    pattern = ((1 << period) - 1) << period
+    length = 2 * period
+    while length < vectors:
+        pattern |= pattern << length
+        length *= 2
+    return pattern & ((1 << vectors) - 1)
+
+
+def ChipyStateKeys(blaster):
+    # Maps the state nodes of registers and memories to the names of their
+    # bits, (signal, bit) or ("memory[address]", bit), which are used to
+    # match the states of two modules.
+    keys = dict()
+    for name, bits in sorted(blaster.signals.items()):
+        for pos, bit in enumerate(bits):
+            if not isinstance(bit, str) and blaster.find(bit) in blaster.netnode:
+                keys.setdefault(blaster.netnode[blaster.find(bit)], list()).append((name, pos))
+    for memid, words in blaster.memories.items():
+        for addr, word in enumerate(words):
+            for i, node in enumerate(word):
+                keys[node] = [("%s[%d]" % (memid, addr), i)]
+    return keys
+
+
+def CheckEquiv(gold, gate, steps=1, vectors=1024, exhaustive=16, seed=0, init=None, dontcare=False):
+    # Compares the outputs of two modules with the same ports for steps
+    # cycles, starting with undefined registers, or registers set to init (0,
+    # 1 or "random"). Uses all input combinations if there are at most
+    # 2**exhaustive, random inputs otherwise. 'bx bits in the outputs of gold
+    # must be 'bx in gate as well, or are don't-care with dontcare=True.
+    # Returns None or a counterexample.
+    modules = [m if isinstance(m, ChipyModule) else tls.ChipyModulesDict[m] for m in (gold, gate)]
+    blasters = [ChipyBlaster(m) for m in modules]
+
+    ports = lambda blaster: {name: len(bits) for name, bits in blaster.inputs}
+    if ports(blasters[0]) != ports(blasters[1]):
+        raise ChipyError('Input ports of {} and {} do not match'.format(modules[0].name, modules[1].name))
+    for name, bits in blasters[0].outputs.items():
+        if len(blasters[1].outputs.get(name, [])) != len(bits):
+            raise ChipyError('Output port {} of {} does not match'.format(name, modules[1].name))
+
+    clocks = ChipyClockInputs(blasters[0]) | ChipyClockInputs(blasters[1])
+    inputs = [(name, width) for name, width in sorted(ports(blasters[0]).items()) if name not in clocks]
+    nbits = steps * sum(width for name, width in inputs)
+    if nbits <= exhaustive:
+        vectors = 1 << nbits
+    rng = random.Random(seed)
+
+    gold, gate = [ChipySim(m, vectors, b) for m, b in zip(modules, blasters)]
+    for sim in (gold, gate):
+        for name in clocks:
+            sim.set(name, 0)
+
+    # Random initial states are shared by register bits with the same name.
+    states = dict()
+    if init is not None:
+        if init not in (0, 1, "random"):
+            raise ChipyError('Invalid init value {}, expected 0, 1 or "random"'.format(init))
+        for sim in (gold, gate):
+            keys = ChipyStateKeys(sim.blaster)
+            for name, q, d, initnode in sim.blaster.states:
+                if initnode != 2:
+                    continue
+                if init == "random":
+                    names = keys.get(q, [])
+                    value = next((states[key] for key in names if key in states), None)
+                    if value is None:
+                        value = rng.getrandbits(vectors)
+                    for key in names:
+                        states.setdefault(key, value)
+                else:
+                    value = sim.mask if init else 0
+                sim.value[q] = value
+                sim.known[q] = sim.mask
+
+    trace = list()
+    defined = 0
+    index = 0
+    for cycle in range(steps):
+        values = dict()
+        for name, width in inputs:
+            if nbits <= exhaustive:
+                values[name] = [ChipyInputPattern(index + i, vectors) for i in range(width)]
+                index += width
+            else:
+                values[name] = [rng.getrandbits(vectors) for i in range(width)]
+            gold.set_bits(name, values[name])
+            gate.set_bits(name, values[name])
+        trace.append(values)
+        gold.eval()
+        gate.eval()
+
+        failed = 0
+        failed_outputs = list()
+        for name in sorted(gold.outputs):
+            mismatch = 0
+            for (vg, kg), (vt, kt) in zip(gold.get_bits(name), gate.get_bits(name)):
+                if dontcare:
+                    mismatch |= kg & (~kt | (vg ^ vt))
+                else:
+                    mismatch |= (kg ^ kt) | (kg & kt & (vg ^ vt))
+                defined |= kg
+            if mismatch:
+                failed |= mismatch
+                failed_outputs.append(name)
+
+        if failed:
+            vec = (failed & -failed).bit_length() - 1
+            cex = [{name: sum(((bits[i] >> vec) & 1) << i for i in range(len(bits)))
+                    for name, bits in values.items()} for values in trace]
+            initial = dict()
+            for (name, pos), value in states.items():
+                initial[name] = initial.get(name, 0) | (((value >> vec) & 1) << pos)
+            return {"cycle": cycle, "outputs": [name for name in failed_outputs],
+                    "inputs": cex, "init": initial, "gold": {name: gold.get(name, vec) for name in failed_outputs},
+                    "gate": {name: gate.get(name, vec) for name in failed_outputs}}
+
+        gold.step()
+        gate.step()
+
+    # Without a reset, the outputs of gold can stay 'bx (don't-care) and
+    # the check would pass for any gate.
+    if defined == 0 and any(gold.outputs.values()):
+        raise ChipyError('Outputs of {} are undefined in all {} cycles, use a reset or init'.format(
+                modules[0].name, steps))
+
+    return None
+
+
+def Simulation(module=None, vectors=1, coverage=False):
+    if module is None:
+        module = tls.ChipyCurrentContext.module
+    return ChipySim(module, vectors, coverage=coverage)
+
+
+def MergeCoverage(coverages):
+    coverages = list(coverages)
+    result = copy.deepcopy(coverages[0])
+    for cov in coverages[1:]:
+        result.merge(cov)
+    return result
+
+
+def Waveform(sim, f, signals=None, vector=0, timescale="1ns", period=10):
+    return ChipyWaveform(sim, f, signals, vector, timescale, period)
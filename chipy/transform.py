@@ -0,0 +1,542 @@
+#
+#  Chipy -- Constructing Hardware In PYthon
+#
+#  Copyright (C) 2016  Clifford Wolf <clifford@clifford.at>
+#
+#  Permission to use, copy, modify, and/or distribute this software for any
+#  purpose with or without fee is hereby granted, provided that the above
+#  copyright notice and this permission notice appear in all copies.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+#  WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+#  MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+#  ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+#  WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+#  ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+#  OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+#
+
+import hashlib
+import io
+import re
+
+from chipy.Chipy import *
+from chipy.analysis import TimingWeights
+
+
+def ChipyRebuild(sig, args):
+    # Re-create the expression sig with new operands (of the same width and
+    # signedness as the original ones).
+    op = sig.op
+    if op in ("-", "~") and len(args) == 1:
+        return ChipyUnaryOp(op, args[0])
+    if op in ("&", "|", "^") and len(args) == 1:
+        return ChipyUnaryOp(op, args[0], signprop=False, logicout=True)
+    if op in ("<", "<=", "==", "!=", ">", ">="):
+        return ChipyCmpOp(op, args[0], args[1])
+    if op in ("<<<", ">>>"):
+        return ChipyBinaryOp(op, args[0], args[1], leftwidth=True)
+    if op in ("+", "-", "*", "/", "%", "**", "&", "|", "^"):
+        return ChipyBinaryOp(op, args[0], args[1], width=sig.width)
+    if op == "?:":
+        return Cond(args[0], args[1], args[2])
+    if op == "{}":
+        return Concat(args)
+    if op == "{{}}":
+        return Repeat(sig.param, args[0])
+    if op == "[:]":
+        return args[0][sig.param[0]:sig.param[1]]
+    if op == "[]":
+        return args[0][args[1]]
+    if op in ("+:", "-:"):
+        return args[0][args[1], sig.param if op == "+:" else -sig.param]
+    if op == "cast":
+        return Sig(args[0], -sig.width if sig.signed else sig.width)
+    raise ChipyError('Cannot rebuild expression with operator {}'.format(op))
+
+
+class ChipyPipeliner:
+    def __init__(self, module, depth, posedge, negedge, weights):
+        self.module = module
+        self.depth = depth
+        self.posedge = posedge
+        self.negedge = negedge
+        self.weights = dict(TimingWeights)
+        if weights is not None:
+            self.weights.update(weights)
+
+        # stage and arrival within the stage, keyed by signal name
+        self.stage = dict()
+        self.local = dict()
+        self.rebuilt = dict()
+        self.delayed = dict()
+
+    def is_leaf(self, sig):
+        return sig.op is None or sig.op == "const" or sig.memory is not None or sig.regkind is not None
+
+    def schedule(self, root):
+        # ASAP stage assignment in topological order: an operator stays in the
+        # stage of its latest operand unless that would exceed the depth limit.
+        stack = [(root, False)]
+        while stack:
+            sig, expanded = stack.pop()
+            if sig.name in self.stage:
+                continue
+            if self.is_leaf(sig):
+                self.stage[sig.name] = None if sig.op == "const" else 0
+                self.local[sig.name] = 0
+                continue
+            if not expanded:
+                stack.append((sig, True))
+                stack.extend((arg, False) for arg in sig.args if arg.name not in self.stage)
+                continue
+
+            w = self.weights.get(sig.op, 1)
+            stages = [self.stage[arg.name] for arg in sig.args if self.stage[arg.name] is not None]
+            st = max(stages) if stages else None
+            t = w
+            for arg in sig.args:
+                if st is not None and self.stage[arg.name] == st:
+                    t = max(t, self.local[arg.name] + w)
+            if st is not None and t > self.depth and w <= self.depth and t > w:
+                st, t = st + 1, w
+            self.stage[sig.name] = st
+            self.local[sig.name] = t
+
+    def delay(self, sig, count):
+        # Returns sig delayed by count register stages, sharing the register
+        # chain between all consumers of sig.
+        chain = self.delayed.setdefault(sig.name, [sig])
+        while len(chain) <= count:
+            prev = chain[-1]
+            with ChipyContext(newmod=self.module):
+                reg = AddReg(ChipyAutoName(self.module, ("pipe", prev.name)), -prev.width if prev.signed else prev.width,
+                        posedge=self.posedge, negedge=self.negedge)
+                reg.next = prev
+            chain.append(reg)
+        return chain[count]
+
+    def rebuild(self, root):
+        stack = [(root, False)]
+        while stack:
+            sig, expanded = stack.pop()
+            if sig.name in self.rebuilt:
+                continue
+            if self.is_leaf(sig):
+                self.rebuilt[sig.name] = sig
+                continue
+            if not expanded:
+                stack.append((sig, True))
+                stack.extend((arg, False) for arg in sig.args if arg.name not in self.rebuilt)
+                continue
+
+            st = self.stage[sig.name]
+            args = list()
+            for arg in sig.args:
+                new_arg = self.rebuilt[arg.name]
+                if self.stage[arg.name] is not None:
+                    new_arg = self.delay(new_arg, st - self.stage[arg.name])
+                args.append(new_arg)
+            self.rebuilt[sig.name] = ChipyRebuild(sig, args)
+
+    def stage_of(self, sig):
+        st = self.stage[sig.name]
+        return 0 if st is None else st
+
+
+def Pipeline(sigs, depth, posedge=None, negedge=None, balance=True, weights=None):
+    raiseOutsideContext('Pipeline')
+
+    if (posedge is None) == (negedge is None):
+        raise ValueError('posedge XOR negedge must be given')
+
+    if isinstance(sigs, ChipyBundle):
+        members = list(sigs.items())
+    elif isinstance(sigs, (list, tuple)):
+        members = list(enumerate(sigs))
+    else:
+        members = [(None, sigs)]
+
+    module = tls.ChipyCurrentContext.module
+    pipeliner = ChipyPipeliner(module, depth, posedge, negedge, weights)
+
+    for key, sig in members:
+        pipeliner.schedule(Sig(sig))
+
+    latency = max([pipeliner.stage_of(Sig(sig)) for key, sig in members] + [0])
+
+    results = list()
+    latencies = list()
+    for key, sig in members:
+        sig = Sig(sig)
+        pipeliner.rebuild(sig)
+        out = pipeliner.rebuilt[sig.name]
+        st = pipeliner.stage_of(sig)
+        if balance:
+            out = pipeliner.delay(out, latency - st)
+            st = latency
+        results.append((key, out))
+        latencies.append((key, st))
+
+    if isinstance(sigs, ChipyBundle):
+        return Bundle(dict(results)), dict(latencies)
+    if isinstance(sigs, (list, tuple)):
+        return [out for key, out in results], [st for key, st in latencies]
+    return results[0][1], latencies[0][1]
+
+
+class ChipyReplay:
+    # Re-creates the contents of module src in module dst using the regular
+    # Chipy API, with all names prefixed by prefix. The ports of src are
+    # mapped to the signals in portmap (a dict keyed by port name), or are
+    # re-created as ports of dst if portmap is None.
+    def __init__(self, src, dst, prefix, portmap=None):
+        self.src = src
+        self.dst = dst
+        self.prefix = prefix
+        self.portmap = portmap
+        self.signals = dict()
+        self.memories = dict()
+        self.resets = dict()
+
+        self.read_ports = dict()
+        self.write_ports = dict()
+        self.memory_writes = dict()
+        for memory in src.memories.values():
+            for port in memory.ports:
+                if port.kind == "read":
+                    self.read_ports[port.data.name] = port
+                else:
+                    for signal in (port.addr, port.data, port.enable):
+                        self.write_ports[signal.name] = port
+            for wen, lhs, rhs in memory.writes:
+                self.memory_writes[wen.name] = (lhs, rhs)
+
+        self.nodefault = set()
+        for snippet in src.init_snippets:
+            for stmt in snippet.stmts:
+                if stmt.rhs is None:
+                    self.nodefault.add(stmt.lhs.name)
+
+    def sigtype(self, sig):
+        return -sig.width if sig.signed else sig.width
+
+    def map(self, sig):
+        if sig is None or sig.module is None:
+            return sig
+        if sig.name in self.signals:
+            return self.signals[sig.name]
+
+        stack = [(sig, False)]
+        while stack:
+            sig, expanded = stack.pop()
+            if sig.module is None or sig.name in self.signals:
+                continue
+            if sig.op is None or sig.op == "mem":
+                if sig.op == "mem" and not expanded:
+                    stack.append((sig, True))
+                    stack.append((sig.args[0], False))
+                    continue
+                with ChipyCodeLocAt(sig.codeloc):
+                    self.signals[sig.name] = self.create(sig)
+                continue
+            if not expanded:
+                stack.append((sig, True))
+                stack.extend((arg, False) for arg in sig.args)
+                continue
+            args = [arg if arg.module is None else self.signals[arg.name] for arg in sig.args]
+            with ChipyCodeLocAt(sig.codeloc):
+                self.signals[sig.name] = ChipyRebuild(sig, args)
+
+        return self.signals[sig.name]
+
+    def create(self, sig):
+        name = self.prefix + sig.name
+
+        if sig.op == "mem":
+            return self.memories[sig.memory.name][self.signals[sig.args[0].name]]
+
+        if sig.name in self.read_ports:
+            port = self.read_ports[sig.name]
+            memory = self.memories[port.memory.name]
+            return memory.read_port(self.map(port.addr), enable=self.map(port.enable),
+                    **{port.edge: self.map(port.clock)})
+
+        if sig.name in self.write_ports:
+            port = self.write_ports[sig.name]
+            memory = self.memories[port.memory.name]
+            new_port = memory.write_port(byteenable=(port.lanewidth != port.memory.width),
+                    **{port.edge: self.map(port.clock)})
+            self.signals[port.addr.name] = new_port.addr
+            self.signals[port.data.name] = new_port.data
+            self.signals[port.enable.name] = new_port.enable
+            return self.signals[sig.name]
+
+        if self.portmap is None and sig.inport:
+            return AddInput(name, self.sigtype(sig))
+        if self.portmap is None and sig.outport:
+            return AddOutput(name, self.sigtype(sig))
+        if sig.register or sig.regkind is not None or sig.portmaster is not None:
+            return AddReg(name, self.sigtype(sig))
+
+        raise ChipyError('Cannot re-create signal {} of module {}'.format(sig.name, self.src.name))
+
+    def reset(self, reset):
+        if reset is None:
+            return False
+        if reset.key not in self.resets:
+            self.resets[reset.key] = Reset(self.map(reset.signal), sync=reset.sync, activelow=reset.activelow)
+        return self.resets[reset.key]
+
+    def replay(self, stmts):
+        for stmt in stmts:
+            with ChipyCodeLocAt(stmt.codeloc):
+                if stmt.kind == "assign":
+                    if stmt.lhs.name in self.memory_writes:
+                        lhs, rhs = self.memory_writes[stmt.lhs.name]
+                        Assign(self.map(lhs), self.map(rhs))
+                    else:
+                        Assign(self.map(stmt.lhs), self.map(stmt.rhs))
+                elif stmt.kind == "if":
+                    with If(self.map(stmt.cond)):
+                        self.replay(stmt.body)
+                    if stmt.orelse is not None:
+                        with ChipyCodeLocAt(stmt.else_codeloc or stmt.codeloc), Else():
+                            self.replay(stmt.orelse)
+                elif stmt.kind == "switch":
+                    with Switch(self.map(stmt.expr), parallel=stmt.parallel, full=stmt.full):
+                        self.replay(stmt.body)
+                elif stmt.label is None:
+                    with Default():
+                        self.replay(stmt.body)
+                else:
+                    with Case(self.map(stmt.label)):
+                        self.replay(stmt.body)
+
+    def run(self):
+        src = self.src
+
+        with ChipyContext(newmod=self.dst):
+            if self.portmap is not None:
+                self.signals.update(self.portmap)
+            else:
+                for signame, signal in sorted(src.signals.items()):
+                    if signal.inport or signal.outport:
+                        self.map(signal)
+
+            for inst_name, inst_type, inst_bundle, inst_codeloc in src.instances:
+                with ChipyCodeLocAt(inst_codeloc):
+                    bundle = AddInst(self.prefix + inst_name, Module(inst_type))
+                for member_name, member_sig in inst_bundle.items():
+                    self.signals[member_sig.name] = bundle.get(member_name)
+
+            for memname, memory in src.memories.items():
+                with ChipyCodeLocAt(memory.codeloc):
+                    self.memories[memname] = ChipyMemory(self.dst, memory.width, memory.depth, self.prefix + memname,
+                            posedge=self.map(memory.posedge), negedge=self.map(memory.negedge),
+                            signed=memory.signed, init=memory.init)
+
+            for snippet in src.code_snippets:
+                self.replay(snippet.stmts)
+
+            for domain in src.clock_domains.values():
+                for signal, codeloc in domain.registers:
+                    with ChipyCodeLocAt(codeloc):
+                        AddFF(self.map(signal), nodefault=(signal.name in self.nodefault),
+                                reset=self.reset(domain.reset), reset_value=signal.reset_value or 0,
+                                **{domain.edge: self.map(domain.clock)})
+
+            for signame, signal in src.signals.items():
+                if signal.regkind == "async" and signal.register and signame not in self.write_ports:
+                    with ChipyCodeLocAt(signal.codeloc):
+                        AddAsync(self.map(signal))
+
+            # Connect() needs the master to be driven already, so connect
+            # chains of aliases starting from the signals that are no slaves.
+            slaves = [signal for signal in src.signals.values() if signal.portmaster is not None]
+            while slaves:
+                pending = {signal.name for signal in slaves}
+                remaining = list()
+                for signal in slaves:
+                    if signal.portmaster.name in pending:
+                        remaining.append(signal)
+                        continue
+                    with ChipyCodeLocAt(signal.codeloc):
+                        Connect(self.map(signal), self.map(signal.portmaster))
+                if len(remaining) == len(slaves):
+                    raise ChipyError('Cyclic Connect statements in module {}'.format(src.name))
+                slaves = remaining
+
+
+def ChipyFindInst(module, name):
+    for idx, inst in enumerate(module.instances):
+        if inst[0] == name:
+            return idx, inst
+    raise ChipyError('Instance {} not found in module {}'.format(name, module.name))
+
+
+def Flatten(names=None, module=None, recursive=False):
+    if module is None:
+        module = Module()
+
+    if names is None:
+        names = [inst[0] for inst in module.instances]
+    elif isinstance(names, str):
+        names = names.split()
+
+    names = list(names)
+    while names:
+        name = names.pop(0)
+        idx, (inst_name, inst_type, inst_bundle, inst_codeloc) = ChipyFindInst(module, name)
+        child = Module(inst_type)
+
+        # The instance outputs are driven by the instance, turn them into
+        # registers that the replayed child logic can assign to.
+        portmap = dict()
+        for member_name, member_sig in inst_bundle.items():
+            if child.signals[member_name].outport:
+                member_sig.register = True
+                member_sig.vlog_lvalue = "__next__" + member_sig.name
+            portmap[member_name] = member_sig
+
+        del module.instances[idx]
+        ChipyReplay(child, module, inst_name + "__", portmap).run()
+
+        if recursive:
+            names += [inst[0] for inst in module.instances if inst[0].startswith(inst_name + "__")]
+
+
+def Uniquify(name, module=None, newname=None):
+    if module is None:
+        module = Module()
+
+    idx, (inst_name, inst_type, inst_bundle, inst_codeloc) = ChipyFindInst(module, name)
+    if newname is None:
+        newname = "%s__%s__%s" % (inst_type, module.name, inst_name)
+
+    src = Module(inst_type)
+    with ChipyCodeLocAt(src.codeloc):
+        dst = AddModule(newname)
+    ChipyReplay(src, dst, "").run()
+
+    module.instances[idx] = (inst_name, newname, inst_bundle, inst_codeloc)
+    return dst
+
+
+ChipyVerilogKeywords = {
+    "module", "endmodule", "input", "output", "inout", "wire", "reg", "signed",
+    "assign", "always", "initial", "begin", "end", "if", "else", "case", "endcase",
+    "default", "posedge", "negedge", "or", "parallel_case", "full_case",
+}
+
+ChipyIdentifierRe = re.compile(r"(?<![\w'$.])[A-Za-z_][\w$]*")
+ChipyDeclRe = re.compile(r"^\s*(wire|reg)\b")
+ChipyAssignRe = re.compile(r"^\s*assign\s+(\S+)\s*=")
+
+
+def ChipyInitKey(init):
+    # Memory init data compared by contents: file names, lists and buffers
+    # (by a hash of their bytes). Other iterables can only be read once.
+    if isinstance(init, str):
+        return init
+    if isinstance(init, (list, tuple, range)):
+        return tuple(int(value) for value in init)
+    try:
+        data = memoryview(init)
+    except TypeError:
+        return id(init)
+    return (data.format, data.itemsize, hashlib.sha256(data.tobytes()).hexdigest())
+
+
+def ChipyCanonicalModule(module):
+    # Returns the Verilog code of module with comments removed and all names
+    # except port, module and instance port names normalized, in an order
+    # that only depends on the structure of the module.
+    buf = io.StringIO()
+    inits = [memory.init for memory in module.memories.values()]
+    try:
+        for memory in module.memories.values():
+            memory.init = None
+        module.write_verilog(buf)
+    finally:
+        for memory, init in zip(module.memories.values(), inits):
+            memory.init = init
+
+    text = re.sub(r"/\*.*?\*/", "", buf.getvalue())
+    lines = [re.sub(r"//.*", "", line).rstrip() for line in text.split("\n")]
+    lines = [line for line in lines if line != ""]
+
+    split = lines.index(");") + 1
+    header, decls, body = lines[1:split], list(), list()
+    assigns = dict()
+    for line in lines[split:]:
+        match = ChipyAssignRe.match(line)
+        if match:
+            assigns[match.group(1)] = line
+            decls.append(line)
+        elif ChipyDeclRe.match(line):
+            decls.append(line)
+        else:
+            body.append(line)
+
+    keep = ChipyVerilogKeywords | set(tls.ChipyModulesDict.keys())
+    ports = [name for name, signal in sorted(module.signals.items()) if signal.inport or signal.outport]
+    keep.update(ports)
+    names = dict()
+
+    def visit(line):
+        queue = [line]
+        while queue:
+            for token in ChipyIdentifierRe.findall(queue.pop(0)):
+                if token not in keep and token not in names:
+                    names[token] = "_%d" % len(names)
+                    if token in assigns:
+                        queue.append(assigns[token])
+
+    # Declarations only referenced by other declarations are numbered in the
+    # order of their text with all normalized names blanked out.
+    skeleton = lambda line: ChipyIdentifierRe.sub(lambda match: match.group(0) if match.group(0) in keep else "_", line)
+
+    for port in ports:
+        if port in assigns:
+            visit(assigns[port])
+    for line in body + sorted(decls, key=skeleton):
+        visit(line)
+
+    rename = lambda match: names.get(match.group(0), match.group(0))
+    decls = sorted(ChipyIdentifierRe.sub(rename, line) for line in decls)
+    body = [ChipyIdentifierRe.sub(rename, line) for line in body]
+    inits = [ChipyInitKey(init) for init in inits if init is not None]
+    return "\n".join(header + decls + body + [repr(inits)])
+
+
+def ShareModules():
+    # Returns a dict mapping the names of the removed modules to the names of
+    # the structurally identical modules that replace them. Only instantiated
+    # modules are removed, top-level modules are always kept.
+    shared = dict()
+
+    while True:
+        instantiated = {inst[1] for module in tls.ChipyModulesDict.values() for inst in module.instances}
+        canonical = dict()
+        replace = dict()
+        for modname, module in tls.ChipyModulesDict.items():
+            text = ChipyCanonicalModule(module)
+            if text in canonical and modname in instantiated:
+                replace[modname] = canonical[text]
+            else:
+                canonical.setdefault(text, modname)
+
+        if len(replace) == 0:
+            return shared
+
+        for modname in replace:
+            del tls.ChipyModulesDict[modname]
+        for old, new in shared.items():
+            shared[old] = replace.get(new, new)
+        shared.update(replace)
+
+        for module in tls.ChipyModulesDict.values():
+            for idx, (inst_name, inst_type, inst_bundle, inst_codeloc) in enumerate(module.instances):
+                if inst_type in replace:
+                    module.instances[idx] = (inst_name, replace[inst_type], inst_bundle, inst_codeloc)
@@ -10,5 +10,7 @@ setup(
     author_email='clifford@clifford.at',
     url='https://github.com/chipy-hdl/chipy',
     keywords=['eda', 'cad', 'hdl', 'verilog'],
+    extras_require={'zstd': ['zstandard']},
+    entry_points={'console_scripts': ['chipy = chipy.cli:main']},
     license='ISC'
 )
@@ -1,7 +1,9 @@
 #!/bin/bash
 
-rm -f test[0-9][0-9][0-9].v
+rm -f test[0-9][0-9][0-9].v test[0-9][0-9][0-9].json test[0-9][0-9][0-9].blif
+rm -f test[0-9][0-9][0-9].aag test[0-9][0-9][0-9].aig test[0-9][0-9][0-9]*.vcd* test[0-9][0-9][0-9]*.fst
 rm -f test[0-9][0-9][0-9]_*.log
+rm -f test[0-9][0-9][0-9]_*.hex test[0-9][0-9][0-9]_*.bin
 
 set -e
 
@@ -11,6 +13,19 @@ run() {
 
 	PYTHONPATH=".." python3 ${id}.py
 
+	read_cmd="read_verilog ${id}.v"
+	if [ -f ${id}.json ]; then
+		read_cmd="$read_cmd; read_json ${id}.json"
+	fi
+	if [ -f ${id}.blif ]; then
+		read_cmd="$read_cmd; read_blif -wideports ${id}.blif"
+	fi
+	for ext in aag aig; do
+		if [ -f ${id}.$ext ]; then
+			read_cmd="$read_cmd; read_aiger -module_name ${id}_$ext -clk_name clk ${id}.$ext"
+		fi
+	done
+
 	yosys_q="-q"
 	if $verbose; then
 		yosys_q=""
@@ -21,17 +36,17 @@ run() {
 		read a1 a2 a3 a4 a5 < <( echo $args; )
 		case "$stmt" in
 			test-sat-equiv-induct)
-				yosys $yosys_q -l ${id}_${idx}.log -p "read_verilog ${id}.v; prep" \
+				yosys $yosys_q -l ${id}_${idx}.log -p "$read_cmd; prep; async2sync" \
 					-p "miter -equiv -ignore_gold_x -flatten -make_outputs $a1 $a2 miter" \
 					-p "sat -verify -prove trigger 0 -show-ports -tempinduct -set-init-undef -set-def-inputs -maxsteps $a3 miter"
 				;;
 			test-sat-equiv-bmc)
-				yosys $yosys_q -l ${id}_${idx}.log -p "read_verilog ${id}.v; prep; memory_map;;" \
+				yosys $yosys_q -l ${id}_${idx}.log -p "$read_cmd; prep; memory_map; async2sync;;" \
 					-p "miter -equiv -ignore_gold_x -flatten -make_outputs $a1 $a2 miter" \
 					-p "sat -verify -prove trigger 0 -show-ports -set-init-undef -set-def-inputs -seq $a3 miter"
 				;;
 			test-sat-equiv-comb)
-				yosys $yosys_q -l ${id}_${idx}.log -p "read_verilog ${id}.v; prep; memory_map;;" \
+				yosys $yosys_q -l ${id}_${idx}.log -p "$read_cmd; prep; memory_map; async2sync;;" \
 					-p "miter -equiv -ignore_gold_x -flatten -make_outputs $a1 $a2 miter" \
 					-p "sat -verify -prove trigger 0 -show-ports -set-def-inputs miter"
 				;;
@@ -0,0 +1,122 @@
+
+//@ test-sat-equiv-induct gold gate_1 5
+//@ test-sat-equiv-induct gold gate_2 5
+//@ test-sat-equiv-induct gold gate_3 5
+//@ test-sat-equiv-induct gold gate_4 5
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module gate_1 (
+  input [31:0] a /* test000.py:9 */,
+  input [31:0] b /* test000.py:9 */,
+  input clk /* test000.py:7 */,
+  output reg [31:0] out /* test000.py:10 */,
+  input submode /* test000.py:8 */
+);
+  wire [31:0] __837d19c3; // test000.py:13
+  wire [31:0] __bca3c472; // test000.py:15
+  reg [31:0] __next__out; // test000.py:10
+  assign __837d19c3 = a - b; // test000.py:13
+  assign __bca3c472 = a + b; // test000.py:15
+  always @* begin
+    __next__out = out; // test000.py:10
+    if (submode) begin // test000.py:12
+      __next__out = __837d19c3; // test000.py:13
+    end
+    else begin // test000.py:14
+      __next__out = __bca3c472; // test000.py:15
+    end
+  end
+  always @(posedge clk) begin
+    out <= __next__out; // test000.py:10
+  end
+endmodule
+
+module gate_2 (
+  input [31:0] a /* test000.py:21 */,
+  input [31:0] b /* test000.py:21 */,
+  input clk /* test000.py:19 */,
+  output reg [31:0] out /* test000.py:22 */,
+  input submode /* test000.py:20 */
+);
+  wire [31:0] __837d19c3; // test000.py:27
+  wire [31:0] __bca3c472; // test000.py:29
+  reg [31:0] __next__out; // test000.py:22
+  assign __837d19c3 = a - b; // test000.py:27
+  assign __bca3c472 = a + b; // test000.py:29
+  always @* begin
+    __next__out = out; // test000.py:24
+    if (submode) begin // test000.py:26
+      __next__out = __837d19c3; // test000.py:27
+    end
+    else begin // test000.py:28
+      __next__out = __bca3c472; // test000.py:29
+    end
+  end
+  always @(posedge clk) begin
+    out <= __next__out; // test000.py:24
+  end
+endmodule
+
+module gate_3 (
+  input [31:0] a /* test000.py:35 */,
+  input [31:0] b /* test000.py:35 */,
+  input clk /* test000.py:33 */,
+  output reg [31:0] out /* test000.py:36 */,
+  input submode /* test000.py:34 */
+);
+  wire [31:0] __837d19c3; // test000.py:41
+  wire [31:0] __bca3c472; // test000.py:43
+  reg [31:0] __next__out; // test000.py:36
+  assign __837d19c3 = a - b; // test000.py:41
+  assign __bca3c472 = a + b; // test000.py:43
+  always @* begin
+    __next__out = out; // test000.py:38
+    if (submode) begin // test000.py:40
+      __next__out = __837d19c3; // test000.py:41
+    end
+    else begin // test000.py:42
+      __next__out = __bca3c472; // test000.py:43
+    end
+  end
+  always @(posedge clk) begin
+    out <= __next__out; // test000.py:38
+  end
+endmodule
+
+module gate_4 (
+  input [31:0] a /* test000.py:49 */,
+  input [31:0] b /* test000.py:49 */,
+  input clk /* test000.py:47 */,
+  output reg [31:0] out /* test000.py:50 */,
+  input submode /* test000.py:48 */
+);
+  wire [31:0] __837d19c3; // test000.py:51
+  wire [31:0] __b14d4339; // test000.py:51
+  wire [31:0] __bca3c472; // test000.py:51
+  reg [31:0] __next__out; // test000.py:50
+  assign __837d19c3 = a - b; // test000.py:51
+  assign __b14d4339 = submode ? __837d19c3 : __bca3c472; // test000.py:51
+  assign __bca3c472 = a + b; // test000.py:51
+  always @* begin
+    __next__out = out; // test000.py:50
+    __next__out = __b14d4339; // test000.py:51
+  end
+  always @(posedge clk) begin
+    out <= __next__out; // test000.py:50
+  end
+endmodule
+
+module gold(clk, submode, a, b, out);
+  input clk, submode;
+  input [31:0] a, b;
+  output reg [31:0] out;
+
+  always @(posedge clk) begin
+    if (submode)
+        out <= a - b;
+    else
+        out <= a + b;
+  end
+endmodule
+
@@ -29,7 +29,7 @@ with AddModule("gate_2"):
     a, b = AddInput("a b", 32)
     out = AddOutput("out", 32, posedge=clk)
 
-    aa, bb = AddReg("aa bb", 32, async=True)
+    aa, bb = AddReg("aa bb", 32, async_=True)
 
     with If(reverse_order):
         aa.next = b
@@ -51,7 +51,7 @@ with AddModule("gate_3"):
     a, b = AddInput("a b", 32)
     out = AddOutput("out", 32, posedge=clk)
 
-    aa, bb = AddReg("aa bb", 32, async=True)
+    aa, bb = AddReg("aa bb", 32, async_=True)
 
     Concat([aa, bb]).next = Concat([a, b])
     with If(reverse_order):
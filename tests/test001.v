@@ -0,0 +1,203 @@
+
+//@ test-sat-equiv-induct gold gate_1 5
+//@ test-sat-equiv-induct gold gate_2 5
+//@ test-sat-equiv-induct gold gate_3 5
+//@ test-sat-equiv-induct gold gate_4 5
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module gate_1 (
+  input [31:0] a /* test001.py:10 */,
+  input [31:0] b /* test001.py:10 */,
+  input clk /* test001.py:7 */,
+  input concat_mode /* test001.py:9 */,
+  output reg [31:0] out /* test001.py:11 */,
+  input reverse_order /* test001.py:8 */
+);
+  wire [15:0] __4c439ed7; // test001.py:15
+  wire [15:0] __4c439ed7_1; // test001.py:17
+  wire [31:0] __837d19c3; // test001.py:22
+  wire [15:0] __a77425d4; // test001.py:15
+  wire [15:0] __a77425d4_1; // test001.py:17
+  wire [31:0] __d1ab2fd2; // test001.py:20
+  wire [31:0] __e80895cd; // test001.py:15
+  wire [31:0] __f8d70000; // test001.py:17
+  reg [31:0] __next__out; // test001.py:11
+  assign __4c439ed7 = b[15:0]; // test001.py:15
+  assign __4c439ed7_1 = b[15:0]; // test001.py:17
+  assign __837d19c3 = a - b; // test001.py:22
+  assign __a77425d4 = a[15:0]; // test001.py:15
+  assign __a77425d4_1 = a[15:0]; // test001.py:17
+  assign __d1ab2fd2 = b - a; // test001.py:20
+  assign __e80895cd = {__4c439ed7,__a77425d4}; // test001.py:15
+  assign __f8d70000 = {__a77425d4_1,__4c439ed7_1}; // test001.py:17
+  always @* begin
+    __next__out = out; // test001.py:11
+    if (concat_mode) begin // test001.py:13
+      if (reverse_order) begin // test001.py:14
+        __next__out = __e80895cd; // test001.py:15
+      end
+      else begin // test001.py:16
+        __next__out = __f8d70000; // test001.py:17
+      end
+    end
+    else begin // test001.py:18
+      if (reverse_order) begin // test001.py:19
+        __next__out = __d1ab2fd2; // test001.py:20
+      end
+      else begin // test001.py:21
+        __next__out = __837d19c3; // test001.py:22
+      end
+    end
+  end
+  always @(posedge clk) begin
+    out <= __next__out; // test001.py:11
+  end
+endmodule
+
+module gate_2 (
+  input [31:0] a /* test001.py:29 */,
+  input [31:0] b /* test001.py:29 */,
+  input clk /* test001.py:26 */,
+  input concat_mode /* test001.py:28 */,
+  output reg [31:0] out /* test001.py:30 */,
+  input reverse_order /* test001.py:27 */
+);
+  wire [31:0] __8246c545; // test001.py:42
+  wire [15:0] __adcf7c33; // test001.py:42
+  wire [15:0] __df1aa131; // test001.py:42
+  wire [31:0] __e4ba2f3b; // test001.py:44
+  wire [31:0] aa; // test001.py:32
+  reg [31:0] __next__aa; // test001.py:32
+  wire [31:0] bb; // test001.py:32
+  reg [31:0] __next__bb; // test001.py:32
+  reg [31:0] __next__out; // test001.py:30
+  assign __8246c545 = {__adcf7c33,__df1aa131}; // test001.py:42
+  assign __adcf7c33 = aa[15:0]; // test001.py:42
+  assign __df1aa131 = bb[15:0]; // test001.py:42
+  assign __e4ba2f3b = aa - bb; // test001.py:44
+  always @* begin
+    __next__out = out; // test001.py:30
+    if (concat_mode) begin // test001.py:41
+      __next__out = __8246c545; // test001.py:42
+    end
+    else begin // test001.py:43
+      __next__out = __e4ba2f3b; // test001.py:44
+    end
+  end
+  always @* begin
+    __next__aa = 32'bx; // test001.py:32
+    __next__bb = 32'bx; // test001.py:32
+    if (reverse_order) begin // test001.py:34
+      __next__aa = b; // test001.py:35
+      __next__bb = a; // test001.py:36
+    end
+    else begin // test001.py:37
+      __next__aa = a; // test001.py:38
+      __next__bb = b; // test001.py:39
+    end
+  end
+  assign aa = __next__aa; // test001.py:32
+  assign bb = __next__bb; // test001.py:32
+  always @(posedge clk) begin
+    out <= __next__out; // test001.py:30
+  end
+endmodule
+
+module gate_3 (
+  input [31:0] a /* test001.py:51 */,
+  input [31:0] b /* test001.py:51 */,
+  input clk /* test001.py:48 */,
+  input concat_mode /* test001.py:50 */,
+  output reg [31:0] out /* test001.py:52 */,
+  input reverse_order /* test001.py:49 */
+);
+  wire [63:0] __4fc29f68; // test001.py:58
+  wire [31:0] __8246c545; // test001.py:60
+  wire [15:0] __adcf7c33; // test001.py:60
+  wire [31:0] __b838ff91; // test001.py:60
+  wire [63:0] __c30b26d2; // test001.py:56
+  wire [15:0] __df1aa131; // test001.py:60
+  wire [31:0] __e4ba2f3b; // test001.py:60
+  wire [31:0] aa; // test001.py:54
+  reg [31:0] __next__aa; // test001.py:54
+  wire [31:0] bb; // test001.py:54
+  reg [31:0] __next__bb; // test001.py:54
+  reg [31:0] __next__out; // test001.py:52
+  assign __4fc29f68 = {b,a}; // test001.py:58
+  assign __8246c545 = {__adcf7c33,__df1aa131}; // test001.py:60
+  assign __adcf7c33 = aa[15:0]; // test001.py:60
+  assign __b838ff91 = concat_mode ? __8246c545 : __e4ba2f3b; // test001.py:60
+  assign __c30b26d2 = {a,b}; // test001.py:56
+  assign __df1aa131 = bb[15:0]; // test001.py:60
+  assign __e4ba2f3b = aa - bb; // test001.py:60
+  always @* begin
+    __next__out = out; // test001.py:52
+    __next__out = __b838ff91; // test001.py:60
+  end
+  always @* begin
+    __next__aa = 32'bx; // test001.py:54
+    __next__bb = 32'bx; // test001.py:54
+    {__next__aa,__next__bb} = __c30b26d2; // test001.py:56
+    if (reverse_order) begin // test001.py:57
+      {__next__aa,__next__bb} = __4fc29f68; // test001.py:58
+    end
+  end
+  assign aa = __next__aa; // test001.py:54
+  assign bb = __next__bb; // test001.py:54
+  always @(posedge clk) begin
+    out <= __next__out; // test001.py:52
+  end
+endmodule
+
+module gate_4 (
+  input [31:0] a /* test001.py:67 */,
+  input [31:0] b /* test001.py:67 */,
+  input clk /* test001.py:64 */,
+  input concat_mode /* test001.py:66 */,
+  output reg [31:0] out /* test001.py:68 */,
+  input reverse_order /* test001.py:65 */
+);
+  wire [31:0] __0747b7e4; // test001.py:74
+  wire [15:0] __4c439ed7; // test001.py:73
+  wire [15:0] __4c439ed7_1; // test001.py:74
+  wire [1:0] __51f72bfc; // test001.py:70
+  wire [31:0] __597c0c5e; // test001.py:73
+  wire [31:0] __837d19c3; // test001.py:71
+  wire [15:0] __a77425d4; // test001.py:73
+  wire [15:0] __a77425d4_1; // test001.py:74
+  wire [31:0] __d1ab2fd2; // test001.py:72
+  reg [31:0] __next__out; // test001.py:68
+  assign __0747b7e4 = {__4c439ed7_1,__a77425d4_1}; // test001.py:74
+  assign __4c439ed7 = b[15:0]; // test001.py:73
+  assign __4c439ed7_1 = b[15:0]; // test001.py:74
+  assign __51f72bfc = {concat_mode,reverse_order}; // test001.py:70
+  assign __597c0c5e = {__a77425d4,__4c439ed7}; // test001.py:73
+  assign __837d19c3 = a - b; // test001.py:71
+  assign __a77425d4 = a[15:0]; // test001.py:73
+  assign __a77425d4_1 = a[15:0]; // test001.py:74
+  assign __d1ab2fd2 = b - a; // test001.py:72
+  always @* begin
+    __next__out = out; // test001.py:68
+    __next__out = (__51f72bfc[1] ? (__51f72bfc[0] ? __0747b7e4 : __597c0c5e) : (__51f72bfc[0] ? __d1ab2fd2 : __837d19c3)); // test001.py:70
+  end
+  always @(posedge clk) begin
+    out <= __next__out; // test001.py:68
+  end
+endmodule
+
+module gold(clk, reverse_order, concat_mode, a, b, out);
+  input clk, reverse_order, concat_mode;
+  input [31:0] a, b;
+  output reg [31:0] out;
+
+  always @(posedge clk) begin
+    case ({concat_mode, reverse_order})
+        2'b 00: out <= a - b;
+        2'b 01: out <= b - a;
+        2'b 10: out <= {a[15:0], b[15:0]};
+        2'b 11: out <= {b[15:0], a[15:0]};
+    endcase
+  end
+endmodule
+
@@ -0,0 +1,138 @@
+
+//@ test-sat-equiv-induct gold gate_1 5
+//@ test-sat-equiv-induct gold gate_2 5
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module gate_1 (
+  input clk /* test002.py:20 */,
+  input [7:0] in__data__blue /* test002.py:9 */,
+  input [7:0] in__data__green /* test002.py:8 */,
+  input [7:0] in__data__red /* test002.py:7 */,
+  output in__ready /* test002.py:21 */,
+  input in__valid /* test002.py:21 */,
+  output reg [7:0] out__data__gray /* test002.py:12 */,
+  input out__ready /* test002.py:22 */,
+  output reg out__valid /* test002.py:22 */
+);
+  wire [9:0] __119eebea; // test002.py:16
+  wire __228e7bd7; // test002.py:24
+  wire [9:0] __4e673904; // test002.py:16
+  wire [9:0] __5e60361a; // test002.py:16
+  wire [9:0] __6de78891; // test002.py:16
+  wire __839ace01; // test002.py:24
+  wire [9:0] __8de17d6c; // test002.py:15
+  wire [9:0] __90f14905; // test002.py:15
+  wire [9:0] __a3d40019; // test002.py:15
+  wire [9:0] __c5613900; // test002.py:16
+  wire __c5a43730; // test002.py:24
+  wire [9:0] __d592fe66; // test002.py:15
+  wire [9:0] __dc87a0a7; // test002.py:15
+  reg __next__in__ready; // test002.py:21
+  reg [7:0] __next__out__data__gray; // test002.py:12
+  reg __next__out__valid; // test002.py:22
+  assign __119eebea = __6de78891 - __c5613900; // test002.py:16
+  assign __228e7bd7 = __839ace01 | out__ready; // test002.py:24
+  assign __4e673904 = __119eebea - __5e60361a; // test002.py:16
+  assign __5e60361a = __8de17d6c >>> 32'sd4; // test002.py:16
+  assign __6de78891 = __8de17d6c >>> 32'sd1; // test002.py:16
+  assign __839ace01 = ~ out__valid; // test002.py:24
+  assign __8de17d6c = __a3d40019 + __d592fe66; // test002.py:15
+  assign __90f14905 = in__data__red; // test002.py:15
+  assign __a3d40019 = __90f14905 + __dc87a0a7; // test002.py:15
+  assign __c5613900 = __8de17d6c >>> 32'sd3; // test002.py:16
+  assign __c5a43730 = in__valid & __228e7bd7; // test002.py:24
+  assign __d592fe66 = in__data__blue; // test002.py:15
+  assign __dc87a0a7 = in__data__green; // test002.py:15
+  always @* begin
+    __next__in__ready = 1'bx; // test002.py:33
+    __next__in__ready = __c5a43730; // test002.py:24
+  end
+  always @* begin
+    __next__out__valid = out__valid; // test002.py:34
+    __next__out__data__gray = out__data__gray; // test002.py:34
+    if (out__ready) begin // test002.py:26
+      __next__out__valid = 32'sd0; // test002.py:27
+    end
+    if (in__ready) begin // test002.py:29
+      __next__out__data__gray = __4e673904; // test002.py:30
+      __next__out__valid = 32'sd1; // test002.py:31
+    end
+  end
+  assign in__ready = __next__in__ready; // test002.py:33
+  always @(posedge clk) begin
+    out__valid <= __next__out__valid; // test002.py:34
+    out__data__gray <= __next__out__data__gray; // test002.py:34
+  end
+endmodule
+
+module gate_2 (
+  input clk /* test002.py:38 */,
+  input [7:0] in__data__blue /* test002.py:38 */,
+  input [7:0] in__data__green /* test002.py:38 */,
+  input [7:0] in__data__red /* test002.py:38 */,
+  output in__ready /* test002.py:38 */,
+  input in__valid /* test002.py:38 */,
+  output [7:0] out__data__gray /* test002.py:38 */,
+  input out__ready /* test002.py:38 */,
+  output out__valid /* test002.py:38 */
+);
+  wire inst__clk; // test002.py:39
+  wire [7:0] inst__in__data__blue; // test002.py:39
+  wire [7:0] inst__in__data__green; // test002.py:39
+  wire [7:0] inst__in__data__red; // test002.py:39
+  wire inst__in__ready; // test002.py:39
+  wire inst__in__valid; // test002.py:39
+  wire [7:0] inst__out__data__gray; // test002.py:39
+  wire inst__out__ready; // test002.py:39
+  wire inst__out__valid; // test002.py:39
+  assign inst__clk = clk; // test002.py:40
+  assign inst__in__data__blue = in__data__blue; // test002.py:40
+  assign inst__in__data__green = in__data__green; // test002.py:40
+  assign inst__in__data__red = in__data__red; // test002.py:40
+  assign in__ready = inst__in__ready; // test002.py:40
+  assign inst__in__valid = in__valid; // test002.py:40
+  assign out__data__gray = inst__out__data__gray; // test002.py:40
+  assign inst__out__ready = out__ready; // test002.py:40
+  assign out__valid = inst__out__valid; // test002.py:40
+  gate_1 inst ( // test002.py:39
+    .clk(clk),
+    .in__data__blue(in__data__blue),
+    .in__data__green(in__data__green),
+    .in__data__red(in__data__red),
+    .in__ready(inst__in__ready),
+    .in__valid(in__valid),
+    .out__data__gray(inst__out__data__gray),
+    .out__ready(out__ready),
+    .out__valid(inst__out__valid)
+  );
+endmodule
+
+module gold(
+  input clk,
+
+  input [7:0] in__data__red,
+  input [7:0] in__data__green,
+  input [7:0] in__data__blue,
+  input in__valid,
+  output in__ready,
+
+  output reg [7:0] out__data__gray,
+  output reg out__valid,
+  input out__ready
+);
+  assign in__ready = in__valid && (!out__valid || out__ready);
+  wire [9:0] rgbsum = in__data__red + in__data__green + in__data__blue;
+  wire [7:0] gray = (rgbsum >> 1) - (rgbsum >> 3) - (rgbsum >> 4);
+
+  always @(posedge clk) begin
+    if (out__ready) begin
+      out__valid <= 0;
+    end
+    if (in__ready) begin
+      out__data__gray <= gray;
+      out__valid <= 1;
+    end
+  end
+endmodule
+
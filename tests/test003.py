@@ -6,7 +6,7 @@ from chipy.Chipy import *
 with AddModule("gate_1"):
     clk, wen1, wen2 = AddInput("clk wen1 wen2")
     addr1, addr2 = AddInput("addr1 addr2", 2)
-    rdata1, rdata2 = AddOutput("rdata1 rdata2", 3, async=True)
+    rdata1, rdata2 = AddOutput("rdata1 rdata2", 3, async_=True)
     wdata = AddInput("wdata", 3)
 
     mem = AddMemory("mem", 3, 4, posedge=clk)
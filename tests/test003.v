@@ -0,0 +1,67 @@
+
+//@ test-sat-equiv-bmc gold gate_1 5
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module gate_1 (
+  input [1:0] addr1 /* test003.py:8 */,
+  input [1:0] addr2 /* test003.py:8 */,
+  input clk /* test003.py:7 */,
+  output [2:0] rdata1 /* test003.py:9 */,
+  output [2:0] rdata2 /* test003.py:9 */,
+  input [2:0] wdata /* test003.py:10 */,
+  input wen1 /* test003.py:7 */,
+  input wen2 /* test003.py:7 */
+);
+  reg [2:0] mem [0:3]; // test003.py:12
+  reg __ab322b01; // test003.py:15
+  wire [2:0] __b4796a4b_1; // test003.py:21
+  wire [2:0] __b63fd412_1; // test003.py:20
+  reg __b98784ef; // test003.py:18
+  reg [2:0] __next__rdata1; // test003.py:9
+  reg [2:0] __next__rdata2; // test003.py:9
+  assign __b4796a4b_1 = mem[addr2]; // test003.py:21
+  assign __b63fd412_1 = mem[addr1]; // test003.py:20
+  always @* begin
+    __next__rdata1 = 3'bx; // test003.py:9
+    __next__rdata1 = __b63fd412_1; // test003.py:20
+  end
+  always @* begin
+    __next__rdata2 = 3'bx; // test003.py:9
+    __next__rdata2 = __b4796a4b_1; // test003.py:21
+  end
+  always @* begin
+    __ab322b01 = 1'b0; // test003.py:15
+    if (wen1) begin // test003.py:14
+      __ab322b01 = 1'b1; // test003.py:15
+    end
+  end
+  always @* begin
+    __b98784ef = 1'b0; // test003.py:18
+    if (wen2) begin // test003.py:17
+      __b98784ef = 1'b1; // test003.py:18
+    end
+  end
+  assign rdata1 = __next__rdata1; // test003.py:9
+  assign rdata2 = __next__rdata2; // test003.py:9
+  always @(posedge clk) begin
+    if (__ab322b01) mem[addr1] <= wdata; // test003.py:15
+    if (__b98784ef) mem[addr2] <= wdata; // test003.py:18
+  end
+endmodule
+
+module gold(
+  input clk, wen1, wen2,
+  input [1:0] addr1, addr2,
+  output [2:0] rdata1, rdata2,
+  input [2:0] wdata
+);
+  reg [2:0] mem [0:3];
+  assign rdata1 = mem[addr1];
+  assign rdata2 = mem[addr2];
+  always @(posedge clk) begin
+    if (wen1) mem[addr1] <= wdata;
+    if (wen2) mem[addr2] <= wdata;
+  end
+endmodule
+
@@ -13,7 +13,7 @@ with AddModule("gate_1"):
     clk = AddInput("clk")
     waddr, raddra, raddrb, raddrc = AddInput("waddr raddra raddrb raddrc", 2)
     inp = AddInput("in", abc)
-    out = AddOutput("out", abc, async=True)
+    out = AddOutput("out", abc, async_=True)
 
     mem = AddMemory("mem", abc, 4, posedge=clk)
 
@@ -28,7 +28,7 @@ with AddModule("gate_2"):
     clk = AddInput("clk")
     waddr, raddra, raddrb, raddrc = AddInput("waddr raddra raddrb raddrc", 2)
     inp = AddInput("in", abc)
-    out = AddOutput("out", abc, async=True)
+    out = AddOutput("out", abc, async_=True)
 
     mem = AddMemory("mem", abc, 4, posedge=clk)
 
@@ -36,9 +36,9 @@ with AddModule("gate_2"):
     mem.b_[waddr].next = inp.b_
     mem.c_[waddr].next = inp.c_
 
-    tmp_a = AddReg("tmp_a", abc, async=True)
-    tmp_b = AddReg("tmp_b", abc, async=True)
-    tmp_c = AddReg("tmp_c", abc, async=True)
+    tmp_a = AddReg("tmp_a", abc, async_=True)
+    tmp_b = AddReg("tmp_b", abc, async_=True)
+    tmp_c = AddReg("tmp_c", abc, async_=True)
 
     tmp_a.next = mem[raddra]
     tmp_b.next = mem[raddrb]
@@ -0,0 +1,232 @@
+
+//@ test-sat-equiv-bmc gold gate_1 5
+//@ test-sat-equiv-bmc gold gate_2 5
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module gate_1 (
+  input clk /* test004.py:13 */,
+  input [1:0] in__a /* test004.py:7 */,
+  input [1:0] in__b /* test004.py:8 */,
+  input [1:0] in__c /* test004.py:9 */,
+  output [1:0] out__a /* test004.py:7 */,
+  output [1:0] out__b /* test004.py:8 */,
+  output [1:0] out__c /* test004.py:9 */,
+  input [1:0] raddra /* test004.py:14 */,
+  input [1:0] raddrb /* test004.py:14 */,
+  input [1:0] raddrc /* test004.py:14 */,
+  input [1:0] waddr /* test004.py:14 */
+);
+  reg [1:0] mem__a [0:3]; // test004.py:7
+  reg [1:0] mem__b [0:3]; // test004.py:8
+  reg [1:0] mem__c [0:3]; // test004.py:9
+  wire [1:0] __00ac6aab; // test004.py:24
+  wire [1:0] __63740b8e; // test004.py:22
+  reg __72a4b720; // test004.py:20
+  reg __99930c23; // test004.py:20
+  reg __9d66dc1e; // test004.py:20
+  wire [1:0] __dcf8d919; // test004.py:23
+  reg [1:0] __next__out__a; // test004.py:7
+  reg [1:0] __next__out__b; // test004.py:8
+  reg [1:0] __next__out__c; // test004.py:9
+  assign __00ac6aab = mem__c[raddrc]; // test004.py:24
+  assign __63740b8e = mem__a[raddra]; // test004.py:22
+  assign __dcf8d919 = mem__b[raddrb]; // test004.py:23
+  always @* begin
+    __next__out__a = 2'bx; // test004.py:7
+    __next__out__a = __63740b8e; // test004.py:22
+  end
+  always @* begin
+    __next__out__b = 2'bx; // test004.py:8
+    __next__out__b = __dcf8d919; // test004.py:23
+  end
+  always @* begin
+    __next__out__c = 2'bx; // test004.py:9
+    __next__out__c = __00ac6aab; // test004.py:24
+  end
+  always @* begin
+    __99930c23 = 1'b0; // test004.py:20
+    __99930c23 = 1'b1; // test004.py:20
+  end
+  always @* begin
+    __72a4b720 = 1'b0; // test004.py:20
+    __72a4b720 = 1'b1; // test004.py:20
+  end
+  always @* begin
+    __9d66dc1e = 1'b0; // test004.py:20
+    __9d66dc1e = 1'b1; // test004.py:20
+  end
+  assign out__a = __next__out__a; // test004.py:7
+  assign out__b = __next__out__b; // test004.py:8
+  assign out__c = __next__out__c; // test004.py:9
+  always @(posedge clk) begin
+    if (__99930c23) mem__a[waddr] <= in__a; // test004.py:20
+  end
+  always @(posedge clk) begin
+    if (__72a4b720) mem__b[waddr] <= in__b; // test004.py:20
+  end
+  always @(posedge clk) begin
+    if (__9d66dc1e) mem__c[waddr] <= in__c; // test004.py:20
+  end
+endmodule
+
+module gate_2 (
+  input clk /* test004.py:28 */,
+  input [1:0] in__a /* test004.py:7 */,
+  input [1:0] in__b /* test004.py:8 */,
+  input [1:0] in__c /* test004.py:9 */,
+  output [1:0] out__a /* test004.py:7 */,
+  output [1:0] out__b /* test004.py:8 */,
+  output [1:0] out__c /* test004.py:9 */,
+  input [1:0] raddra /* test004.py:29 */,
+  input [1:0] raddrb /* test004.py:29 */,
+  input [1:0] raddrc /* test004.py:29 */,
+  input [1:0] waddr /* test004.py:29 */
+);
+  reg [1:0] mem__a [0:3]; // test004.py:7
+  reg [1:0] mem__b [0:3]; // test004.py:8
+  reg [1:0] mem__c [0:3]; // test004.py:9
+  wire [1:0] __00ac6aab; // test004.py:45
+  wire [1:0] __016e009c; // test004.py:44
+  wire [1:0] __0328bec5; // test004.py:43
+  wire [1:0] __60f0dfe0; // test004.py:45
+  wire [1:0] __6132b5d7; // test004.py:44
+  wire [1:0] __63740b8e; // test004.py:43
+  reg __72a4b720; // test004.py:36
+  reg __99930c23; // test004.py:35
+  reg __9d66dc1e; // test004.py:37
+  wire [1:0] __dcf8d919; // test004.py:44
+  wire [1:0] __dd3ab32e; // test004.py:45
+  wire [1:0] __debe6740; // test004.py:43
+  reg [1:0] __next__out__a; // test004.py:7
+  reg [1:0] __next__out__b; // test004.py:8
+  reg [1:0] __next__out__c; // test004.py:9
+  wire [1:0] tmp_a__a; // test004.py:7
+  reg [1:0] __next__tmp_a__a; // test004.py:7
+  wire [1:0] tmp_a__b; // test004.py:8
+  reg [1:0] __next__tmp_a__b; // test004.py:8
+  wire [1:0] tmp_a__c; // test004.py:9
+  reg [1:0] __next__tmp_a__c; // test004.py:9
+  wire [1:0] tmp_b__a; // test004.py:7
+  reg [1:0] __next__tmp_b__a; // test004.py:7
+  wire [1:0] tmp_b__b; // test004.py:8
+  reg [1:0] __next__tmp_b__b; // test004.py:8
+  wire [1:0] tmp_b__c; // test004.py:9
+  reg [1:0] __next__tmp_b__c; // test004.py:9
+  wire [1:0] tmp_c__a; // test004.py:7
+  reg [1:0] __next__tmp_c__a; // test004.py:7
+  wire [1:0] tmp_c__b; // test004.py:8
+  reg [1:0] __next__tmp_c__b; // test004.py:8
+  wire [1:0] tmp_c__c; // test004.py:9
+  reg [1:0] __next__tmp_c__c; // test004.py:9
+  assign __00ac6aab = mem__c[raddrc]; // test004.py:45
+  assign __016e009c = mem__c[raddrb]; // test004.py:44
+  assign __0328bec5 = mem__c[raddra]; // test004.py:43
+  assign __60f0dfe0 = mem__a[raddrc]; // test004.py:45
+  assign __6132b5d7 = mem__a[raddrb]; // test004.py:44
+  assign __63740b8e = mem__a[raddra]; // test004.py:43
+  assign __dcf8d919 = mem__b[raddrb]; // test004.py:44
+  assign __dd3ab32e = mem__b[raddrc]; // test004.py:45
+  assign __debe6740 = mem__b[raddra]; // test004.py:43
+  always @* begin
+    __next__out__a = 2'bx; // test004.py:7
+    __next__out__a = tmp_a__a; // test004.py:47
+  end
+  always @* begin
+    __next__out__b = 2'bx; // test004.py:8
+    __next__out__b = tmp_b__b; // test004.py:48
+  end
+  always @* begin
+    __next__out__c = 2'bx; // test004.py:9
+    __next__out__c = tmp_c__c; // test004.py:49
+  end
+  always @* begin
+    __99930c23 = 1'b0; // test004.py:35
+    __99930c23 = 1'b1; // test004.py:35
+  end
+  always @* begin
+    __72a4b720 = 1'b0; // test004.py:36
+    __72a4b720 = 1'b1; // test004.py:36
+  end
+  always @* begin
+    __9d66dc1e = 1'b0; // test004.py:37
+    __9d66dc1e = 1'b1; // test004.py:37
+  end
+  always @* begin
+    __next__tmp_a__a = 2'bx; // test004.py:7
+    __next__tmp_a__a = __63740b8e; // test004.py:43
+  end
+  always @* begin
+    __next__tmp_a__b = 2'bx; // test004.py:8
+    __next__tmp_a__b = __debe6740; // test004.py:43
+  end
+  always @* begin
+    __next__tmp_a__c = 2'bx; // test004.py:9
+    __next__tmp_a__c = __0328bec5; // test004.py:43
+  end
+  always @* begin
+    __next__tmp_b__a = 2'bx; // test004.py:7
+    __next__tmp_b__a = __6132b5d7; // test004.py:44
+  end
+  always @* begin
+    __next__tmp_b__b = 2'bx; // test004.py:8
+    __next__tmp_b__b = __dcf8d919; // test004.py:44
+  end
+  always @* begin
+    __next__tmp_b__c = 2'bx; // test004.py:9
+    __next__tmp_b__c = __016e009c; // test004.py:44
+  end
+  always @* begin
+    __next__tmp_c__a = 2'bx; // test004.py:7
+    __next__tmp_c__a = __60f0dfe0; // test004.py:45
+  end
+  always @* begin
+    __next__tmp_c__b = 2'bx; // test004.py:8
+    __next__tmp_c__b = __dd3ab32e; // test004.py:45
+  end
+  always @* begin
+    __next__tmp_c__c = 2'bx; // test004.py:9
+    __next__tmp_c__c = __00ac6aab; // test004.py:45
+  end
+  assign out__a = __next__out__a; // test004.py:7
+  assign out__b = __next__out__b; // test004.py:8
+  assign out__c = __next__out__c; // test004.py:9
+  assign tmp_a__a = __next__tmp_a__a; // test004.py:7
+  assign tmp_a__b = __next__tmp_a__b; // test004.py:8
+  assign tmp_a__c = __next__tmp_a__c; // test004.py:9
+  assign tmp_b__a = __next__tmp_b__a; // test004.py:7
+  assign tmp_b__b = __next__tmp_b__b; // test004.py:8
+  assign tmp_b__c = __next__tmp_b__c; // test004.py:9
+  assign tmp_c__a = __next__tmp_c__a; // test004.py:7
+  assign tmp_c__b = __next__tmp_c__b; // test004.py:8
+  assign tmp_c__c = __next__tmp_c__c; // test004.py:9
+  always @(posedge clk) begin
+    if (__99930c23) mem__a[waddr] <= in__a; // test004.py:35
+  end
+  always @(posedge clk) begin
+    if (__72a4b720) mem__b[waddr] <= in__b; // test004.py:36
+  end
+  always @(posedge clk) begin
+    if (__9d66dc1e) mem__c[waddr] <= in__c; // test004.py:37
+  end
+endmodule
+
+module gold(
+  input clk,
+  input [1:0] waddr, raddra, raddrb, raddrc,
+  input [1:0] in__a, in__b, in__c,
+  output [1:0] out__a, out__b, out__c,
+);
+  reg [1:0] mem_a [0:3];
+  reg [1:0] mem_b [0:3];
+  reg [1:0] mem_c [0:3];
+  assign out__a = mem_a[raddra];
+  assign out__b = mem_b[raddrb];
+  assign out__c = mem_c[raddrc];
+  always @(posedge clk) begin
+    mem_a[waddr] <= in__a;
+    mem_b[waddr] <= in__b;
+    mem_c[waddr] <= in__c;
+  end
+endmodule
+
@@ -6,7 +6,7 @@ from chipy.Chipy import *
 with AddModule("gate_1"):
     clk = AddInput("clk")
     addr1, addr2, din = AddInput("addr1 addr2 din", 2)
-    dout = AddOutput("dout", 8, async=True)
+    dout = AddOutput("dout", 8, async_=True)
 
     mem1, mem2 = AddMemory("mem1 mem2", 4, 4, posedge=clk)
 
@@ -0,0 +1,62 @@
+
+//@ test-sat-equiv-bmc gold gate_1 5
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module gate_1 (
+  input [1:0] addr1 /* test005.py:8 */,
+  input [1:0] addr2 /* test005.py:8 */,
+  input clk /* test005.py:7 */,
+  input [1:0] din /* test005.py:8 */,
+  output [7:0] dout /* test005.py:9 */
+);
+  reg [3:0] mem1 [0:3]; // test005.py:11
+  reg [3:0] mem2 [0:3]; // test005.py:11
+  wire __03a51544; // test005.py:13
+  wire __27de0db5; // test005.py:14
+  wire [3:0] __8005f812_1; // test005.py:16
+  reg __be8304a9; // test005.py:13
+  wire [7:0] __e67be146; // test005.py:16
+  reg __ed195f2d; // test005.py:14
+  wire [3:0] __f5dd94bb; // test005.py:16
+  reg [7:0] __next__dout; // test005.py:9
+  assign __03a51544 = din[1]; // test005.py:13
+  assign __27de0db5 = din[0]; // test005.py:14
+  assign __8005f812_1 = mem1[addr1]; // test005.py:16
+  assign __e67be146 = {__8005f812_1,__f5dd94bb}; // test005.py:16
+  assign __f5dd94bb = mem2[addr2]; // test005.py:16
+  always @* begin
+    __next__dout = 8'bx; // test005.py:9
+    __next__dout = __e67be146; // test005.py:16
+  end
+  always @* begin
+    __be8304a9 = 1'b0; // test005.py:13
+    __be8304a9 = 1'b1; // test005.py:13
+  end
+  always @* begin
+    __ed195f2d = 1'b0; // test005.py:14
+    __ed195f2d = 1'b1; // test005.py:14
+  end
+  assign dout = __next__dout; // test005.py:9
+  always @(posedge clk) begin
+    if (__be8304a9) mem1[addr1][addr2] <= __03a51544; // test005.py:13
+  end
+  always @(posedge clk) begin
+    if (__ed195f2d) mem2[addr1][addr2] <= __27de0db5; // test005.py:14
+  end
+endmodule
+
+module gold(
+  input clk,
+  input [1:0] addr1, addr2, din,
+  output [7:0] dout
+);
+  reg [3:0] mem1 [0:3];
+  reg [3:0] mem2 [0:3];
+  assign dout = {mem1[addr1], mem2[addr2]};
+  always @(posedge clk) begin
+    mem1[addr1][addr2] <= din[1];
+    mem2[addr1][addr2] <= din[0];
+  end
+endmodule
+
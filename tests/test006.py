@@ -6,7 +6,7 @@ from chipy.Chipy import *
 with AddModule("gate_1"):
     sel = AddInput("sel", 2)
     din = AddInput("din", 32)
-    dout = AddOutput("dout", 32, async=True)
+    dout = AddOutput("dout", 32, async_=True)
 
     dout.next = 0
 
@@ -0,0 +1,97 @@
+
+//@ test-sat-equiv-comb gold gate_1
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module gate_1 (
+  input [31:0] din /* test006.py:8 */,
+  output [31:0] dout /* test006.py:9 */,
+  input [1:0] sel /* test006.py:7 */
+);
+  wire [31:0] __03336c02; // test006.py:24
+  wire __14c624e2; // test006.py:20
+  wire [31:0] __2afbd8f0; // test006.py:22
+  wire [15:0] __40c07d69; // test006.py:16
+  wire __5d3f9838; // test006.py:19
+  wire [3:0] __607e7765; // test006.py:20
+  wire [3:0] __607e7765_1; // test006.py:22
+  wire [3:0] __607e7765_2; // test006.py:24
+  wire [15:0] __640859f6; // test006.py:15
+  wire [4:0] __76ef63b8; // test006.py:22
+  wire [4:0] __c5557bd8; // test006.py:24
+  wire __ca60ce3a; // test006.py:19
+  wire [31:0] __cc77104b; // test006.py:24
+  wire [31:0] __e5bfa4b9; // test006.py:22
+  wire [3:0] __f19214a1; // test006.py:20
+  wire [3:0] __f19214a1_1; // test006.py:22
+  wire [3:0] __f19214a1_2; // test006.py:24
+  wire __fa8af9bb; // test006.py:18
+  reg [31:0] __next__dout; // test006.py:9
+  assign __03336c02 = 32'sd10 + __f19214a1_2; // test006.py:24
+  assign __14c624e2 = din[__f19214a1]; // test006.py:20
+  assign __2afbd8f0 = 32'sd10 + __f19214a1_1; // test006.py:22
+  assign __40c07d69 = din[15:0]; // test006.py:16
+  assign __5d3f9838 = din[20]; // test006.py:19
+  assign __607e7765 = din[3:0]; // test006.py:20
+  assign __607e7765_1 = din[3:0]; // test006.py:22
+  assign __607e7765_2 = din[3:0]; // test006.py:24
+  assign __640859f6 = din[31:16]; // test006.py:15
+  assign __76ef63b8 = din[__2afbd8f0 -: 5]; // test006.py:22
+  assign __c5557bd8 = din[__03336c02 +: 5]; // test006.py:24
+  assign __ca60ce3a = ~ __5d3f9838; // test006.py:19
+  assign __cc77104b = 32'sd10 + __607e7765_2; // test006.py:24
+  assign __e5bfa4b9 = 32'sd10 + __607e7765_1; // test006.py:22
+  assign __f19214a1 = din[7:4]; // test006.py:20
+  assign __f19214a1_1 = din[7:4]; // test006.py:22
+  assign __f19214a1_2 = din[7:4]; // test006.py:24
+  assign __fa8af9bb = din[30]; // test006.py:18
+  always @* begin
+    __next__dout = 32'bx; // test006.py:9
+    __next__dout = 32'sd0; // test006.py:11
+    (* parallel_case *) case (sel) // test006.py:13
+      32'sd0: begin // test006.py:14
+        __next__dout[15:0] = __640859f6; // test006.py:15
+        __next__dout[31:16] = __40c07d69; // test006.py:16
+      end
+      32'sd1: begin // test006.py:17
+        __next__dout[1] = __fa8af9bb; // test006.py:18
+        __next__dout[7] = __ca60ce3a; // test006.py:19
+        __next__dout[__607e7765] = __14c624e2; // test006.py:20
+      end
+      32'sd2: begin // test006.py:21
+        __next__dout[__e5bfa4b9 +: 5] = __76ef63b8; // test006.py:22
+      end
+      32'sd3: begin // test006.py:23
+        __next__dout[__cc77104b -: 5] = __c5557bd8; // test006.py:24
+      end
+    endcase
+  end
+  assign dout = __next__dout; // test006.py:9
+endmodule
+
+module gold(
+  input [1:0] sel,
+  input [31:0] din,
+  output reg [31:0] dout
+);
+  always @* begin
+    dout = 0;
+    case (sel)
+      0: begin
+        {dout[15:0], dout[31:16]} = din;
+      end
+      1: begin
+        dout[1] = din[30];
+        dout[7] = ~din[20];
+        dout[din[3:0]] = din[din[7:4]];
+      end
+      2: begin
+        dout[10 + din[3:0] +: 5] = din[10 + din[7:4] -: 5];
+      end
+      3: begin
+        dout[10 + din[3:0] -: 5] = din[10 + din[7:4] +: 5];
+      end
+    endcase
+  end
+endmodule
+
@@ -6,7 +6,7 @@ from chipy.Chipy import *
 with AddModule("gate_1"):
     sel = AddInput("sel", 5)
     a, b = AddInput("a b", 8)
-    y = AddOutput("y", 8, async=True)
+    y = AddOutput("y", 8, async_=True)
 
     with Switch(sel):
         with Case( 0): y.next = -a
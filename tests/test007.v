@@ -0,0 +1,100 @@
+
+//@ test-sat-equiv-comb gold gate_1
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module gate_1 (
+  input [7:0] a /* test007.py:8 */,
+  input [7:0] b /* test007.py:8 */,
+  input [4:0] sel /* test007.py:7 */,
+  output [7:0] y /* test007.py:9 */
+);
+  wire [7:0] __0ae8830f; // test007.py:19
+  wire [7:0] __1d5e9adb; // test007.py:16
+  wire [7:0] __2403d987; // test007.py:18
+  wire [7:0] __26d738b7; // test007.py:13
+  wire [7:0] __456ac16b; // test007.py:17
+  wire __5af2ea48; // test007.py:22
+  wire [2:0] __68e6d81e; // test007.py:31
+  wire [7:0] __837d19c3; // test007.py:15
+  wire __8bbaa67f; // test007.py:24
+  wire __901c6902; // test007.py:29
+  wire [7:0] __907778d1; // test007.py:20
+  wire __9d231ab1; // test007.py:27
+  wire __a5225b51; // test007.py:21
+  wire __bb9c2ee5; // test007.py:25
+  wire [7:0] __bca3c472; // test007.py:14
+  wire __bebbb032; // test007.py:31
+  wire __c57eee1a; // test007.py:26
+  wire __c7fd0b3e; // test007.py:23
+  wire [3:0] __e1d2d3b8; // test007.py:31
+  wire [7:0] __e2cce549; // test007.py:12
+  wire __e3104da7; // test007.py:28
+  wire __e3104da7_1; // test007.py:30
+  reg [7:0] __next__y; // test007.py:9
+  assign __0ae8830f = a | b; // test007.py:19
+  assign __1d5e9adb = a <<< b; // test007.py:16
+  assign __2403d987 = a & b; // test007.py:18
+  assign __26d738b7 = ~ a; // test007.py:13
+  assign __456ac16b = a >>> b; // test007.py:17
+  assign __5af2ea48 = a <= b; // test007.py:22
+  assign __68e6d81e = b[2:0]; // test007.py:31
+  assign __837d19c3 = a - b; // test007.py:15
+  assign __8bbaa67f = a != b; // test007.py:24
+  assign __901c6902 = ^ a; // test007.py:29
+  assign __907778d1 = a ^ b; // test007.py:20
+  assign __9d231ab1 = & a; // test007.py:27
+  assign __a5225b51 = a < b; // test007.py:21
+  assign __bb9c2ee5 = a >= b; // test007.py:25
+  assign __bca3c472 = a + b; // test007.py:14
+  assign __bebbb032 = a[__68e6d81e]; // test007.py:31
+  assign __c57eee1a = a > b; // test007.py:26
+  assign __c7fd0b3e = a == b; // test007.py:23
+  assign __e1d2d3b8 = {4{__bebbb032}}; // test007.py:31
+  assign __e2cce549 = - a; // test007.py:12
+  assign __e3104da7 = | a; // test007.py:28
+  assign __e3104da7_1 = | a; // test007.py:30
+  always @* begin
+    __next__y = 8'bx; // test007.py:9
+    __next__y = (sel[4] ? (sel[3] ? 8'h0 : (sel[2] ? 8'h0 : (sel[1] ? (sel[0] ? {4'd0,__e1d2d3b8} : {7'd0,__e3104da7_1}) : (sel[0] ? {7'd0,__901c6902} : {7'd0,__e3104da7})))) : (sel[3] ? (sel[2] ? (sel[1] ? (sel[0] ? {7'd0,__9d231ab1} : {7'd0,__c57eee1a}) : (sel[0] ? {7'd0,__bb9c2ee5} : {7'd0,__8bbaa67f})) : (sel[1] ? (sel[0] ? {7'd0,__c7fd0b3e} : {7'd0,__5af2ea48}) : (sel[0] ? {7'd0,__a5225b51} : __907778d1))) : (sel[2] ? (sel[1] ? (sel[0] ? __0ae8830f : __2403d987) : (sel[0] ? __456ac16b : __1d5e9adb)) : (sel[1] ? (sel[0] ? __837d19c3 : __bca3c472) : (sel[0] ? __26d738b7 : __e2cce549))))); // test007.py:11
+  end
+  assign y = __next__y; // test007.py:9
+endmodule
+
+module gold(
+  input [4:0] sel,
+  input [7:0] a, b,
+  output reg [7:0] y
+);
+  always @* begin
+    case (sel)
+       0: y = -a;
+       1: y = ~a;
+
+       2: y = a + b;
+       3: y = a - b;
+       4: y = a << b;
+       5: y = a >> b;
+       6: y = a & b;
+       7: y = a | b;
+       8: y = a ^ b;
+
+       9: y = a < b;
+      10: y = a <= b;
+      11: y = a == b;
+      12: y = a != b;
+      13: y = a >= b;
+      14: y = a > b;
+
+      15: y = &a;
+      16: y = |a;
+      17: y = ^a;
+      18: y = !!a;
+
+      19: y = {4{a[b[2:0]]}};
+
+      default: y = 0;
+    endcase
+  end
+endmodule
+
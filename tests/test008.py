@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+from chipy.Chipy import *
+from chipy.analysis import *
+
+
+with AddModule("gate_1"):
+    clk = AddInput("clk")
+    sel = AddInput("sel", 2)
+    a, b = AddInput("a b", 8)
+    out = AddOutput("out", 8, posedge=clk)
+
+    with If(sel == 0):
+        out.next = a + b
+    with ElseIf(sel == 1):
+        out.next = a - b
+    with ElseIf(sel == 2):
+        out.next = (a + b) * b
+    with Else():
+        out.next = a
+
+
+with AddModule("gate_2"):
+    clk = AddInput("clk")
+    sel = AddInput("sel", 2)
+    a, b = AddInput("a b", 8)
+    out = AddOutput("out", 8, posedge=clk)
+
+    with Switch(sel, parallel=True):
+        with Case(0): out.next = a + b
+        with Case(1): out.next = a - b
+        with Case(2): out.next = (a + b) * b
+        with Default(): out.next = a
+
+
+timing = TimingAnalysis(Module("gate_1"))
+assert timing.depth() == 4 + 8 + 3
+kind, path = timing.paths(1)[0]
+assert kind == "register" and path[-1][0] == "out"
+assert path[0][0] in ("a", "b")
+assert dict(timing.fanout())["sel"] == 3
+
+
+with open("test008.v", "w") as f:
+    print("""
+//@ test-sat-equiv-induct gold gate_1 5
+//@ test-sat-equiv-induct gold gate_2 5
+""", file=f)
+
+    WriteVerilog(f)
+
+    print("""
+module gold(clk, sel, a, b, out);
+  input clk;
+  input [1:0] sel;
+  input [7:0] a, b;
+  output reg [7:0] out;
+
+  always @(posedge clk) begin
+    case (sel)
+      0: out <= a + b;
+      1: out <= a - b;
+      2: out <= (a + b) * b;
+      3: out <= a;
+    endcase
+  end
+endmodule
+""", file=f)
@@ -0,0 +1,89 @@
+
+//@ test-sat-equiv-induct gold gate_1 5
+//@ test-sat-equiv-induct gold gate_2 5
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module gate_1 (
+  input [7:0] a /* test008.py:10 */,
+  input [7:0] b /* test008.py:10 */,
+  input clk /* test008.py:8 */,
+  output reg [7:0] out /* test008.py:11 */,
+  input [1:0] sel /* test008.py:9 */
+);
+  wire __20a7c467; // test008.py:15
+  wire __2165ae50; // test008.py:13
+  wire __22e17a3e; // test008.py:17
+  wire [7:0] __837d19c3; // test008.py:16
+  wire [7:0] __bca3c472; // test008.py:14
+  wire [7:0] __bca3c472_1; // test008.py:18
+  wire [7:0] __c2dddbd6; // test008.py:18
+  reg [7:0] __next__out; // test008.py:11
+  assign __20a7c467 = sel == 32'sd1; // test008.py:15
+  assign __2165ae50 = sel == 32'sd0; // test008.py:13
+  assign __22e17a3e = sel == 32'sd2; // test008.py:17
+  assign __837d19c3 = a - b; // test008.py:16
+  assign __bca3c472 = a + b; // test008.py:14
+  assign __bca3c472_1 = a + b; // test008.py:18
+  assign __c2dddbd6 = __bca3c472_1 * b; // test008.py:18
+  always @* begin
+    __next__out = out; // test008.py:11
+    if (__2165ae50) begin // test008.py:13
+      __next__out = __bca3c472; // test008.py:14
+    end
+    else if (__20a7c467) begin // test008.py:15
+      __next__out = __837d19c3; // test008.py:16
+    end
+    else if (__22e17a3e) begin // test008.py:17
+      __next__out = __c2dddbd6; // test008.py:18
+    end
+    else begin // test008.py:19
+      __next__out = a; // test008.py:20
+    end
+  end
+  always @(posedge clk) begin
+    out <= __next__out; // test008.py:11
+  end
+endmodule
+
+module gate_2 (
+  input [7:0] a /* test008.py:26 */,
+  input [7:0] b /* test008.py:26 */,
+  input clk /* test008.py:24 */,
+  output reg [7:0] out /* test008.py:27 */,
+  input [1:0] sel /* test008.py:25 */
+);
+  wire [7:0] __837d19c3; // test008.py:31
+  wire [7:0] __bca3c472; // test008.py:30
+  wire [7:0] __bca3c472_1; // test008.py:32
+  wire [7:0] __c2dddbd6; // test008.py:32
+  reg [7:0] __next__out; // test008.py:27
+  assign __837d19c3 = a - b; // test008.py:31
+  assign __bca3c472 = a + b; // test008.py:30
+  assign __bca3c472_1 = a + b; // test008.py:32
+  assign __c2dddbd6 = __bca3c472_1 * b; // test008.py:32
+  always @* begin
+    __next__out = out; // test008.py:27
+    __next__out = (sel[1] ? (sel[0] ? a : __c2dddbd6) : (sel[0] ? __837d19c3 : __bca3c472)); // test008.py:29
+  end
+  always @(posedge clk) begin
+    out <= __next__out; // test008.py:27
+  end
+endmodule
+
+module gold(clk, sel, a, b, out);
+  input clk;
+  input [1:0] sel;
+  input [7:0] a, b;
+  output reg [7:0] out;
+
+  always @(posedge clk) begin
+    case (sel)
+      0: out <= a + b;
+      1: out <= a - b;
+      2: out <= (a + b) * b;
+      3: out <= a;
+    endcase
+  end
+endmodule
+
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+
+from chipy.Chipy import *
+from chipy.transform import *
+
+
+with AddModule("gate_1"):
+    clk = AddInput("clk")
+    a, b, c = AddInput("a b c", 8)
+    x, y = AddOutput("x y", 8, posedge=clk)
+
+    (px, py), latency = Pipeline([((a + b) * c) ^ (a - c), a + c], 8, posedge=clk)
+    assert latency == [2, 2]
+
+    x.next = px
+    y.next = py
+
+
+with AddModule("gate_2"):
+    clk = AddInput("clk")
+    a, b, c = AddInput("a b c", 8)
+    x = AddOutput("x", 8, posedge=clk)
+
+    px, latency = Pipeline(((a + b) * c) ^ (a - c), 100, posedge=clk)
+    assert latency == 0
+
+    x.next = px
+
+
+with open("test009.v", "w") as f:
+    print("""
+//@ test-sat-equiv-induct gold gate_1 5
+""", file=f)
+
+    WriteVerilog(f)
+
+    print("""
+module gold(clk, a, b, c, x, y);
+  input clk;
+  input [7:0] a, b, c;
+  output reg [7:0] x, y;
+
+  reg [7:0] a1, b1, c1, a2, b2, c2;
+
+  always @(posedge clk) begin
+    {a1, b1, c1} <= {a, b, c};
+    {a2, b2, c2} <= {a1, b1, c1};
+    x <= ((a2 + b2) * c2) ^ (a2 - c2);
+    y <= a2 + c2;
+  end
+endmodule
+""", file=f)
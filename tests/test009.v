@@ -0,0 +1,128 @@
+
+//@ test-sat-equiv-induct gold gate_1 5
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module gate_1 (
+  input [7:0] a /* test009.py:9 */,
+  input [7:0] b /* test009.py:9 */,
+  input [7:0] c /* test009.py:9 */,
+  input clk /* test009.py:8 */,
+  output reg [7:0] x /* test009.py:10 */,
+  output reg [7:0] y /* test009.py:10 */
+);
+  wire [7:0] __12cb55e3_1; // test009.py:12
+  reg [7:0] __1f59592f; // test009.py:12
+  reg [7:0] __next____1f59592f; // test009.py:12
+  wire [7:0] __26685416; // test009.py:12
+  wire [7:0] __2d158852_1; // test009.py:12
+  reg [7:0] __656ed982; // test009.py:12
+  reg [7:0] __next____656ed982; // test009.py:12
+  reg [7:0] __69530803; // test009.py:12
+  reg [7:0] __next____69530803; // test009.py:12
+  reg [7:0] __9822b324; // test009.py:12
+  reg [7:0] __next____9822b324; // test009.py:12
+  wire [7:0] __ab5ba118; // test009.py:12
+  wire [7:0] __bca3c472_1; // test009.py:12
+  reg [7:0] __c5482786; // test009.py:12
+  reg [7:0] __next____c5482786; // test009.py:12
+  reg [7:0] __ea0792bd; // test009.py:12
+  reg [7:0] __next____ea0792bd; // test009.py:12
+  reg [7:0] __fcd555c0; // test009.py:12
+  reg [7:0] __next____fcd555c0; // test009.py:12
+  reg [7:0] __next__x; // test009.py:10
+  reg [7:0] __next__y; // test009.py:10
+  assign __12cb55e3_1 = a + c; // test009.py:12
+  assign __26685416 = __ea0792bd ^ __69530803; // test009.py:12
+  assign __2d158852_1 = a - c; // test009.py:12
+  assign __ab5ba118 = __c5482786 * __656ed982; // test009.py:12
+  assign __bca3c472_1 = a + b; // test009.py:12
+  always @* begin
+    __next__x = x; // test009.py:10
+    __next__x = __26685416; // test009.py:15
+  end
+  always @* begin
+    __next__y = y; // test009.py:10
+    __next__y = __fcd555c0; // test009.py:16
+  end
+  always @* begin
+    __next____c5482786 = __c5482786; // test009.py:12
+    __next____c5482786 = __bca3c472_1; // test009.py:12
+  end
+  always @* begin
+    __next____656ed982 = __656ed982; // test009.py:12
+    __next____656ed982 = c; // test009.py:12
+  end
+  always @* begin
+    __next____ea0792bd = __ea0792bd; // test009.py:12
+    __next____ea0792bd = __ab5ba118; // test009.py:12
+  end
+  always @* begin
+    __next____9822b324 = __9822b324; // test009.py:12
+    __next____9822b324 = __2d158852_1; // test009.py:12
+  end
+  always @* begin
+    __next____69530803 = __69530803; // test009.py:12
+    __next____69530803 = __9822b324; // test009.py:12
+  end
+  always @* begin
+    __next____1f59592f = __1f59592f; // test009.py:12
+    __next____1f59592f = __12cb55e3_1; // test009.py:12
+  end
+  always @* begin
+    __next____fcd555c0 = __fcd555c0; // test009.py:12
+    __next____fcd555c0 = __1f59592f; // test009.py:12
+  end
+  always @(posedge clk) begin
+    x <= __next__x; // test009.py:10
+    y <= __next__y; // test009.py:10
+    __c5482786 <= __next____c5482786; // test009.py:12
+    __656ed982 <= __next____656ed982; // test009.py:12
+    __ea0792bd <= __next____ea0792bd; // test009.py:12
+    __9822b324 <= __next____9822b324; // test009.py:12
+    __69530803 <= __next____69530803; // test009.py:12
+    __1f59592f <= __next____1f59592f; // test009.py:12
+    __fcd555c0 <= __next____fcd555c0; // test009.py:12
+  end
+endmodule
+
+module gate_2 (
+  input [7:0] a /* test009.py:21 */,
+  input [7:0] b /* test009.py:21 */,
+  input [7:0] c /* test009.py:21 */,
+  input clk /* test009.py:20 */,
+  output reg [7:0] x /* test009.py:22 */
+);
+  wire [7:0] __2d158852_1; // test009.py:24
+  wire [7:0] __5d40ec32; // test009.py:24
+  wire [7:0] __6cb54a47; // test009.py:24
+  wire [7:0] __bca3c472_1; // test009.py:24
+  reg [7:0] __next__x; // test009.py:22
+  assign __2d158852_1 = a - c; // test009.py:24
+  assign __5d40ec32 = __6cb54a47 ^ __2d158852_1; // test009.py:24
+  assign __6cb54a47 = __bca3c472_1 * c; // test009.py:24
+  assign __bca3c472_1 = a + b; // test009.py:24
+  always @* begin
+    __next__x = x; // test009.py:22
+    __next__x = __5d40ec32; // test009.py:27
+  end
+  always @(posedge clk) begin
+    x <= __next__x; // test009.py:22
+  end
+endmodule
+
+module gold(clk, a, b, c, x, y);
+  input clk;
+  input [7:0] a, b, c;
+  output reg [7:0] x, y;
+
+  reg [7:0] a1, b1, c1, a2, b2, c2;
+
+  always @(posedge clk) begin
+    {a1, b1, c1} <= {a, b, c};
+    {a2, b2, c2} <= {a1, b1, c1};
+    x <= ((a2 + b2) * c2) ^ (a2 - c2);
+    y <= a2 + c2;
+  end
+endmodule
+
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+from chipy.Chipy import *
+from chipy.analysis import *
+
+
+with AddModule("gate_1"):
+    clk1, clk2 = AddInput("clk1 clk2")
+    a, b = AddInput("a b", 8)
+    flag = AddInput("flag")
+
+    x = AddReg("x", 8, posedge=clk1)
+    y = AddReg("y", 8, negedge=clk2)
+    f1, f2 = AddReg("f1 f2", 1, posedge=clk1)
+    s1, s2 = AddReg("s1 s2", 1, negedge=clk2)
+    out = AddOutput("out", 8, negedge=clk2)
+    sync = AddOutput("sync", 1, negedge=clk2)
+
+    x.next = a + b
+    f1.next = flag
+    f2.next = f1
+    y.next = b
+    s1.next = f2
+    s2.next = s1
+    out.next = x ^ y
+    sync.next = s2
+
+
+crossings = ClockDomainCrossings(Module("gate_1"))
+assert len(Module("gate_1").clock_domains) == 2
+assert sorted((dst, src, synchronized) for dst, dst_domain, src, src_domain, synchronized in crossings) == \
+        [("out", "x", False), ("s1", "f2", True)]
+
+
+with open("test010.v", "w") as f:
+    print("""
+//@ test-sat-equiv-induct gold gate_1 5
+""", file=f)
+
+    WriteVerilog(f)
+
+    print("""
+module gold(clk1, clk2, a, b, flag, out, sync);
+  input clk1, clk2, flag;
+  input [7:0] a, b;
+  output reg [7:0] out;
+  output reg sync;
+
+  reg [7:0] x, y;
+  reg f1, f2, s1, s2;
+
+  always @(posedge clk1) begin
+    x <= a + b;
+    f1 <= flag;
+    f2 <= f1;
+  end
+
+  always @(negedge clk2) begin
+    y <= b;
+    s1 <= f2;
+    s2 <= s1;
+    out <= x ^ y;
+    sync <= s2;
+  end
+endmodule
+""", file=f)
@@ -0,0 +1,102 @@
+
+//@ test-sat-equiv-induct gold gate_1 5
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module gate_1 (
+  input [7:0] a /* test010.py:9 */,
+  input [7:0] b /* test010.py:9 */,
+  input clk1 /* test010.py:8 */,
+  input clk2 /* test010.py:8 */,
+  input flag /* test010.py:10 */,
+  output reg [7:0] out /* test010.py:16 */,
+  output reg sync /* test010.py:17 */
+);
+  wire [7:0] __bca3c472; // test010.py:19
+  wire [7:0] __dd47f5f6; // test010.py:25
+  reg f1; // test010.py:14
+  reg __next__f1; // test010.py:14
+  reg f2; // test010.py:14
+  reg __next__f2; // test010.py:14
+  reg [7:0] __next__out; // test010.py:16
+  reg s1; // test010.py:15
+  reg __next__s1; // test010.py:15
+  reg s2; // test010.py:15
+  reg __next__s2; // test010.py:15
+  reg __next__sync; // test010.py:17
+  reg [7:0] x; // test010.py:12
+  reg [7:0] __next__x; // test010.py:12
+  reg [7:0] y; // test010.py:13
+  reg [7:0] __next__y; // test010.py:13
+  assign __bca3c472 = a + b; // test010.py:19
+  assign __dd47f5f6 = x ^ y; // test010.py:25
+  always @* begin
+    __next__x = x; // test010.py:12
+    __next__x = __bca3c472; // test010.py:19
+  end
+  always @* begin
+    __next__y = y; // test010.py:13
+    __next__y = b; // test010.py:22
+  end
+  always @* begin
+    __next__f1 = f1; // test010.py:14
+    __next__f1 = flag; // test010.py:20
+  end
+  always @* begin
+    __next__f2 = f2; // test010.py:14
+    __next__f2 = f1; // test010.py:21
+  end
+  always @* begin
+    __next__s1 = s1; // test010.py:15
+    __next__s1 = f2; // test010.py:23
+  end
+  always @* begin
+    __next__s2 = s2; // test010.py:15
+    __next__s2 = s1; // test010.py:24
+  end
+  always @* begin
+    __next__out = out; // test010.py:16
+    __next__out = __dd47f5f6; // test010.py:25
+  end
+  always @* begin
+    __next__sync = sync; // test010.py:17
+    __next__sync = s2; // test010.py:26
+  end
+  always @(posedge clk1) begin
+    x <= __next__x; // test010.py:12
+    f1 <= __next__f1; // test010.py:14
+    f2 <= __next__f2; // test010.py:14
+  end
+  always @(negedge clk2) begin
+    y <= __next__y; // test010.py:13
+    s1 <= __next__s1; // test010.py:15
+    s2 <= __next__s2; // test010.py:15
+    out <= __next__out; // test010.py:16
+    sync <= __next__sync; // test010.py:17
+  end
+endmodule
+
+module gold(clk1, clk2, a, b, flag, out, sync);
+  input clk1, clk2, flag;
+  input [7:0] a, b;
+  output reg [7:0] out;
+  output reg sync;
+
+  reg [7:0] x, y;
+  reg f1, f2, s1, s2;
+
+  always @(posedge clk1) begin
+    x <= a + b;
+    f1 <= flag;
+    f2 <= f1;
+  end
+
+  always @(negedge clk2) begin
+    y <= b;
+    s1 <= f2;
+    s2 <= s1;
+    out <= x ^ y;
+    sync <= s2;
+  end
+endmodule
+
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+from chipy.Chipy import *
+
+
+with AddModule("gate_1"):
+    clk, rst, en = AddInput("clk rst en")
+    a = AddInput("a", 8)
+    cnt = AddOutput("cnt", 8, posedge=clk, reset=rst)
+    acc = AddOutput("acc", 8, posedge=clk, reset=rst, reset_value=0x5a)
+    last = AddOutput("last", 8, posedge=clk)
+
+    with If(en):
+        cnt.next = cnt + 1
+        acc.next = acc ^ a
+    last.next = a
+
+
+with AddModule("gate_2"):
+    clk, rst, en = AddInput("clk rst en")
+    a = AddInput("a", 8)
+    DefaultReset(rst)
+    cnt = AddOutput("cnt", 8, posedge=clk)
+    acc = AddOutput("acc", 8, posedge=clk, reset_value=-166)
+    last = AddOutput("last", 8, posedge=clk, reset=False)
+
+    with If(en):
+        cnt.next = cnt + 1
+        acc.next = acc ^ a
+    last.next = a
+
+
+with AddModule("gate_3"):
+    clk, rst, en = AddInput("clk rst en")
+    a = AddInput("a", 8)
+    cnt, acc = AddReg("cnt_q acc_q", 8)
+    last = AddOutput("last", 8, posedge=clk)
+    AddFF(cnt, posedge=clk, reset=Reset(rst, activelow=True))
+    AddFF(acc, posedge=clk, reset=Reset(rst, activelow=True), reset_value=0x5a)
+
+    with If(en):
+        cnt.next = cnt + 1
+        acc.next = acc ^ a
+    last.next = a
+
+    Connect(AddOutput("cnt", 8), cnt)
+    Connect(AddOutput("acc", 8), acc)
+
+
+assert len(Module("gate_2").clock_domains) == 2
+
+
+with open("test011.v", "w") as f:
+    print("""
+//@ test-sat-equiv-induct gold gate_1 5
+//@ test-sat-equiv-induct gold gate_2 5
+//@ test-sat-equiv-induct gold_n gate_3 5
+""", file=f)
+
+    WriteVerilog(f)
+
+    print("""
+module gold(clk, rst, en, a, cnt, acc, last);
+  input clk, rst, en;
+  input [7:0] a;
+  output reg [7:0] cnt, acc, last;
+
+  always @(posedge clk) begin
+    if (en) begin
+      cnt <= cnt + 1;
+      acc <= acc ^ a;
+    end
+    if (rst) begin
+      cnt <= 0;
+      acc <= 8'h5a;
+    end
+    last <= a;
+  end
+endmodule
+
+module gold_n(clk, rst, en, a, cnt, acc, last);
+  input clk, rst, en;
+  input [7:0] a;
+  output reg [7:0] cnt, acc, last;
+
+  always @(posedge clk) begin
+    if (en) begin
+      cnt <= cnt + 1;
+      acc <= acc ^ a;
+    end
+    if (!rst) begin
+      cnt <= 0;
+      acc <= 8'h5a;
+    end
+    last <= a;
+  end
+endmodule
+""", file=f)
@@ -0,0 +1,173 @@
+
+//@ test-sat-equiv-induct gold gate_1 5
+//@ test-sat-equiv-induct gold gate_2 5
+//@ test-sat-equiv-induct gold_n gate_3 5
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module gate_1 (
+  input [7:0] a /* test011.py:8 */,
+  output reg [7:0] acc /* test011.py:10 */,
+  input clk /* test011.py:7 */,
+  output reg [7:0] cnt /* test011.py:9 */,
+  input en /* test011.py:7 */,
+  output reg [7:0] last /* test011.py:11 */,
+  input rst /* test011.py:7 */
+);
+  wire [31:0] __db69c35b; // test011.py:14
+  wire [7:0] __dd062117; // test011.py:15
+  reg [7:0] __next__acc; // test011.py:10
+  reg [7:0] __next__cnt; // test011.py:9
+  reg [7:0] __next__last; // test011.py:11
+  assign __db69c35b = cnt + 32'sd1; // test011.py:14
+  assign __dd062117 = acc ^ a; // test011.py:15
+  always @* begin
+    __next__cnt = cnt; // test011.py:9
+    __next__acc = acc; // test011.py:10
+    if (en) begin // test011.py:13
+      __next__cnt = __db69c35b; // test011.py:14
+      __next__acc = __dd062117; // test011.py:15
+    end
+  end
+  always @* begin
+    __next__last = last; // test011.py:11
+    __next__last = a; // test011.py:16
+  end
+  always @(posedge clk) begin
+    if (rst) begin
+      cnt <= 8'h0; // test011.py:9
+      acc <= 8'h5a; // test011.py:10
+    end else begin
+      cnt <= __next__cnt; // test011.py:9
+      acc <= __next__acc; // test011.py:10
+    end
+  end
+  always @(posedge clk) begin
+    last <= __next__last; // test011.py:11
+  end
+endmodule
+
+module gate_2 (
+  input [7:0] a /* test011.py:21 */,
+  output reg [7:0] acc /* test011.py:24 */,
+  input clk /* test011.py:20 */,
+  output reg [7:0] cnt /* test011.py:23 */,
+  input en /* test011.py:20 */,
+  output reg [7:0] last /* test011.py:25 */,
+  input rst /* test011.py:20 */
+);
+  wire [31:0] __db69c35b; // test011.py:28
+  wire [7:0] __dd062117; // test011.py:29
+  reg [7:0] __next__acc; // test011.py:24
+  reg [7:0] __next__cnt; // test011.py:23
+  reg [7:0] __next__last; // test011.py:25
+  assign __db69c35b = cnt + 32'sd1; // test011.py:28
+  assign __dd062117 = acc ^ a; // test011.py:29
+  always @* begin
+    __next__cnt = cnt; // test011.py:23
+    __next__acc = acc; // test011.py:24
+    if (en) begin // test011.py:27
+      __next__cnt = __db69c35b; // test011.py:28
+      __next__acc = __dd062117; // test011.py:29
+    end
+  end
+  always @* begin
+    __next__last = last; // test011.py:25
+    __next__last = a; // test011.py:30
+  end
+  always @(posedge clk) begin
+    if (rst) begin
+      cnt <= 8'h0; // test011.py:23
+      acc <= 8'h5a; // test011.py:24
+    end else begin
+      cnt <= __next__cnt; // test011.py:23
+      acc <= __next__acc; // test011.py:24
+    end
+  end
+  always @(posedge clk) begin
+    last <= __next__last; // test011.py:25
+  end
+endmodule
+
+module gate_3 (
+  input [7:0] a /* test011.py:35 */,
+  output [7:0] acc /* test011.py:47 */,
+  input clk /* test011.py:34 */,
+  output [7:0] cnt /* test011.py:46 */,
+  input en /* test011.py:34 */,
+  output reg [7:0] last /* test011.py:37 */,
+  input rst /* test011.py:34 */
+);
+  wire [31:0] __c595ba46; // test011.py:42
+  wire [7:0] __d33d568f; // test011.py:43
+  reg [7:0] acc_q; // test011.py:36
+  reg [7:0] __next__acc_q; // test011.py:36
+  reg [7:0] cnt_q; // test011.py:36
+  reg [7:0] __next__cnt_q; // test011.py:36
+  reg [7:0] __next__last; // test011.py:37
+  assign __c595ba46 = cnt_q + 32'sd1; // test011.py:42
+  assign __d33d568f = acc_q ^ a; // test011.py:43
+  always @* begin
+    __next__last = last; // test011.py:37
+    __next__last = a; // test011.py:44
+  end
+  always @* begin
+    __next__cnt_q = cnt_q; // test011.py:38
+    __next__acc_q = acc_q; // test011.py:39
+    if (en) begin // test011.py:41
+      __next__cnt_q = __c595ba46; // test011.py:42
+      __next__acc_q = __d33d568f; // test011.py:43
+    end
+  end
+  assign cnt = cnt_q; // test011.py:46
+  assign acc = acc_q; // test011.py:47
+  always @(posedge clk) begin
+    last <= __next__last; // test011.py:37
+  end
+  always @(posedge clk) begin
+    if (!rst) begin
+      cnt_q <= 8'h0; // test011.py:38
+      acc_q <= 8'h5a; // test011.py:39
+    end else begin
+      cnt_q <= __next__cnt_q; // test011.py:38
+      acc_q <= __next__acc_q; // test011.py:39
+    end
+  end
+endmodule
+
+module gold(clk, rst, en, a, cnt, acc, last);
+  input clk, rst, en;
+  input [7:0] a;
+  output reg [7:0] cnt, acc, last;
+
+  always @(posedge clk) begin
+    if (en) begin
+      cnt <= cnt + 1;
+      acc <= acc ^ a;
+    end
+    if (rst) begin
+      cnt <= 0;
+      acc <= 8'h5a;
+    end
+    last <= a;
+  end
+endmodule
+
+module gold_n(clk, rst, en, a, cnt, acc, last);
+  input clk, rst, en;
+  input [7:0] a;
+  output reg [7:0] cnt, acc, last;
+
+  always @(posedge clk) begin
+    if (en) begin
+      cnt <= cnt + 1;
+      acc <= acc ^ a;
+    end
+    if (!rst) begin
+      cnt <= 0;
+      acc <= 8'h5a;
+    end
+    last <= a;
+  end
+endmodule
+
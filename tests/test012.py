@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+from chipy.Chipy import *
+
+
+with AddModule("gate_1"):
+    clk, wen, ren = AddInput("clk wen ren")
+    waddr, raddr = AddInput("waddr raddr", 3)
+    be = AddInput("be", 2)
+    wdata = AddInput("wdata", 16)
+    rdata, adata = AddOutput("rdata adata", 16, async_=True)
+
+    mem = AddMemory("mem", 16, 8, posedge=clk, init=[0x1111 * i for i in range(8)])
+
+    wp = mem.write_port(byteenable=True)
+    with If(wen):
+        wp.write(waddr, wdata, be)
+
+    rdata.next = mem.read_port(raddr, posedge=clk, enable=ren)
+    adata.next = mem.read_port(raddr)
+
+
+with AddModule("gate_2"):
+    clk, wen, ren = AddInput("clk wen ren")
+    waddr, raddr = AddInput("waddr raddr", 3)
+    be = AddInput("be", 2)
+    wdata = AddInput("wdata", 16)
+    rdata, adata = AddOutput("rdata adata", 16, async_=True)
+
+    mem = AddMemory("mem", 16, 8, init=[0x1111 * i for i in range(8)])
+
+    wp = mem.write_port(posedge=clk, byteenable=True)
+    wp.addr.next = waddr
+    wp.data.next = wdata
+    with If(wen):
+        wp.enable.next = be
+
+    rdata.next = mem.read_port(raddr, posedge=clk, enable=ren)
+    adata.next = mem[raddr]
+
+
+with open("test012.v", "w") as f:
+    print("""
+//@ test-sat-equiv-bmc gold gate_1 5
+//@ test-sat-equiv-bmc gold gate_2 5
+""", file=f)
+
+    WriteVerilog(f)
+
+    print("""
+module gold(
+  input clk, wen, ren,
+  input [2:0] waddr, raddr,
+  input [1:0] be,
+  input [15:0] wdata,
+  output reg [15:0] rdata,
+  output [15:0] adata
+);
+  reg [15:0] mem [0:7];
+  integer i;
+  initial for (i = 0; i < 8; i = i+1) mem[i] = 16'h1111 * i;
+  assign adata = mem[raddr];
+  always @(posedge clk) begin
+    if (wen && be[0]) mem[waddr][7:0] <= wdata[7:0];
+    if (wen && be[1]) mem[waddr][15:8] <= wdata[15:8];
+    if (ren) rdata <= mem[raddr];
+  end
+endmodule
+""", file=f)
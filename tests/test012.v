@@ -0,0 +1,157 @@
+
+//@ test-sat-equiv-bmc gold gate_1 5
+//@ test-sat-equiv-bmc gold gate_2 5
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module gate_1 (
+  output [15:0] adata /* test012.py:11 */,
+  input [1:0] be /* test012.py:9 */,
+  input clk /* test012.py:7 */,
+  input [2:0] raddr /* test012.py:8 */,
+  output [15:0] rdata /* test012.py:11 */,
+  input ren /* test012.py:7 */,
+  input [2:0] waddr /* test012.py:8 */,
+  input [15:0] wdata /* test012.py:10 */,
+  input wen /* test012.py:7 */
+);
+  reg [15:0] mem [0:7]; // test012.py:13
+  wire [15:0] __b76af828; // test012.py:20
+  reg [15:0] __next__adata; // test012.py:11
+  reg [15:0] mem__rd1; // test012.py:19
+  wire [2:0] mem__wr0__addr; // test012.py:15
+  reg [2:0] __next__mem__wr0__addr; // test012.py:15
+  wire [15:0] mem__wr0__data; // test012.py:15
+  reg [15:0] __next__mem__wr0__data; // test012.py:15
+  wire [1:0] mem__wr0__en; // test012.py:15
+  reg [1:0] __next__mem__wr0__en; // test012.py:15
+  reg [15:0] __next__rdata; // test012.py:11
+  assign __b76af828 = mem[raddr]; // test012.py:20
+  always @* begin
+    __next__rdata = 16'bx; // test012.py:11
+    __next__rdata = mem__rd1; // test012.py:19
+  end
+  always @* begin
+    __next__adata = 16'bx; // test012.py:11
+    __next__adata = __b76af828; // test012.py:20
+  end
+  always @* begin
+    __next__mem__wr0__addr = 3'bx; // test012.py:15
+    __next__mem__wr0__data = 16'bx; // test012.py:15
+    __next__mem__wr0__en = 2'bx; // test012.py:15
+    __next__mem__wr0__en = 2'd0; // test012.py:15
+    if (wen) begin // test012.py:16
+      __next__mem__wr0__addr = waddr; // test012.py:17
+      __next__mem__wr0__data = wdata; // test012.py:17
+      __next__mem__wr0__en = be; // test012.py:17
+    end
+  end
+  assign rdata = __next__rdata; // test012.py:11
+  assign adata = __next__adata; // test012.py:11
+  assign mem__wr0__addr = __next__mem__wr0__addr; // test012.py:15
+  assign mem__wr0__data = __next__mem__wr0__data; // test012.py:15
+  assign mem__wr0__en = __next__mem__wr0__en; // test012.py:15
+  always @(posedge clk) begin
+    if (mem__wr0__en[0]) mem[mem__wr0__addr][0 +: 8] <= mem__wr0__data[0 +: 8]; // test012.py:15
+    if (mem__wr0__en[1]) mem[mem__wr0__addr][8 +: 8] <= mem__wr0__data[8 +: 8]; // test012.py:15
+    if (ren) mem__rd1 <= mem[raddr]; // test012.py:19
+  end
+  initial begin // test012.py:13
+    mem[0] = 16'h0;
+    mem[1] = 16'h1111;
+    mem[2] = 16'h2222;
+    mem[3] = 16'h3333;
+    mem[4] = 16'h4444;
+    mem[5] = 16'h5555;
+    mem[6] = 16'h6666;
+    mem[7] = 16'h7777;
+  end
+endmodule
+
+module gate_2 (
+  output [15:0] adata /* test012.py:28 */,
+  input [1:0] be /* test012.py:26 */,
+  input clk /* test012.py:24 */,
+  input [2:0] raddr /* test012.py:25 */,
+  output [15:0] rdata /* test012.py:28 */,
+  input ren /* test012.py:24 */,
+  input [2:0] waddr /* test012.py:25 */,
+  input [15:0] wdata /* test012.py:27 */,
+  input wen /* test012.py:24 */
+);
+  reg [15:0] mem [0:7]; // test012.py:30
+  wire [15:0] __b76af828; // test012.py:39
+  reg [15:0] __next__adata; // test012.py:28
+  reg [15:0] mem__rd1; // test012.py:38
+  wire [2:0] mem__wr0__addr; // test012.py:32
+  reg [2:0] __next__mem__wr0__addr; // test012.py:32
+  wire [15:0] mem__wr0__data; // test012.py:32
+  reg [15:0] __next__mem__wr0__data; // test012.py:32
+  wire [1:0] mem__wr0__en; // test012.py:32
+  reg [1:0] __next__mem__wr0__en; // test012.py:32
+  reg [15:0] __next__rdata; // test012.py:28
+  assign __b76af828 = mem[raddr]; // test012.py:39
+  always @* begin
+    __next__rdata = 16'bx; // test012.py:28
+    __next__rdata = mem__rd1; // test012.py:38
+  end
+  always @* begin
+    __next__adata = 16'bx; // test012.py:28
+    __next__adata = __b76af828; // test012.py:39
+  end
+  always @* begin
+    __next__mem__wr0__addr = 3'bx; // test012.py:32
+    __next__mem__wr0__addr = waddr; // test012.py:33
+  end
+  always @* begin
+    __next__mem__wr0__data = 16'bx; // test012.py:32
+    __next__mem__wr0__data = wdata; // test012.py:34
+  end
+  always @* begin
+    __next__mem__wr0__en = 2'bx; // test012.py:32
+    __next__mem__wr0__en = 2'd0; // test012.py:32
+    if (wen) begin // test012.py:35
+      __next__mem__wr0__en = be; // test012.py:36
+    end
+  end
+  assign rdata = __next__rdata; // test012.py:28
+  assign adata = __next__adata; // test012.py:28
+  assign mem__wr0__addr = __next__mem__wr0__addr; // test012.py:32
+  assign mem__wr0__data = __next__mem__wr0__data; // test012.py:32
+  assign mem__wr0__en = __next__mem__wr0__en; // test012.py:32
+  always @(posedge clk) begin
+    if (mem__wr0__en[0]) mem[mem__wr0__addr][0 +: 8] <= mem__wr0__data[0 +: 8]; // test012.py:32
+    if (mem__wr0__en[1]) mem[mem__wr0__addr][8 +: 8] <= mem__wr0__data[8 +: 8]; // test012.py:32
+    if (ren) mem__rd1 <= mem[raddr]; // test012.py:38
+  end
+  initial begin // test012.py:30
+    mem[0] = 16'h0;
+    mem[1] = 16'h1111;
+    mem[2] = 16'h2222;
+    mem[3] = 16'h3333;
+    mem[4] = 16'h4444;
+    mem[5] = 16'h5555;
+    mem[6] = 16'h6666;
+    mem[7] = 16'h7777;
+  end
+endmodule
+
+module gold(
+  input clk, wen, ren,
+  input [2:0] waddr, raddr,
+  input [1:0] be,
+  input [15:0] wdata,
+  output reg [15:0] rdata,
+  output [15:0] adata
+);
+  reg [15:0] mem [0:7];
+  integer i;
+  initial for (i = 0; i < 8; i = i+1) mem[i] = 16'h1111 * i;
+  assign adata = mem[raddr];
+  always @(posedge clk) begin
+    if (wen && be[0]) mem[waddr][7:0] <= wdata[7:0];
+    if (wen && be[1]) mem[waddr][15:8] <= wdata[15:8];
+    if (ren) rdata <= mem[raddr];
+  end
+endmodule
+
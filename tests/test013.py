@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+
+from chipy.Chipy import *
+import sys
+from array import array
+
+
+values = array("H", [0xf000 | (i*37 + 5) for i in range(200)])
+
+raw = array("H", values)
+if sys.byteorder != "little":
+    raw.byteswap()
+
+with open("test013_rom.bin", "wb") as f:
+    f.write(raw.tobytes())
+
+
+with AddModule("gate_1"):
+    addr = AddInput("addr", 8)
+    data = AddOutput("data", 12, async_=True)
+
+    rom = AddMemory("rom", 12, 256, init=values)
+    data.next = rom[addr]
+
+
+with AddModule("gate_2"):
+    addr = AddInput("addr", 8)
+    data = AddOutput("data", 12, async_=True)
+
+    rom = AddMemory("rom", 12, 256, init="test013_rom.bin")
+    data.next = rom[addr]
+
+
+with open("test013.v", "w") as f:
+    print("""
+//@ test-sat-equiv-bmc gold gate_1 2
+//@ test-sat-equiv-bmc gold gate_2 2
+""", file=f)
+
+    WriteVerilog(f)
+
+    print("""
+module gold(
+  input [7:0] addr,
+  output [11:0] data
+);
+  reg [11:0] rom [0:255];
+  integer i;
+  initial for (i = 0; i < 200; i = i+1) rom[i] = i*37 + 5;
+  assign data = rom[addr];
+endmodule
+""", file=f)
@@ -0,0 +1,48 @@
+
+//@ test-sat-equiv-bmc gold gate_1 2
+//@ test-sat-equiv-bmc gold gate_2 2
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module gate_1 (
+  input [7:0] addr /* test013.py:19 */,
+  output [11:0] data /* test013.py:20 */
+);
+  reg [11:0] rom [0:255]; // test013.py:22
+  wire [11:0] __d4f35c6e; // test013.py:23
+  reg [11:0] __next__data; // test013.py:20
+  assign __d4f35c6e = rom[addr]; // test013.py:23
+  always @* begin
+    __next__data = 12'bx; // test013.py:20
+    __next__data = __d4f35c6e; // test013.py:23
+  end
+  assign data = __next__data; // test013.py:20
+  initial $readmemh("/root/package/tests/test013_gate_1_rom.hex", rom, 0, 199); // test013.py:22
+endmodule
+
+module gate_2 (
+  input [7:0] addr /* test013.py:27 */,
+  output [11:0] data /* test013.py:28 */
+);
+  reg [11:0] rom [0:255]; // test013.py:30
+  wire [11:0] __d4f35c6e; // test013.py:31
+  reg [11:0] __next__data; // test013.py:28
+  assign __d4f35c6e = rom[addr]; // test013.py:31
+  always @* begin
+    __next__data = 12'bx; // test013.py:28
+    __next__data = __d4f35c6e; // test013.py:31
+  end
+  assign data = __next__data; // test013.py:28
+  initial $readmemh("/root/package/tests/test013_gate_2_rom.hex", rom, 0, 199); // test013.py:30
+endmodule
+
+module gold(
+  input [7:0] addr,
+  output [11:0] data
+);
+  reg [11:0] rom [0:255];
+  integer i;
+  initial for (i = 0; i < 200; i = i+1) rom[i] = i*37 + 5;
+  assign data = rom[addr];
+endmodule
+
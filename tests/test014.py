@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+from chipy.Chipy import *
+from chipy.transform import *
+
+
+def make_design(top_name, suffix):
+    leaf = AddModule("leaf_" + suffix)
+    with leaf:
+        x = AddInput("x", 8)
+        y = AddOutput("y", 8, async_=True)
+        y.next = x ^ Sig(0x5a, 8)
+
+    child = AddModule("child_" + suffix)
+    with child:
+        clk, rst, en = AddInput("clk rst en")
+        a = AddInput("a", 8)
+        sel = AddInput("sel", 2)
+        q = AddOutput("q", 8, posedge=clk, reset=rst, reset_value=3)
+        r, m = AddOutput("r m", 8, async_=True)
+
+        mem = AddMemory("mem", 8, 4)
+        wp = mem.write_port(posedge=clk)
+        with If(en):
+            wp.write(sel, a)
+        m.next = mem.read_port(sel, posedge=clk)
+
+        l = AddInst("l", leaf)
+        Connect(l.x_, a)
+
+        with Switch(sel):
+            with Case(0):
+                r.next = l.y_
+            with Case(1):
+                r.next = a + 1
+            with Default():
+                r.next = a
+
+        with If(en):
+            q.next = q + a
+        with ElseIf(sel == 3):
+            q.next = ~q
+
+    with AddModule(top_name):
+        clk, rst, en = AddInput("clk rst en")
+        a = AddInput("a", 8)
+        sel = AddInput("sel", 2)
+        outs = AddOutput("q0 r0 m0 q1 r1 m1", 8)
+
+        c0, c1 = AddInst("c0 c1", child)
+        for inst, inst_a in ((c0, a), (c1, ~a)):
+            Connect(inst.clk_, clk)
+            Connect(inst.rst_, rst)
+            Connect(inst.en_, en)
+            Connect(inst.sel_, sel)
+            Connect(inst.a_, inst_a)
+
+        for out, sig in zip(outs, [c0.q_, c0.r_, c0.m_, c1.q_, c1.r_, c1.m_]):
+            Connect(out, sig)
+
+
+make_design("gold", "gold")
+
+make_design("gate_1", "1")
+Flatten(module=Module("gate_1"), recursive=True)
+assert len(Module("gate_1").instances) == 0
+assert "c1__l__y" in Module("gate_1").signals
+assert "c0__mem" in Module("gate_1").memories
+
+make_design("gate_2", "2")
+uniq = Uniquify("c1", Module("gate_2"))
+Flatten("c0", Module("gate_2"))
+assert [inst[:2] for inst in Module("gate_2").instances] == [("c1", uniq.name), ("c0__l", "leaf_2")]
+
+
+with open("test014.v", "w") as f:
+    print("""
+//@ test-sat-equiv-bmc gold gate_1 5
+//@ test-sat-equiv-bmc gold gate_2 5
+""", file=f)
+
+    WriteVerilog(f)
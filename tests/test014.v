@@ -0,0 +1,778 @@
+
+//@ test-sat-equiv-bmc gold gate_1 5
+//@ test-sat-equiv-bmc gold gate_2 5
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module leaf_gold (
+  input [7:0] x /* test014.py:10 */,
+  output [7:0] y /* test014.py:11 */
+);
+  wire [7:0] __49558b2a; // test014.py:12
+  reg [7:0] __next__y; // test014.py:11
+  assign __49558b2a = x ^ 8'd90; // test014.py:12
+  always @* begin
+    __next__y = 8'bx; // test014.py:11
+    __next__y = __49558b2a; // test014.py:12
+  end
+  assign y = __next__y; // test014.py:11
+endmodule
+
+module child_gold (
+  input [7:0] a /* test014.py:17 */,
+  input clk /* test014.py:16 */,
+  input en /* test014.py:16 */,
+  output [7:0] m /* test014.py:20 */,
+  output reg [7:0] q /* test014.py:19 */,
+  output [7:0] r /* test014.py:20 */,
+  input rst /* test014.py:16 */,
+  input [1:0] sel /* test014.py:18 */
+);
+  reg [7:0] mem [0:3]; // test014.py:22
+  wire __23231009; // test014.py:41
+  wire [31:0] __823e62ea; // test014.py:35
+  wire [7:0] __c0f00629; // test014.py:42
+  wire [7:0] __de8f626c; // test014.py:40
+  wire [7:0] l__x; // test014.py:28
+  wire [7:0] l__y; // test014.py:28
+  reg [7:0] __next__m; // test014.py:20
+  reg [7:0] mem__rd1; // test014.py:26
+  wire [1:0] mem__wr0__addr; // test014.py:23
+  reg [1:0] __next__mem__wr0__addr; // test014.py:23
+  wire [7:0] mem__wr0__data; // test014.py:23
+  reg [7:0] __next__mem__wr0__data; // test014.py:23
+  wire mem__wr0__en; // test014.py:23
+  reg __next__mem__wr0__en; // test014.py:23
+  reg [7:0] __next__q; // test014.py:19
+  reg [7:0] __next__r; // test014.py:20
+  assign __23231009 = sel == 32'sd3; // test014.py:41
+  assign __823e62ea = a + 32'sd1; // test014.py:35
+  assign __c0f00629 = ~ q; // test014.py:42
+  assign __de8f626c = q + a; // test014.py:40
+  always @* begin
+    __next__q = q; // test014.py:19
+    if (en) begin // test014.py:39
+      __next__q = __de8f626c; // test014.py:40
+    end
+    else if (__23231009) begin // test014.py:41
+      __next__q = __c0f00629; // test014.py:42
+    end
+  end
+  always @* begin
+    __next__r = 8'bx; // test014.py:20
+    __next__r = (sel[1] ? a : (sel[0] ? __823e62ea[7:0] : l__y)); // test014.py:31
+  end
+  always @* begin
+    __next__m = 8'bx; // test014.py:20
+    __next__m = mem__rd1; // test014.py:26
+  end
+  always @* begin
+    __next__mem__wr0__addr = 2'bx; // test014.py:23
+    __next__mem__wr0__data = 8'bx; // test014.py:23
+    __next__mem__wr0__en = 1'bx; // test014.py:23
+    __next__mem__wr0__en = 1'd0; // test014.py:23
+    if (en) begin // test014.py:24
+      __next__mem__wr0__addr = sel; // test014.py:25
+      __next__mem__wr0__data = a; // test014.py:25
+      __next__mem__wr0__en = 1'd1; // test014.py:25
+    end
+  end
+  assign r = __next__r; // test014.py:20
+  assign m = __next__m; // test014.py:20
+  assign mem__wr0__addr = __next__mem__wr0__addr; // test014.py:23
+  assign mem__wr0__data = __next__mem__wr0__data; // test014.py:23
+  assign mem__wr0__en = __next__mem__wr0__en; // test014.py:23
+  assign l__x = a; // test014.py:29
+  always @(posedge clk) begin
+    if (rst) begin
+      q <= 8'h3; // test014.py:19
+    end else begin
+      q <= __next__q; // test014.py:19
+    end
+  end
+  leaf_gold l ( // test014.py:28
+    .x(a),
+    .y(l__y)
+  );
+  always @(posedge clk) begin
+    if (mem__wr0__en) mem[mem__wr0__addr] <= mem__wr0__data; // test014.py:23
+    mem__rd1 <= mem[sel]; // test014.py:26
+  end
+endmodule
+
+module gold (
+  input [7:0] a /* test014.py:46 */,
+  input clk /* test014.py:45 */,
+  input en /* test014.py:45 */,
+  output [7:0] m0 /* test014.py:48 */,
+  output [7:0] m1 /* test014.py:48 */,
+  output [7:0] q0 /* test014.py:48 */,
+  output [7:0] q1 /* test014.py:48 */,
+  output [7:0] r0 /* test014.py:48 */,
+  output [7:0] r1 /* test014.py:48 */,
+  input rst /* test014.py:45 */,
+  input [1:0] sel /* test014.py:47 */
+);
+  wire [7:0] __26d738b7; // test014.py:51
+  wire [7:0] c0__a; // test014.py:50
+  wire c0__clk; // test014.py:50
+  wire c0__en; // test014.py:50
+  wire [7:0] c0__m; // test014.py:50
+  wire [7:0] c0__q; // test014.py:50
+  wire [7:0] c0__r; // test014.py:50
+  wire c0__rst; // test014.py:50
+  wire [1:0] c0__sel; // test014.py:50
+  wire [7:0] c1__a; // test014.py:50
+  wire c1__clk; // test014.py:50
+  wire c1__en; // test014.py:50
+  wire [7:0] c1__m; // test014.py:50
+  wire [7:0] c1__q; // test014.py:50
+  wire [7:0] c1__r; // test014.py:50
+  wire c1__rst; // test014.py:50
+  wire [1:0] c1__sel; // test014.py:50
+  assign __26d738b7 = ~ a; // test014.py:51
+  assign c0__clk = clk; // test014.py:52
+  assign c0__rst = rst; // test014.py:53
+  assign c0__en = en; // test014.py:54
+  assign c0__sel = sel; // test014.py:55
+  assign c0__a = a; // test014.py:56
+  assign c1__clk = clk; // test014.py:52
+  assign c1__rst = rst; // test014.py:53
+  assign c1__en = en; // test014.py:54
+  assign c1__sel = sel; // test014.py:55
+  assign c1__a = __26d738b7; // test014.py:56
+  assign q0 = c0__q; // test014.py:59
+  assign r0 = c0__r; // test014.py:59
+  assign m0 = c0__m; // test014.py:59
+  assign q1 = c1__q; // test014.py:59
+  assign r1 = c1__r; // test014.py:59
+  assign m1 = c1__m; // test014.py:59
+  child_gold c0 ( // test014.py:50
+    .a(a),
+    .clk(clk),
+    .en(en),
+    .m(c0__m),
+    .q(c0__q),
+    .r(c0__r),
+    .rst(rst),
+    .sel(sel)
+  );
+  child_gold c1 ( // test014.py:50
+    .a(__26d738b7),
+    .clk(clk),
+    .en(en),
+    .m(c1__m),
+    .q(c1__q),
+    .r(c1__r),
+    .rst(rst),
+    .sel(sel)
+  );
+endmodule
+
+module leaf_1 (
+  input [7:0] x /* test014.py:10 */,
+  output [7:0] y /* test014.py:11 */
+);
+  wire [7:0] __49558b2a; // test014.py:12
+  reg [7:0] __next__y; // test014.py:11
+  assign __49558b2a = x ^ 8'd90; // test014.py:12
+  always @* begin
+    __next__y = 8'bx; // test014.py:11
+    __next__y = __49558b2a; // test014.py:12
+  end
+  assign y = __next__y; // test014.py:11
+endmodule
+
+module child_1 (
+  input [7:0] a /* test014.py:17 */,
+  input clk /* test014.py:16 */,
+  input en /* test014.py:16 */,
+  output [7:0] m /* test014.py:20 */,
+  output reg [7:0] q /* test014.py:19 */,
+  output [7:0] r /* test014.py:20 */,
+  input rst /* test014.py:16 */,
+  input [1:0] sel /* test014.py:18 */
+);
+  reg [7:0] mem [0:3]; // test014.py:22
+  wire __23231009; // test014.py:41
+  wire [31:0] __823e62ea; // test014.py:35
+  wire [7:0] __c0f00629; // test014.py:42
+  wire [7:0] __de8f626c; // test014.py:40
+  wire [7:0] l__x; // test014.py:28
+  wire [7:0] l__y; // test014.py:28
+  reg [7:0] __next__m; // test014.py:20
+  reg [7:0] mem__rd1; // test014.py:26
+  wire [1:0] mem__wr0__addr; // test014.py:23
+  reg [1:0] __next__mem__wr0__addr; // test014.py:23
+  wire [7:0] mem__wr0__data; // test014.py:23
+  reg [7:0] __next__mem__wr0__data; // test014.py:23
+  wire mem__wr0__en; // test014.py:23
+  reg __next__mem__wr0__en; // test014.py:23
+  reg [7:0] __next__q; // test014.py:19
+  reg [7:0] __next__r; // test014.py:20
+  assign __23231009 = sel == 32'sd3; // test014.py:41
+  assign __823e62ea = a + 32'sd1; // test014.py:35
+  assign __c0f00629 = ~ q; // test014.py:42
+  assign __de8f626c = q + a; // test014.py:40
+  always @* begin
+    __next__q = q; // test014.py:19
+    if (en) begin // test014.py:39
+      __next__q = __de8f626c; // test014.py:40
+    end
+    else if (__23231009) begin // test014.py:41
+      __next__q = __c0f00629; // test014.py:42
+    end
+  end
+  always @* begin
+    __next__r = 8'bx; // test014.py:20
+    __next__r = (sel[1] ? a : (sel[0] ? __823e62ea[7:0] : l__y)); // test014.py:31
+  end
+  always @* begin
+    __next__m = 8'bx; // test014.py:20
+    __next__m = mem__rd1; // test014.py:26
+  end
+  always @* begin
+    __next__mem__wr0__addr = 2'bx; // test014.py:23
+    __next__mem__wr0__data = 8'bx; // test014.py:23
+    __next__mem__wr0__en = 1'bx; // test014.py:23
+    __next__mem__wr0__en = 1'd0; // test014.py:23
+    if (en) begin // test014.py:24
+      __next__mem__wr0__addr = sel; // test014.py:25
+      __next__mem__wr0__data = a; // test014.py:25
+      __next__mem__wr0__en = 1'd1; // test014.py:25
+    end
+  end
+  assign r = __next__r; // test014.py:20
+  assign m = __next__m; // test014.py:20
+  assign mem__wr0__addr = __next__mem__wr0__addr; // test014.py:23
+  assign mem__wr0__data = __next__mem__wr0__data; // test014.py:23
+  assign mem__wr0__en = __next__mem__wr0__en; // test014.py:23
+  assign l__x = a; // test014.py:29
+  always @(posedge clk) begin
+    if (rst) begin
+      q <= 8'h3; // test014.py:19
+    end else begin
+      q <= __next__q; // test014.py:19
+    end
+  end
+  leaf_1 l ( // test014.py:28
+    .x(a),
+    .y(l__y)
+  );
+  always @(posedge clk) begin
+    if (mem__wr0__en) mem[mem__wr0__addr] <= mem__wr0__data; // test014.py:23
+    mem__rd1 <= mem[sel]; // test014.py:26
+  end
+endmodule
+
+module gate_1 (
+  input [7:0] a /* test014.py:46 */,
+  input clk /* test014.py:45 */,
+  input en /* test014.py:45 */,
+  output [7:0] m0 /* test014.py:48 */,
+  output [7:0] m1 /* test014.py:48 */,
+  output [7:0] q0 /* test014.py:48 */,
+  output [7:0] q1 /* test014.py:48 */,
+  output [7:0] r0 /* test014.py:48 */,
+  output [7:0] r1 /* test014.py:48 */,
+  input rst /* test014.py:45 */,
+  input [1:0] sel /* test014.py:47 */
+);
+  reg [7:0] c0__mem [0:3]; // test014.py:22
+  reg [7:0] c1__mem [0:3]; // test014.py:22
+  wire [7:0] __0fd864f7; // test014.py:42
+  wire [7:0] __26d738b7; // test014.py:51
+  wire [7:0] __4a494bb0; // test014.py:40
+  wire __79b7997c; // test014.py:41
+  wire __96e52f9d; // test014.py:41
+  wire [31:0] __99cd0bb8; // test014.py:35
+  wire [7:0] __9c1e36f5; // test014.py:40
+  wire [7:0] __c0b64f60; // test014.py:12
+  wire [7:0] __ce51a7b1; // test014.py:12
+  wire [7:0] __d83ae4af; // test014.py:42
+  wire [31:0] __facad29c; // test014.py:35
+  wire [7:0] c0__a; // test014.py:50
+  wire c0__clk; // test014.py:50
+  wire c0__en; // test014.py:50
+  wire [7:0] c0__l__x; // test014.py:28
+  wire [7:0] c0__l__y; // test014.py:28
+  reg [7:0] __next__c0__l__y; // test014.py:28
+  wire [7:0] c0__m; // test014.py:50
+  reg [7:0] __next__c0__m; // test014.py:50
+  reg [7:0] c0__mem__rd1; // test014.py:26
+  wire [1:0] c0__mem__wr0__addr; // test014.py:23
+  reg [1:0] __next__c0__mem__wr0__addr; // test014.py:23
+  wire [7:0] c0__mem__wr0__data; // test014.py:23
+  reg [7:0] __next__c0__mem__wr0__data; // test014.py:23
+  wire c0__mem__wr0__en; // test014.py:23
+  reg __next__c0__mem__wr0__en; // test014.py:23
+  reg [7:0] c0__q; // test014.py:50
+  reg [7:0] __next__c0__q; // test014.py:50
+  wire [7:0] c0__r; // test014.py:50
+  reg [7:0] __next__c0__r; // test014.py:50
+  wire c0__rst; // test014.py:50
+  wire [1:0] c0__sel; // test014.py:50
+  wire [7:0] c1__a; // test014.py:50
+  wire c1__clk; // test014.py:50
+  wire c1__en; // test014.py:50
+  wire [7:0] c1__l__x; // test014.py:28
+  wire [7:0] c1__l__y; // test014.py:28
+  reg [7:0] __next__c1__l__y; // test014.py:28
+  wire [7:0] c1__m; // test014.py:50
+  reg [7:0] __next__c1__m; // test014.py:50
+  reg [7:0] c1__mem__rd1; // test014.py:26
+  wire [1:0] c1__mem__wr0__addr; // test014.py:23
+  reg [1:0] __next__c1__mem__wr0__addr; // test014.py:23
+  wire [7:0] c1__mem__wr0__data; // test014.py:23
+  reg [7:0] __next__c1__mem__wr0__data; // test014.py:23
+  wire c1__mem__wr0__en; // test014.py:23
+  reg __next__c1__mem__wr0__en; // test014.py:23
+  reg [7:0] c1__q; // test014.py:50
+  reg [7:0] __next__c1__q; // test014.py:50
+  wire [7:0] c1__r; // test014.py:50
+  reg [7:0] __next__c1__r; // test014.py:50
+  wire c1__rst; // test014.py:50
+  wire [1:0] c1__sel; // test014.py:50
+  assign __0fd864f7 = ~ c0__q; // test014.py:42
+  assign __26d738b7 = ~ a; // test014.py:51
+  assign __4a494bb0 = c0__q + c0__a; // test014.py:40
+  assign __79b7997c = c0__sel == 32'sd3; // test014.py:41
+  assign __96e52f9d = c1__sel == 32'sd3; // test014.py:41
+  assign __99cd0bb8 = c0__a + 32'sd1; // test014.py:35
+  assign __9c1e36f5 = c1__q + c1__a; // test014.py:40
+  assign __c0b64f60 = c1__l__x ^ 8'd90; // test014.py:12
+  assign __ce51a7b1 = c0__l__x ^ 8'd90; // test014.py:12
+  assign __d83ae4af = ~ c1__q; // test014.py:42
+  assign __facad29c = c1__a + 32'sd1; // test014.py:35
+  always @* begin
+    __next__c0__mem__wr0__addr = 2'bx; // test014.py:23
+    __next__c0__mem__wr0__data = 8'bx; // test014.py:23
+    __next__c0__mem__wr0__en = 1'bx; // test014.py:23
+    __next__c0__mem__wr0__en = 1'd0; // test014.py:23
+    if (c0__en) begin // test014.py:24
+      __next__c0__mem__wr0__addr = c0__sel; // test014.py:25
+      __next__c0__mem__wr0__data = c0__a; // test014.py:25
+      __next__c0__mem__wr0__en = 1'd1; // test014.py:25
+    end
+  end
+  always @* begin
+    __next__c0__q = c0__q; // test014.py:19
+    if (c0__en) begin // test014.py:39
+      __next__c0__q = __4a494bb0; // test014.py:40
+    end
+    else begin // test014.py:39
+      if (__79b7997c) begin // test014.py:41
+        __next__c0__q = __0fd864f7; // test014.py:42
+      end
+    end
+  end
+  always @* begin
+    __next__c0__r = 8'bx; // test014.py:20
+    __next__c0__r = (c0__sel[1] ? c0__a : (c0__sel[0] ? __99cd0bb8[7:0] : c0__l__y)); // test014.py:31
+  end
+  always @* begin
+    __next__c0__m = 8'bx; // test014.py:20
+    __next__c0__m = c0__mem__rd1; // test014.py:26
+  end
+  always @* begin
+    __next__c1__mem__wr0__addr = 2'bx; // test014.py:23
+    __next__c1__mem__wr0__data = 8'bx; // test014.py:23
+    __next__c1__mem__wr0__en = 1'bx; // test014.py:23
+    __next__c1__mem__wr0__en = 1'd0; // test014.py:23
+    if (c1__en) begin // test014.py:24
+      __next__c1__mem__wr0__addr = c1__sel; // test014.py:25
+      __next__c1__mem__wr0__data = c1__a; // test014.py:25
+      __next__c1__mem__wr0__en = 1'd1; // test014.py:25
+    end
+  end
+  always @* begin
+    __next__c1__q = c1__q; // test014.py:19
+    if (c1__en) begin // test014.py:39
+      __next__c1__q = __9c1e36f5; // test014.py:40
+    end
+    else begin // test014.py:39
+      if (__96e52f9d) begin // test014.py:41
+        __next__c1__q = __d83ae4af; // test014.py:42
+      end
+    end
+  end
+  always @* begin
+    __next__c1__r = 8'bx; // test014.py:20
+    __next__c1__r = (c1__sel[1] ? c1__a : (c1__sel[0] ? __facad29c[7:0] : c1__l__y)); // test014.py:31
+  end
+  always @* begin
+    __next__c1__m = 8'bx; // test014.py:20
+    __next__c1__m = c1__mem__rd1; // test014.py:26
+  end
+  always @* begin
+    __next__c0__l__y = 8'bx; // test014.py:11
+    __next__c0__l__y = __ce51a7b1; // test014.py:12
+  end
+  always @* begin
+    __next__c1__l__y = 8'bx; // test014.py:11
+    __next__c1__l__y = __c0b64f60; // test014.py:12
+  end
+  assign c0__clk = clk; // test014.py:52
+  assign c0__rst = rst; // test014.py:53
+  assign c0__en = en; // test014.py:54
+  assign c0__sel = sel; // test014.py:55
+  assign c0__a = a; // test014.py:56
+  assign c1__clk = clk; // test014.py:52
+  assign c1__rst = rst; // test014.py:53
+  assign c1__en = en; // test014.py:54
+  assign c1__sel = sel; // test014.py:55
+  assign c1__a = __26d738b7; // test014.py:56
+  assign q0 = c0__q; // test014.py:59
+  assign r0 = c0__r; // test014.py:59
+  assign m0 = c0__m; // test014.py:59
+  assign q1 = c1__q; // test014.py:59
+  assign r1 = c1__r; // test014.py:59
+  assign m1 = c1__m; // test014.py:59
+  assign c0__mem__wr0__addr = __next__c0__mem__wr0__addr; // test014.py:23
+  assign c0__mem__wr0__data = __next__c0__mem__wr0__data; // test014.py:23
+  assign c0__mem__wr0__en = __next__c0__mem__wr0__en; // test014.py:23
+  assign c0__r = __next__c0__r; // test014.py:20
+  assign c0__m = __next__c0__m; // test014.py:20
+  assign c0__l__x = c0__a; // test014.py:28
+  assign c1__mem__wr0__addr = __next__c1__mem__wr0__addr; // test014.py:23
+  assign c1__mem__wr0__data = __next__c1__mem__wr0__data; // test014.py:23
+  assign c1__mem__wr0__en = __next__c1__mem__wr0__en; // test014.py:23
+  assign c1__r = __next__c1__r; // test014.py:20
+  assign c1__m = __next__c1__m; // test014.py:20
+  assign c1__l__x = c1__a; // test014.py:28
+  assign c0__l__y = __next__c0__l__y; // test014.py:11
+  assign c1__l__y = __next__c1__l__y; // test014.py:11
+  always @(posedge c0__clk) begin
+    if (c0__rst) begin
+      c0__q <= 8'h3; // test014.py:19
+    end else begin
+      c0__q <= __next__c0__q; // test014.py:19
+    end
+  end
+  always @(posedge c1__clk) begin
+    if (c1__rst) begin
+      c1__q <= 8'h3; // test014.py:19
+    end else begin
+      c1__q <= __next__c1__q; // test014.py:19
+    end
+  end
+  always @(posedge c0__clk) begin
+    if (c0__mem__wr0__en) c0__mem[c0__mem__wr0__addr] <= c0__mem__wr0__data; // test014.py:23
+    c0__mem__rd1 <= c0__mem[c0__sel]; // test014.py:26
+  end
+  always @(posedge c1__clk) begin
+    if (c1__mem__wr0__en) c1__mem[c1__mem__wr0__addr] <= c1__mem__wr0__data; // test014.py:23
+    c1__mem__rd1 <= c1__mem[c1__sel]; // test014.py:26
+  end
+endmodule
+
+module leaf_2 (
+  input [7:0] x /* test014.py:10 */,
+  output [7:0] y /* test014.py:11 */
+);
+  wire [7:0] __49558b2a; // test014.py:12
+  reg [7:0] __next__y; // test014.py:11
+  assign __49558b2a = x ^ 8'd90; // test014.py:12
+  always @* begin
+    __next__y = 8'bx; // test014.py:11
+    __next__y = __49558b2a; // test014.py:12
+  end
+  assign y = __next__y; // test014.py:11
+endmodule
+
+module child_2 (
+  input [7:0] a /* test014.py:17 */,
+  input clk /* test014.py:16 */,
+  input en /* test014.py:16 */,
+  output [7:0] m /* test014.py:20 */,
+  output reg [7:0] q /* test014.py:19 */,
+  output [7:0] r /* test014.py:20 */,
+  input rst /* test014.py:16 */,
+  input [1:0] sel /* test014.py:18 */
+);
+  reg [7:0] mem [0:3]; // test014.py:22
+  wire __23231009; // test014.py:41
+  wire [31:0] __823e62ea; // test014.py:35
+  wire [7:0] __c0f00629; // test014.py:42
+  wire [7:0] __de8f626c; // test014.py:40
+  wire [7:0] l__x; // test014.py:28
+  wire [7:0] l__y; // test014.py:28
+  reg [7:0] __next__m; // test014.py:20
+  reg [7:0] mem__rd1; // test014.py:26
+  wire [1:0] mem__wr0__addr; // test014.py:23
+  reg [1:0] __next__mem__wr0__addr; // test014.py:23
+  wire [7:0] mem__wr0__data; // test014.py:23
+  reg [7:0] __next__mem__wr0__data; // test014.py:23
+  wire mem__wr0__en; // test014.py:23
+  reg __next__mem__wr0__en; // test014.py:23
+  reg [7:0] __next__q; // test014.py:19
+  reg [7:0] __next__r; // test014.py:20
+  assign __23231009 = sel == 32'sd3; // test014.py:41
+  assign __823e62ea = a + 32'sd1; // test014.py:35
+  assign __c0f00629 = ~ q; // test014.py:42
+  assign __de8f626c = q + a; // test014.py:40
+  always @* begin
+    __next__q = q; // test014.py:19
+    if (en) begin // test014.py:39
+      __next__q = __de8f626c; // test014.py:40
+    end
+    else if (__23231009) begin // test014.py:41
+      __next__q = __c0f00629; // test014.py:42
+    end
+  end
+  always @* begin
+    __next__r = 8'bx; // test014.py:20
+    __next__r = (sel[1] ? a : (sel[0] ? __823e62ea[7:0] : l__y)); // test014.py:31
+  end
+  always @* begin
+    __next__m = 8'bx; // test014.py:20
+    __next__m = mem__rd1; // test014.py:26
+  end
+  always @* begin
+    __next__mem__wr0__addr = 2'bx; // test014.py:23
+    __next__mem__wr0__data = 8'bx; // test014.py:23
+    __next__mem__wr0__en = 1'bx; // test014.py:23
+    __next__mem__wr0__en = 1'd0; // test014.py:23
+    if (en) begin // test014.py:24
+      __next__mem__wr0__addr = sel; // test014.py:25
+      __next__mem__wr0__data = a; // test014.py:25
+      __next__mem__wr0__en = 1'd1; // test014.py:25
+    end
+  end
+  assign r = __next__r; // test014.py:20
+  assign m = __next__m; // test014.py:20
+  assign mem__wr0__addr = __next__mem__wr0__addr; // test014.py:23
+  assign mem__wr0__data = __next__mem__wr0__data; // test014.py:23
+  assign mem__wr0__en = __next__mem__wr0__en; // test014.py:23
+  assign l__x = a; // test014.py:29
+  always @(posedge clk) begin
+    if (rst) begin
+      q <= 8'h3; // test014.py:19
+    end else begin
+      q <= __next__q; // test014.py:19
+    end
+  end
+  leaf_2 l ( // test014.py:28
+    .x(a),
+    .y(l__y)
+  );
+  always @(posedge clk) begin
+    if (mem__wr0__en) mem[mem__wr0__addr] <= mem__wr0__data; // test014.py:23
+    mem__rd1 <= mem[sel]; // test014.py:26
+  end
+endmodule
+
+module gate_2 (
+  input [7:0] a /* test014.py:46 */,
+  input clk /* test014.py:45 */,
+  input en /* test014.py:45 */,
+  output [7:0] m0 /* test014.py:48 */,
+  output [7:0] m1 /* test014.py:48 */,
+  output [7:0] q0 /* test014.py:48 */,
+  output [7:0] q1 /* test014.py:48 */,
+  output [7:0] r0 /* test014.py:48 */,
+  output [7:0] r1 /* test014.py:48 */,
+  input rst /* test014.py:45 */,
+  input [1:0] sel /* test014.py:47 */
+);
+  reg [7:0] c0__mem [0:3]; // test014.py:22
+  wire [7:0] __0fd864f7; // test014.py:42
+  wire [7:0] __26d738b7; // test014.py:51
+  wire [7:0] __4a494bb0; // test014.py:40
+  wire __79b7997c; // test014.py:41
+  wire [31:0] __99cd0bb8; // test014.py:35
+  wire [7:0] c0__a; // test014.py:50
+  wire c0__clk; // test014.py:50
+  wire c0__en; // test014.py:50
+  wire [7:0] c0__l__x; // test014.py:28
+  wire [7:0] c0__l__y; // test014.py:28
+  wire [7:0] c0__m; // test014.py:50
+  reg [7:0] __next__c0__m; // test014.py:50
+  reg [7:0] c0__mem__rd1; // test014.py:26
+  wire [1:0] c0__mem__wr0__addr; // test014.py:23
+  reg [1:0] __next__c0__mem__wr0__addr; // test014.py:23
+  wire [7:0] c0__mem__wr0__data; // test014.py:23
+  reg [7:0] __next__c0__mem__wr0__data; // test014.py:23
+  wire c0__mem__wr0__en; // test014.py:23
+  reg __next__c0__mem__wr0__en; // test014.py:23
+  reg [7:0] c0__q; // test014.py:50
+  reg [7:0] __next__c0__q; // test014.py:50
+  wire [7:0] c0__r; // test014.py:50
+  reg [7:0] __next__c0__r; // test014.py:50
+  wire c0__rst; // test014.py:50
+  wire [1:0] c0__sel; // test014.py:50
+  wire [7:0] c1__a; // test014.py:50
+  wire c1__clk; // test014.py:50
+  wire c1__en; // test014.py:50
+  wire [7:0] c1__m; // test014.py:50
+  wire [7:0] c1__q; // test014.py:50
+  wire [7:0] c1__r; // test014.py:50
+  wire c1__rst; // test014.py:50
+  wire [1:0] c1__sel; // test014.py:50
+  assign __0fd864f7 = ~ c0__q; // test014.py:42
+  assign __26d738b7 = ~ a; // test014.py:51
+  assign __4a494bb0 = c0__q + c0__a; // test014.py:40
+  assign __79b7997c = c0__sel == 32'sd3; // test014.py:41
+  assign __99cd0bb8 = c0__a + 32'sd1; // test014.py:35
+  always @* begin
+    __next__c0__mem__wr0__addr = 2'bx; // test014.py:23
+    __next__c0__mem__wr0__data = 8'bx; // test014.py:23
+    __next__c0__mem__wr0__en = 1'bx; // test014.py:23
+    __next__c0__mem__wr0__en = 1'd0; // test014.py:23
+    if (c0__en) begin // test014.py:24
+      __next__c0__mem__wr0__addr = c0__sel; // test014.py:25
+      __next__c0__mem__wr0__data = c0__a; // test014.py:25
+      __next__c0__mem__wr0__en = 1'd1; // test014.py:25
+    end
+  end
+  always @* begin
+    __next__c0__q = c0__q; // test014.py:19
+    if (c0__en) begin // test014.py:39
+      __next__c0__q = __4a494bb0; // test014.py:40
+    end
+    else begin // test014.py:39
+      if (__79b7997c) begin // test014.py:41
+        __next__c0__q = __0fd864f7; // test014.py:42
+      end
+    end
+  end
+  always @* begin
+    __next__c0__r = 8'bx; // test014.py:20
+    __next__c0__r = (c0__sel[1] ? c0__a : (c0__sel[0] ? __99cd0bb8[7:0] : c0__l__y)); // test014.py:31
+  end
+  always @* begin
+    __next__c0__m = 8'bx; // test014.py:20
+    __next__c0__m = c0__mem__rd1; // test014.py:26
+  end
+  assign c0__clk = clk; // test014.py:52
+  assign c0__rst = rst; // test014.py:53
+  assign c0__en = en; // test014.py:54
+  assign c0__sel = sel; // test014.py:55
+  assign c0__a = a; // test014.py:56
+  assign c1__clk = clk; // test014.py:52
+  assign c1__rst = rst; // test014.py:53
+  assign c1__en = en; // test014.py:54
+  assign c1__sel = sel; // test014.py:55
+  assign c1__a = __26d738b7; // test014.py:56
+  assign q0 = c0__q; // test014.py:59
+  assign r0 = c0__r; // test014.py:59
+  assign m0 = c0__m; // test014.py:59
+  assign q1 = c1__q; // test014.py:59
+  assign r1 = c1__r; // test014.py:59
+  assign m1 = c1__m; // test014.py:59
+  assign c0__mem__wr0__addr = __next__c0__mem__wr0__addr; // test014.py:23
+  assign c0__mem__wr0__data = __next__c0__mem__wr0__data; // test014.py:23
+  assign c0__mem__wr0__en = __next__c0__mem__wr0__en; // test014.py:23
+  assign c0__r = __next__c0__r; // test014.py:20
+  assign c0__m = __next__c0__m; // test014.py:20
+  assign c0__l__x = c0__a; // test014.py:28
+  always @(posedge c0__clk) begin
+    if (c0__rst) begin
+      c0__q <= 8'h3; // test014.py:19
+    end else begin
+      c0__q <= __next__c0__q; // test014.py:19
+    end
+  end
+  child_2__gate_2__c1 c1 ( // test014.py:50
+    .a(__26d738b7),
+    .clk(clk),
+    .en(en),
+    .m(c1__m),
+    .q(c1__q),
+    .r(c1__r),
+    .rst(rst),
+    .sel(sel)
+  );
+  leaf_2 c0__l ( // test014.py:28
+    .x(c0__a),
+    .y(c0__l__y)
+  );
+  always @(posedge c0__clk) begin
+    if (c0__mem__wr0__en) c0__mem[c0__mem__wr0__addr] <= c0__mem__wr0__data; // test014.py:23
+    c0__mem__rd1 <= c0__mem[c0__sel]; // test014.py:26
+  end
+endmodule
+
+module child_2__gate_2__c1 (
+  input [7:0] a /* test014.py:17 */,
+  input clk /* test014.py:16 */,
+  input en /* test014.py:16 */,
+  output [7:0] m /* test014.py:20 */,
+  output reg [7:0] q /* test014.py:19 */,
+  output [7:0] r /* test014.py:20 */,
+  input rst /* test014.py:16 */,
+  input [1:0] sel /* test014.py:18 */
+);
+  reg [7:0] mem [0:3]; // test014.py:22
+  wire __23231009; // test014.py:41
+  wire [31:0] __823e62ea; // test014.py:35
+  wire [7:0] __c0f00629; // test014.py:42
+  wire [7:0] __de8f626c; // test014.py:40
+  wire [7:0] l__x; // test014.py:28
+  wire [7:0] l__y; // test014.py:28
+  reg [7:0] __next__m; // test014.py:20
+  reg [7:0] mem__rd1; // test014.py:26
+  wire [1:0] mem__wr0__addr; // test014.py:23
+  reg [1:0] __next__mem__wr0__addr; // test014.py:23
+  wire [7:0] mem__wr0__data; // test014.py:23
+  reg [7:0] __next__mem__wr0__data; // test014.py:23
+  wire mem__wr0__en; // test014.py:23
+  reg __next__mem__wr0__en; // test014.py:23
+  reg [7:0] __next__q; // test014.py:19
+  reg [7:0] __next__r; // test014.py:20
+  assign __23231009 = sel == 32'sd3; // test014.py:41
+  assign __823e62ea = a + 32'sd1; // test014.py:35
+  assign __c0f00629 = ~ q; // test014.py:42
+  assign __de8f626c = q + a; // test014.py:40
+  always @* begin
+    __next__mem__wr0__addr = 2'bx; // test014.py:23
+    __next__mem__wr0__data = 8'bx; // test014.py:23
+    __next__mem__wr0__en = 1'bx; // test014.py:23
+    __next__mem__wr0__en = 1'd0; // test014.py:23
+    if (en) begin // test014.py:24
+      __next__mem__wr0__addr = sel; // test014.py:25
+      __next__mem__wr0__data = a; // test014.py:25
+      __next__mem__wr0__en = 1'd1; // test014.py:25
+    end
+  end
+  always @* begin
+    __next__q = q; // test014.py:19
+    if (en) begin // test014.py:39
+      __next__q = __de8f626c; // test014.py:40
+    end
+    else begin // test014.py:39
+      if (__23231009) begin // test014.py:41
+        __next__q = __c0f00629; // test014.py:42
+      end
+    end
+  end
+  always @* begin
+    __next__r = 8'bx; // test014.py:20
+    __next__r = (sel[1] ? a : (sel[0] ? __823e62ea[7:0] : l__y)); // test014.py:31
+  end
+  always @* begin
+    __next__m = 8'bx; // test014.py:20
+    __next__m = mem__rd1; // test014.py:26
+  end
+  assign mem__wr0__addr = __next__mem__wr0__addr; // test014.py:23
+  assign mem__wr0__data = __next__mem__wr0__data; // test014.py:23
+  assign mem__wr0__en = __next__mem__wr0__en; // test014.py:23
+  assign r = __next__r; // test014.py:20
+  assign m = __next__m; // test014.py:20
+  assign l__x = a; // test014.py:28
+  always @(posedge clk) begin
+    if (rst) begin
+      q <= 8'h3; // test014.py:19
+    end else begin
+      q <= __next__q; // test014.py:19
+    end
+  end
+  leaf_2 l ( // test014.py:28
+    .x(a),
+    .y(l__y)
+  );
+  always @(posedge clk) begin
+    if (mem__wr0__en) mem[mem__wr0__addr] <= mem__wr0__data; // test014.py:23
+    mem__rd1 <= mem[sel]; // test014.py:26
+  end
+endmodule
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+from chipy.Chipy import *
+from chipy.transform import *
+
+
+def make_lane(name, offset):
+    lane = AddModule(name)
+    with lane:
+        x = AddInput("x", 8)
+        y = AddOutput("y", 8, async_=True)
+        y.next = x * 3 + offset
+    return lane
+
+
+def make_pair(name, lane_a, lane_b):
+    pair = AddModule(name)
+    with pair:
+        a, b = AddInput("a b", 8)
+        ya, yb = AddOutput("ya yb", 8)
+        la = AddInst("la", lane_a)
+        lb = AddInst("lb", lane_b)
+        Connect(la.x_, a)
+        Connect(lb.x_, b)
+        Connect(ya, la.y_)
+        Connect(yb, lb.y_)
+    return pair
+
+
+def make_table(name, init, names):
+    # internal registers that are only referenced by declarations
+    table = AddModule(name)
+    with table:
+        x = AddInput("x", 2)
+        y = AddOutput("y", 8, async_=True)
+        mem = AddMemory("mem", 8, 4, init=init)
+        y.next = mem[x]
+        r1, r2 = AddReg(names, 8, async_=True)
+        r1.next = x + 1
+        r2.next = x * 2
+    return table
+
+
+lanes = [make_lane("lane_%d" % i, 1) for i in range(4)]
+pair_0 = make_pair("pair_0", lanes[0], lanes[1])
+pair_1 = make_pair("pair_1", lanes[2], lanes[3])
+lane_odd = make_lane("lane_odd", 2)
+
+with AddModule("gate_1"):
+    a, b, c, d, e = AddInput("a b c d e", 8)
+    outs = AddOutput("y0 y1 y2 y3 y4", 8)
+    p0 = AddInst("p0", pair_0)
+    p1 = AddInst("p1", pair_1)
+    o = AddInst("o", lane_odd)
+    Connect(p0.a_, a)
+    Connect(p0.b_, b)
+    Connect(p1.a_, c)
+    Connect(p1.b_, d)
+    Connect(o.x_, e)
+    for y, sig in zip(outs, [p0.ya_, p0.yb_, p1.ya_, p1.yb_, o.y_]):
+        Connect(y, sig)
+
+# identical top-level modules are not instantiated and must both be kept
+make_lane("top_a", 5)
+make_lane("top_b", 5)
+
+tables = [make_table("table_a", [1, 2, 3, 4], "aa zz"), make_table("table_b", [1, 2, 3, 4], "zz aa"),
+        make_table("table_c", [1, 2, 3, 5], "aa zz")]
+with AddModule("tables"):
+    x = AddInput("x", 2)
+    for idx, table in enumerate(tables):
+        Connect(AddInst("t%d" % idx, table).x_, x)
+
+shared = ShareModules()
+assert shared == {"lane_1": "lane_0", "lane_2": "lane_0", "lane_3": "lane_0", "pair_1": "pair_0",
+        "table_b": "table_a"}, shared
+assert Module("top_a") is not None and Module("top_b") is not None
+assert [inst[1] for inst in Module("tables").instances] == ["table_a", "table_a", "table_c"]
+assert [inst[1] for inst in Module("gate_1").instances] == ["pair_0", "pair_0", "lane_odd"]
+assert Module("lane_1") is None
+
+
+with open("test015.v", "w") as f:
+    print("""
+//@ test-sat-equiv-comb gold gate_1
+""", file=f)
+
+    WriteVerilog(f)
+
+    print("""
+module gold(
+  input [7:0] a, b, c, d, e,
+  output [7:0] y0, y1, y2, y3, y4
+);
+  assign y0 = a * 3 + 1;
+  assign y1 = b * 3 + 1;
+  assign y2 = c * 3 + 1;
+  assign y3 = d * 3 + 1;
+  assign y4 = e * 3 + 2;
+endmodule
+""", file=f)
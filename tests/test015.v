@@ -0,0 +1,122 @@
+
+//@ test-sat-equiv-comb gold gate_1
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module lane_0 (
+  input [7:0] x /* test015.py:10 */,
+  output [7:0] y /* test015.py:11 */
+);
+  wire [31:0] __131f7f0b; // test015.py:12
+  wire [31:0] __9c05213d; // test015.py:12
+  reg [7:0] __next__y; // test015.py:11
+  assign __131f7f0b = x * 32'sd3; // test015.py:12
+  assign __9c05213d = __131f7f0b + 32'sd1; // test015.py:12
+  always @* begin
+    __next__y = 8'bx; // test015.py:11
+    __next__y = __9c05213d; // test015.py:12
+  end
+  assign y = __next__y; // test015.py:11
+endmodule
+
+module pair_0 (
+  input [7:0] a /* test015.py:19 */,
+  input [7:0] b /* test015.py:19 */,
+  output [7:0] ya /* test015.py:20 */,
+  output [7:0] yb /* test015.py:20 */
+);
+  wire [7:0] la__x; // test015.py:21
+  wire [7:0] la__y; // test015.py:21
+  wire [7:0] lb__x; // test015.py:22
+  wire [7:0] lb__y; // test015.py:22
+  assign la__x = a; // test015.py:23
+  assign lb__x = b; // test015.py:24
+  assign ya = la__y; // test015.py:25
+  assign yb = lb__y; // test015.py:26
+  lane_0 la ( // test015.py:21
+    .x(a),
+    .y(la__y)
+  );
+  lane_0 lb ( // test015.py:22
+    .x(b),
+    .y(lb__y)
+  );
+endmodule
+
+module lane_odd (
+  input [7:0] x /* test015.py:10 */,
+  output [7:0] y /* test015.py:11 */
+);
+  wire [31:0] __131f7f0b; // test015.py:12
+  wire [31:0] __b5cd95cf; // test015.py:12
+  reg [7:0] __next__y; // test015.py:11
+  assign __131f7f0b = x * 32'sd3; // test015.py:12
+  assign __b5cd95cf = __131f7f0b + 32'sd2; // test015.py:12
+  always @* begin
+    __next__y = 8'bx; // test015.py:11
+    __next__y = __b5cd95cf; // test015.py:12
+  end
+  assign y = __next__y; // test015.py:11
+endmodule
+
+module gate_1 (
+  input [7:0] a /* test015.py:36 */,
+  input [7:0] b /* test015.py:36 */,
+  input [7:0] c /* test015.py:36 */,
+  input [7:0] d /* test015.py:36 */,
+  input [7:0] e /* test015.py:36 */,
+  output [7:0] y0 /* test015.py:37 */,
+  output [7:0] y1 /* test015.py:37 */,
+  output [7:0] y2 /* test015.py:37 */,
+  output [7:0] y3 /* test015.py:37 */,
+  output [7:0] y4 /* test015.py:37 */
+);
+  wire [7:0] o__x; // test015.py:40
+  wire [7:0] o__y; // test015.py:40
+  wire [7:0] p0__a; // test015.py:38
+  wire [7:0] p0__b; // test015.py:38
+  wire [7:0] p0__ya; // test015.py:38
+  wire [7:0] p0__yb; // test015.py:38
+  wire [7:0] p1__a; // test015.py:39
+  wire [7:0] p1__b; // test015.py:39
+  wire [7:0] p1__ya; // test015.py:39
+  wire [7:0] p1__yb; // test015.py:39
+  assign p0__a = a; // test015.py:41
+  assign p0__b = b; // test015.py:42
+  assign p1__a = c; // test015.py:43
+  assign p1__b = d; // test015.py:44
+  assign o__x = e; // test015.py:45
+  assign y0 = p0__ya; // test015.py:47
+  assign y1 = p0__yb; // test015.py:47
+  assign y2 = p1__ya; // test015.py:47
+  assign y3 = p1__yb; // test015.py:47
+  assign y4 = o__y; // test015.py:47
+  pair_0 p0 ( // test015.py:38
+    .a(a),
+    .b(b),
+    .ya(p0__ya),
+    .yb(p0__yb)
+  );
+  pair_0 p1 ( // test015.py:39
+    .a(c),
+    .b(d),
+    .ya(p1__ya),
+    .yb(p1__yb)
+  );
+  lane_odd o ( // test015.py:40
+    .x(e),
+    .y(o__y)
+  );
+endmodule
+
+module gold(
+  input [7:0] a, b, c, d, e,
+  output [7:0] y0, y1, y2, y3, y4
+);
+  assign y0 = a * 3 + 1;
+  assign y1 = b * 3 + 1;
+  assign y2 = c * 3 + 1;
+  assign y3 = d * 3 + 1;
+  assign y4 = e * 3 + 2;
+endmodule
+
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+
+from chipy.Chipy import *
+from chipy.export import *
+
+
+def make_design(name):
+    sub = AddModule("sub_" + name)
+    with sub:
+        x = AddInput("x", 8)
+        y = AddOutput("y", 8, async_=True)
+        y.next = x ^ Sig(0x5a, 8)
+
+    with AddModule(name):
+        clk, rst, arst, en = AddInput("clk rst arst en")
+        sel = AddInput("sel", 2)
+        idx = AddInput("idx", 3)
+        a = AddInput("a", 8)
+        b = AddInput("b", -8)
+
+        q = AddOutput("q", 8, posedge=clk, reset=rst, reset_value=3)
+        r = AddOutput("r", 8, posedge=clk, reset=Reset(arst, sync=False), reset_value=0x5a)
+        s = AddOutput("s", -8, async_=True)
+        d, part, m, mr = AddOutput("d part m mr", 8, async_=True)
+        u = AddOutput("u", 8)
+        cmp = AddOutput("cmp", 2, async_=True)
+
+        with If(en):
+            q.next = q + a
+        with ElseIf(sel == 3):
+            q.next = q - b
+        with Else():
+            q.next = (a * b)[7:0]
+
+        with Switch(sel, parallel=True):
+            with Case(0): r.next = a + b
+            with Case(1): r.next = r >> 1
+            with Case(2): r.next = -r
+            with Default(): r.next = a
+
+        s.next = (b >> 2) + b // 3
+        d.next = Concat([a[idx], Repeat(3, a[0]), a[idx, 4]])
+
+        part.next = a
+        part[idx, 2].next = Sig(2, 2)
+        part[7].next = en
+
+        cmp.next = Concat([b < Sig(0, -8), a.reduce_xor()])
+
+        mem = AddMemory("mem", 8, 4, posedge=clk, init=[1, 2, 3, 4])
+        with If(en):
+            mem[sel].next = a
+        wp = mem.write_port()
+        with If(~en):
+            wp.write(idx[1:0], b)
+        m.next = mem[sel]
+        mr.next = mem.read_port(idx[1:0], posedge=clk, enable=a[0])
+
+        inst = AddInst("inst", sub)
+        Connect(inst.x_, a + b)
+        Connect(u, inst.y_)
+
+
+def make_blif_design(name):
+    sub = AddModule("bsub_" + name)
+    with sub:
+        x = AddInput("x", 4)
+        y = AddOutput("y", 4, async_=True)
+        y.next = ~x
+
+    with AddModule(name):
+        clk, sel = AddInput("clk sel")
+        a, b = AddInput("a b", 4)
+        y = AddOutput("y", 4, posedge=clk, reset=False)
+        w = AddOutput("w", 4, async_=True)
+        z = AddOutput("z", 2, async_=True)
+
+        with If(sel):
+            y.next = a ^ b
+        w.next = Cond(sel, a & b, a | ~b)
+        z.next = Concat([a == b, (a ^ b).reduce_and()])
+
+        inst = AddInst("inst", sub)
+        Connect(inst.x_, y)
+
+
+make_design("gate_1")
+with open("test016.json", "w") as f:
+    WriteJSON(f)
+
+ResetDesign()
+make_blif_design("gate_2")
+with open("test016.blif", "w") as f:
+    WriteBLIF(f)
+
+ResetDesign()
+make_design("gold")
+make_blif_design("gold_2")
+
+with open("test016.v", "w") as f:
+    print("""
+//@ test-sat-equiv-bmc gold gate_1 5
+//@ test-sat-equiv-induct gold_2 gate_2 5
+""", file=f)
+
+    WriteVerilog(f)
@@ -0,0 +1,280 @@
+
+//@ test-sat-equiv-bmc gold gate_1 5
+//@ test-sat-equiv-induct gold_2 gate_2 5
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module sub_gold (
+  input [7:0] x /* test016.py:10 */,
+  output [7:0] y /* test016.py:11 */
+);
+  wire [7:0] __49558b2a; // test016.py:12
+  reg [7:0] __next__y; // test016.py:11
+  assign __49558b2a = x ^ 8'd90; // test016.py:12
+  always @* begin
+    __next__y = 8'bx; // test016.py:11
+    __next__y = __49558b2a; // test016.py:12
+  end
+  assign y = __next__y; // test016.py:11
+endmodule
+
+module gold (
+  input [7:0] a /* test016.py:18 */,
+  input arst /* test016.py:15 */,
+  input signed [7:0] b /* test016.py:19 */,
+  input clk /* test016.py:15 */,
+  output [1:0] cmp /* test016.py:26 */,
+  output [7:0] d /* test016.py:24 */,
+  input en /* test016.py:15 */,
+  input [2:0] idx /* test016.py:17 */,
+  output [7:0] m /* test016.py:24 */,
+  output [7:0] mr /* test016.py:24 */,
+  output [7:0] part /* test016.py:24 */,
+  output reg [7:0] q /* test016.py:21 */,
+  output reg [7:0] r /* test016.py:22 */,
+  input rst /* test016.py:15 */,
+  output signed [7:0] s /* test016.py:23 */,
+  input [1:0] sel /* test016.py:16 */,
+  output [7:0] u /* test016.py:25 */
+);
+  reg [7:0] mem [0:3]; // test016.py:50
+  wire [7:0] __067ea91d; // test016.py:37
+  wire __23231009; // test016.py:30
+  wire __2babb7bb; // test016.py:42
+  wire __2babb7bb_1; // test016.py:57
+  wire [7:0] __2d236f25; // test016.py:38
+  wire [7:0] __3014dc66; // test016.py:42
+  wire [7:0] __4f14e40a; // test016.py:41
+  wire __5197225e; // test016.py:54
+  wire [7:0] __57dea04c_1; // test016.py:56
+  wire [7:0] __5bbe62e5; // test016.py:33
+  wire [7:0] __6ecbcc32; // test016.py:33
+  wire [31:0] __83250053; // test016.py:41
+  wire __8c458142; // test016.py:48
+  wire __901c6902; // test016.py:48
+  wire __b4581e3b; // test016.py:42
+  wire [7:0] __bca3c472; // test016.py:36
+  wire [7:0] __bca3c472_1; // test016.py:60
+  wire [7:0] __c8990b2f; // test016.py:31
+  wire [31:0] __cc560935; // test016.py:41
+  wire [7:0] __de8f626c; // test016.py:29
+  reg __de9bd520; // test016.py:52
+  wire [2:0] __e2fc5dc8; // test016.py:42
+  wire [1:0] __e7c72d03; // test016.py:48
+  wire [3:0] __eeae8b85; // test016.py:42
+  wire [1:0] __fb0ed949; // test016.py:55
+  wire [1:0] __fb0ed949_1; // test016.py:57
+  reg [1:0] __next__cmp; // test016.py:26
+  reg [7:0] __next__d; // test016.py:24
+  wire [7:0] inst__x; // test016.py:59
+  wire [7:0] inst__y; // test016.py:59
+  reg [7:0] __next__m; // test016.py:24
+  reg [7:0] mem__rd1; // test016.py:57
+  wire [1:0] mem__wr0__addr; // test016.py:53
+  reg [1:0] __next__mem__wr0__addr; // test016.py:53
+  wire [7:0] mem__wr0__data; // test016.py:53
+  reg [7:0] __next__mem__wr0__data; // test016.py:53
+  wire mem__wr0__en; // test016.py:53
+  reg __next__mem__wr0__en; // test016.py:53
+  reg [7:0] __next__mr; // test016.py:24
+  reg [7:0] __next__part; // test016.py:24
+  reg [7:0] __next__q; // test016.py:21
+  reg [7:0] __next__r; // test016.py:22
+  reg [7:0] __next__s; // test016.py:23
+  assign __067ea91d = r >>> 32'sd1; // test016.py:37
+  assign __23231009 = sel == 32'sd3; // test016.py:30
+  assign __2babb7bb = a[0]; // test016.py:42
+  assign __2babb7bb_1 = a[0]; // test016.py:57
+  assign __2d236f25 = - r; // test016.py:38
+  assign __3014dc66 = {__b4581e3b,__e2fc5dc8,__eeae8b85}; // test016.py:42
+  assign __4f14e40a = b >>> 32'sd2; // test016.py:41
+  assign __5197225e = ~ en; // test016.py:54
+  assign __57dea04c_1 = mem[sel]; // test016.py:56
+  assign __5bbe62e5 = a * b; // test016.py:33
+  assign __6ecbcc32 = __5bbe62e5[7:0]; // test016.py:33
+  assign __83250053 = __4f14e40a + __cc560935; // test016.py:41
+  assign __8c458142 = b < 8'sd0; // test016.py:48
+  assign __901c6902 = ^ a; // test016.py:48
+  assign __b4581e3b = a[idx]; // test016.py:42
+  assign __bca3c472 = a + b; // test016.py:36
+  assign __bca3c472_1 = a + b; // test016.py:60
+  assign __c8990b2f = q - b; // test016.py:31
+  assign __cc560935 = b / 32'sd3; // test016.py:41
+  assign __de8f626c = q + a; // test016.py:29
+  assign __e2fc5dc8 = {3{__2babb7bb}}; // test016.py:42
+  assign __e7c72d03 = {__8c458142,__901c6902}; // test016.py:48
+  assign __eeae8b85 = a[idx +: 4]; // test016.py:42
+  assign __fb0ed949 = idx[1:0]; // test016.py:55
+  assign __fb0ed949_1 = idx[1:0]; // test016.py:57
+  always @* begin
+    __next__q = q; // test016.py:21
+    if (en) begin // test016.py:28
+      __next__q = __de8f626c; // test016.py:29
+    end
+    else if (__23231009) begin // test016.py:30
+      __next__q = __c8990b2f; // test016.py:31
+    end
+    else begin // test016.py:32
+      __next__q = __6ecbcc32; // test016.py:33
+    end
+  end
+  always @* begin
+    __next__r = r; // test016.py:22
+    __next__r = (sel[1] ? (sel[0] ? a : __2d236f25) : (sel[0] ? __067ea91d : __bca3c472)); // test016.py:35
+  end
+  always @* begin
+    __next__s = 8'bx; // test016.py:23
+    __next__s = __83250053; // test016.py:41
+  end
+  always @* begin
+    __next__d = 8'bx; // test016.py:24
+    __next__d = __3014dc66; // test016.py:42
+  end
+  always @* begin
+    __next__part = 8'bx; // test016.py:24
+    __next__part = a; // test016.py:44
+    __next__part[idx +: 2] = 2'd2; // test016.py:45
+    __next__part[7] = en; // test016.py:46
+  end
+  always @* begin
+    __next__m = 8'bx; // test016.py:24
+    __next__m = __57dea04c_1; // test016.py:56
+  end
+  always @* begin
+    __next__mr = 8'bx; // test016.py:24
+    __next__mr = mem__rd1; // test016.py:57
+  end
+  always @* begin
+    __next__cmp = 2'bx; // test016.py:26
+    __next__cmp = __e7c72d03; // test016.py:48
+  end
+  always @* begin
+    __de9bd520 = 1'b0; // test016.py:52
+    if (en) begin // test016.py:51
+      __de9bd520 = 1'b1; // test016.py:52
+    end
+  end
+  always @* begin
+    __next__mem__wr0__addr = 2'bx; // test016.py:53
+    __next__mem__wr0__data = 8'bx; // test016.py:53
+    __next__mem__wr0__en = 1'bx; // test016.py:53
+    __next__mem__wr0__en = 1'd0; // test016.py:53
+    if (__5197225e) begin // test016.py:54
+      __next__mem__wr0__addr = __fb0ed949; // test016.py:55
+      __next__mem__wr0__data = b; // test016.py:55
+      __next__mem__wr0__en = 1'd1; // test016.py:55
+    end
+  end
+  assign s = __next__s; // test016.py:23
+  assign d = __next__d; // test016.py:24
+  assign part = __next__part; // test016.py:24
+  assign m = __next__m; // test016.py:24
+  assign mr = __next__mr; // test016.py:24
+  assign cmp = __next__cmp; // test016.py:26
+  assign mem__wr0__addr = __next__mem__wr0__addr; // test016.py:53
+  assign mem__wr0__data = __next__mem__wr0__data; // test016.py:53
+  assign mem__wr0__en = __next__mem__wr0__en; // test016.py:53
+  assign inst__x = __bca3c472_1; // test016.py:60
+  assign u = inst__y; // test016.py:61
+  always @(posedge clk) begin
+    if (rst) begin
+      q <= 8'h3; // test016.py:21
+    end else begin
+      q <= __next__q; // test016.py:21
+    end
+  end
+  always @(posedge clk or posedge arst) begin
+    if (arst) begin
+      r <= 8'h5a; // test016.py:22
+    end else begin
+      r <= __next__r; // test016.py:22
+    end
+  end
+  sub_gold inst ( // test016.py:59
+    .x(__bca3c472_1),
+    .y(inst__y)
+  );
+  always @(posedge clk) begin
+    if (__de9bd520) mem[sel] <= a; // test016.py:52
+    if (mem__wr0__en) mem[mem__wr0__addr] <= mem__wr0__data; // test016.py:53
+    if (__2babb7bb_1) mem__rd1 <= mem[__fb0ed949_1]; // test016.py:57
+  end
+  initial begin // test016.py:50
+    mem[0] = 8'h1;
+    mem[1] = 8'h2;
+    mem[2] = 8'h3;
+    mem[3] = 8'h4;
+  end
+endmodule
+
+module bsub_gold_2 (
+  input [3:0] x /* test016.py:67 */,
+  output [3:0] y /* test016.py:68 */
+);
+  wire [3:0] __1d8b08f7; // test016.py:69
+  reg [3:0] __next__y; // test016.py:68
+  assign __1d8b08f7 = ~ x; // test016.py:69
+  always @* begin
+    __next__y = 4'bx; // test016.py:68
+    __next__y = __1d8b08f7; // test016.py:69
+  end
+  assign y = __next__y; // test016.py:68
+endmodule
+
+module gold_2 (
+  input [3:0] a /* test016.py:73 */,
+  input [3:0] b /* test016.py:73 */,
+  input clk /* test016.py:72 */,
+  input sel /* test016.py:72 */,
+  output [3:0] w /* test016.py:75 */,
+  output reg [3:0] y /* test016.py:74 */,
+  output [1:0] z /* test016.py:76 */
+);
+  wire [3:0] __0f1f8c45; // test016.py:80
+  wire [3:0] __2403d987; // test016.py:80
+  wire [3:0] __24eb77a4; // test016.py:80
+  wire [3:0] __6f90a20d; // test016.py:80
+  wire [3:0] __907778d1; // test016.py:79
+  wire [3:0] __907778d1_1; // test016.py:81
+  wire __c7fd0b3e; // test016.py:81
+  wire [1:0] __c99f0063; // test016.py:81
+  wire __d4dbe95d; // test016.py:81
+  wire [3:0] inst__x; // test016.py:83
+  wire [3:0] inst__y; // test016.py:83
+  reg [3:0] __next__w; // test016.py:75
+  reg [3:0] __next__y; // test016.py:74
+  reg [1:0] __next__z; // test016.py:76
+  assign __0f1f8c45 = ~ b; // test016.py:80
+  assign __2403d987 = a & b; // test016.py:80
+  assign __24eb77a4 = sel ? __2403d987 : __6f90a20d; // test016.py:80
+  assign __6f90a20d = a | __0f1f8c45; // test016.py:80
+  assign __907778d1 = a ^ b; // test016.py:79
+  assign __907778d1_1 = a ^ b; // test016.py:81
+  assign __c7fd0b3e = a == b; // test016.py:81
+  assign __c99f0063 = {__c7fd0b3e,__d4dbe95d}; // test016.py:81
+  assign __d4dbe95d = & __907778d1_1; // test016.py:81
+  always @* begin
+    __next__y = y; // test016.py:74
+    if (sel) begin // test016.py:78
+      __next__y = __907778d1; // test016.py:79
+    end
+  end
+  always @* begin
+    __next__w = 4'bx; // test016.py:75
+    __next__w = __24eb77a4; // test016.py:80
+  end
+  always @* begin
+    __next__z = 2'bx; // test016.py:76
+    __next__z = __c99f0063; // test016.py:81
+  end
+  assign w = __next__w; // test016.py:75
+  assign z = __next__z; // test016.py:76
+  assign inst__x = y; // test016.py:84
+  always @(posedge clk) begin
+    y <= __next__y; // test016.py:74
+  end
+  bsub_gold_2 inst ( // test016.py:83
+    .x(y),
+    .y(inst__y)
+  );
+endmodule
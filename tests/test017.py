@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+from chipy.Chipy import *
+import io, os, sys, gzip, lzma, tempfile
+
+
+with AddModule("gate_1"):
+    clk = AddInput("clk")
+    a, b = AddInput("a b", 8)
+    outs = list()
+    for i in range(8):
+        out = AddOutput("out_%d" % i, 8, posedge=clk)
+        out.next = a + Sig(i, 8) ^ b
+        outs.append(out)
+
+
+buf = io.StringIO()
+WriteVerilog(buf)
+
+with tempfile.TemporaryDirectory() as tmpdir:
+    WriteVerilog(os.path.join(tmpdir, "test017.v.gz"), level=1)
+    with gzip.open(os.path.join(tmpdir, "test017.v.gz"), "rt") as f:
+        assert f.read() == buf.getvalue()
+
+    WriteVerilog(os.path.join(tmpdir, "test017.v.xz"))
+    with lzma.open(os.path.join(tmpdir, "test017.v.xz"), "rt") as f:
+        assert f.read() == buf.getvalue()
+
+    # a failed write does not leave a truncated file behind
+    with AddModule("broken"):
+        AddOutput("y", 8)
+    try:
+        WriteVerilog(os.path.join(tmpdir, "broken.v.gz"))
+        assert False
+    except ChipyError:
+        pass
+    assert not os.path.exists(os.path.join(tmpdir, "broken.v.gz"))
+    del tls.ChipyModulesDict["broken"]
+
+    # an existing file is kept when the output cannot be opened
+    with open(os.path.join(tmpdir, "test017.v.zst"), "w") as f:
+        f.write("old")
+    sys.modules["zstandard"] = None
+    try:
+        WriteVerilog(os.path.join(tmpdir, "test017.v.zst"))
+        assert False
+    except ChipyError:
+        pass
+    del sys.modules["zstandard"]
+    with open(os.path.join(tmpdir, "test017.v.zst")) as f:
+        assert f.read() == "old"
+
+
+with open("test017.v", "w") as f:
+    print("""
+//@ test-sat-equiv-induct gold gate_1 3
+""", file=f)
+
+    WriteVerilog(f)
+
+    print("module gold(input clk, input [7:0] a, b, output reg [7:0] %s);" %
+            ", ".join("out_%d" % i for i in range(8)), file=f)
+    for i in range(8):
+        print("  always @(posedge clk) out_%d <= a + 8'd%d ^ b;" % (i, i), file=f)
+    print("endmodule", file=f)
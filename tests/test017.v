@@ -0,0 +1,111 @@
+
+//@ test-sat-equiv-induct gold gate_1 3
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module gate_1 (
+  input [7:0] a /* test017.py:9 */,
+  input [7:0] b /* test017.py:9 */,
+  input clk /* test017.py:8 */,
+  output reg [7:0] out_0 /* test017.py:12 */,
+  output reg [7:0] out_1 /* test017.py:12 */,
+  output reg [7:0] out_2 /* test017.py:12 */,
+  output reg [7:0] out_3 /* test017.py:12 */,
+  output reg [7:0] out_4 /* test017.py:12 */,
+  output reg [7:0] out_5 /* test017.py:12 */,
+  output reg [7:0] out_6 /* test017.py:12 */,
+  output reg [7:0] out_7 /* test017.py:12 */
+);
+  wire [7:0] __1e66f6c1; // test017.py:13
+  wire [7:0] __37ae4233; // test017.py:13
+  wire [7:0] __4df79f25; // test017.py:13
+  wire [7:0] __643f2bd7; // test017.py:13
+  wire [7:0] __76bf831d; // test017.py:13
+  wire [7:0] __8f0f6c71; // test017.py:13
+  wire [7:0] __905f1643; // test017.py:13
+  wire [7:0] __99c6d3a2; // test017.py:13
+  wire [7:0] __a7092449; // test017.py:13
+  wire [7:0] __b00e6750; // test017.py:13
+  wire [7:0] __b2e4ff01; // test017.py:13
+  wire [7:0] __ca57ba46; // test017.py:13
+  wire [7:0] __cf2a5151; // test017.py:13
+  wire [7:0] __d5ca17ed; // test017.py:13
+  wire [7:0] __e39f0eb4; // test017.py:13
+  wire [7:0] __eac0b0fe; // test017.py:13
+  reg [7:0] __next__out_0; // test017.py:12
+  reg [7:0] __next__out_1; // test017.py:12
+  reg [7:0] __next__out_2; // test017.py:12
+  reg [7:0] __next__out_3; // test017.py:12
+  reg [7:0] __next__out_4; // test017.py:12
+  reg [7:0] __next__out_5; // test017.py:12
+  reg [7:0] __next__out_6; // test017.py:12
+  reg [7:0] __next__out_7; // test017.py:12
+  assign __1e66f6c1 = a + 8'd1; // test017.py:13
+  assign __37ae4233 = a + 8'd2; // test017.py:13
+  assign __4df79f25 = a + 8'd7; // test017.py:13
+  assign __643f2bd7 = a + 8'd4; // test017.py:13
+  assign __76bf831d = __99c6d3a2 ^ b; // test017.py:13
+  assign __8f0f6c71 = __643f2bd7 ^ b; // test017.py:13
+  assign __905f1643 = __1e66f6c1 ^ b; // test017.py:13
+  assign __99c6d3a2 = a + 8'd3; // test017.py:13
+  assign __a7092449 = __ca57ba46 ^ b; // test017.py:13
+  assign __b00e6750 = a + 8'd0; // test017.py:13
+  assign __b2e4ff01 = __b00e6750 ^ b; // test017.py:13
+  assign __ca57ba46 = a + 8'd5; // test017.py:13
+  assign __cf2a5151 = __e39f0eb4 ^ b; // test017.py:13
+  assign __d5ca17ed = __37ae4233 ^ b; // test017.py:13
+  assign __e39f0eb4 = a + 8'd6; // test017.py:13
+  assign __eac0b0fe = __4df79f25 ^ b; // test017.py:13
+  always @* begin
+    __next__out_0 = out_0; // test017.py:12
+    __next__out_0 = __b2e4ff01; // test017.py:13
+  end
+  always @* begin
+    __next__out_1 = out_1; // test017.py:12
+    __next__out_1 = __905f1643; // test017.py:13
+  end
+  always @* begin
+    __next__out_2 = out_2; // test017.py:12
+    __next__out_2 = __d5ca17ed; // test017.py:13
+  end
+  always @* begin
+    __next__out_3 = out_3; // test017.py:12
+    __next__out_3 = __76bf831d; // test017.py:13
+  end
+  always @* begin
+    __next__out_4 = out_4; // test017.py:12
+    __next__out_4 = __8f0f6c71; // test017.py:13
+  end
+  always @* begin
+    __next__out_5 = out_5; // test017.py:12
+    __next__out_5 = __a7092449; // test017.py:13
+  end
+  always @* begin
+    __next__out_6 = out_6; // test017.py:12
+    __next__out_6 = __cf2a5151; // test017.py:13
+  end
+  always @* begin
+    __next__out_7 = out_7; // test017.py:12
+    __next__out_7 = __eac0b0fe; // test017.py:13
+  end
+  always @(posedge clk) begin
+    out_0 <= __next__out_0; // test017.py:12
+    out_1 <= __next__out_1; // test017.py:12
+    out_2 <= __next__out_2; // test017.py:12
+    out_3 <= __next__out_3; // test017.py:12
+    out_4 <= __next__out_4; // test017.py:12
+    out_5 <= __next__out_5; // test017.py:12
+    out_6 <= __next__out_6; // test017.py:12
+    out_7 <= __next__out_7; // test017.py:12
+  end
+endmodule
+module gold(input clk, input [7:0] a, b, output reg [7:0] out_0, out_1, out_2, out_3, out_4, out_5, out_6, out_7);
+  always @(posedge clk) out_0 <= a + 8'd0 ^ b;
+  always @(posedge clk) out_1 <= a + 8'd1 ^ b;
+  always @(posedge clk) out_2 <= a + 8'd2 ^ b;
+  always @(posedge clk) out_3 <= a + 8'd3 ^ b;
+  always @(posedge clk) out_4 <= a + 8'd4 ^ b;
+  always @(posedge clk) out_5 <= a + 8'd5 ^ b;
+  always @(posedge clk) out_6 <= a + 8'd6 ^ b;
+  always @(posedge clk) out_7 <= a + 8'd7 ^ b;
+endmodule
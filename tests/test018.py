@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+from chipy.Chipy import *
+import os, tempfile
+
+
+def build(offset):
+    ResetDesign()
+    leaf = AddModule("leaf")
+    with leaf:
+        x = AddInput("x", 8)
+        y = AddOutput("y", 8, async_=True)
+        y.next = x ^ Sig(offset, 8)
+
+    mid = AddModule("mid")
+    with mid:
+        x = AddInput("x", 8)
+        y = AddOutput("y", 8)
+        inst = AddInst("leaf", leaf)
+        Connect(inst.x_, x + Sig(1, 8))
+        Connect(y, inst.y_)
+
+    with AddModule("gate_1"):
+        a = AddInput("a", 8)
+        y = AddOutput("y", 8)
+        inst = AddInst("mid", mid)
+        Connect(inst.x_, a)
+        Connect(y, inst.y_)
+
+    # move the top module to the front of the design
+    top = tls.ChipyModulesDict.pop("gate_1")
+    tls.ChipyModulesDict = dict(gate_1=top, **tls.ChipyModulesDict)
+
+
+with tempfile.TemporaryDirectory() as tmpdir:
+    build(0x33)
+    changed = WriteVerilogDir(tmpdir)
+    assert sorted(os.path.basename(fn) for fn in changed) == ["files.f", "gate_1.v", "leaf.v", "mid.v"]
+
+    with open(os.path.join(tmpdir, "files.f")) as f:
+        files = f.read().split()
+    assert files == [os.path.join(os.path.abspath(tmpdir), name) for name in ("leaf.v", "mid.v", "gate_1.v")]
+
+    build(0x33)
+    assert WriteVerilogDir(tmpdir) == []
+
+    build(0x55)
+    assert [os.path.basename(fn) for fn in WriteVerilogDir(tmpdir)] == ["leaf.v"]
+
+    with open("test018.v", "w") as f:
+        print("""
+//@ test-sat-equiv-comb gold gate_1
+""", file=f)
+
+        for filename in files:
+            with open(filename) as fin:
+                f.write(fin.read())
+
+        print("""
+module gold(input [7:0] a, output [7:0] y);
+  assign y = (a + 1) ^ 8'h55;
+endmodule
+""", file=f)
+
+
+# memory init files are written along with the modules, also only when changed
+def build_rom(data):
+    ResetDesign()
+    with AddModule("rom"):
+        addr = AddInput("addr", 2)
+        y = AddOutput("y", 8, async_=True)
+        mem = AddMemory("mem", 8, 4, init=bytes(data))
+        y.next = mem[addr]
+
+with tempfile.TemporaryDirectory() as tmpdir:
+    build_rom([1, 2, 3, 4])
+    assert sorted(os.path.basename(fn) for fn in WriteVerilogDir(tmpdir)) == ["files.f", "rom.v", "rom_rom_mem.hex"]
+    with open(os.path.join(tmpdir, "files.f")) as f:
+        assert f.read().split() == [os.path.join(os.path.abspath(tmpdir), "rom.v")]
+    with open(os.path.join(tmpdir, "rom.v")) as f:
+        assert '$readmemh("%s"' % os.path.join(os.path.abspath(tmpdir), "rom_rom_mem.hex") in f.read()
+
+    build_rom([1, 2, 3, 4])
+    assert WriteVerilogDir(tmpdir) == []
+
+    build_rom([1, 2, 3, 5])
+    assert [os.path.basename(fn) for fn in WriteVerilogDir(tmpdir)] == ["rom_rom_mem.hex"]
+
+    # files of modules that are no longer in the design are removed
+    build(0x33)
+    with open(os.path.join(tmpdir, "other.v"), "w") as f:
+        print("// not written by WriteVerilogDir", file=f)
+    WriteVerilogDir(tmpdir)
+    assert sorted(os.listdir(tmpdir)) == ["files.f", "gate_1.v", "leaf.v", "mid.v", "other.v"]
@@ -0,0 +1,55 @@
+
+//@ test-sat-equiv-comb gold gate_1
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module leaf (
+  input [7:0] x /* test018.py:11 */,
+  output [7:0] y /* test018.py:12 */
+);
+  wire [7:0] __b4aa9d7f; // test018.py:13
+  reg [7:0] __next__y; // test018.py:12
+  assign __b4aa9d7f = x ^ 8'd85; // test018.py:13
+  always @* begin
+    __next__y = 8'bx; // test018.py:12
+    __next__y = __b4aa9d7f; // test018.py:13
+  end
+  assign y = __next__y; // test018.py:12
+endmodule
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module mid (
+  input [7:0] x /* test018.py:17 */,
+  output [7:0] y /* test018.py:18 */
+);
+  wire [7:0] __3225d065; // test018.py:20
+  wire [7:0] leaf__x; // test018.py:19
+  wire [7:0] leaf__y; // test018.py:19
+  assign __3225d065 = x + 8'd1; // test018.py:20
+  assign leaf__x = __3225d065; // test018.py:20
+  assign y = leaf__y; // test018.py:21
+  leaf leaf ( // test018.py:19
+    .x(__3225d065),
+    .y(leaf__y)
+  );
+endmodule
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module gate_1 (
+  input [7:0] a /* test018.py:24 */,
+  output [7:0] y /* test018.py:25 */
+);
+  wire [7:0] mid__x; // test018.py:26
+  wire [7:0] mid__y; // test018.py:26
+  assign mid__x = a; // test018.py:27
+  assign y = mid__y; // test018.py:28
+  mid mid ( // test018.py:26
+    .x(a),
+    .y(mid__y)
+  );
+endmodule
+
+module gold(input [7:0] a, output [7:0] y);
+  assign y = (a + 1) ^ 8'h55;
+endmodule
+
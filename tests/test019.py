@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+
+from chipy.Chipy import *
+
+
+def build(extra):
+    ResetDesign()
+
+    with AddModule("other"):
+        x = AddInput("x", 8)
+        y = AddOutput("y", 8, async_=True)
+        y.next = x + x if extra else x
+
+    with AddModule("gate_1"):
+        a, b = AddInput("a b", 8)
+        y, z = AddOutput("y z", 8, async_=True)
+        if extra:
+            z.next = a - b
+        else:
+            z.next = a
+        y.next = (a + b) ^ (a + b)[3:0]
+
+    return {name for name in Module("gate_1").signals if name.startswith("__")}
+
+
+names = build(False)
+extra_names = build(True)
+
+# Expressions that did not change keep their names, even though other
+# expressions were added before them in this and in other modules.
+assert names < extra_names
+assert len(extra_names - names) == 1
+
+# Identical expressions get distinct names.
+assert len([name for name in names if name.endswith("_1")]) == 1
+
+
+with open("test019.v", "w") as f:
+    print("""
+//@ test-sat-equiv-comb gold gate_1
+""", file=f)
+
+    WriteVerilog(f)
+
+    print("""
+module gold(input [7:0] a, b, output [7:0] y, z);
+  wire [7:0] s = a + b;
+  assign y = s ^ s[3:0];
+  assign z = a - b;
+endmodule
+""", file=f)
@@ -0,0 +1,55 @@
+
+//@ test-sat-equiv-comb gold gate_1
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module other (
+  input [7:0] x /* test019.py:10 */,
+  output [7:0] y /* test019.py:11 */
+);
+  wire [7:0] __5ffbd8c4; // test019.py:12
+  reg [7:0] __next__y; // test019.py:11
+  assign __5ffbd8c4 = x + x; // test019.py:12
+  always @* begin
+    __next__y = 8'bx; // test019.py:11
+    __next__y = __5ffbd8c4; // test019.py:12
+  end
+  assign y = __next__y; // test019.py:11
+endmodule
+
+module gate_1 (
+  input [7:0] a /* test019.py:15 */,
+  input [7:0] b /* test019.py:15 */,
+  output [7:0] y /* test019.py:16 */,
+  output [7:0] z /* test019.py:16 */
+);
+  wire [7:0] __6974ac04; // test019.py:21
+  wire [7:0] __837d19c3; // test019.py:18
+  wire [3:0] __bc2595f7; // test019.py:21
+  wire [7:0] __bca3c472; // test019.py:21
+  wire [7:0] __bca3c472_1; // test019.py:21
+  reg [7:0] __next__y; // test019.py:16
+  reg [7:0] __next__z; // test019.py:16
+  assign __6974ac04 = __bca3c472 ^ __bc2595f7; // test019.py:21
+  assign __837d19c3 = a - b; // test019.py:18
+  assign __bc2595f7 = __bca3c472_1[3:0]; // test019.py:21
+  assign __bca3c472 = a + b; // test019.py:21
+  assign __bca3c472_1 = a + b; // test019.py:21
+  always @* begin
+    __next__y = 8'bx; // test019.py:16
+    __next__y = __6974ac04; // test019.py:21
+  end
+  always @* begin
+    __next__z = 8'bx; // test019.py:16
+    __next__z = __837d19c3; // test019.py:18
+  end
+  assign y = __next__y; // test019.py:16
+  assign z = __next__z; // test019.py:16
+endmodule
+
+module gold(input [7:0] a, b, output [7:0] y, z);
+  wire [7:0] s = a + b;
+  assign y = s ^ s[3:0];
+  assign z = a - b;
+endmodule
+
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+from chipy import *
+from chipy import NewDesign, ElaborateAsync, WriteVerilogAsync
+from chipy.Chipy import tls
+import asyncio
+import io
+import sys
+
+
+def build(offset):
+    with AddModule("gate_1"):
+        a = AddInput("a", 8)
+        y = AddOutput("y", 8, async_=True)
+        y.next = a + Sig(offset, 8)
+
+
+class Sink:
+    def __init__(self):
+        self.chunks = list()
+
+    async def write(self, data):
+        await asyncio.sleep(0)
+        self.chunks.append(data)
+
+
+async def task_local(offset):
+    # Designs created directly in concurrent tasks do not see each other.
+    ResetDesign()
+    build(offset)
+    await asyncio.sleep(0)
+    assert Module("gate_1").signals["y"] is not None
+    assert len(tls.ChipyModulesDict) == 1
+    sink = Sink()
+    await WriteVerilogAsync(sink)
+    return "".join(sink.chunks)
+
+
+async def main():
+    designs = await asyncio.gather(*[ElaborateAsync(build, i) for i in range(4)])
+    sinks = [Sink() for d in designs]
+    await asyncio.gather(*[WriteVerilogAsync(s, d, chunksize=16) for s, d in zip(sinks, designs)])
+    texts = ["".join(s.chunks) for s in sinks]
+    assert len(set(texts)) == 4
+    assert len(sinks[0].chunks) > 1
+
+    texts2 = await asyncio.gather(*[task_local(i) for i in range(4)])
+    assert texts2 == texts
+
+    # overlapping calls for the same design run one after the other
+    sinks = [Sink(), Sink()]
+    await asyncio.gather(WriteVerilogAsync(sinks[0], designs[0], chunksize=16),
+            WriteVerilogAsync(sinks[1], designs[0], chunksize=16),
+            ElaborateAsync(AddModule, "extra", design=designs[0]))
+    assert "".join(sinks[0].chunks) == "".join(sinks[1].chunks) == texts[0]
+    assert designs[0].run(Module, "extra") is not None
+    return texts[3]
+
+
+if sys.version_info >= (3, 7):
+    text = asyncio.run(main())
+else:
+    # The async API requires the contextvars module (Python 3.7)
+    try:
+        NewDesign()
+        assert False
+    except ChipyError:
+        pass
+    build(3)
+    buf = io.StringIO()
+    WriteVerilog(buf)
+    text = buf.getvalue()
+    ResetDesign()
+assert Module("gate_1") is None
+
+with open("test020.v", "w") as f:
+    print("""
+//@ test-sat-equiv-comb gold gate_1
+""", file=f)
+
+    print(text, file=f)
+
+    print("""
+module gold(input [7:0] a, output [7:0] y);
+  assign y = a + 8'd3;
+endmodule
+""", file=f)
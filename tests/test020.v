@@ -0,0 +1,24 @@
+
+//@ test-sat-equiv-comb gold gate_1
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module gate_1 (
+  input [7:0] a /* test020.py:12 */,
+  output [7:0] y /* test020.py:13 */
+);
+  wire [7:0] __99c6d3a2; // test020.py:14
+  reg [7:0] __next__y; // test020.py:13
+  assign __99c6d3a2 = a + 8'd3; // test020.py:14
+  always @* begin
+    __next__y = 8'bx; // test020.py:13
+    __next__y = __99c6d3a2; // test020.py:14
+  end
+  assign y = __next__y; // test020.py:13
+endmodule
+
+
+module gold(input [7:0] a, output [7:0] y);
+  assign y = a + 8'd3;
+endmodule
+
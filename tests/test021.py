@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+
+from chipy import *
+from chipy import CheckLatches
+import io, warnings
+
+with warnings.catch_warnings(record=True) as caught:
+    warnings.simplefilter("always")
+
+    with AddModule("latches"):
+        a = AddInput("a", 8)
+        sel = AddInput("sel", 2)
+        y, w = AddOutput("y w", 8, async_=True)
+        y[3:0].next = a[3:0]
+        with If(sel[0]):
+            y[7:4].next = a[7:4]
+        with Switch(sel):
+            with Case(0):
+                w.next = a
+            with Case(1):
+                w[7:4].next = a[3:0]
+                w[3:0].next = a[7:4]
+            with Case(2):
+                w[sel].next = 1
+            with Case(3):
+                Concat([w[3:0], w[7:4]]).next = a
+    assert CheckLatches(Module("latches")) == [("w", "7:0"), ("y", "7:4")]
+
+    with AddModule("gate_1"):
+        a, b = AddInput("a b", 8)
+        sel = AddInput("sel", 2)
+        y, z, w = AddOutput("y z w", 8, async_=True)
+        p, q = AddReg("p q", 4)
+        AddAsync(p)
+        AddAsync(q)
+        idx = AddReg("idx", 3)
+        AddAsync(idx)
+
+        idx.next = a[2:0]
+        y[3:0].next = a[3:0]
+        with If(sel[0]):
+            y[7:4].next = b[7:4]
+        with Else():
+            y[7:4].next = a[7:4]
+        Concat([p, q]).next = b
+        z.next = Concat([p, q]) ^ y
+        w.next = b
+        with Switch(sel):
+            with Case(0):
+                w.next = a
+            with Case(2):
+                w[idx].next = 1
+    assert CheckLatches(Module("gate_1")) == []
+    assert idx.gotassign and not a.gotassign
+
+messages = [str(w.message) for w in caught if issubclass(w.category, ChipyLatchWarning)]
+assert len(messages) == 2 and "latches.w" in messages[0] and "7:4 of latches.y" in messages[1]
+
+# The assignments to idx, y, z, {p,q} and w each get their own always block,
+# indexing w with idx does not merge them.
+buf = io.StringIO()
+Module("gate_1").write_verilog(buf)
+assert buf.getvalue().count("always @*") == 5
+
+with open("test021.v", "w") as f:
+    print("""
+//@ test-sat-equiv-comb gold gate_1
+""", file=f)
+
+    WriteVerilog(f)
+
+    print("""
+module gold(input [7:0] a, b, input [1:0] sel, output reg [7:0] y, z, w);
+  always @* begin
+    y = sel[0] ? {b[7:4], a[3:0]} : a;
+    z = b ^ y;
+    w = b;
+    case (sel)
+      0: w = a;
+      2: w[a[2:0]] = 1;
+    endcase
+  end
+endmodule
+""", file=f)
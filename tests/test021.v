@@ -0,0 +1,138 @@
+
+//@ test-sat-equiv-comb gold gate_1
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module latches (
+  input [7:0] a /* test021.py:10 */,
+  input [1:0] sel /* test021.py:11 */,
+  output [7:0] w /* test021.py:12 */,
+  output [7:0] y /* test021.py:12 */
+);
+  wire [3:0] __6c0bcd6b; // test021.py:13
+  wire [3:0] __6c0bcd6b_1; // test021.py:20
+  wire __94d914f5; // test021.py:14
+  wire [3:0] __fde7aeaf; // test021.py:15
+  wire [3:0] __fde7aeaf_1; // test021.py:21
+  reg [7:0] __next__w; // test021.py:12
+  reg [7:0] __next__y; // test021.py:12
+  assign __6c0bcd6b = a[3:0]; // test021.py:13
+  assign __6c0bcd6b_1 = a[3:0]; // test021.py:20
+  assign __94d914f5 = sel[0]; // test021.py:14
+  assign __fde7aeaf = a[7:4]; // test021.py:15
+  assign __fde7aeaf_1 = a[7:4]; // test021.py:21
+  always @* begin
+    __next__y = 8'bx; // test021.py:12
+    __next__y[3:0] = __6c0bcd6b; // test021.py:13
+    if (__94d914f5) begin // test021.py:14
+      __next__y[7:4] = __fde7aeaf; // test021.py:15
+    end
+  end
+  always @* begin
+    __next__w = 8'bx; // test021.py:12
+    (* parallel_case *) case (sel) // test021.py:16
+      32'sd0: begin // test021.py:17
+        __next__w = a; // test021.py:18
+      end
+      32'sd1: begin // test021.py:19
+        __next__w[7:4] = __6c0bcd6b_1; // test021.py:20
+        __next__w[3:0] = __fde7aeaf_1; // test021.py:21
+      end
+      32'sd2: begin // test021.py:22
+        __next__w[sel] = 32'sd1; // test021.py:23
+      end
+      32'sd3: begin // test021.py:24
+        {__next__w[3:0],__next__w[7:4]} = a; // test021.py:25
+      end
+    endcase
+  end
+  assign y = __next__y; // test021.py:12
+  assign w = __next__w; // test021.py:12
+endmodule
+
+module gate_1 (
+  input [7:0] a /* test021.py:29 */,
+  input [7:0] b /* test021.py:29 */,
+  input [1:0] sel /* test021.py:30 */,
+  output [7:0] w /* test021.py:31 */,
+  output [7:0] y /* test021.py:31 */,
+  output [7:0] z /* test021.py:31 */
+);
+  wire [2:0] __516be4db; // test021.py:38
+  wire [3:0] __6c0bcd6b; // test021.py:39
+  wire [7:0] __6d7a0a4e_1; // test021.py:45
+  wire __94d914f5; // test021.py:40
+  wire [3:0] __c46a926a; // test021.py:41
+  wire [7:0] __d7e1f1c9; // test021.py:45
+  wire [3:0] __fde7aeaf; // test021.py:43
+  wire [2:0] idx; // test021.py:35
+  reg [2:0] __next__idx; // test021.py:35
+  wire [3:0] p; // test021.py:32
+  reg [3:0] __next__p; // test021.py:32
+  wire [3:0] q; // test021.py:32
+  reg [3:0] __next__q; // test021.py:32
+  reg [7:0] __next__w; // test021.py:31
+  reg [7:0] __next__y; // test021.py:31
+  reg [7:0] __next__z; // test021.py:31
+  assign __516be4db = a[2:0]; // test021.py:38
+  assign __6c0bcd6b = a[3:0]; // test021.py:39
+  assign __6d7a0a4e_1 = {p,q}; // test021.py:45
+  assign __94d914f5 = sel[0]; // test021.py:40
+  assign __c46a926a = b[7:4]; // test021.py:41
+  assign __d7e1f1c9 = __6d7a0a4e_1 ^ y; // test021.py:45
+  assign __fde7aeaf = a[7:4]; // test021.py:43
+  always @* begin
+    __next__y = 8'bx; // test021.py:31
+    __next__y[3:0] = __6c0bcd6b; // test021.py:39
+    if (__94d914f5) begin // test021.py:40
+      __next__y[7:4] = __c46a926a; // test021.py:41
+    end
+    else begin // test021.py:42
+      __next__y[7:4] = __fde7aeaf; // test021.py:43
+    end
+  end
+  always @* begin
+    __next__z = 8'bx; // test021.py:31
+    __next__z = __d7e1f1c9; // test021.py:45
+  end
+  always @* begin
+    __next__w = 8'bx; // test021.py:31
+    __next__w = b; // test021.py:46
+    (* parallel_case *) case (sel) // test021.py:47
+      32'sd0: begin // test021.py:48
+        __next__w = a; // test021.py:49
+      end
+      32'sd2: begin // test021.py:50
+        __next__w[idx] = 32'sd1; // test021.py:51
+      end
+    endcase
+  end
+  always @* begin
+    __next__p = 4'bx; // test021.py:33
+    __next__q = 4'bx; // test021.py:34
+    {__next__p,__next__q} = b; // test021.py:44
+  end
+  always @* begin
+    __next__idx = 3'bx; // test021.py:36
+    __next__idx = __516be4db; // test021.py:38
+  end
+  assign y = __next__y; // test021.py:31
+  assign z = __next__z; // test021.py:31
+  assign w = __next__w; // test021.py:31
+  assign p = __next__p; // test021.py:33
+  assign q = __next__q; // test021.py:34
+  assign idx = __next__idx; // test021.py:36
+endmodule
+
+module gold(input [7:0] a, b, input [1:0] sel, output reg [7:0] y, z, w);
+  always @* begin
+    y = sel[0] ? {b[7:4], a[3:0]} : a;
+    z = b ^ y;
+    w = b;
+    case (sel)
+      0: w = a;
+      2: w[a[2:0]] = 1;
+    endcase
+  end
+endmodule
+
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+from chipy import *
+import io
+
+with AddModule("gate_1"):
+    sel = AddInput("sel", 3)
+    op = AddInput("op", 8)
+    a, b = AddInput("a b", 8)
+    rom, y, z, w = AddOutput("rom y z w", 8, async_=True)
+
+    # constant case bodies: lookup table
+    with Switch(sel):
+        for i in range(8):
+            with Case(i):
+                rom.next = (i * 37) & 255
+
+    # wide selector: one-hot AND-OR mux, z keeps its value if not matched
+    z.next = a
+    with Switch(op):
+        with Case(0x12):
+            y.next = a + b
+            z.next = b
+        with Case(0x34):
+            y.next = a - b
+        with Case(0x80):
+            y.next = -1
+        with Default():
+            y.next = b
+
+    # nested statements can not be lowered, but the labels are exclusive
+    w.next = 0
+    with Switch(sel):
+        with Case(1):
+            with If(a[0]):
+                w.next = a
+        with Case(2):
+            w.next = b
+
+text = io.StringIO()
+Module("gate_1").write_verilog(text)
+text = text.getvalue()
+assert text.count("case (") == 1
+assert "(* parallel_case *)" in text
+assert "64'h" in text and "+: 8" in text
+
+with open("test022.v", "w") as f:
+    print("""
+//@ test-sat-equiv-comb gold gate_1
+""", file=f)
+
+    WriteVerilog(f)
+
+    print("""
+module gold(input [2:0] sel, input [7:0] op, a, b, output reg [7:0] rom, y, z, w);
+  always @* begin
+    rom = (sel * 37) & 255;
+    z = a;
+    case (op)
+      8'h12: begin y = a + b; z = b; end
+      8'h34: y = a - b;
+      8'h80: y = 8'hff;
+      default: y = b;
+    endcase
+    w = 0;
+    case (sel)
+      1: if (a[0]) w = a;
+      2: w = b;
+    endcase
+  end
+endmodule
+""", file=f)
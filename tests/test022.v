@@ -0,0 +1,76 @@
+
+//@ test-sat-equiv-comb gold gate_1
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module gate_1 (
+  input [7:0] a /* test022.py:9 */,
+  input [7:0] b /* test022.py:9 */,
+  input [7:0] op /* test022.py:8 */,
+  output [7:0] rom /* test022.py:10 */,
+  input [2:0] sel /* test022.py:7 */,
+  output [7:0] w /* test022.py:10 */,
+  output [7:0] y /* test022.py:10 */,
+  output [7:0] z /* test022.py:10 */
+);
+  wire __2babb7bb; // test022.py:35
+  wire [7:0] __837d19c3; // test022.py:25
+  wire [7:0] __bca3c472; // test022.py:22
+  wire [63:0] __e3500c0f; // test022.py:13
+  reg [7:0] __next__rom; // test022.py:10
+  reg [7:0] __next__w; // test022.py:10
+  reg [7:0] __next__y; // test022.py:10
+  reg [7:0] __next__z; // test022.py:10
+  assign __2babb7bb = a[0]; // test022.py:35
+  assign __837d19c3 = a - b; // test022.py:25
+  assign __bca3c472 = a + b; // test022.py:22
+  assign __e3500c0f = 64'h3deb9946f4a2500; // test022.py:13
+  always @* begin
+    __next__rom = 8'bx; // test022.py:10
+    __next__rom = __e3500c0f[sel * 8 +: 8]; // test022.py:13
+  end
+  always @* begin
+    __next__y = 8'bx; // test022.py:10
+    __next__z = 8'bx; // test022.py:10
+    __next__z = a; // test022.py:19
+    __next__y = ({8{op == 8'h12}} & __bca3c472) | ({8{op == 8'h34}} & __837d19c3) | ({8{op == 8'h80}} & 8'hff) | ({8{!(op == 8'h12 || op == 8'h34 || op == 8'h80)}} & b); // test022.py:20
+    __next__z = ({8{op == 8'h12}} & b) | ({8{op == 8'h34}} & __next__z) | ({8{op == 8'h80}} & __next__z) | ({8{!(op == 8'h12 || op == 8'h34 || op == 8'h80)}} & __next__z); // test022.py:20
+  end
+  always @* begin
+    __next__w = 8'bx; // test022.py:10
+    __next__w = 32'sd0; // test022.py:32
+    (* parallel_case *) case (sel) // test022.py:33
+      32'sd1: begin // test022.py:34
+        if (__2babb7bb) begin // test022.py:35
+          __next__w = a; // test022.py:36
+        end
+      end
+      32'sd2: begin // test022.py:37
+        __next__w = b; // test022.py:38
+      end
+    endcase
+  end
+  assign rom = __next__rom; // test022.py:10
+  assign y = __next__y; // test022.py:10
+  assign z = __next__z; // test022.py:10
+  assign w = __next__w; // test022.py:10
+endmodule
+
+module gold(input [2:0] sel, input [7:0] op, a, b, output reg [7:0] rom, y, z, w);
+  always @* begin
+    rom = (sel * 37) & 255;
+    z = a;
+    case (op)
+      8'h12: begin y = a + b; z = b; end
+      8'h34: y = a - b;
+      8'h80: y = 8'hff;
+      default: y = b;
+    endcase
+    w = 0;
+    case (sel)
+      1: if (a[0]) w = a;
+      2: w = b;
+    endcase
+  end
+endmodule
+
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+
+from chipy import *
+from chipy import Flatten, CheckEquiv, Simulation
+
+
+def make_alu(name, bug=False):
+    with AddModule(name):
+        sel = AddInput("sel", 3)
+        a, b = AddInput("a b", 4)
+        y = AddOutput("y", 8, async_=True)
+        with Switch(sel, lower=(name != "alu_gold")):
+            with Case(0): y.next = a + b
+            with Case(1): y.next = a - b
+            with Case(2): y.next = a * b
+            with Case(3): y.next = a // b
+            with Case(4): y.next = a % b
+            with Case(5): y.next = a << (b[2:0] if bug else b[1:0])
+            with Case(6): y.next = a[b[1:0], 2]
+            with Case(7): y.next = Concat([a, b]) >> 3
+
+
+def make_design(top_name, suffix, reset_value=3):
+    leaf = AddModule("leaf_" + suffix)
+    with leaf:
+        x = AddInput("x", 8)
+        y = AddOutput("y", 8, async_=True)
+        y.next = x ^ Sig(0x5a, 8)
+
+    child = AddModule("child_" + suffix)
+    with child:
+        clk, rst, en = AddInput("clk rst en")
+        a = AddInput("a", 8)
+        sel = AddInput("sel", 2)
+        q = AddOutput("q", 8, posedge=clk, reset=rst, reset_value=reset_value)
+        r, m = AddOutput("r m", 8, async_=True)
+
+        mem = AddMemory("mem", 8, 4)
+        wp = mem.write_port(posedge=clk)
+        with If(en):
+            wp.write(sel, a)
+        m.next = mem.read_port(sel, posedge=clk)
+
+        l = AddInst("l", leaf)
+        Connect(l.x_, a)
+
+        with Switch(sel):
+            with Case(0):
+                r.next = l.y_
+            with Case(1):
+                r.next = a + 1
+            with Default():
+                r.next = a
+
+        with If(en):
+            q.next = q + a
+        with ElseIf(sel == 3):
+            q.next = ~q
+
+    with AddModule(top_name):
+        clk, rst, en = AddInput("clk rst en")
+        a = AddInput("a", 8)
+        sel = AddInput("sel", 2)
+        outs = AddOutput("q0 r0 m0", 8)
+
+        c0 = AddInst("c0", child)
+        Connect(c0.clk_, clk)
+        Connect(c0.rst_, rst)
+        Connect(c0.en_, en)
+        Connect(c0.sel_, sel)
+        Connect(c0.a_, a)
+
+        for out, sig in zip(outs, [c0.q_, c0.r_, c0.m_]):
+            Connect(out, sig)
+
+
+# combinational: exhaustive, all 2**11 input combinations
+make_alu("alu_gold")
+make_alu("gate_1")
+make_alu("alu_bug", bug=True)
+assert CheckEquiv("alu_gold", "gate_1") is None
+cex = CheckEquiv("alu_gold", "alu_bug")
+assert cex["outputs"] == ["y"] and cex["inputs"][0]["sel"] == 5 and cex["inputs"][0]["b"] & 4
+
+# 'bx in gold (division by zero) must be 'bx in gate as well, unless it is don't-care
+with AddModule("div_gold"):
+    a, b = AddInput("a b", 4)
+    y = AddOutput("y", 4, async_=True)
+    y.next = a // b
+with AddModule("div_zero"):
+    a, b = AddInput("a b", 4)
+    y = AddOutput("y", 4, async_=True)
+    y.next = Cond(b == 0, Sig(0, 4), a // b)
+cex = CheckEquiv("div_gold", "div_zero")
+assert cex["inputs"][0]["b"] == 0 and cex["gold"]["y"] is None and cex["gate"]["y"] == 0
+assert CheckEquiv("div_gold", "div_zero", dontcare=True) is None
+
+# sequential: random inputs over 8 cycles, hierarchy vs. flattened
+make_design("gold", "gold")
+make_design("gate_2", "2")
+Flatten(module=Module("gate_2"), recursive=True)
+make_design("seq_bug", "bug", reset_value=4)
+assert CheckEquiv("gold", "gate_2", steps=8) is None
+cex = CheckEquiv("gold", "seq_bug", steps=8)
+assert cex["outputs"] == ["q0"] and cex["inputs"][cex["cycle"] - 1]["rst"] == 1
+
+# sequential without reset: registers start with the same random values
+def make_accu(name, op):
+    with AddModule(name):
+        clk = AddInput("clk")
+        a = AddInput("a", 4)
+        q = AddOutput("q", 4, posedge=clk)
+        q.next = op(q, a)
+
+make_accu("accu_add", lambda q, a: q + a)
+make_accu("accu_add2", lambda q, a: a + q)
+make_accu("accu_sub", lambda q, a: q - a)
+try:
+    CheckEquiv("accu_add", "accu_sub", steps=2)
+    assert False
+except ChipyError:
+    pass
+assert CheckEquiv("accu_add", "accu_add2", steps=3, init="random") is None
+cex = CheckEquiv("accu_add", "accu_sub", steps=2, init="random")
+assert cex["cycle"] == 1 and cex["inputs"][0]["a"] not in (0, 8)
+assert cex["gold"]["q"] == (cex["init"]["q"] + cex["inputs"][0]["a"]) % 16
+cex = CheckEquiv("accu_add", "accu_sub", steps=2, init=0)
+assert cex["gold"]["q"] == cex["inputs"][0]["a"] and cex["init"] == {}
+
+# single vector simulation
+sim = Simulation(Module("gold"))
+sim.set("rst", 1)
+sim.step()
+sim.set("rst", 0)
+sim.set("en", 1)
+sim.set("sel", 2)
+for i in range(4):
+    sim.set("a", 10)
+    sim.step()
+sim.eval()
+assert sim.get("q0") == 43 and sim.get("m0") == 10 and sim.get("r0") == 10
+
+
+with open("test023.v", "w") as f:
+    print("""
+//@ test-sat-equiv-comb alu_gold gate_1
+//@ test-sat-equiv-bmc gold gate_2 5
+""", file=f)
+
+    WriteVerilog(f)
@@ -0,0 +1,691 @@
+
+//@ test-sat-equiv-comb alu_gold gate_1
+//@ test-sat-equiv-bmc gold gate_2 5
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module alu_gold (
+  input [3:0] a /* test023.py:9 */,
+  input [3:0] b /* test023.py:9 */,
+  input [2:0] sel /* test023.py:8 */,
+  output [7:0] y /* test023.py:10 */
+);
+  wire [3:0] __02d6fdc6; // test023.py:17
+  wire [1:0] __2f46a2ce; // test023.py:17
+  wire [1:0] __2f46a2ce_1; // test023.py:18
+  wire [3:0] __5bbe62e5; // test023.py:14
+  wire [3:0] __837d19c3; // test023.py:13
+  wire [1:0] __8955798b; // test023.py:18
+  wire [3:0] __963752ac; // test023.py:15
+  wire [7:0] __a5e6e698; // test023.py:19
+  wire [3:0] __bca3c472; // test023.py:12
+  wire [7:0] __c30b26d2; // test023.py:19
+  wire [3:0] __d654347f; // test023.py:16
+  reg [7:0] __next__y; // test023.py:10
+  assign __02d6fdc6 = a <<< __2f46a2ce; // test023.py:17
+  assign __2f46a2ce = b[1:0]; // test023.py:17
+  assign __2f46a2ce_1 = b[1:0]; // test023.py:18
+  assign __5bbe62e5 = a * b; // test023.py:14
+  assign __837d19c3 = a - b; // test023.py:13
+  assign __8955798b = a[__2f46a2ce_1 +: 2]; // test023.py:18
+  assign __963752ac = a / b; // test023.py:15
+  assign __a5e6e698 = __c30b26d2 >>> 32'sd3; // test023.py:19
+  assign __bca3c472 = a + b; // test023.py:12
+  assign __c30b26d2 = {a,b}; // test023.py:19
+  assign __d654347f = a % b; // test023.py:16
+  always @* begin
+    __next__y = 8'bx; // test023.py:10
+    (* parallel_case *) case (sel) // test023.py:11
+      32'sd0: begin // test023.py:12
+        __next__y = __bca3c472; // test023.py:12
+      end
+      32'sd1: begin // test023.py:13
+        __next__y = __837d19c3; // test023.py:13
+      end
+      32'sd2: begin // test023.py:14
+        __next__y = __5bbe62e5; // test023.py:14
+      end
+      32'sd3: begin // test023.py:15
+        __next__y = __963752ac; // test023.py:15
+      end
+      32'sd4: begin // test023.py:16
+        __next__y = __d654347f; // test023.py:16
+      end
+      32'sd5: begin // test023.py:17
+        __next__y = __02d6fdc6; // test023.py:17
+      end
+      32'sd6: begin // test023.py:18
+        __next__y = __8955798b; // test023.py:18
+      end
+      32'sd7: begin // test023.py:19
+        __next__y = __a5e6e698; // test023.py:19
+      end
+    endcase
+  end
+  assign y = __next__y; // test023.py:10
+endmodule
+
+module gate_1 (
+  input [3:0] a /* test023.py:9 */,
+  input [3:0] b /* test023.py:9 */,
+  input [2:0] sel /* test023.py:8 */,
+  output [7:0] y /* test023.py:10 */
+);
+  wire [3:0] __02d6fdc6; // test023.py:17
+  wire [1:0] __2f46a2ce; // test023.py:17
+  wire [1:0] __2f46a2ce_1; // test023.py:18
+  wire [3:0] __5bbe62e5; // test023.py:14
+  wire [3:0] __837d19c3; // test023.py:13
+  wire [1:0] __8955798b; // test023.py:18
+  wire [3:0] __963752ac; // test023.py:15
+  wire [7:0] __a5e6e698; // test023.py:19
+  wire [3:0] __bca3c472; // test023.py:12
+  wire [7:0] __c30b26d2; // test023.py:19
+  wire [3:0] __d654347f; // test023.py:16
+  reg [7:0] __next__y; // test023.py:10
+  assign __02d6fdc6 = a <<< __2f46a2ce; // test023.py:17
+  assign __2f46a2ce = b[1:0]; // test023.py:17
+  assign __2f46a2ce_1 = b[1:0]; // test023.py:18
+  assign __5bbe62e5 = a * b; // test023.py:14
+  assign __837d19c3 = a - b; // test023.py:13
+  assign __8955798b = a[__2f46a2ce_1 +: 2]; // test023.py:18
+  assign __963752ac = a / b; // test023.py:15
+  assign __a5e6e698 = __c30b26d2 >>> 32'sd3; // test023.py:19
+  assign __bca3c472 = a + b; // test023.py:12
+  assign __c30b26d2 = {a,b}; // test023.py:19
+  assign __d654347f = a % b; // test023.py:16
+  always @* begin
+    __next__y = 8'bx; // test023.py:10
+    __next__y = (sel[2] ? (sel[1] ? (sel[0] ? __a5e6e698 : {6'd0,__8955798b}) : (sel[0] ? {4'd0,__02d6fdc6} : {4'd0,__d654347f})) : (sel[1] ? (sel[0] ? {4'd0,__963752ac} : {4'd0,__5bbe62e5}) : (sel[0] ? {4'd0,__837d19c3} : {4'd0,__bca3c472}))); // test023.py:11
+  end
+  assign y = __next__y; // test023.py:10
+endmodule
+
+module alu_bug (
+  input [3:0] a /* test023.py:9 */,
+  input [3:0] b /* test023.py:9 */,
+  input [2:0] sel /* test023.py:8 */,
+  output [7:0] y /* test023.py:10 */
+);
+  wire [3:0] __1bcb5ea7; // test023.py:17
+  wire [1:0] __2759b33f; // test023.py:18
+  wire [1:0] __2f46a2ce; // test023.py:18
+  wire [3:0] __5bbe62e5; // test023.py:14
+  wire [2:0] __68e6d81e; // test023.py:17
+  wire [3:0] __837d19c3; // test023.py:13
+  wire [3:0] __963752ac; // test023.py:15
+  wire [7:0] __a5e6e698; // test023.py:19
+  wire [3:0] __bca3c472; // test023.py:12
+  wire [7:0] __c30b26d2; // test023.py:19
+  wire [3:0] __d654347f; // test023.py:16
+  reg [7:0] __next__y; // test023.py:10
+  assign __1bcb5ea7 = a <<< __68e6d81e; // test023.py:17
+  assign __2759b33f = a[__2f46a2ce +: 2]; // test023.py:18
+  assign __2f46a2ce = b[1:0]; // test023.py:18
+  assign __5bbe62e5 = a * b; // test023.py:14
+  assign __68e6d81e = b[2:0]; // test023.py:17
+  assign __837d19c3 = a - b; // test023.py:13
+  assign __963752ac = a / b; // test023.py:15
+  assign __a5e6e698 = __c30b26d2 >>> 32'sd3; // test023.py:19
+  assign __bca3c472 = a + b; // test023.py:12
+  assign __c30b26d2 = {a,b}; // test023.py:19
+  assign __d654347f = a % b; // test023.py:16
+  always @* begin
+    __next__y = 8'bx; // test023.py:10
+    __next__y = (sel[2] ? (sel[1] ? (sel[0] ? __a5e6e698 : {6'd0,__2759b33f}) : (sel[0] ? {4'd0,__1bcb5ea7} : {4'd0,__d654347f})) : (sel[1] ? (sel[0] ? {4'd0,__963752ac} : {4'd0,__5bbe62e5}) : (sel[0] ? {4'd0,__837d19c3} : {4'd0,__bca3c472}))); // test023.py:11
+  end
+  assign y = __next__y; // test023.py:10
+endmodule
+
+module div_gold (
+  input [3:0] a /* test023.py:86 */,
+  input [3:0] b /* test023.py:86 */,
+  output [3:0] y /* test023.py:87 */
+);
+  wire [3:0] __963752ac; // test023.py:88
+  reg [3:0] __next__y; // test023.py:87
+  assign __963752ac = a / b; // test023.py:88
+  always @* begin
+    __next__y = 4'bx; // test023.py:87
+    __next__y = __963752ac; // test023.py:88
+  end
+  assign y = __next__y; // test023.py:87
+endmodule
+
+module div_zero (
+  input [3:0] a /* test023.py:90 */,
+  input [3:0] b /* test023.py:90 */,
+  output [3:0] y /* test023.py:91 */
+);
+  wire [3:0] __86b57953; // test023.py:92
+  wire [3:0] __963752ac; // test023.py:92
+  wire __9cf51ea6; // test023.py:92
+  reg [3:0] __next__y; // test023.py:91
+  assign __86b57953 = __9cf51ea6 ? 4'd0 : __963752ac; // test023.py:92
+  assign __963752ac = a / b; // test023.py:92
+  assign __9cf51ea6 = b == 32'sd0; // test023.py:92
+  always @* begin
+    __next__y = 4'bx; // test023.py:91
+    __next__y = __86b57953; // test023.py:92
+  end
+  assign y = __next__y; // test023.py:91
+endmodule
+
+module leaf_gold (
+  input [7:0] x /* test023.py:25 */,
+  output [7:0] y /* test023.py:26 */
+);
+  wire [7:0] __49558b2a; // test023.py:27
+  reg [7:0] __next__y; // test023.py:26
+  assign __49558b2a = x ^ 8'd90; // test023.py:27
+  always @* begin
+    __next__y = 8'bx; // test023.py:26
+    __next__y = __49558b2a; // test023.py:27
+  end
+  assign y = __next__y; // test023.py:26
+endmodule
+
+module child_gold (
+  input [7:0] a /* test023.py:32 */,
+  input clk /* test023.py:31 */,
+  input en /* test023.py:31 */,
+  output [7:0] m /* test023.py:35 */,
+  output reg [7:0] q /* test023.py:34 */,
+  output [7:0] r /* test023.py:35 */,
+  input rst /* test023.py:31 */,
+  input [1:0] sel /* test023.py:33 */
+);
+  reg [7:0] mem [0:3]; // test023.py:37
+  wire __23231009; // test023.py:56
+  wire [31:0] __823e62ea; // test023.py:50
+  wire [7:0] __c0f00629; // test023.py:57
+  wire [7:0] __de8f626c; // test023.py:55
+  wire [7:0] l__x; // test023.py:43
+  wire [7:0] l__y; // test023.py:43
+  reg [7:0] __next__m; // test023.py:35
+  reg [7:0] mem__rd1; // test023.py:41
+  wire [1:0] mem__wr0__addr; // test023.py:38
+  reg [1:0] __next__mem__wr0__addr; // test023.py:38
+  wire [7:0] mem__wr0__data; // test023.py:38
+  reg [7:0] __next__mem__wr0__data; // test023.py:38
+  wire mem__wr0__en; // test023.py:38
+  reg __next__mem__wr0__en; // test023.py:38
+  reg [7:0] __next__q; // test023.py:34
+  reg [7:0] __next__r; // test023.py:35
+  assign __23231009 = sel == 32'sd3; // test023.py:56
+  assign __823e62ea = a + 32'sd1; // test023.py:50
+  assign __c0f00629 = ~ q; // test023.py:57
+  assign __de8f626c = q + a; // test023.py:55
+  always @* begin
+    __next__q = q; // test023.py:34
+    if (en) begin // test023.py:54
+      __next__q = __de8f626c; // test023.py:55
+    end
+    else if (__23231009) begin // test023.py:56
+      __next__q = __c0f00629; // test023.py:57
+    end
+  end
+  always @* begin
+    __next__r = 8'bx; // test023.py:35
+    __next__r = (sel[1] ? a : (sel[0] ? __823e62ea[7:0] : l__y)); // test023.py:46
+  end
+  always @* begin
+    __next__m = 8'bx; // test023.py:35
+    __next__m = mem__rd1; // test023.py:41
+  end
+  always @* begin
+    __next__mem__wr0__addr = 2'bx; // test023.py:38
+    __next__mem__wr0__data = 8'bx; // test023.py:38
+    __next__mem__wr0__en = 1'bx; // test023.py:38
+    __next__mem__wr0__en = 1'd0; // test023.py:38
+    if (en) begin // test023.py:39
+      __next__mem__wr0__addr = sel; // test023.py:40
+      __next__mem__wr0__data = a; // test023.py:40
+      __next__mem__wr0__en = 1'd1; // test023.py:40
+    end
+  end
+  assign r = __next__r; // test023.py:35
+  assign m = __next__m; // test023.py:35
+  assign mem__wr0__addr = __next__mem__wr0__addr; // test023.py:38
+  assign mem__wr0__data = __next__mem__wr0__data; // test023.py:38
+  assign mem__wr0__en = __next__mem__wr0__en; // test023.py:38
+  assign l__x = a; // test023.py:44
+  always @(posedge clk) begin
+    if (rst) begin
+      q <= 8'h3; // test023.py:34
+    end else begin
+      q <= __next__q; // test023.py:34
+    end
+  end
+  leaf_gold l ( // test023.py:43
+    .x(a),
+    .y(l__y)
+  );
+  always @(posedge clk) begin
+    if (mem__wr0__en) mem[mem__wr0__addr] <= mem__wr0__data; // test023.py:38
+    mem__rd1 <= mem[sel]; // test023.py:41
+  end
+endmodule
+
+module gold (
+  input [7:0] a /* test023.py:61 */,
+  input clk /* test023.py:60 */,
+  input en /* test023.py:60 */,
+  output [7:0] m0 /* test023.py:63 */,
+  output [7:0] q0 /* test023.py:63 */,
+  output [7:0] r0 /* test023.py:63 */,
+  input rst /* test023.py:60 */,
+  input [1:0] sel /* test023.py:62 */
+);
+  wire [7:0] c0__a; // test023.py:65
+  wire c0__clk; // test023.py:65
+  wire c0__en; // test023.py:65
+  wire [7:0] c0__m; // test023.py:65
+  wire [7:0] c0__q; // test023.py:65
+  wire [7:0] c0__r; // test023.py:65
+  wire c0__rst; // test023.py:65
+  wire [1:0] c0__sel; // test023.py:65
+  assign c0__clk = clk; // test023.py:66
+  assign c0__rst = rst; // test023.py:67
+  assign c0__en = en; // test023.py:68
+  assign c0__sel = sel; // test023.py:69
+  assign c0__a = a; // test023.py:70
+  assign q0 = c0__q; // test023.py:73
+  assign r0 = c0__r; // test023.py:73
+  assign m0 = c0__m; // test023.py:73
+  child_gold c0 ( // test023.py:65
+    .a(a),
+    .clk(clk),
+    .en(en),
+    .m(c0__m),
+    .q(c0__q),
+    .r(c0__r),
+    .rst(rst),
+    .sel(sel)
+  );
+endmodule
+
+module leaf_2 (
+  input [7:0] x /* test023.py:25 */,
+  output [7:0] y /* test023.py:26 */
+);
+  wire [7:0] __49558b2a; // test023.py:27
+  reg [7:0] __next__y; // test023.py:26
+  assign __49558b2a = x ^ 8'd90; // test023.py:27
+  always @* begin
+    __next__y = 8'bx; // test023.py:26
+    __next__y = __49558b2a; // test023.py:27
+  end
+  assign y = __next__y; // test023.py:26
+endmodule
+
+module child_2 (
+  input [7:0] a /* test023.py:32 */,
+  input clk /* test023.py:31 */,
+  input en /* test023.py:31 */,
+  output [7:0] m /* test023.py:35 */,
+  output reg [7:0] q /* test023.py:34 */,
+  output [7:0] r /* test023.py:35 */,
+  input rst /* test023.py:31 */,
+  input [1:0] sel /* test023.py:33 */
+);
+  reg [7:0] mem [0:3]; // test023.py:37
+  wire __23231009; // test023.py:56
+  wire [31:0] __823e62ea; // test023.py:50
+  wire [7:0] __c0f00629; // test023.py:57
+  wire [7:0] __de8f626c; // test023.py:55
+  wire [7:0] l__x; // test023.py:43
+  wire [7:0] l__y; // test023.py:43
+  reg [7:0] __next__m; // test023.py:35
+  reg [7:0] mem__rd1; // test023.py:41
+  wire [1:0] mem__wr0__addr; // test023.py:38
+  reg [1:0] __next__mem__wr0__addr; // test023.py:38
+  wire [7:0] mem__wr0__data; // test023.py:38
+  reg [7:0] __next__mem__wr0__data; // test023.py:38
+  wire mem__wr0__en; // test023.py:38
+  reg __next__mem__wr0__en; // test023.py:38
+  reg [7:0] __next__q; // test023.py:34
+  reg [7:0] __next__r; // test023.py:35
+  assign __23231009 = sel == 32'sd3; // test023.py:56
+  assign __823e62ea = a + 32'sd1; // test023.py:50
+  assign __c0f00629 = ~ q; // test023.py:57
+  assign __de8f626c = q + a; // test023.py:55
+  always @* begin
+    __next__q = q; // test023.py:34
+    if (en) begin // test023.py:54
+      __next__q = __de8f626c; // test023.py:55
+    end
+    else if (__23231009) begin // test023.py:56
+      __next__q = __c0f00629; // test023.py:57
+    end
+  end
+  always @* begin
+    __next__r = 8'bx; // test023.py:35
+    __next__r = (sel[1] ? a : (sel[0] ? __823e62ea[7:0] : l__y)); // test023.py:46
+  end
+  always @* begin
+    __next__m = 8'bx; // test023.py:35
+    __next__m = mem__rd1; // test023.py:41
+  end
+  always @* begin
+    __next__mem__wr0__addr = 2'bx; // test023.py:38
+    __next__mem__wr0__data = 8'bx; // test023.py:38
+    __next__mem__wr0__en = 1'bx; // test023.py:38
+    __next__mem__wr0__en = 1'd0; // test023.py:38
+    if (en) begin // test023.py:39
+      __next__mem__wr0__addr = sel; // test023.py:40
+      __next__mem__wr0__data = a; // test023.py:40
+      __next__mem__wr0__en = 1'd1; // test023.py:40
+    end
+  end
+  assign r = __next__r; // test023.py:35
+  assign m = __next__m; // test023.py:35
+  assign mem__wr0__addr = __next__mem__wr0__addr; // test023.py:38
+  assign mem__wr0__data = __next__mem__wr0__data; // test023.py:38
+  assign mem__wr0__en = __next__mem__wr0__en; // test023.py:38
+  assign l__x = a; // test023.py:44
+  always @(posedge clk) begin
+    if (rst) begin
+      q <= 8'h3; // test023.py:34
+    end else begin
+      q <= __next__q; // test023.py:34
+    end
+  end
+  leaf_2 l ( // test023.py:43
+    .x(a),
+    .y(l__y)
+  );
+  always @(posedge clk) begin
+    if (mem__wr0__en) mem[mem__wr0__addr] <= mem__wr0__data; // test023.py:38
+    mem__rd1 <= mem[sel]; // test023.py:41
+  end
+endmodule
+
+module gate_2 (
+  input [7:0] a /* test023.py:61 */,
+  input clk /* test023.py:60 */,
+  input en /* test023.py:60 */,
+  output [7:0] m0 /* test023.py:63 */,
+  output [7:0] q0 /* test023.py:63 */,
+  output [7:0] r0 /* test023.py:63 */,
+  input rst /* test023.py:60 */,
+  input [1:0] sel /* test023.py:62 */
+);
+  reg [7:0] c0__mem [0:3]; // test023.py:37
+  wire [7:0] __0fd864f7; // test023.py:57
+  wire [7:0] __4a494bb0; // test023.py:55
+  wire __79b7997c; // test023.py:56
+  wire [31:0] __99cd0bb8; // test023.py:50
+  wire [7:0] __ce51a7b1; // test023.py:27
+  wire [7:0] c0__a; // test023.py:65
+  wire c0__clk; // test023.py:65
+  wire c0__en; // test023.py:65
+  wire [7:0] c0__l__x; // test023.py:43
+  wire [7:0] c0__l__y; // test023.py:43
+  reg [7:0] __next__c0__l__y; // test023.py:43
+  wire [7:0] c0__m; // test023.py:65
+  reg [7:0] __next__c0__m; // test023.py:65
+  reg [7:0] c0__mem__rd1; // test023.py:41
+  wire [1:0] c0__mem__wr0__addr; // test023.py:38
+  reg [1:0] __next__c0__mem__wr0__addr; // test023.py:38
+  wire [7:0] c0__mem__wr0__data; // test023.py:38
+  reg [7:0] __next__c0__mem__wr0__data; // test023.py:38
+  wire c0__mem__wr0__en; // test023.py:38
+  reg __next__c0__mem__wr0__en; // test023.py:38
+  reg [7:0] c0__q; // test023.py:65
+  reg [7:0] __next__c0__q; // test023.py:65
+  wire [7:0] c0__r; // test023.py:65
+  reg [7:0] __next__c0__r; // test023.py:65
+  wire c0__rst; // test023.py:65
+  wire [1:0] c0__sel; // test023.py:65
+  assign __0fd864f7 = ~ c0__q; // test023.py:57
+  assign __4a494bb0 = c0__q + c0__a; // test023.py:55
+  assign __79b7997c = c0__sel == 32'sd3; // test023.py:56
+  assign __99cd0bb8 = c0__a + 32'sd1; // test023.py:50
+  assign __ce51a7b1 = c0__l__x ^ 8'd90; // test023.py:27
+  always @* begin
+    __next__c0__mem__wr0__addr = 2'bx; // test023.py:38
+    __next__c0__mem__wr0__data = 8'bx; // test023.py:38
+    __next__c0__mem__wr0__en = 1'bx; // test023.py:38
+    __next__c0__mem__wr0__en = 1'd0; // test023.py:38
+    if (c0__en) begin // test023.py:39
+      __next__c0__mem__wr0__addr = c0__sel; // test023.py:40
+      __next__c0__mem__wr0__data = c0__a; // test023.py:40
+      __next__c0__mem__wr0__en = 1'd1; // test023.py:40
+    end
+  end
+  always @* begin
+    __next__c0__q = c0__q; // test023.py:34
+    if (c0__en) begin // test023.py:54
+      __next__c0__q = __4a494bb0; // test023.py:55
+    end
+    else begin // test023.py:54
+      if (__79b7997c) begin // test023.py:56
+        __next__c0__q = __0fd864f7; // test023.py:57
+      end
+    end
+  end
+  always @* begin
+    __next__c0__r = 8'bx; // test023.py:35
+    __next__c0__r = (c0__sel[1] ? c0__a : (c0__sel[0] ? __99cd0bb8[7:0] : c0__l__y)); // test023.py:46
+  end
+  always @* begin
+    __next__c0__m = 8'bx; // test023.py:35
+    __next__c0__m = c0__mem__rd1; // test023.py:41
+  end
+  always @* begin
+    __next__c0__l__y = 8'bx; // test023.py:26
+    __next__c0__l__y = __ce51a7b1; // test023.py:27
+  end
+  assign c0__clk = clk; // test023.py:66
+  assign c0__rst = rst; // test023.py:67
+  assign c0__en = en; // test023.py:68
+  assign c0__sel = sel; // test023.py:69
+  assign c0__a = a; // test023.py:70
+  assign q0 = c0__q; // test023.py:73
+  assign r0 = c0__r; // test023.py:73
+  assign m0 = c0__m; // test023.py:73
+  assign c0__mem__wr0__addr = __next__c0__mem__wr0__addr; // test023.py:38
+  assign c0__mem__wr0__data = __next__c0__mem__wr0__data; // test023.py:38
+  assign c0__mem__wr0__en = __next__c0__mem__wr0__en; // test023.py:38
+  assign c0__r = __next__c0__r; // test023.py:35
+  assign c0__m = __next__c0__m; // test023.py:35
+  assign c0__l__x = c0__a; // test023.py:43
+  assign c0__l__y = __next__c0__l__y; // test023.py:26
+  always @(posedge c0__clk) begin
+    if (c0__rst) begin
+      c0__q <= 8'h3; // test023.py:34
+    end else begin
+      c0__q <= __next__c0__q; // test023.py:34
+    end
+  end
+  always @(posedge c0__clk) begin
+    if (c0__mem__wr0__en) c0__mem[c0__mem__wr0__addr] <= c0__mem__wr0__data; // test023.py:38
+    c0__mem__rd1 <= c0__mem[c0__sel]; // test023.py:41
+  end
+endmodule
+
+module leaf_bug (
+  input [7:0] x /* test023.py:25 */,
+  output [7:0] y /* test023.py:26 */
+);
+  wire [7:0] __49558b2a; // test023.py:27
+  reg [7:0] __next__y; // test023.py:26
+  assign __49558b2a = x ^ 8'd90; // test023.py:27
+  always @* begin
+    __next__y = 8'bx; // test023.py:26
+    __next__y = __49558b2a; // test023.py:27
+  end
+  assign y = __next__y; // test023.py:26
+endmodule
+
+module child_bug (
+  input [7:0] a /* test023.py:32 */,
+  input clk /* test023.py:31 */,
+  input en /* test023.py:31 */,
+  output [7:0] m /* test023.py:35 */,
+  output reg [7:0] q /* test023.py:34 */,
+  output [7:0] r /* test023.py:35 */,
+  input rst /* test023.py:31 */,
+  input [1:0] sel /* test023.py:33 */
+);
+  reg [7:0] mem [0:3]; // test023.py:37
+  wire __23231009; // test023.py:56
+  wire [31:0] __823e62ea; // test023.py:50
+  wire [7:0] __c0f00629; // test023.py:57
+  wire [7:0] __de8f626c; // test023.py:55
+  wire [7:0] l__x; // test023.py:43
+  wire [7:0] l__y; // test023.py:43
+  reg [7:0] __next__m; // test023.py:35
+  reg [7:0] mem__rd1; // test023.py:41
+  wire [1:0] mem__wr0__addr; // test023.py:38
+  reg [1:0] __next__mem__wr0__addr; // test023.py:38
+  wire [7:0] mem__wr0__data; // test023.py:38
+  reg [7:0] __next__mem__wr0__data; // test023.py:38
+  wire mem__wr0__en; // test023.py:38
+  reg __next__mem__wr0__en; // test023.py:38
+  reg [7:0] __next__q; // test023.py:34
+  reg [7:0] __next__r; // test023.py:35
+  assign __23231009 = sel == 32'sd3; // test023.py:56
+  assign __823e62ea = a + 32'sd1; // test023.py:50
+  assign __c0f00629 = ~ q; // test023.py:57
+  assign __de8f626c = q + a; // test023.py:55
+  always @* begin
+    __next__q = q; // test023.py:34
+    if (en) begin // test023.py:54
+      __next__q = __de8f626c; // test023.py:55
+    end
+    else if (__23231009) begin // test023.py:56
+      __next__q = __c0f00629; // test023.py:57
+    end
+  end
+  always @* begin
+    __next__r = 8'bx; // test023.py:35
+    __next__r = (sel[1] ? a : (sel[0] ? __823e62ea[7:0] : l__y)); // test023.py:46
+  end
+  always @* begin
+    __next__m = 8'bx; // test023.py:35
+    __next__m = mem__rd1; // test023.py:41
+  end
+  always @* begin
+    __next__mem__wr0__addr = 2'bx; // test023.py:38
+    __next__mem__wr0__data = 8'bx; // test023.py:38
+    __next__mem__wr0__en = 1'bx; // test023.py:38
+    __next__mem__wr0__en = 1'd0; // test023.py:38
+    if (en) begin // test023.py:39
+      __next__mem__wr0__addr = sel; // test023.py:40
+      __next__mem__wr0__data = a; // test023.py:40
+      __next__mem__wr0__en = 1'd1; // test023.py:40
+    end
+  end
+  assign r = __next__r; // test023.py:35
+  assign m = __next__m; // test023.py:35
+  assign mem__wr0__addr = __next__mem__wr0__addr; // test023.py:38
+  assign mem__wr0__data = __next__mem__wr0__data; // test023.py:38
+  assign mem__wr0__en = __next__mem__wr0__en; // test023.py:38
+  assign l__x = a; // test023.py:44
+  always @(posedge clk) begin
+    if (rst) begin
+      q <= 8'h4; // test023.py:34
+    end else begin
+      q <= __next__q; // test023.py:34
+    end
+  end
+  leaf_bug l ( // test023.py:43
+    .x(a),
+    .y(l__y)
+  );
+  always @(posedge clk) begin
+    if (mem__wr0__en) mem[mem__wr0__addr] <= mem__wr0__data; // test023.py:38
+    mem__rd1 <= mem[sel]; // test023.py:41
+  end
+endmodule
+
+module seq_bug (
+  input [7:0] a /* test023.py:61 */,
+  input clk /* test023.py:60 */,
+  input en /* test023.py:60 */,
+  output [7:0] m0 /* test023.py:63 */,
+  output [7:0] q0 /* test023.py:63 */,
+  output [7:0] r0 /* test023.py:63 */,
+  input rst /* test023.py:60 */,
+  input [1:0] sel /* test023.py:62 */
+);
+  wire [7:0] c0__a; // test023.py:65
+  wire c0__clk; // test023.py:65
+  wire c0__en; // test023.py:65
+  wire [7:0] c0__m; // test023.py:65
+  wire [7:0] c0__q; // test023.py:65
+  wire [7:0] c0__r; // test023.py:65
+  wire c0__rst; // test023.py:65
+  wire [1:0] c0__sel; // test023.py:65
+  assign c0__clk = clk; // test023.py:66
+  assign c0__rst = rst; // test023.py:67
+  assign c0__en = en; // test023.py:68
+  assign c0__sel = sel; // test023.py:69
+  assign c0__a = a; // test023.py:70
+  assign q0 = c0__q; // test023.py:73
+  assign r0 = c0__r; // test023.py:73
+  assign m0 = c0__m; // test023.py:73
+  child_bug c0 ( // test023.py:65
+    .a(a),
+    .clk(clk),
+    .en(en),
+    .m(c0__m),
+    .q(c0__q),
+    .r(c0__r),
+    .rst(rst),
+    .sel(sel)
+  );
+endmodule
+
+module accu_add (
+  input [3:0] a /* test023.py:110 */,
+  input clk /* test023.py:109 */,
+  output reg [3:0] q /* test023.py:111 */
+);
+  wire [3:0] __de8f626c; // test023.py:114
+  reg [3:0] __next__q; // test023.py:111
+  assign __de8f626c = q + a; // test023.py:114
+  always @* begin
+    __next__q = q; // test023.py:111
+    __next__q = __de8f626c; // test023.py:112
+  end
+  always @(posedge clk) begin
+    q <= __next__q; // test023.py:111
+  end
+endmodule
+
+module accu_add2 (
+  input [3:0] a /* test023.py:110 */,
+  input clk /* test023.py:109 */,
+  output reg [3:0] q /* test023.py:111 */
+);
+  wire [3:0] __734c4e1e; // test023.py:115
+  reg [3:0] __next__q; // test023.py:111
+  assign __734c4e1e = a + q; // test023.py:115
+  always @* begin
+    __next__q = q; // test023.py:111
+    __next__q = __734c4e1e; // test023.py:112
+  end
+  always @(posedge clk) begin
+    q <= __next__q; // test023.py:111
+  end
+endmodule
+
+module accu_sub (
+  input [3:0] a /* test023.py:110 */,
+  input clk /* test023.py:109 */,
+  output reg [3:0] q /* test023.py:111 */
+);
+  wire [3:0] __e151bfdd; // test023.py:116
+  reg [3:0] __next__q; // test023.py:111
+  assign __e151bfdd = q - a; // test023.py:116
+  always @* begin
+    __next__q = q; // test023.py:111
+    __next__q = __e151bfdd; // test023.py:112
+  end
+  always @(posedge clk) begin
+    q <= __next__q; // test023.py:111
+  end
+endmodule
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+
+from chipy import *
+from chipy import WriteAIGER, WriteDIMACS, AIGSize
+
+
+def make_design(name):
+    with AddModule(name):
+        clk, rst, en = AddInput("clk rst en")
+        a, b = AddInput("a b", 4)
+        y = AddOutput("y", 4, async_=True)
+        q = AddOutput("q", 4, posedge=clk, reset=rst, reset_value=5)
+        m = AddOutput("m", 4, async_=True)
+
+        mem = AddMemory("mem", 4, 4)
+        wp = mem.write_port(posedge=clk)
+        with If(en):
+            wp.write(a[1:0], b)
+        m.next = mem.read_port(b[1:0], posedge=clk)
+
+        y.next = (a * b) ^ Cond(a < b, a - b, Concat([a[1:0], b[3:2]]))
+        with If(en):
+            q.next = q + a
+
+
+def solve(cnf):
+    # Minimal DPLL with unit propagation
+    clauses = [[int(l) for l in line.split()[:-1]] for line in cnf.splitlines()
+            if line and line[0] not in "cp"]
+
+    def dpll(clauses, assignment):
+        while True:
+            units = [c[0] for c in clauses if len(c) == 1]
+            if not units:
+                break
+            lit = units[0]
+            assignment.add(lit)
+            new = list()
+            for c in clauses:
+                if lit in c:
+                    continue
+                c = [l for l in c if l != -lit]
+                if not c:
+                    return None
+                new.append(c)
+            clauses = new
+        if not clauses:
+            return assignment
+        lit = clauses[0][0]
+        for choice in (lit, -lit):
+            result = dpll(clauses + [[choice]], set(assignment))
+            if result is not None:
+                return result
+        return None
+
+    return dpll(clauses, set())
+
+
+def make_counter(name, bug=False):
+    with AddModule(name):
+        clk, en = AddInput("clk en")
+        a = AddInput("a", 2)
+        q = AddOutput("q", 3, posedge=clk)
+        y = AddOutput("y", 1, async_=True)
+        y.next = (q == 6)
+        with If(en):
+            q.next = q + (a if not bug else 1)
+
+
+make_design("gold")
+make_counter("cnt")
+make_counter("cnt_copy")
+make_counter("cnt_bug", bug=True)
+
+size = AIGSize(Module("gold"))
+assert size["inputs"] == 10 and size["latches"] == 4 + 4 + 16 and size["ands"] > 0
+
+class Text:
+    def __init__(self):
+        self.text = ""
+    def write(self, s):
+        self.text += s
+
+# Structurally equivalent logic hashes to the same AIG nodes: the miter
+# output is constant 0.
+for name in ("comb_a", "comb_b"):
+    with AddModule(name):
+        a, b = AddInput("a b", 4)
+        y = AddOutput("y", 4, async_=True)
+        y.next = (a + b) & (b | a) if name == "comb_a" else (b | a) & (b + a)
+aag = Text()
+WriteAIGER(aag, Module("comb_a"), Module("comb_b"))
+assert aag.text.splitlines()[0].split()[3:] == ["0", "1", "0"]
+assert aag.text.splitlines()[9] == "0"
+
+# Without an initial state the registers of the two copies are independent.
+cnf = Text()
+WriteDIMACS(cnf, Module("cnt"), Module("cnt_copy"), steps=3)
+assert solve(cnf.text) is not None
+cnf = Text()
+WriteDIMACS(cnf, Module("cnt"), Module("cnt_copy"), steps=3, init=0)
+assert solve(cnf.text) is None
+
+cnf = Text()
+WriteDIMACS(cnf, Module("cnt"), Module("cnt_bug"), steps=1, init=0)
+assert solve(cnf.text) is None
+cnf = Text()
+WriteDIMACS(cnf, Module("cnt"), Module("cnt_bug"), steps=3, init=0)
+assert solve(cnf.text) is not None
+
+WriteAIGER("test024.aag", Module("gold"))
+WriteAIGER("test024.aig", Module("gold"), binary=True)
+
+with open("test024.v", "w") as f:
+    print("""
+//@ test-sat-equiv-bmc gold gate_1 5
+//@ test-sat-equiv-bmc gold gate_2 5
+""", file=f)
+
+    WriteVerilog(f)
+
+    for gate, aig in (("gate_1", "test024_aag"), ("gate_2", "test024_aig")):
+        print("module %s(input clk, rst, en, input [3:0] a, b, output [3:0] y, q, m);" % gate, file=f)
+        conns = ["clk", "rst", "en"] + ["%s[%d]" % (n, i) for n in "abyqm" for i in range(4)]
+        print("  %s inst (%s);" % (aig, ", ".join(".\\%s (%s)" % (c, c) for c in conns)), file=f)
+        print("endmodule", file=f)
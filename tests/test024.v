@@ -0,0 +1,222 @@
+
+//@ test-sat-equiv-bmc gold gate_1 5
+//@ test-sat-equiv-bmc gold gate_2 5
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module gold (
+  input [3:0] a /* test024.py:9 */,
+  input [3:0] b /* test024.py:9 */,
+  input clk /* test024.py:8 */,
+  input en /* test024.py:8 */,
+  output [3:0] m /* test024.py:12 */,
+  output reg [3:0] q /* test024.py:11 */,
+  input rst /* test024.py:8 */,
+  output [3:0] y /* test024.py:10 */
+);
+  reg [3:0] mem [0:3]; // test024.py:14
+  wire [1:0] __16cb9e0b; // test024.py:17
+  wire [1:0] __16cb9e0b_1; // test024.py:20
+  wire [3:0] __211eb23d; // test024.py:20
+  wire [1:0] __2f46a2ce; // test024.py:18
+  wire [3:0] __5bbe62e5; // test024.py:20
+  wire [1:0] __67b0932c; // test024.py:20
+  wire [3:0] __7284a5d9; // test024.py:20
+  wire [3:0] __837d19c3; // test024.py:20
+  wire __a5225b51; // test024.py:20
+  wire [3:0] __c85235f7; // test024.py:20
+  wire [3:0] __de8f626c; // test024.py:22
+  reg [3:0] __next__m; // test024.py:12
+  reg [3:0] mem__rd1; // test024.py:18
+  wire [1:0] mem__wr0__addr; // test024.py:15
+  reg [1:0] __next__mem__wr0__addr; // test024.py:15
+  wire [3:0] mem__wr0__data; // test024.py:15
+  reg [3:0] __next__mem__wr0__data; // test024.py:15
+  wire mem__wr0__en; // test024.py:15
+  reg __next__mem__wr0__en; // test024.py:15
+  reg [3:0] __next__q; // test024.py:11
+  reg [3:0] __next__y; // test024.py:10
+  assign __16cb9e0b = a[1:0]; // test024.py:17
+  assign __16cb9e0b_1 = a[1:0]; // test024.py:20
+  assign __211eb23d = {__16cb9e0b_1,__67b0932c}; // test024.py:20
+  assign __2f46a2ce = b[1:0]; // test024.py:18
+  assign __5bbe62e5 = a * b; // test024.py:20
+  assign __67b0932c = b[3:2]; // test024.py:20
+  assign __7284a5d9 = __5bbe62e5 ^ __c85235f7; // test024.py:20
+  assign __837d19c3 = a - b; // test024.py:20
+  assign __a5225b51 = a < b; // test024.py:20
+  assign __c85235f7 = __a5225b51 ? __837d19c3 : __211eb23d; // test024.py:20
+  assign __de8f626c = q + a; // test024.py:22
+  always @* begin
+    __next__y = 4'bx; // test024.py:10
+    __next__y = __7284a5d9; // test024.py:20
+  end
+  always @* begin
+    __next__q = q; // test024.py:11
+    if (en) begin // test024.py:21
+      __next__q = __de8f626c; // test024.py:22
+    end
+  end
+  always @* begin
+    __next__m = 4'bx; // test024.py:12
+    __next__m = mem__rd1; // test024.py:18
+  end
+  always @* begin
+    __next__mem__wr0__addr = 2'bx; // test024.py:15
+    __next__mem__wr0__data = 4'bx; // test024.py:15
+    __next__mem__wr0__en = 1'bx; // test024.py:15
+    __next__mem__wr0__en = 1'd0; // test024.py:15
+    if (en) begin // test024.py:16
+      __next__mem__wr0__addr = __16cb9e0b; // test024.py:17
+      __next__mem__wr0__data = b; // test024.py:17
+      __next__mem__wr0__en = 1'd1; // test024.py:17
+    end
+  end
+  assign y = __next__y; // test024.py:10
+  assign m = __next__m; // test024.py:12
+  assign mem__wr0__addr = __next__mem__wr0__addr; // test024.py:15
+  assign mem__wr0__data = __next__mem__wr0__data; // test024.py:15
+  assign mem__wr0__en = __next__mem__wr0__en; // test024.py:15
+  always @(posedge clk) begin
+    if (rst) begin
+      q <= 4'h5; // test024.py:11
+    end else begin
+      q <= __next__q; // test024.py:11
+    end
+  end
+  always @(posedge clk) begin
+    if (mem__wr0__en) mem[mem__wr0__addr] <= mem__wr0__data; // test024.py:15
+    mem__rd1 <= mem[__2f46a2ce]; // test024.py:18
+  end
+endmodule
+
+module cnt (
+  input [1:0] a /* test024.py:61 */,
+  input clk /* test024.py:60 */,
+  input en /* test024.py:60 */,
+  output reg [2:0] q /* test024.py:62 */,
+  output y /* test024.py:63 */
+);
+  wire __91b5a800; // test024.py:64
+  wire [2:0] __de8f626c; // test024.py:66
+  reg [2:0] __next__q; // test024.py:62
+  reg __next__y; // test024.py:63
+  assign __91b5a800 = q == 32'sd6; // test024.py:64
+  assign __de8f626c = q + a; // test024.py:66
+  always @* begin
+    __next__q = q; // test024.py:62
+    if (en) begin // test024.py:65
+      __next__q = __de8f626c; // test024.py:66
+    end
+  end
+  always @* begin
+    __next__y = 1'bx; // test024.py:63
+    __next__y = __91b5a800; // test024.py:64
+  end
+  assign y = __next__y; // test024.py:63
+  always @(posedge clk) begin
+    q <= __next__q; // test024.py:62
+  end
+endmodule
+
+module cnt_copy (
+  input [1:0] a /* test024.py:61 */,
+  input clk /* test024.py:60 */,
+  input en /* test024.py:60 */,
+  output reg [2:0] q /* test024.py:62 */,
+  output y /* test024.py:63 */
+);
+  wire __91b5a800; // test024.py:64
+  wire [2:0] __de8f626c; // test024.py:66
+  reg [2:0] __next__q; // test024.py:62
+  reg __next__y; // test024.py:63
+  assign __91b5a800 = q == 32'sd6; // test024.py:64
+  assign __de8f626c = q + a; // test024.py:66
+  always @* begin
+    __next__q = q; // test024.py:62
+    if (en) begin // test024.py:65
+      __next__q = __de8f626c; // test024.py:66
+    end
+  end
+  always @* begin
+    __next__y = 1'bx; // test024.py:63
+    __next__y = __91b5a800; // test024.py:64
+  end
+  assign y = __next__y; // test024.py:63
+  always @(posedge clk) begin
+    q <= __next__q; // test024.py:62
+  end
+endmodule
+
+module cnt_bug (
+  input [1:0] a /* test024.py:61 */,
+  input clk /* test024.py:60 */,
+  input en /* test024.py:60 */,
+  output reg [2:0] q /* test024.py:62 */,
+  output y /* test024.py:63 */
+);
+  wire [31:0] __286c3992; // test024.py:66
+  wire __91b5a800; // test024.py:64
+  reg [2:0] __next__q; // test024.py:62
+  reg __next__y; // test024.py:63
+  assign __286c3992 = q + 32'sd1; // test024.py:66
+  assign __91b5a800 = q == 32'sd6; // test024.py:64
+  always @* begin
+    __next__q = q; // test024.py:62
+    if (en) begin // test024.py:65
+      __next__q = __286c3992; // test024.py:66
+    end
+  end
+  always @* begin
+    __next__y = 1'bx; // test024.py:63
+    __next__y = __91b5a800; // test024.py:64
+  end
+  assign y = __next__y; // test024.py:63
+  always @(posedge clk) begin
+    q <= __next__q; // test024.py:62
+  end
+endmodule
+
+module comb_a (
+  input [3:0] a /* test024.py:87 */,
+  input [3:0] b /* test024.py:87 */,
+  output [3:0] y /* test024.py:88 */
+);
+  wire [3:0] __583eb51e; // test024.py:89
+  wire [3:0] __bca3c472; // test024.py:89
+  wire [3:0] __e902894d; // test024.py:89
+  reg [3:0] __next__y; // test024.py:88
+  assign __583eb51e = b | a; // test024.py:89
+  assign __bca3c472 = a + b; // test024.py:89
+  assign __e902894d = __bca3c472 & __583eb51e; // test024.py:89
+  always @* begin
+    __next__y = 4'bx; // test024.py:88
+    __next__y = __e902894d; // test024.py:89
+  end
+  assign y = __next__y; // test024.py:88
+endmodule
+
+module comb_b (
+  input [3:0] a /* test024.py:87 */,
+  input [3:0] b /* test024.py:87 */,
+  output [3:0] y /* test024.py:88 */
+);
+  wire [3:0] __583eb51e; // test024.py:89
+  wire [3:0] __704170bb; // test024.py:89
+  wire [3:0] __ee75f263; // test024.py:89
+  reg [3:0] __next__y; // test024.py:88
+  assign __583eb51e = b | a; // test024.py:89
+  assign __704170bb = __583eb51e & __ee75f263; // test024.py:89
+  assign __ee75f263 = b + a; // test024.py:89
+  always @* begin
+    __next__y = 4'bx; // test024.py:88
+    __next__y = __704170bb; // test024.py:89
+  end
+  assign y = __next__y; // test024.py:88
+endmodule
+module gate_1(input clk, rst, en, input [3:0] a, b, output [3:0] y, q, m);
+  test024_aag inst (.\clk (clk), .\rst (rst), .\en (en), .\a[0] (a[0]), .\a[1] (a[1]), .\a[2] (a[2]), .\a[3] (a[3]), .\b[0] (b[0]), .\b[1] (b[1]), .\b[2] (b[2]), .\b[3] (b[3]), .\y[0] (y[0]), .\y[1] (y[1]), .\y[2] (y[2]), .\y[3] (y[3]), .\q[0] (q[0]), .\q[1] (q[1]), .\q[2] (q[2]), .\q[3] (q[3]), .\m[0] (m[0]), .\m[1] (m[1]), .\m[2] (m[2]), .\m[3] (m[3]));
+endmodule
+module gate_2(input clk, rst, en, input [3:0] a, b, output [3:0] y, q, m);
+  test024_aig inst (.\clk (clk), .\rst (rst), .\en (en), .\a[0] (a[0]), .\a[1] (a[1]), .\a[2] (a[2]), .\a[3] (a[3]), .\b[0] (b[0]), .\b[1] (b[1]), .\b[2] (b[2]), .\b[3] (b[3]), .\y[0] (y[0]), .\y[1] (y[1]), .\y[2] (y[2]), .\y[3] (y[3]), .\q[0] (q[0]), .\q[1] (q[1]), .\q[2] (q[2]), .\q[3] (q[3]), .\m[0] (m[0]), .\m[1] (m[1]), .\m[2] (m[2]), .\m[3] (m[3]));
+endmodule
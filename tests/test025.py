@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+import gzip
+import io
+from chipy import *
+from chipy import Simulation, Waveform
+
+
+def make_design(name):
+    counter = AddModule(name + "_counter")
+    with counter:
+        clk, rst, en = AddInput("clk rst en")
+        q = AddOutput("q", 4, posedge=clk, reset=rst)
+        tmp = AddReg("tmp", 4, async_=True)
+        tmp.next = q + 1
+        with If(en):
+            q.next = tmp
+
+    with AddModule(name):
+        clk, rst, en = AddInput("clk rst en")
+        y = AddOutput("y", 4)
+        wrap = AddOutput("wrap", 1, async_=True)
+        c0 = AddInst("c0", counter)
+        Connect(c0.clk_, clk)
+        Connect(c0.rst_, rst)
+        Connect(c0.en_, en)
+        Connect(y, c0.q_)
+        wrap.next = y == 15
+
+
+def read_vcd(text):
+    # returns {name: [(time, value)]}, signals with the same code share values
+    codes = dict()
+    changes = dict()
+    scope = list()
+    time = 0
+    for line in text.splitlines():
+        words = line.split()
+        if words[0] == "$scope":
+            scope.append(words[2])
+        elif words[0] == "$upscope":
+            scope.pop()
+        elif words[0] == "$var":
+            codes.setdefault(words[3], list()).append(".".join(scope[1:] + [words[4]]))
+        elif words[0].startswith("#"):
+            time = int(words[0][1:])
+        elif words[0].startswith("b"):
+            for name in codes[words[1]]:
+                changes.setdefault(name, list()).append((time, words[0][1:]))
+        elif words[0][0] in "01xz":
+            for name in codes[line[1:]]:
+                changes.setdefault(name, list()).append((time, line[0]))
+    return changes
+
+
+make_design("gold")
+make_design("gate_1")
+
+# all signals, written to a file object
+buf = io.StringIO()
+sim = Simulation(Module("gold"))
+wave = Waveform(sim, buf)
+sim.set("rst", 1)
+sim.set("en", 1)
+for i in range(20):
+    sim.step()
+    sim.set("rst", 0)
+    sim.set("en", int(i not in (10, 11)))
+wave.close()
+
+changes = read_vcd(buf.getvalue())
+assert sorted(changes) == ["c0.clk", "c0.en", "c0.q", "c0.rst", "c0.tmp", "c0__clk", "c0__en", "c0__q", "c0__rst",
+        "clk", "en", "rst", "wrap", "y"]
+assert changes["y"][:3] == [(0, "xxxx"), (10, "0"), (20, "1")]
+assert changes["c0.tmp"][1] == (10, "1") and changes["wrap"][:2] == [(0, "x"), (10, "0")]
+y = [(t, int(v, 2)) for t, v in changes["y"][1:]]
+assert y[9:12] == [(100, 9), (110, 10), (140, 11)] and y[-1] == (200, 1)
+assert changes["wrap"][-2:] == [(180, "1"), (190, "0")] and changes["en"][1:3] == [(110, "0"), (130, "1")]
+assert changes["clk"][:4] == [(0, "1"), (5, "0"), (10, "1"), (15, "0")]
+assert buf.getvalue().endswith("#210\n")
+assert len({line.split()[3] for line in buf.getvalue().splitlines() if line.startswith("$var")}) == 6
+
+# selected signals only, compressed file, sim internals via get()
+sim = Simulation(Module("gold"))
+with Waveform(sim, "test025.vcd.gz", signals="y c0.t*") as wave:
+    sim.set("rst", 1)
+    sim.set("en", 1)
+    for i in range(100):
+        sim.step()
+        sim.set("rst", 0)
+with gzip.open("test025.vcd.gz", "rt") as f:
+    changes = read_vcd(f.read())
+assert sorted(changes) == ["c0.tmp", "y"] and len(changes["y"]) == 101
+sim.eval()
+assert sim.get("c0.tmp") == (sim.get("y") + 1) % 16 and sim.get("y") == 99 % 16
+
+try:
+    Waveform(sim, io.StringIO(), signals="nosuchsignal")
+    assert False
+except ChipyError:
+    pass
+
+
+with open("test025.v", "w") as f:
+    print("""
+//@ test-sat-equiv-induct gold gate_1 5
+""", file=f)
+
+    WriteVerilog(f)
@@ -0,0 +1,128 @@
+
+//@ test-sat-equiv-induct gold gate_1 5
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module gold_counter (
+  input clk /* test025.py:11 */,
+  input en /* test025.py:11 */,
+  output reg [3:0] q /* test025.py:12 */,
+  input rst /* test025.py:11 */
+);
+  wire [31:0] __286c3992; // test025.py:14
+  reg [3:0] __next__q; // test025.py:12
+  wire [3:0] tmp; // test025.py:13
+  reg [3:0] __next__tmp; // test025.py:13
+  assign __286c3992 = q + 32'sd1; // test025.py:14
+  always @* begin
+    __next__q = q; // test025.py:12
+    if (en) begin // test025.py:15
+      __next__q = tmp; // test025.py:16
+    end
+  end
+  always @* begin
+    __next__tmp = 4'bx; // test025.py:13
+    __next__tmp = __286c3992; // test025.py:14
+  end
+  assign tmp = __next__tmp; // test025.py:13
+  always @(posedge clk) begin
+    if (rst) begin
+      q <= 4'h0; // test025.py:12
+    end else begin
+      q <= __next__q; // test025.py:12
+    end
+  end
+endmodule
+
+module gold (
+  input clk /* test025.py:19 */,
+  input en /* test025.py:19 */,
+  input rst /* test025.py:19 */,
+  output wrap /* test025.py:21 */,
+  output [3:0] y /* test025.py:20 */
+);
+  wire __c43288f8; // test025.py:27
+  wire c0__clk; // test025.py:22
+  wire c0__en; // test025.py:22
+  wire [3:0] c0__q; // test025.py:22
+  wire c0__rst; // test025.py:22
+  reg __next__wrap; // test025.py:21
+  assign __c43288f8 = y == 32'sd15; // test025.py:27
+  always @* begin
+    __next__wrap = 1'bx; // test025.py:21
+    __next__wrap = __c43288f8; // test025.py:27
+  end
+  assign wrap = __next__wrap; // test025.py:21
+  assign c0__clk = clk; // test025.py:23
+  assign c0__rst = rst; // test025.py:24
+  assign c0__en = en; // test025.py:25
+  assign y = c0__q; // test025.py:26
+  gold_counter c0 ( // test025.py:22
+    .clk(clk),
+    .en(en),
+    .q(c0__q),
+    .rst(rst)
+  );
+endmodule
+
+module gate_1_counter (
+  input clk /* test025.py:11 */,
+  input en /* test025.py:11 */,
+  output reg [3:0] q /* test025.py:12 */,
+  input rst /* test025.py:11 */
+);
+  wire [31:0] __286c3992; // test025.py:14
+  reg [3:0] __next__q; // test025.py:12
+  wire [3:0] tmp; // test025.py:13
+  reg [3:0] __next__tmp; // test025.py:13
+  assign __286c3992 = q + 32'sd1; // test025.py:14
+  always @* begin
+    __next__q = q; // test025.py:12
+    if (en) begin // test025.py:15
+      __next__q = tmp; // test025.py:16
+    end
+  end
+  always @* begin
+    __next__tmp = 4'bx; // test025.py:13
+    __next__tmp = __286c3992; // test025.py:14
+  end
+  assign tmp = __next__tmp; // test025.py:13
+  always @(posedge clk) begin
+    if (rst) begin
+      q <= 4'h0; // test025.py:12
+    end else begin
+      q <= __next__q; // test025.py:12
+    end
+  end
+endmodule
+
+module gate_1 (
+  input clk /* test025.py:19 */,
+  input en /* test025.py:19 */,
+  input rst /* test025.py:19 */,
+  output wrap /* test025.py:21 */,
+  output [3:0] y /* test025.py:20 */
+);
+  wire __c43288f8; // test025.py:27
+  wire c0__clk; // test025.py:22
+  wire c0__en; // test025.py:22
+  wire [3:0] c0__q; // test025.py:22
+  wire c0__rst; // test025.py:22
+  reg __next__wrap; // test025.py:21
+  assign __c43288f8 = y == 32'sd15; // test025.py:27
+  always @* begin
+    __next__wrap = 1'bx; // test025.py:21
+    __next__wrap = __c43288f8; // test025.py:27
+  end
+  assign wrap = __next__wrap; // test025.py:21
+  assign c0__clk = clk; // test025.py:23
+  assign c0__rst = rst; // test025.py:24
+  assign c0__en = en; // test025.py:25
+  assign y = c0__q; // test025.py:26
+  gate_1_counter c0 ( // test025.py:22
+    .clk(clk),
+    .en(en),
+    .q(c0__q),
+    .rst(rst)
+  );
+endmodule
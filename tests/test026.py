@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+import pickle
+import random
+from chipy import *
+from chipy import Simulation, MergeCoverage
+
+
+def make_design(name):
+    unit = AddModule(name + "_unit")
+    with unit:
+        clk = AddInput("clk")
+        op = AddInput("op", 2)
+        a = AddInput("a", 4)
+        y = AddOutput("y", 4, posedge=clk)
+        flag = AddOutput("flag", 1, async_=True)
+
+        with If(op == 0):                           # line 17
+            y.next = a
+        with ElseIf(a == 15):                       # line 19
+            y.next = 0
+        with Else():                                # line 21
+            y.next = y + 1
+
+        flag.next = 0
+        with Switch(op):                            # line 25
+            with Case(1):                           # line 26
+                flag.next = 1
+            with Case(3):                           # line 28
+                with If(a[3]):                      # line 29
+                    flag.next = y[0]
+
+    with AddModule(name):
+        clk = AddInput("clk")
+        op = AddInput("op", 2)
+        a = AddInput("a", 4)
+        y0, y1 = AddOutput("y0 y1", 4)
+        f0, f1 = AddOutput("f0 f1", 1)
+        for inst, y, f, opx in (("u0", y0, f0, op), ("u1", y1, f1, op & Sig(1, 2))):
+            u = AddInst(inst, unit)
+            Connect(u.clk_, clk)
+            Connect(u.op_, opx)
+            Connect(u.a_, a)
+            Connect(y, u.y_)
+            Connect(f, u.flag_)
+
+
+def run(seed, cycles):
+    sim = Simulation(Module("gold"), vectors=4, coverage=True)
+    rng = random.Random(seed)
+    for i in range(cycles):
+        sim.set("op", [rng.randrange(4) for v in range(4)])
+        sim.set("a", [rng.randrange(15) for v in range(4)])
+        sim.step()
+    return sim.coverage
+
+
+make_design("gold")
+make_design("gate_1")
+
+cov = run(1, 50)
+report = {(codeloc, kind): (hits, missed) for codeloc, kind, hits, missed in cov.report()}
+assert sorted(report) == [("test026.py:%d" % line, kind) for line, kind in ((18, "if"), (20, "elseif"),
+        (22, "else"), (26, "default"), (27, "case"), (29, "case"), (30, "else"), (30, "if"))]
+assert report[("test026.py:18", "if")][0] + report[("test026.py:20", "elseif")][0] + \
+        report[("test026.py:22", "else")][0] == 2 * 50 * 4
+assert report[("test026.py:26", "default")][0] > 0
+# a is never 15, and u1 never sees op 2 or 3
+missed = [("test026.py:20", "elseif"), ("test026.py:29", "case"), ("test026.py:30", "if"), ("test026.py:30", "else")]
+assert cov.missed() == missed
+assert report[("test026.py:29", "case")][1] == 1 and report[("test026.py:27", "case")][1] == 0
+assert cov.untoggled() == [("u1.op", "1"), ("u1__op", "1")]
+
+# results of parallel workers are merged
+parts = [pickle.loads(pickle.dumps(run(seed, 25))) for seed in (2, 3)]
+total = MergeCoverage(parts)
+assert total.samples == 200 and sum(total.hits) == sum(parts[0].hits) + sum(parts[1].hits)
+assert total.missed() == missed
+
+
+with open("test026.v", "w") as f:
+    print("""
+//@ test-sat-equiv-induct gold gate_1 5
+""", file=f)
+
+    WriteVerilog(f)
@@ -0,0 +1,200 @@
+
+//@ test-sat-equiv-induct gold gate_1 5
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module gold_unit (
+  input [3:0] a /* test026.py:13 */,
+  input clk /* test026.py:11 */,
+  output flag /* test026.py:15 */,
+  input [1:0] op /* test026.py:12 */,
+  output reg [3:0] y /* test026.py:14 */
+);
+  wire __3cb357d2; // test026.py:30
+  wire __47269ea8; // test026.py:29
+  wire [31:0] __7d45142e; // test026.py:22
+  wire __91d9aaa2; // test026.py:19
+  wire __acf6f132; // test026.py:17
+  reg __next__flag; // test026.py:15
+  reg [3:0] __next__y; // test026.py:14
+  assign __3cb357d2 = y[0]; // test026.py:30
+  assign __47269ea8 = a[3]; // test026.py:29
+  assign __7d45142e = y + 32'sd1; // test026.py:22
+  assign __91d9aaa2 = a == 32'sd15; // test026.py:19
+  assign __acf6f132 = op == 32'sd0; // test026.py:17
+  always @* begin
+    __next__y = y; // test026.py:14
+    if (__acf6f132) begin // test026.py:17
+      __next__y = a; // test026.py:18
+    end
+    else if (__91d9aaa2) begin // test026.py:19
+      __next__y = 32'sd0; // test026.py:20
+    end
+    else begin // test026.py:21
+      __next__y = __7d45142e; // test026.py:22
+    end
+  end
+  always @* begin
+    __next__flag = 1'bx; // test026.py:15
+    __next__flag = 32'sd0; // test026.py:24
+    (* parallel_case *) case (op) // test026.py:25
+      32'sd1: begin // test026.py:26
+        __next__flag = 32'sd1; // test026.py:27
+      end
+      32'sd3: begin // test026.py:28
+        if (__47269ea8) begin // test026.py:29
+          __next__flag = __3cb357d2; // test026.py:30
+        end
+      end
+    endcase
+  end
+  assign flag = __next__flag; // test026.py:15
+  always @(posedge clk) begin
+    y <= __next__y; // test026.py:14
+  end
+endmodule
+
+module gold (
+  input [3:0] a /* test026.py:35 */,
+  input clk /* test026.py:33 */,
+  output f0 /* test026.py:37 */,
+  output f1 /* test026.py:37 */,
+  input [1:0] op /* test026.py:34 */,
+  output [3:0] y0 /* test026.py:36 */,
+  output [3:0] y1 /* test026.py:36 */
+);
+  wire [1:0] __4d955e98; // test026.py:38
+  wire [3:0] u0__a; // test026.py:39
+  wire u0__clk; // test026.py:39
+  wire u0__flag; // test026.py:39
+  wire [1:0] u0__op; // test026.py:39
+  wire [3:0] u0__y; // test026.py:39
+  wire [3:0] u1__a; // test026.py:39
+  wire u1__clk; // test026.py:39
+  wire u1__flag; // test026.py:39
+  wire [1:0] u1__op; // test026.py:39
+  wire [3:0] u1__y; // test026.py:39
+  assign __4d955e98 = op & 2'd1; // test026.py:38
+  assign u0__clk = clk; // test026.py:40
+  assign u0__op = op; // test026.py:41
+  assign u0__a = a; // test026.py:42
+  assign y0 = u0__y; // test026.py:43
+  assign f0 = u0__flag; // test026.py:44
+  assign u1__clk = clk; // test026.py:40
+  assign u1__op = __4d955e98; // test026.py:41
+  assign u1__a = a; // test026.py:42
+  assign y1 = u1__y; // test026.py:43
+  assign f1 = u1__flag; // test026.py:44
+  gold_unit u0 ( // test026.py:39
+    .a(a),
+    .clk(clk),
+    .flag(u0__flag),
+    .op(op),
+    .y(u0__y)
+  );
+  gold_unit u1 ( // test026.py:39
+    .a(a),
+    .clk(clk),
+    .flag(u1__flag),
+    .op(__4d955e98),
+    .y(u1__y)
+  );
+endmodule
+
+module gate_1_unit (
+  input [3:0] a /* test026.py:13 */,
+  input clk /* test026.py:11 */,
+  output flag /* test026.py:15 */,
+  input [1:0] op /* test026.py:12 */,
+  output reg [3:0] y /* test026.py:14 */
+);
+  wire __3cb357d2; // test026.py:30
+  wire __47269ea8; // test026.py:29
+  wire [31:0] __7d45142e; // test026.py:22
+  wire __91d9aaa2; // test026.py:19
+  wire __acf6f132; // test026.py:17
+  reg __next__flag; // test026.py:15
+  reg [3:0] __next__y; // test026.py:14
+  assign __3cb357d2 = y[0]; // test026.py:30
+  assign __47269ea8 = a[3]; // test026.py:29
+  assign __7d45142e = y + 32'sd1; // test026.py:22
+  assign __91d9aaa2 = a == 32'sd15; // test026.py:19
+  assign __acf6f132 = op == 32'sd0; // test026.py:17
+  always @* begin
+    __next__y = y; // test026.py:14
+    if (__acf6f132) begin // test026.py:17
+      __next__y = a; // test026.py:18
+    end
+    else if (__91d9aaa2) begin // test026.py:19
+      __next__y = 32'sd0; // test026.py:20
+    end
+    else begin // test026.py:21
+      __next__y = __7d45142e; // test026.py:22
+    end
+  end
+  always @* begin
+    __next__flag = 1'bx; // test026.py:15
+    __next__flag = 32'sd0; // test026.py:24
+    (* parallel_case *) case (op) // test026.py:25
+      32'sd1: begin // test026.py:26
+        __next__flag = 32'sd1; // test026.py:27
+      end
+      32'sd3: begin // test026.py:28
+        if (__47269ea8) begin // test026.py:29
+          __next__flag = __3cb357d2; // test026.py:30
+        end
+      end
+    endcase
+  end
+  assign flag = __next__flag; // test026.py:15
+  always @(posedge clk) begin
+    y <= __next__y; // test026.py:14
+  end
+endmodule
+
+module gate_1 (
+  input [3:0] a /* test026.py:35 */,
+  input clk /* test026.py:33 */,
+  output f0 /* test026.py:37 */,
+  output f1 /* test026.py:37 */,
+  input [1:0] op /* test026.py:34 */,
+  output [3:0] y0 /* test026.py:36 */,
+  output [3:0] y1 /* test026.py:36 */
+);
+  wire [1:0] __4d955e98; // test026.py:38
+  wire [3:0] u0__a; // test026.py:39
+  wire u0__clk; // test026.py:39
+  wire u0__flag; // test026.py:39
+  wire [1:0] u0__op; // test026.py:39
+  wire [3:0] u0__y; // test026.py:39
+  wire [3:0] u1__a; // test026.py:39
+  wire u1__clk; // test026.py:39
+  wire u1__flag; // test026.py:39
+  wire [1:0] u1__op; // test026.py:39
+  wire [3:0] u1__y; // test026.py:39
+  assign __4d955e98 = op & 2'd1; // test026.py:38
+  assign u0__clk = clk; // test026.py:40
+  assign u0__op = op; // test026.py:41
+  assign u0__a = a; // test026.py:42
+  assign y0 = u0__y; // test026.py:43
+  assign f0 = u0__flag; // test026.py:44
+  assign u1__clk = clk; // test026.py:40
+  assign u1__op = __4d955e98; // test026.py:41
+  assign u1__a = a; // test026.py:42
+  assign y1 = u1__y; // test026.py:43
+  assign f1 = u1__flag; // test026.py:44
+  gate_1_unit u0 ( // test026.py:39
+    .a(a),
+    .clk(clk),
+    .flag(u0__flag),
+    .op(op),
+    .y(u0__y)
+  );
+  gate_1_unit u1 ( // test026.py:39
+    .a(a),
+    .clk(clk),
+    .flag(u1__flag),
+    .op(__4d955e98),
+    .y(u1__y)
+  );
+endmodule
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+import warnings
+from chipy import *
+from chipy import CheckDesign
+
+
+def make_design(name):
+    with AddModule(name + "_sub"):
+        a, b = AddInput("a b", 8)
+        unused = AddInput("unused")
+        y = AddOutput("y", 8, async_=True)
+        y.next = a - b
+
+    with AddModule(name):
+        clk = AddInput("clk")
+        a, b = AddInput("a b", 8)
+        q = AddOutput("q", 8, posedge=clk)
+        s = AddInst("s", Module(name + "_sub"))
+        Connect(s.a_, a)
+        Connect(s.b_, b)
+        Connect(s.unused_, clk)
+        q.next = s.y_ + 1
+
+
+def make_broken():
+    with AddModule("broken_sub"):
+        a, b = AddInput("a b", 4)
+        y = AddOutput("y", 4, async_=True)
+        y.next = a
+
+    with AddModule("broken"):
+        clk = AddInput("clk")
+        a = AddInput("a", 8)
+        sa = AddInput("sa", -8)
+        x = AddInput("x", 4)
+        unused = AddInput("unused")
+        out = AddOutput("out", 4, async_=True)
+        narrow = AddOutput("narrow", 4, posedge=clk)
+        cmp = AddOutput("cmp", async_=True)
+        lonely = AddReg("lonely", 4)
+        floating = AddReg("floating", 4)
+        floating.next = x
+        l1, l2 = AddReg("l1 l2", 4, async_=True)
+
+        narrow.next = a                     # truncation
+        out.next = x + 1                    # fine
+        cmp.next = sa < a                   # signed/unsigned mix
+        l1.next = l2 + 1                    # loop
+        l2.next = l1 ^ x
+
+    with AddModule("broken_inst"):
+        x = AddInput("x", 4)
+        d = AddReg("d", 4)
+        s = AddInst("s", Module("broken_sub"))
+        Connect(s.a_, x)
+        Connect(d, s.y_)
+        d.next = x
+
+
+def check_broken():
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        make_broken()
+    assert [w.category for w in caught] == [ChipyLoopWarning]
+    issues = CheckDesign()
+    found = sorted((modname, kind) for severity, modname, kind, codeloc, message in issues)
+    assert found == [("broken", "loop"), ("broken", "signedness"), ("broken", "truncation"), ("broken", "unassigned"),
+            ("broken", "unsynchronized"), ("broken", "unused"), ("broken_inst", "multidriven"),
+            ("broken_inst", "netlist"), ("broken_inst", "undriven"), ("broken_sub", "unused")], found
+    messages = {kind: (severity, codeloc, message) for severity, modname, kind, codeloc, message in issues}
+    assert messages["unassigned"][2] == "Register without assignment: lonely"
+    assert messages["unsynchronized"][2] == "Register without synchronization element: floating"
+    assert messages["undriven"][2] == "Input b of instance s (broken_sub) is not driven"
+    assert messages["unused"][2] == "Input port unused is not used"
+    assert messages["truncation"][2] == "Assignment of 8 bits wide a to 4 bits wide narrow"
+    assert messages["multidriven"][2] == "Signal d is driven by Connect (from s__y) and by an assignment"
+    assert messages["netlist"][:1] == ("warning",)
+    assert messages["loop"][0] == "error" and messages["loop"][2] == \
+            "Combinational loop: l1[0] -> (l2 + 32'sd1)[0] -> l2[0] -> (l1 ^ x)[0] -> l1[0] (test027.py:49, test027.py:50)"
+    assert messages["truncation"][0] == "warning" and messages["truncation"][1] == "test027.py:46"
+    assert messages["signedness"][1] == "test027.py:48"
+
+    try:
+        CheckDesign(errors=True)
+        assert False
+    except ChipyError as e:
+        assert str(e).count("\n") == len(issues)
+
+    assert [kind for severity, modname, kind, codeloc, message in CheckDesign("broken_sub")] == ["unused"]
+
+
+check_broken()
+ResetDesign()
+
+make_design("gold")
+make_design("gate_1")
+assert CheckDesign(errors=True) == [("warning", "gold_sub", "unused", "test027.py:11", "Input port unused is not used"),
+        ("warning", "gate_1_sub", "unused", "test027.py:11", "Input port unused is not used")]
+
+
+with open("test027.v", "w") as f:
+    print("""
+//@ test-sat-equiv-induct gold gate_1 5
+""", file=f)
+
+    WriteVerilog(f)
@@ -0,0 +1,98 @@
+
+//@ test-sat-equiv-induct gold gate_1 5
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module gold_sub (
+  input [7:0] a /* test027.py:9 */,
+  input [7:0] b /* test027.py:9 */,
+  input unused /* test027.py:10 */,
+  output [7:0] y /* test027.py:11 */
+);
+  wire [7:0] __837d19c3; // test027.py:12
+  reg [7:0] __next__y; // test027.py:11
+  assign __837d19c3 = a - b; // test027.py:12
+  always @* begin
+    __next__y = 8'bx; // test027.py:11
+    __next__y = __837d19c3; // test027.py:12
+  end
+  assign y = __next__y; // test027.py:11
+endmodule
+
+module gold (
+  input [7:0] a /* test027.py:16 */,
+  input [7:0] b /* test027.py:16 */,
+  input clk /* test027.py:15 */,
+  output reg [7:0] q /* test027.py:17 */
+);
+  wire [31:0] __848aa457; // test027.py:22
+  reg [7:0] __next__q; // test027.py:17
+  wire [7:0] s__a; // test027.py:18
+  wire [7:0] s__b; // test027.py:18
+  wire s__unused; // test027.py:18
+  wire [7:0] s__y; // test027.py:18
+  assign __848aa457 = s__y + 32'sd1; // test027.py:22
+  always @* begin
+    __next__q = q; // test027.py:17
+    __next__q = __848aa457; // test027.py:22
+  end
+  assign s__a = a; // test027.py:19
+  assign s__b = b; // test027.py:20
+  assign s__unused = clk; // test027.py:21
+  always @(posedge clk) begin
+    q <= __next__q; // test027.py:17
+  end
+  gold_sub s ( // test027.py:18
+    .a(a),
+    .b(b),
+    .unused(clk),
+    .y(s__y)
+  );
+endmodule
+
+module gate_1_sub (
+  input [7:0] a /* test027.py:9 */,
+  input [7:0] b /* test027.py:9 */,
+  input unused /* test027.py:10 */,
+  output [7:0] y /* test027.py:11 */
+);
+  wire [7:0] __837d19c3; // test027.py:12
+  reg [7:0] __next__y; // test027.py:11
+  assign __837d19c3 = a - b; // test027.py:12
+  always @* begin
+    __next__y = 8'bx; // test027.py:11
+    __next__y = __837d19c3; // test027.py:12
+  end
+  assign y = __next__y; // test027.py:11
+endmodule
+
+module gate_1 (
+  input [7:0] a /* test027.py:16 */,
+  input [7:0] b /* test027.py:16 */,
+  input clk /* test027.py:15 */,
+  output reg [7:0] q /* test027.py:17 */
+);
+  wire [31:0] __848aa457; // test027.py:22
+  reg [7:0] __next__q; // test027.py:17
+  wire [7:0] s__a; // test027.py:18
+  wire [7:0] s__b; // test027.py:18
+  wire s__unused; // test027.py:18
+  wire [7:0] s__y; // test027.py:18
+  assign __848aa457 = s__y + 32'sd1; // test027.py:22
+  always @* begin
+    __next__q = q; // test027.py:17
+    __next__q = __848aa457; // test027.py:22
+  end
+  assign s__a = a; // test027.py:19
+  assign s__b = b; // test027.py:20
+  assign s__unused = clk; // test027.py:21
+  always @(posedge clk) begin
+    q <= __next__q; // test027.py:17
+  end
+  gate_1_sub s ( // test027.py:18
+    .a(a),
+    .b(b),
+    .unused(clk),
+    .y(s__y)
+  );
+endmodule
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+import warnings
+from chipy import *
+from chipy import CheckDesign, CheckCombLoops, Simulation
+
+
+def make_design(name):
+    # bit-level dependencies inside one register are not a loop
+    with AddModule(name):
+        a, b = AddInput("a b", 8)
+        cin = AddInput("cin")
+        s = AddOutput("s", 8, async_=True)
+        carry = AddReg("carry", 9, async_=True)
+        carry[0].next = cin
+        for i in range(8):
+            s[i].next = a[i] ^ b[i] ^ carry[i]
+            carry[i+1].next = (a[i] & b[i]) | (carry[i] & (a[i] ^ b[i]))
+
+
+def make_loops():
+    with AddModule("loop_cond"):
+        a = AddInput("a", 4)
+        y = AddOutput("y", 4, async_=True)
+        t = AddReg("t", 4, async_=True)
+        t.next = a
+        with If(y == 3):                        # line 26
+            t.next = 0
+        y.next = t
+
+    with AddModule("loop_self"):
+        a = AddInput("a", 4)
+        y = AddOutput("y", 4, async_=True)
+        y.next = a
+        y[3:2].next = y[1:0]
+        y[1].next = y[3]                        # line 35
+
+    with AddModule("loop_connect"):
+        a = AddInput("a", 4)
+        y = AddOutput("y", 4)
+        w = AddReg("w", 4, async_=True)
+        Connect(y, w)
+        w.next = y + a                          # line 42
+
+    with AddModule("no_loop"):
+        clk = AddInput("clk")
+        y = AddOutput("y", 4, posedge=clk)
+        y.next = y + 1
+
+
+def check_loops():
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        make_loops()
+    messages = [str(w.message) for w in caught if w.category is ChipyLoopWarning]
+    assert messages == [
+        "Combinational loop in module loop_cond: t[0] -> (y == 32'sd3) -> y[0] -> t[0] (test028.py:28, test028.py:27, test028.py:29)",
+        "Combinational loop in module loop_self: y[1] -> (y[3]) -> y[3] -> (y[1:0])[1] -> y[1] (test028.py:36, test028.py:35)",
+        "Combinational loop in module loop_connect: w[0] -> (y + a)[0] -> y[0] -> w[0] (test028.py:43, test028.py:42)"], messages
+
+    assert CheckCombLoops(Module("no_loop")) == []
+    loops = CheckCombLoops(Module("loop_self"))
+    assert len(loops) == 1 and [(name, bit) for name, bit, codeloc in loops[0]][::2] == [("y", 1), ("y", 3)]
+    loops = CheckCombLoops(Module("loop_cond"))
+    assert len(loops) == 1 and [(name, bit) for name, bit, codeloc in loops[0]][::2] == [("t", 0), ("y", 0)]
+    assert [kind for severity, modname, kind, codeloc, message in CheckDesign("loop_connect")] == ["loop"]
+
+
+check_loops()
+ResetDesign()
+
+with warnings.catch_warnings():
+    warnings.simplefilter("error")
+    make_design("gold")
+    make_design("gate_1")
+
+assert CheckCombLoops(Module("gold")) == []
+sim = Simulation(Module("gold"))
+sim.set("a", 200)
+sim.set("b", 100)
+sim.set("cin", 1)
+sim.eval()
+assert sim.get("s") == 45
+
+
+with open("test028.v", "w") as f:
+    print("""
+//@ test-sat-equiv-comb gold gate_1
+""", file=f)
+
+    WriteVerilog(f)
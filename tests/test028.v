@@ -0,0 +1,524 @@
+
+//@ test-sat-equiv-comb gold gate_1
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module gold (
+  input [7:0] a /* test028.py:10 */,
+  input [7:0] b /* test028.py:10 */,
+  input cin /* test028.py:11 */,
+  output [7:0] s /* test028.py:12 */
+);
+  wire __0a780473; // test028.py:16
+  wire __0d4db35a; // test028.py:16
+  wire __0fb9b162_1; // test028.py:16
+  wire __0fb9b162_2; // test028.py:17
+  wire __0fd0af4a; // test028.py:16
+  wire __0fd0af4a_1; // test028.py:17
+  wire __0fd0af4a_2; // test028.py:17
+  wire __12268b7e; // test028.py:16
+  wire __12268b7e_1; // test028.py:17
+  wire __12268b7e_2; // test028.py:17
+  wire __132e992a; // test028.py:17
+  wire __15dd8a71; // test028.py:17
+  wire __27db5aa9; // test028.py:17
+  wire __282b93f7; // test028.py:16
+  wire __2babb7bb; // test028.py:16
+  wire __2babb7bb_1; // test028.py:17
+  wire __2babb7bb_2; // test028.py:17
+  wire __2bc2a993_1; // test028.py:16
+  wire __2bc2a993_2; // test028.py:17
+  wire __365d938f; // test028.py:16
+  wire __365d938f_1; // test028.py:17
+  wire __365d938f_2; // test028.py:17
+  wire __3b8c12f5; // test028.py:17
+  wire __4237b55e; // test028.py:17
+  wire __44029e67; // test028.py:17
+  wire __47269ea8; // test028.py:16
+  wire __47269ea8_1; // test028.py:17
+  wire __47269ea8_2; // test028.py:17
+  wire __474f8080_1; // test028.py:16
+  wire __474f8080_2; // test028.py:17
+  wire __48ac0204; // test028.py:17
+  wire __4e99293d; // test028.py:17
+  wire __4f6cade6; // test028.py:17
+  wire __5ad0ba9c; // test028.py:16
+  wire __5ad0ba9c_1; // test028.py:17
+  wire __5ad0ba9c_2; // test028.py:17
+  wire __5c3e0544; // test028.py:17
+  wire __5ee415c1; // test028.py:17
+  wire __63349871_1; // test028.py:16
+  wire __63349871_2; // test028.py:17
+  wire __635d8659; // test028.py:16
+  wire __635d8659_1; // test028.py:17
+  wire __635d8659_2; // test028.py:17
+  wire __694a34fd; // test028.py:17
+  wire __6b323074; // test028.py:16
+  wire __6efc9e1b; // test028.py:16
+  wire __74b1b2ea; // test028.py:16
+  wire __76213f3a; // test028.py:17
+  wire __79b541d6; // test028.py:17
+  wire __7a8fa359; // test028.py:17
+  wire __7b1eed9b; // test028.py:17
+  wire __7d77ddaa; // test028.py:17
+  wire __7eaba26d; // test028.py:16
+  wire __7eaba26d_1; // test028.py:17
+  wire __7eaba26d_2; // test028.py:17
+  wire __83cae8ba; // test028.py:16
+  wire __83cae8ba_1; // test028.py:17
+  wire __83cae8ba_2; // test028.py:17
+  wire __87e0ed18; // test028.py:16
+  wire __8d53e9e1; // test028.py:16
+  wire __90454884; // test028.py:16
+  wire __90c6fe6b; // test028.py:17
+  wire __932883ef; // test028.py:17
+  wire __94e2eef5; // test028.py:16
+  wire __96f7bb77; // test028.py:17
+  wire __9a592714; // test028.py:17
+  wire __9c0a9cb8; // test028.py:17
+  wire __9e3ccc8e; // test028.py:16
+  wire __9e3ccc8e_1; // test028.py:17
+  wire __9e3ccc8e_2; // test028.py:17
+  wire __9e55d2a6_1; // test028.py:16
+  wire __9e55d2a6_2; // test028.py:17
+  wire __9f861f8c; // test028.py:17
+  wire __a7b1f04b; // test028.py:16
+  wire __a7b1f04b_1; // test028.py:17
+  wire __a7b1f04b_2; // test028.py:17
+  wire __b19a0878; // test028.py:17
+  wire __b3c0eefa; // test028.py:16
+  wire __ba2eca57_1; // test028.py:16
+  wire __ba2eca57_2; // test028.py:17
+  wire __ba47d47f; // test028.py:16
+  wire __ba47d47f_1; // test028.py:17
+  wire __ba47d47f_2; // test028.py:17
+  wire __bf212d80; // test028.py:16
+  wire __c14f3b65; // test028.py:17
+  wire __c6496dfa; // test028.py:16
+  wire __cb3cd958; // test028.py:16
+  wire __cb3cd958_1; // test028.py:17
+  wire __cb3cd958_2; // test028.py:17
+  wire __cde1a706; // test028.py:17
+  wire __d450616e; // test028.py:17
+  wire __d5b0e32c; // test028.py:16
+  wire __d6a3e344_1; // test028.py:16
+  wire __d6a3e344_2; // test028.py:17
+  wire __d6cafd6c; // test028.py:16
+  wire __d6cafd6c_1; // test028.py:17
+  wire __d6cafd6c_2; // test028.py:17
+  wire __d8fefd0d; // test028.py:17
+  wire __e4acc83d; // test028.py:17
+  wire __e595848c; // test028.py:17
+  wire __ea9d078e; // test028.py:16
+  wire __ef47c1a9; // test028.py:16
+  wire __ef47c1a9_1; // test028.py:17
+  wire __ef47c1a9_2; // test028.py:17
+  wire __f1c12cde; // test028.py:17
+  wire __f2b1e59d; // test028.py:16
+  wire __f2b1e59d_1; // test028.py:17
+  wire __f2b1e59d_2; // test028.py:17
+  wire __f2d8fbb5_1; // test028.py:16
+  wire __f2d8fbb5_2; // test028.py:17
+  wire __f58deee0; // test028.py:16
+  wire __fd6fb0bd; // test028.py:17
+  wire [8:0] carry; // test028.py:13
+  reg [8:0] __next__carry; // test028.py:13
+  reg [7:0] __next__s; // test028.py:12
+  assign __0a780473 = __0fd0af4a ^ __365d938f; // test028.py:16
+  assign __0d4db35a = __6b323074 ^ __ba2eca57_1; // test028.py:16
+  assign __0fb9b162_1 = carry[1]; // test028.py:16
+  assign __0fb9b162_2 = carry[1]; // test028.py:17
+  assign __0fd0af4a = a[1]; // test028.py:16
+  assign __0fd0af4a_1 = a[1]; // test028.py:17
+  assign __0fd0af4a_2 = a[1]; // test028.py:17
+  assign __12268b7e = b[0]; // test028.py:16
+  assign __12268b7e_1 = b[0]; // test028.py:17
+  assign __12268b7e_2 = b[0]; // test028.py:17
+  assign __132e992a = __4e99293d | __3b8c12f5; // test028.py:17
+  assign __15dd8a71 = __96f7bb77 | __694a34fd; // test028.py:17
+  assign __27db5aa9 = __932883ef | __9c0a9cb8; // test028.py:17
+  assign __282b93f7 = __635d8659 ^ __5ad0ba9c; // test028.py:16
+  assign __2babb7bb = a[0]; // test028.py:16
+  assign __2babb7bb_1 = a[0]; // test028.py:17
+  assign __2babb7bb_2 = a[0]; // test028.py:17
+  assign __2bc2a993_1 = carry[0]; // test028.py:16
+  assign __2bc2a993_2 = carry[0]; // test028.py:17
+  assign __365d938f = b[1]; // test028.py:16
+  assign __365d938f_1 = b[1]; // test028.py:17
+  assign __365d938f_2 = b[1]; // test028.py:17
+  assign __3b8c12f5 = __474f8080_2 & __4237b55e; // test028.py:17
+  assign __4237b55e = __47269ea8_2 ^ __7eaba26d_2; // test028.py:17
+  assign __44029e67 = __9e3ccc8e_2 ^ __a7b1f04b_2; // test028.py:17
+  assign __47269ea8 = a[3]; // test028.py:16
+  assign __47269ea8_1 = a[3]; // test028.py:17
+  assign __47269ea8_2 = a[3]; // test028.py:17
+  assign __474f8080_1 = carry[3]; // test028.py:16
+  assign __474f8080_2 = carry[3]; // test028.py:17
+  assign __48ac0204 = __9e3ccc8e_1 & __a7b1f04b_1; // test028.py:17
+  assign __4e99293d = __47269ea8_1 & __7eaba26d_1; // test028.py:17
+  assign __4f6cade6 = __2bc2a993_2 & __76213f3a; // test028.py:17
+  assign __5ad0ba9c = b[2]; // test028.py:16
+  assign __5ad0ba9c_1 = b[2]; // test028.py:17
+  assign __5ad0ba9c_2 = b[2]; // test028.py:17
+  assign __5c3e0544 = __d450616e | __b19a0878; // test028.py:17
+  assign __5ee415c1 = __ba2eca57_2 & __fd6fb0bd; // test028.py:17
+  assign __63349871_1 = carry[2]; // test028.py:16
+  assign __63349871_2 = carry[2]; // test028.py:17
+  assign __635d8659 = a[2]; // test028.py:16
+  assign __635d8659_1 = a[2]; // test028.py:17
+  assign __635d8659_2 = a[2]; // test028.py:17
+  assign __694a34fd = __f2d8fbb5_2 & __9a592714; // test028.py:17
+  assign __6b323074 = __ba47d47f ^ __83cae8ba; // test028.py:16
+  assign __6efc9e1b = __74b1b2ea ^ __9e55d2a6_1; // test028.py:16
+  assign __74b1b2ea = __9e3ccc8e ^ __a7b1f04b; // test028.py:16
+  assign __76213f3a = __2babb7bb_2 ^ __12268b7e_2; // test028.py:17
+  assign __79b541d6 = __7a8fa359 | __4f6cade6; // test028.py:17
+  assign __7a8fa359 = __2babb7bb_1 & __12268b7e_1; // test028.py:17
+  assign __7b1eed9b = __d6a3e344_2 & __cde1a706; // test028.py:17
+  assign __7d77ddaa = __c14f3b65 | __7b1eed9b; // test028.py:17
+  assign __7eaba26d = b[3]; // test028.py:16
+  assign __7eaba26d_1 = b[3]; // test028.py:17
+  assign __7eaba26d_2 = b[3]; // test028.py:17
+  assign __83cae8ba = b[4]; // test028.py:16
+  assign __83cae8ba_1 = b[4]; // test028.py:17
+  assign __83cae8ba_2 = b[4]; // test028.py:17
+  assign __87e0ed18 = __47269ea8 ^ __7eaba26d; // test028.py:16
+  assign __8d53e9e1 = __282b93f7 ^ __63349871_1; // test028.py:16
+  assign __90454884 = __2babb7bb ^ __12268b7e; // test028.py:16
+  assign __90c6fe6b = __9e55d2a6_2 & __44029e67; // test028.py:17
+  assign __932883ef = __0fd0af4a_1 & __365d938f_1; // test028.py:17
+  assign __94e2eef5 = __87e0ed18 ^ __474f8080_1; // test028.py:16
+  assign __96f7bb77 = __f2b1e59d_1 & __cb3cd958_1; // test028.py:17
+  assign __9a592714 = __f2b1e59d_2 ^ __cb3cd958_2; // test028.py:17
+  assign __9c0a9cb8 = __0fb9b162_2 & __9f861f8c; // test028.py:17
+  assign __9e3ccc8e = a[5]; // test028.py:16
+  assign __9e3ccc8e_1 = a[5]; // test028.py:17
+  assign __9e3ccc8e_2 = a[5]; // test028.py:17
+  assign __9e55d2a6_1 = carry[5]; // test028.py:16
+  assign __9e55d2a6_2 = carry[5]; // test028.py:17
+  assign __9f861f8c = __0fd0af4a_2 ^ __365d938f_2; // test028.py:17
+  assign __a7b1f04b = b[5]; // test028.py:16
+  assign __a7b1f04b_1 = b[5]; // test028.py:17
+  assign __a7b1f04b_2 = b[5]; // test028.py:17
+  assign __b19a0878 = __63349871_2 & __d8fefd0d; // test028.py:17
+  assign __b3c0eefa = __d5b0e32c ^ __f2d8fbb5_1; // test028.py:16
+  assign __ba2eca57_1 = carry[4]; // test028.py:16
+  assign __ba2eca57_2 = carry[4]; // test028.py:17
+  assign __ba47d47f = a[4]; // test028.py:16
+  assign __ba47d47f_1 = a[4]; // test028.py:17
+  assign __ba47d47f_2 = a[4]; // test028.py:17
+  assign __bf212d80 = __0a780473 ^ __0fb9b162_1; // test028.py:16
+  assign __c14f3b65 = __d6cafd6c_1 & __ef47c1a9_1; // test028.py:17
+  assign __c6496dfa = __ea9d078e ^ __d6a3e344_1; // test028.py:16
+  assign __cb3cd958 = b[6]; // test028.py:16
+  assign __cb3cd958_1 = b[6]; // test028.py:17
+  assign __cb3cd958_2 = b[6]; // test028.py:17
+  assign __cde1a706 = __d6cafd6c_2 ^ __ef47c1a9_2; // test028.py:17
+  assign __d450616e = __635d8659_1 & __5ad0ba9c_1; // test028.py:17
+  assign __d5b0e32c = __f2b1e59d ^ __cb3cd958; // test028.py:16
+  assign __d6a3e344_1 = carry[7]; // test028.py:16
+  assign __d6a3e344_2 = carry[7]; // test028.py:17
+  assign __d6cafd6c = a[7]; // test028.py:16
+  assign __d6cafd6c_1 = a[7]; // test028.py:17
+  assign __d6cafd6c_2 = a[7]; // test028.py:17
+  assign __d8fefd0d = __635d8659_2 ^ __5ad0ba9c_2; // test028.py:17
+  assign __e4acc83d = __f1c12cde | __5ee415c1; // test028.py:17
+  assign __e595848c = __48ac0204 | __90c6fe6b; // test028.py:17
+  assign __ea9d078e = __d6cafd6c ^ __ef47c1a9; // test028.py:16
+  assign __ef47c1a9 = b[7]; // test028.py:16
+  assign __ef47c1a9_1 = b[7]; // test028.py:17
+  assign __ef47c1a9_2 = b[7]; // test028.py:17
+  assign __f1c12cde = __ba47d47f_1 & __83cae8ba_1; // test028.py:17
+  assign __f2b1e59d = a[6]; // test028.py:16
+  assign __f2b1e59d_1 = a[6]; // test028.py:17
+  assign __f2b1e59d_2 = a[6]; // test028.py:17
+  assign __f2d8fbb5_1 = carry[6]; // test028.py:16
+  assign __f2d8fbb5_2 = carry[6]; // test028.py:17
+  assign __f58deee0 = __90454884 ^ __2bc2a993_1; // test028.py:16
+  assign __fd6fb0bd = __ba47d47f_2 ^ __83cae8ba_2; // test028.py:17
+  always @* begin
+    __next__s = 8'bx; // test028.py:12
+    __next__s[0] = __f58deee0; // test028.py:16
+    __next__s[1] = __bf212d80; // test028.py:16
+    __next__s[2] = __8d53e9e1; // test028.py:16
+    __next__s[3] = __94e2eef5; // test028.py:16
+    __next__s[4] = __0d4db35a; // test028.py:16
+    __next__s[5] = __6efc9e1b; // test028.py:16
+    __next__s[6] = __b3c0eefa; // test028.py:16
+    __next__s[7] = __c6496dfa; // test028.py:16
+  end
+  always @* begin
+    __next__carry = 9'bx; // test028.py:13
+    __next__carry[0] = cin; // test028.py:14
+    __next__carry[1] = __79b541d6; // test028.py:17
+    __next__carry[2] = __27db5aa9; // test028.py:17
+    __next__carry[3] = __5c3e0544; // test028.py:17
+    __next__carry[4] = __132e992a; // test028.py:17
+    __next__carry[5] = __e4acc83d; // test028.py:17
+    __next__carry[6] = __e595848c; // test028.py:17
+    __next__carry[7] = __15dd8a71; // test028.py:17
+    __next__carry[8] = __7d77ddaa; // test028.py:17
+  end
+  assign s = __next__s; // test028.py:12
+  assign carry = __next__carry; // test028.py:13
+endmodule
+
+module gate_1 (
+  input [7:0] a /* test028.py:10 */,
+  input [7:0] b /* test028.py:10 */,
+  input cin /* test028.py:11 */,
+  output [7:0] s /* test028.py:12 */
+);
+  wire __0a780473; // test028.py:16
+  wire __0d4db35a; // test028.py:16
+  wire __0fb9b162_1; // test028.py:16
+  wire __0fb9b162_2; // test028.py:17
+  wire __0fd0af4a; // test028.py:16
+  wire __0fd0af4a_1; // test028.py:17
+  wire __0fd0af4a_2; // test028.py:17
+  wire __12268b7e; // test028.py:16
+  wire __12268b7e_1; // test028.py:17
+  wire __12268b7e_2; // test028.py:17
+  wire __132e992a; // test028.py:17
+  wire __15dd8a71; // test028.py:17
+  wire __27db5aa9; // test028.py:17
+  wire __282b93f7; // test028.py:16
+  wire __2babb7bb; // test028.py:16
+  wire __2babb7bb_1; // test028.py:17
+  wire __2babb7bb_2; // test028.py:17
+  wire __2bc2a993_1; // test028.py:16
+  wire __2bc2a993_2; // test028.py:17
+  wire __365d938f; // test028.py:16
+  wire __365d938f_1; // test028.py:17
+  wire __365d938f_2; // test028.py:17
+  wire __3b8c12f5; // test028.py:17
+  wire __4237b55e; // test028.py:17
+  wire __44029e67; // test028.py:17
+  wire __47269ea8; // test028.py:16
+  wire __47269ea8_1; // test028.py:17
+  wire __47269ea8_2; // test028.py:17
+  wire __474f8080_1; // test028.py:16
+  wire __474f8080_2; // test028.py:17
+  wire __48ac0204; // test028.py:17
+  wire __4e99293d; // test028.py:17
+  wire __4f6cade6; // test028.py:17
+  wire __5ad0ba9c; // test028.py:16
+  wire __5ad0ba9c_1; // test028.py:17
+  wire __5ad0ba9c_2; // test028.py:17
+  wire __5c3e0544; // test028.py:17
+  wire __5ee415c1; // test028.py:17
+  wire __63349871_1; // test028.py:16
+  wire __63349871_2; // test028.py:17
+  wire __635d8659; // test028.py:16
+  wire __635d8659_1; // test028.py:17
+  wire __635d8659_2; // test028.py:17
+  wire __694a34fd; // test028.py:17
+  wire __6b323074; // test028.py:16
+  wire __6efc9e1b; // test028.py:16
+  wire __74b1b2ea; // test028.py:16
+  wire __76213f3a; // test028.py:17
+  wire __79b541d6; // test028.py:17
+  wire __7a8fa359; // test028.py:17
+  wire __7b1eed9b; // test028.py:17
+  wire __7d77ddaa; // test028.py:17
+  wire __7eaba26d; // test028.py:16
+  wire __7eaba26d_1; // test028.py:17
+  wire __7eaba26d_2; // test028.py:17
+  wire __83cae8ba; // test028.py:16
+  wire __83cae8ba_1; // test028.py:17
+  wire __83cae8ba_2; // test028.py:17
+  wire __87e0ed18; // test028.py:16
+  wire __8d53e9e1; // test028.py:16
+  wire __90454884; // test028.py:16
+  wire __90c6fe6b; // test028.py:17
+  wire __932883ef; // test028.py:17
+  wire __94e2eef5; // test028.py:16
+  wire __96f7bb77; // test028.py:17
+  wire __9a592714; // test028.py:17
+  wire __9c0a9cb8; // test028.py:17
+  wire __9e3ccc8e; // test028.py:16
+  wire __9e3ccc8e_1; // test028.py:17
+  wire __9e3ccc8e_2; // test028.py:17
+  wire __9e55d2a6_1; // test028.py:16
+  wire __9e55d2a6_2; // test028.py:17
+  wire __9f861f8c; // test028.py:17
+  wire __a7b1f04b; // test028.py:16
+  wire __a7b1f04b_1; // test028.py:17
+  wire __a7b1f04b_2; // test028.py:17
+  wire __b19a0878; // test028.py:17
+  wire __b3c0eefa; // test028.py:16
+  wire __ba2eca57_1; // test028.py:16
+  wire __ba2eca57_2; // test028.py:17
+  wire __ba47d47f; // test028.py:16
+  wire __ba47d47f_1; // test028.py:17
+  wire __ba47d47f_2; // test028.py:17
+  wire __bf212d80; // test028.py:16
+  wire __c14f3b65; // test028.py:17
+  wire __c6496dfa; // test028.py:16
+  wire __cb3cd958; // test028.py:16
+  wire __cb3cd958_1; // test028.py:17
+  wire __cb3cd958_2; // test028.py:17
+  wire __cde1a706; // test028.py:17
+  wire __d450616e; // test028.py:17
+  wire __d5b0e32c; // test028.py:16
+  wire __d6a3e344_1; // test028.py:16
+  wire __d6a3e344_2; // test028.py:17
+  wire __d6cafd6c; // test028.py:16
+  wire __d6cafd6c_1; // test028.py:17
+  wire __d6cafd6c_2; // test028.py:17
+  wire __d8fefd0d; // test028.py:17
+  wire __e4acc83d; // test028.py:17
+  wire __e595848c; // test028.py:17
+  wire __ea9d078e; // test028.py:16
+  wire __ef47c1a9; // test028.py:16
+  wire __ef47c1a9_1; // test028.py:17
+  wire __ef47c1a9_2; // test028.py:17
+  wire __f1c12cde; // test028.py:17
+  wire __f2b1e59d; // test028.py:16
+  wire __f2b1e59d_1; // test028.py:17
+  wire __f2b1e59d_2; // test028.py:17
+  wire __f2d8fbb5_1; // test028.py:16
+  wire __f2d8fbb5_2; // test028.py:17
+  wire __f58deee0; // test028.py:16
+  wire __fd6fb0bd; // test028.py:17
+  wire [8:0] carry; // test028.py:13
+  reg [8:0] __next__carry; // test028.py:13
+  reg [7:0] __next__s; // test028.py:12
+  assign __0a780473 = __0fd0af4a ^ __365d938f; // test028.py:16
+  assign __0d4db35a = __6b323074 ^ __ba2eca57_1; // test028.py:16
+  assign __0fb9b162_1 = carry[1]; // test028.py:16
+  assign __0fb9b162_2 = carry[1]; // test028.py:17
+  assign __0fd0af4a = a[1]; // test028.py:16
+  assign __0fd0af4a_1 = a[1]; // test028.py:17
+  assign __0fd0af4a_2 = a[1]; // test028.py:17
+  assign __12268b7e = b[0]; // test028.py:16
+  assign __12268b7e_1 = b[0]; // test028.py:17
+  assign __12268b7e_2 = b[0]; // test028.py:17
+  assign __132e992a = __4e99293d | __3b8c12f5; // test028.py:17
+  assign __15dd8a71 = __96f7bb77 | __694a34fd; // test028.py:17
+  assign __27db5aa9 = __932883ef | __9c0a9cb8; // test028.py:17
+  assign __282b93f7 = __635d8659 ^ __5ad0ba9c; // test028.py:16
+  assign __2babb7bb = a[0]; // test028.py:16
+  assign __2babb7bb_1 = a[0]; // test028.py:17
+  assign __2babb7bb_2 = a[0]; // test028.py:17
+  assign __2bc2a993_1 = carry[0]; // test028.py:16
+  assign __2bc2a993_2 = carry[0]; // test028.py:17
+  assign __365d938f = b[1]; // test028.py:16
+  assign __365d938f_1 = b[1]; // test028.py:17
+  assign __365d938f_2 = b[1]; // test028.py:17
+  assign __3b8c12f5 = __474f8080_2 & __4237b55e; // test028.py:17
+  assign __4237b55e = __47269ea8_2 ^ __7eaba26d_2; // test028.py:17
+  assign __44029e67 = __9e3ccc8e_2 ^ __a7b1f04b_2; // test028.py:17
+  assign __47269ea8 = a[3]; // test028.py:16
+  assign __47269ea8_1 = a[3]; // test028.py:17
+  assign __47269ea8_2 = a[3]; // test028.py:17
+  assign __474f8080_1 = carry[3]; // test028.py:16
+  assign __474f8080_2 = carry[3]; // test028.py:17
+  assign __48ac0204 = __9e3ccc8e_1 & __a7b1f04b_1; // test028.py:17
+  assign __4e99293d = __47269ea8_1 & __7eaba26d_1; // test028.py:17
+  assign __4f6cade6 = __2bc2a993_2 & __76213f3a; // test028.py:17
+  assign __5ad0ba9c = b[2]; // test028.py:16
+  assign __5ad0ba9c_1 = b[2]; // test028.py:17
+  assign __5ad0ba9c_2 = b[2]; // test028.py:17
+  assign __5c3e0544 = __d450616e | __b19a0878; // test028.py:17
+  assign __5ee415c1 = __ba2eca57_2 & __fd6fb0bd; // test028.py:17
+  assign __63349871_1 = carry[2]; // test028.py:16
+  assign __63349871_2 = carry[2]; // test028.py:17
+  assign __635d8659 = a[2]; // test028.py:16
+  assign __635d8659_1 = a[2]; // test028.py:17
+  assign __635d8659_2 = a[2]; // test028.py:17
+  assign __694a34fd = __f2d8fbb5_2 & __9a592714; // test028.py:17
+  assign __6b323074 = __ba47d47f ^ __83cae8ba; // test028.py:16
+  assign __6efc9e1b = __74b1b2ea ^ __9e55d2a6_1; // test028.py:16
+  assign __74b1b2ea = __9e3ccc8e ^ __a7b1f04b; // test028.py:16
+  assign __76213f3a = __2babb7bb_2 ^ __12268b7e_2; // test028.py:17
+  assign __79b541d6 = __7a8fa359 | __4f6cade6; // test028.py:17
+  assign __7a8fa359 = __2babb7bb_1 & __12268b7e_1; // test028.py:17
+  assign __7b1eed9b = __d6a3e344_2 & __cde1a706; // test028.py:17
+  assign __7d77ddaa = __c14f3b65 | __7b1eed9b; // test028.py:17
+  assign __7eaba26d = b[3]; // test028.py:16
+  assign __7eaba26d_1 = b[3]; // test028.py:17
+  assign __7eaba26d_2 = b[3]; // test028.py:17
+  assign __83cae8ba = b[4]; // test028.py:16
+  assign __83cae8ba_1 = b[4]; // test028.py:17
+  assign __83cae8ba_2 = b[4]; // test028.py:17
+  assign __87e0ed18 = __47269ea8 ^ __7eaba26d; // test028.py:16
+  assign __8d53e9e1 = __282b93f7 ^ __63349871_1; // test028.py:16
+  assign __90454884 = __2babb7bb ^ __12268b7e; // test028.py:16
+  assign __90c6fe6b = __9e55d2a6_2 & __44029e67; // test028.py:17
+  assign __932883ef = __0fd0af4a_1 & __365d938f_1; // test028.py:17
+  assign __94e2eef5 = __87e0ed18 ^ __474f8080_1; // test028.py:16
+  assign __96f7bb77 = __f2b1e59d_1 & __cb3cd958_1; // test028.py:17
+  assign __9a592714 = __f2b1e59d_2 ^ __cb3cd958_2; // test028.py:17
+  assign __9c0a9cb8 = __0fb9b162_2 & __9f861f8c; // test028.py:17
+  assign __9e3ccc8e = a[5]; // test028.py:16
+  assign __9e3ccc8e_1 = a[5]; // test028.py:17
+  assign __9e3ccc8e_2 = a[5]; // test028.py:17
+  assign __9e55d2a6_1 = carry[5]; // test028.py:16
+  assign __9e55d2a6_2 = carry[5]; // test028.py:17
+  assign __9f861f8c = __0fd0af4a_2 ^ __365d938f_2; // test028.py:17
+  assign __a7b1f04b = b[5]; // test028.py:16
+  assign __a7b1f04b_1 = b[5]; // test028.py:17
+  assign __a7b1f04b_2 = b[5]; // test028.py:17
+  assign __b19a0878 = __63349871_2 & __d8fefd0d; // test028.py:17
+  assign __b3c0eefa = __d5b0e32c ^ __f2d8fbb5_1; // test028.py:16
+  assign __ba2eca57_1 = carry[4]; // test028.py:16
+  assign __ba2eca57_2 = carry[4]; // test028.py:17
+  assign __ba47d47f = a[4]; // test028.py:16
+  assign __ba47d47f_1 = a[4]; // test028.py:17
+  assign __ba47d47f_2 = a[4]; // test028.py:17
+  assign __bf212d80 = __0a780473 ^ __0fb9b162_1; // test028.py:16
+  assign __c14f3b65 = __d6cafd6c_1 & __ef47c1a9_1; // test028.py:17
+  assign __c6496dfa = __ea9d078e ^ __d6a3e344_1; // test028.py:16
+  assign __cb3cd958 = b[6]; // test028.py:16
+  assign __cb3cd958_1 = b[6]; // test028.py:17
+  assign __cb3cd958_2 = b[6]; // test028.py:17
+  assign __cde1a706 = __d6cafd6c_2 ^ __ef47c1a9_2; // test028.py:17
+  assign __d450616e = __635d8659_1 & __5ad0ba9c_1; // test028.py:17
+  assign __d5b0e32c = __f2b1e59d ^ __cb3cd958; // test028.py:16
+  assign __d6a3e344_1 = carry[7]; // test028.py:16
+  assign __d6a3e344_2 = carry[7]; // test028.py:17
+  assign __d6cafd6c = a[7]; // test028.py:16
+  assign __d6cafd6c_1 = a[7]; // test028.py:17
+  assign __d6cafd6c_2 = a[7]; // test028.py:17
+  assign __d8fefd0d = __635d8659_2 ^ __5ad0ba9c_2; // test028.py:17
+  assign __e4acc83d = __f1c12cde | __5ee415c1; // test028.py:17
+  assign __e595848c = __48ac0204 | __90c6fe6b; // test028.py:17
+  assign __ea9d078e = __d6cafd6c ^ __ef47c1a9; // test028.py:16
+  assign __ef47c1a9 = b[7]; // test028.py:16
+  assign __ef47c1a9_1 = b[7]; // test028.py:17
+  assign __ef47c1a9_2 = b[7]; // test028.py:17
+  assign __f1c12cde = __ba47d47f_1 & __83cae8ba_1; // test028.py:17
+  assign __f2b1e59d = a[6]; // test028.py:16
+  assign __f2b1e59d_1 = a[6]; // test028.py:17
+  assign __f2b1e59d_2 = a[6]; // test028.py:17
+  assign __f2d8fbb5_1 = carry[6]; // test028.py:16
+  assign __f2d8fbb5_2 = carry[6]; // test028.py:17
+  assign __f58deee0 = __90454884 ^ __2bc2a993_1; // test028.py:16
+  assign __fd6fb0bd = __ba47d47f_2 ^ __83cae8ba_2; // test028.py:17
+  always @* begin
+    __next__s = 8'bx; // test028.py:12
+    __next__s[0] = __f58deee0; // test028.py:16
+    __next__s[1] = __bf212d80; // test028.py:16
+    __next__s[2] = __8d53e9e1; // test028.py:16
+    __next__s[3] = __94e2eef5; // test028.py:16
+    __next__s[4] = __0d4db35a; // test028.py:16
+    __next__s[5] = __6efc9e1b; // test028.py:16
+    __next__s[6] = __b3c0eefa; // test028.py:16
+    __next__s[7] = __c6496dfa; // test028.py:16
+  end
+  always @* begin
+    __next__carry = 9'bx; // test028.py:13
+    __next__carry[0] = cin; // test028.py:14
+    __next__carry[1] = __79b541d6; // test028.py:17
+    __next__carry[2] = __27db5aa9; // test028.py:17
+    __next__carry[3] = __5c3e0544; // test028.py:17
+    __next__carry[4] = __132e992a; // test028.py:17
+    __next__carry[5] = __e4acc83d; // test028.py:17
+    __next__carry[6] = __e595848c; // test028.py:17
+    __next__carry[7] = __15dd8a71; // test028.py:17
+    __next__carry[8] = __7d77ddaa; // test028.py:17
+  end
+  assign s = __next__s; // test028.py:12
+  assign carry = __next__carry; // test028.py:13
+endmodule
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+
+from chipy import *
+from chipy import Simulation
+from chipy.Chipy import ChipyMinimalConst, ChipyConstValue
+
+
+def make_outputs():
+    a = AddInput("a", 8)
+    b = AddInput("b", 4)
+    sa = AddInput("sa", -6)
+    sb = AddInput("sb", -4)
+    widths = [("y_sum", 9), ("y_prod", 12), ("y_inc", 9), ("y_cmp", 1), ("y_sat", 8), ("y_dsat", 8),
+            ("y_ssum", -7), ("y_sprod", -10), ("y_ssat", -6)]
+    return (a, b, sa, sb) + tuple(AddOutput(name, width, async_=True) for name, width in widths)
+
+
+def make_gold(name):
+    with AddModule(name):
+        a, b, sa, sb, y_sum, y_prod, y_inc, y_cmp, y_sat, y_dsat, y_ssum, y_sprod, y_ssat = make_outputs()
+
+        with WidthMode("full"):
+            s = a + b
+            p = a * b
+            i = a + 1
+            c = a == 200
+            ss = sa + sb
+            sp = sa * sb
+            assert (s.width, p.width, i.width, ss.width, sp.width) == (9, 12, 9, 7, 10)
+            assert ss.signed and sp.signed and not s.signed
+            d = a - b
+            assert d.width == 9 and d.signed
+            assert [arg.width for arg in c.args] == [8, 8]
+            y_sum.next = s
+            y_prod.next = p
+            y_inc.next = i
+            y_cmp.next = c
+            y_ssum.next = ss
+            y_sprod.next = sp
+
+        with WidthMode("sat"):
+            y_sat.next = a + b
+            y_dsat.next = a - b
+            y_ssat.next = sa + sb
+            assert (a + b).width == 8 and (sa + sb).width == 6 and (sa + sb).signed
+
+        assert (a + b).width == 8 and (a + 1).width == 32
+
+
+def make_gate(name):
+    with AddModule(name):
+        a, b, sa, sb, y_sum, y_prod, y_inc, y_cmp, y_sat, y_dsat, y_ssum, y_sprod, y_ssat = make_outputs()
+
+        y_sum.next = Sig(a, 9) + Sig(b, 9)
+        y_prod.next = Sig(a, 12) * Sig(b, 12)
+        y_inc.next = Sig(a, 9) + Sig(1, 9)
+        y_cmp.next = a == 200
+        y_ssum.next = Sig(sa, -7) + Sig(sb, -7)
+        y_sprod.next = Sig(sa, -10) * Sig(sb, -10)
+
+        t = Sig(a, 9) + Sig(b, 9)
+        y_sat.next = t
+        with If(t > 255):
+            y_sat.next = 255
+
+        y_dsat.next = a - b
+        with If(a < b):
+            y_dsat.next = 0
+
+        t = Sig(sa, -7) + Sig(sb, -7)
+        y_ssat.next = t
+        with If(t[6:5] == 1):
+            y_ssat.next = 31
+        with If(t[6:5] == 2):
+            y_ssat.next = Sig(32, 6)
+
+
+make_gold("gold")
+make_gate("gate_1")
+
+with WidthMode("wrap"):
+    assert ChipyMinimalConst(5).width == 3 and ChipyMinimalConst(5, True).width == 4
+    assert ChipyMinimalConst(-8).width == 4 and ChipyConstValue(ChipyMinimalConst(-8), 8) == 0xf8
+
+try:
+    with WidthMode("fast"):
+        pass
+    assert False
+except ChipyError:
+    pass
+
+sim = Simulation(Module("gold"))
+for a, b, sa, sb in [(250, 10, -30, -8), (3, 9, 31, 7), (200, 0, -1, 1)]:
+    sim.set("a", a)
+    sim.set("b", b)
+    sim.set("sa", sa & 63)
+    sim.set("sb", sb & 15)
+    sim.eval()
+    assert sim.get("y_sum") == a + b and sim.get("y_prod") == a * b
+    assert sim.get("y_sat") == min(a + b, 255) and sim.get("y_dsat") == max(a - b, 0)
+    assert sim.get("y_ssum") == (sa + sb) & 127 and sim.get("y_sprod") == (sa * sb) & 1023
+    assert sim.get("y_ssat") == min(max(sa + sb, -32), 31) & 63
+    assert sim.get("y_cmp") == (a == 200)
+
+
+with open("test029.v", "w") as f:
+    print("""
+//@ test-sat-equiv-comb gold gate_1
+""", file=f)
+
+    WriteVerilog(f)
@@ -0,0 +1,266 @@
+
+//@ test-sat-equiv-comb gold gate_1
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module gold (
+  input [7:0] a /* test029.py:8 */,
+  input [3:0] b /* test029.py:9 */,
+  input signed [5:0] sa /* test029.py:10 */,
+  input signed [3:0] sb /* test029.py:11 */,
+  output y_cmp /* test029.py:14 */,
+  output [7:0] y_dsat /* test029.py:14 */,
+  output [8:0] y_inc /* test029.py:14 */,
+  output [11:0] y_prod /* test029.py:14 */,
+  output [7:0] y_sat /* test029.py:14 */,
+  output signed [9:0] y_sprod /* test029.py:14 */,
+  output signed [5:0] y_ssat /* test029.py:14 */,
+  output signed [6:0] y_ssum /* test029.py:14 */,
+  output [8:0] y_sum /* test029.py:14 */
+);
+  wire __032c2eee; // test029.py:39
+  wire [7:0] __0760aac2; // test029.py:40
+  wire __1f22e7b6; // test029.py:41
+  wire [5:0] __22620f7b; // test029.py:41
+  wire [5:0] __25f10a18; // test029.py:41
+  wire [5:0] __3ad945d5; // test029.py:41
+  wire __4857bfab; // test029.py:41
+  wire [7:0] __49a53337; // test029.py:39
+  wire __4aa8a51e; // test029.py:41
+  wire __4de9b71b; // test029.py:40
+  wire [11:0] __5bbe62e5; // test029.py:23
+  wire __5bff8a44; // test029.py:39
+  wire __60cdadf1; // test029.py:41
+  wire [7:0] __78c401f7; // test029.py:39
+  wire [8:0] __837d19c3; // test029.py:40
+  wire [9:0] __9ca0dbf3; // test029.py:27
+  wire [6:0] __9d1526ee; // test029.py:26
+  wire [6:0] __9d1526ee_1; // test029.py:41
+  wire [8:0] __bca3c472; // test029.py:22
+  wire [8:0] __bca3c472_1; // test029.py:39
+  wire [8:0] __c0256b1c; // test029.py:24
+  wire [7:0] __c9af66e7; // test029.py:40
+  wire [5:0] __cb30cc08; // test029.py:41
+  wire __daca115e; // test029.py:41
+  wire __e1834c99; // test029.py:25
+  wire [1:0] __f1e7429d; // test029.py:41
+  reg __next__y_cmp; // test029.py:14
+  reg [7:0] __next__y_dsat; // test029.py:14
+  reg [8:0] __next__y_inc; // test029.py:14
+  reg [11:0] __next__y_prod; // test029.py:14
+  reg [7:0] __next__y_sat; // test029.py:14
+  reg [9:0] __next__y_sprod; // test029.py:14
+  reg [5:0] __next__y_ssat; // test029.py:14
+  reg [6:0] __next__y_ssum; // test029.py:14
+  reg [8:0] __next__y_sum; // test029.py:14
+  assign __032c2eee = __bca3c472_1[8:8]; // test029.py:39
+  assign __0760aac2 = __837d19c3[7:0]; // test029.py:40
+  assign __1f22e7b6 = __4857bfab & __4aa8a51e; // test029.py:41
+  assign __22620f7b = __1f22e7b6 ? __25f10a18 : __cb30cc08; // test029.py:41
+  assign __25f10a18 = __daca115e ? 6'd32 : 6'd31; // test029.py:41
+  assign __3ad945d5 = __22620f7b; // test029.py:41
+  assign __4857bfab = | __f1e7429d; // test029.py:41
+  assign __49a53337 = __bca3c472_1[7:0]; // test029.py:39
+  assign __4aa8a51e = ~ __60cdadf1; // test029.py:41
+  assign __4de9b71b = __837d19c3[8]; // test029.py:40
+  assign __5bbe62e5 = a * b; // test029.py:23
+  assign __5bff8a44 = | __032c2eee; // test029.py:39
+  assign __60cdadf1 = & __f1e7429d; // test029.py:41
+  assign __78c401f7 = __5bff8a44 ? 8'd255 : __49a53337; // test029.py:39
+  assign __837d19c3 = a - b; // test029.py:40
+  assign __9ca0dbf3 = sa * sb; // test029.py:27
+  assign __9d1526ee = sa + sb; // test029.py:26
+  assign __9d1526ee_1 = sa + sb; // test029.py:41
+  assign __bca3c472 = a + b; // test029.py:22
+  assign __bca3c472_1 = a + b; // test029.py:39
+  assign __c0256b1c = a + 1'd1; // test029.py:24
+  assign __c9af66e7 = __4de9b71b ? 8'd0 : __0760aac2; // test029.py:40
+  assign __cb30cc08 = __9d1526ee_1[5:0]; // test029.py:41
+  assign __daca115e = __9d1526ee_1[6]; // test029.py:41
+  assign __e1834c99 = a == 8'd200; // test029.py:25
+  assign __f1e7429d = __9d1526ee_1[6:5]; // test029.py:41
+  always @* begin
+    __next__y_sum = 9'bx; // test029.py:14
+    __next__y_sum = __bca3c472; // test029.py:31
+  end
+  always @* begin
+    __next__y_prod = 12'bx; // test029.py:14
+    __next__y_prod = __5bbe62e5; // test029.py:32
+  end
+  always @* begin
+    __next__y_inc = 9'bx; // test029.py:14
+    __next__y_inc = __c0256b1c; // test029.py:33
+  end
+  always @* begin
+    __next__y_cmp = 1'bx; // test029.py:14
+    __next__y_cmp = __e1834c99; // test029.py:34
+  end
+  always @* begin
+    __next__y_sat = 8'bx; // test029.py:14
+    __next__y_sat = __78c401f7; // test029.py:39
+  end
+  always @* begin
+    __next__y_dsat = 8'bx; // test029.py:14
+    __next__y_dsat = __c9af66e7; // test029.py:40
+  end
+  always @* begin
+    __next__y_ssum = 7'bx; // test029.py:14
+    __next__y_ssum = __9d1526ee; // test029.py:35
+  end
+  always @* begin
+    __next__y_sprod = 10'bx; // test029.py:14
+    __next__y_sprod = __9ca0dbf3; // test029.py:36
+  end
+  always @* begin
+    __next__y_ssat = 6'bx; // test029.py:14
+    __next__y_ssat = __3ad945d5; // test029.py:41
+  end
+  assign y_sum = __next__y_sum; // test029.py:14
+  assign y_prod = __next__y_prod; // test029.py:14
+  assign y_inc = __next__y_inc; // test029.py:14
+  assign y_cmp = __next__y_cmp; // test029.py:14
+  assign y_sat = __next__y_sat; // test029.py:14
+  assign y_dsat = __next__y_dsat; // test029.py:14
+  assign y_ssum = __next__y_ssum; // test029.py:14
+  assign y_sprod = __next__y_sprod; // test029.py:14
+  assign y_ssat = __next__y_ssat; // test029.py:14
+endmodule
+
+module gate_1 (
+  input [7:0] a /* test029.py:8 */,
+  input [3:0] b /* test029.py:9 */,
+  input signed [5:0] sa /* test029.py:10 */,
+  input signed [3:0] sb /* test029.py:11 */,
+  output y_cmp /* test029.py:14 */,
+  output [7:0] y_dsat /* test029.py:14 */,
+  output [8:0] y_inc /* test029.py:14 */,
+  output [11:0] y_prod /* test029.py:14 */,
+  output [7:0] y_sat /* test029.py:14 */,
+  output signed [9:0] y_sprod /* test029.py:14 */,
+  output signed [5:0] y_ssat /* test029.py:14 */,
+  output signed [6:0] y_ssum /* test029.py:14 */,
+  output [8:0] y_sum /* test029.py:14 */
+);
+  wire [9:0] __0182b092; // test029.py:56
+  wire [8:0] __03b9236c; // test029.py:58
+  wire [11:0] __03e46da8; // test029.py:52
+  wire [6:0] __0fac0d0e; // test029.py:55
+  wire [6:0] __0fac0d0e_1; // test029.py:67
+  wire [11:0] __1bfd286d; // test029.py:52
+  wire __24d148b8; // test029.py:54
+  wire __27c5b988; // test029.py:71
+  wire [11:0] __2a1532f0; // test029.py:52
+  wire [8:0] __32f8a04e; // test029.py:51
+  wire [8:0] __37cf5710; // test029.py:51
+  wire [8:0] __37cf5710_1; // test029.py:58
+  wire [6:0] __3e441793; // test029.py:55
+  wire [6:0] __3e441793_1; // test029.py:67
+  wire [6:0] __60daa209; // test029.py:67
+  wire [9:0] __660524a2; // test029.py:56
+  wire [6:0] __71cd1fe9; // test029.py:55
+  wire [7:0] __837d19c3; // test029.py:63
+  wire __9994247b; // test029.py:69
+  wire __a5225b51; // test029.py:64
+  wire [8:0] __b15b25be; // test029.py:51
+  wire [8:0] __b15b25be_1; // test029.py:53
+  wire [8:0] __b15b25be_2; // test029.py:58
+  wire [8:0] __cb8104e6; // test029.py:53
+  wire [9:0] __e88a2341; // test029.py:56
+  wire [1:0] __e89adc2d; // test029.py:69
+  wire [1:0] __e89adc2d_1; // test029.py:71
+  wire __f1337da4; // test029.py:60
+  reg __next__y_cmp; // test029.py:14
+  reg [7:0] __next__y_dsat; // test029.py:14
+  reg [8:0] __next__y_inc; // test029.py:14
+  reg [11:0] __next__y_prod; // test029.py:14
+  reg [7:0] __next__y_sat; // test029.py:14
+  reg [9:0] __next__y_sprod; // test029.py:14
+  reg [5:0] __next__y_ssat; // test029.py:14
+  reg [6:0] __next__y_ssum; // test029.py:14
+  reg [8:0] __next__y_sum; // test029.py:14
+  assign __0182b092 = __660524a2 * __e88a2341; // test029.py:56
+  assign __03b9236c = __b15b25be_2 + __37cf5710_1; // test029.py:58
+  assign __03e46da8 = __1bfd286d * __2a1532f0; // test029.py:52
+  assign __0fac0d0e = sb; // test029.py:55
+  assign __0fac0d0e_1 = sb; // test029.py:67
+  assign __1bfd286d = a; // test029.py:52
+  assign __24d148b8 = a == 32'sd200; // test029.py:54
+  assign __27c5b988 = __e89adc2d_1 == 32'sd2; // test029.py:71
+  assign __2a1532f0 = b; // test029.py:52
+  assign __32f8a04e = __b15b25be + __37cf5710; // test029.py:51
+  assign __37cf5710 = b; // test029.py:51
+  assign __37cf5710_1 = b; // test029.py:58
+  assign __3e441793 = sa; // test029.py:55
+  assign __3e441793_1 = sa; // test029.py:67
+  assign __60daa209 = __3e441793_1 + __0fac0d0e_1; // test029.py:67
+  assign __660524a2 = sa; // test029.py:56
+  assign __71cd1fe9 = __3e441793 + __0fac0d0e; // test029.py:55
+  assign __837d19c3 = a - b; // test029.py:63
+  assign __9994247b = __e89adc2d == 32'sd1; // test029.py:69
+  assign __a5225b51 = a < b; // test029.py:64
+  assign __b15b25be = a; // test029.py:51
+  assign __b15b25be_1 = a; // test029.py:53
+  assign __b15b25be_2 = a; // test029.py:58
+  assign __cb8104e6 = __b15b25be_1 + 9'd1; // test029.py:53
+  assign __e88a2341 = sb; // test029.py:56
+  assign __e89adc2d = __60daa209[6:5]; // test029.py:69
+  assign __e89adc2d_1 = __60daa209[6:5]; // test029.py:71
+  assign __f1337da4 = __03b9236c > 32'sd255; // test029.py:60
+  always @* begin
+    __next__y_sum = 9'bx; // test029.py:14
+    __next__y_sum = __32f8a04e; // test029.py:51
+  end
+  always @* begin
+    __next__y_prod = 12'bx; // test029.py:14
+    __next__y_prod = __03e46da8; // test029.py:52
+  end
+  always @* begin
+    __next__y_inc = 9'bx; // test029.py:14
+    __next__y_inc = __cb8104e6; // test029.py:53
+  end
+  always @* begin
+    __next__y_cmp = 1'bx; // test029.py:14
+    __next__y_cmp = __24d148b8; // test029.py:54
+  end
+  always @* begin
+    __next__y_sat = 8'bx; // test029.py:14
+    __next__y_sat = __03b9236c; // test029.py:59
+    if (__f1337da4) begin // test029.py:60
+      __next__y_sat = 32'sd255; // test029.py:61
+    end
+  end
+  always @* begin
+    __next__y_dsat = 8'bx; // test029.py:14
+    __next__y_dsat = __837d19c3; // test029.py:63
+    if (__a5225b51) begin // test029.py:64
+      __next__y_dsat = 32'sd0; // test029.py:65
+    end
+  end
+  always @* begin
+    __next__y_ssum = 7'bx; // test029.py:14
+    __next__y_ssum = __71cd1fe9; // test029.py:55
+  end
+  always @* begin
+    __next__y_sprod = 10'bx; // test029.py:14
+    __next__y_sprod = __0182b092; // test029.py:56
+  end
+  always @* begin
+    __next__y_ssat = 6'bx; // test029.py:14
+    __next__y_ssat = __60daa209; // test029.py:68
+    if (__9994247b) begin // test029.py:69
+      __next__y_ssat = 32'sd31; // test029.py:70
+    end
+    if (__27c5b988) begin // test029.py:71
+      __next__y_ssat = 6'd32; // test029.py:72
+    end
+  end
+  assign y_sum = __next__y_sum; // test029.py:14
+  assign y_prod = __next__y_prod; // test029.py:14
+  assign y_inc = __next__y_inc; // test029.py:14
+  assign y_cmp = __next__y_cmp; // test029.py:14
+  assign y_sat = __next__y_sat; // test029.py:14
+  assign y_dsat = __next__y_dsat; // test029.py:14
+  assign y_ssum = __next__y_ssum; // test029.py:14
+  assign y_sprod = __next__y_sprod; // test029.py:14
+  assign y_ssat = __next__y_ssat; // test029.py:14
+endmodule
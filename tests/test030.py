@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+
+from chipy import *
+
+
+def pixel(addport, role):
+    addport("red", 5)
+    addport("green", 6)
+    addport("blue", 5)
+    addport("flags", pixelflags)
+
+def pixelflags(addport, role):
+    addport("alpha", 1)
+    addport("mark", 2)
+
+
+def widepixel(addport, role):
+    addport("red", 10)
+    addport("green", 12)
+    addport("blue", 10)
+    addport("flags", wideflags)
+
+def wideflags(addport, role):
+    addport("alpha", 2)
+    addport("mark", 4)
+
+
+def make_gold(name):
+    with AddModule(name):
+        sel = AddInput("sel")
+        a = AddPort("a", pixel, "input")
+        b = AddPort("b", pixel, "input")
+        packed = AddInput("packed", 19)
+        y = AddPort("y", pixel, "output", async_=True)
+        wide = AddPort("wide", widepixel, "output", async_=True)
+        flat = AddOutput("flat", 19, async_=True)
+
+        y.next = Cond(sel, a, b)
+        wide.next = Concat([a, b])
+        flat.next = a.unflat(packed).flat() ^ b.flat()
+
+        for n, members in Zip([a, b], recursive=True).items():
+            assert n in ("red", "green", "blue", "flags")
+        assert Zip({"x": a, "y": b})["green"]["y"] is b.green_
+        assert Zip([a, b], recursive=True)["flags"]["mark"] == [a.flags_.mark_, b.flags_.mark_]
+
+
+def make_gate(name):
+    with AddModule(name):
+        sel = AddInput("sel")
+        a = AddPort("a", pixel, "input")
+        b = AddPort("b", pixel, "input")
+        packed = AddInput("packed", 19)
+        y = AddPort("y", pixel, "output", async_=True)
+        wide = AddPort("wide", widepixel, "output", async_=True)
+        flat = AddOutput("flat", 19, async_=True)
+
+        with If(sel):
+            y.red_.next = a.red_
+            y.green_.next = a.green_
+            y.blue_.next = a.blue_
+            y.flags_.alpha_.next = a.flags_.alpha_
+            y.flags_.mark_.next = a.flags_.mark_
+        with Else():
+            y.red_.next = b.red_
+            y.green_.next = b.green_
+            y.blue_.next = b.blue_
+            y.flags_.alpha_.next = b.flags_.alpha_
+            y.flags_.mark_.next = b.flags_.mark_
+
+        wide.red_.next = Concat([a.red_, b.red_])
+        wide.green_.next = Concat([a.green_, b.green_])
+        wide.blue_.next = Concat([a.blue_, b.blue_])
+        wide.flags_.alpha_.next = Concat([a.flags_.alpha_, b.flags_.alpha_])
+        wide.flags_.mark_.next = Concat([a.flags_.mark_, b.flags_.mark_])
+
+        flat.next = packed ^ Concat([b.red_, b.green_, b.blue_, b.flags_.alpha_, b.flags_.mark_])
+
+
+make_gold("gold")
+make_gate("gate_1")
+
+with AddModule("errors"):
+    a = AddPort("a", pixel, "input")
+    c = AddPort("c", pixelflags, "input")
+    assert a.width() == 19 and a.flags_.width() == 3
+    assert a.flags_.mark_ is a.get("flags").get("mark")
+    try:
+        a.nosuchfield_
+        assert False
+    except AttributeError:
+        pass
+    for func in [lambda: Zip([a, c]), lambda: Cond(a.red_, a, c), lambda: Concat([a, c]), lambda: a.unflat(c.flat())]:
+        try:
+            func()
+            assert False
+        except ChipyError:
+            pass
+
+
+with open("test030.v", "w") as f:
+    print("""
+//@ test-sat-equiv-comb gold gate_1
+""", file=f)
+
+    WriteVerilog(f)
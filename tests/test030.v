@@ -0,0 +1,252 @@
+
+//@ test-sat-equiv-comb gold gate_1
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module gold (
+  input [4:0] a__blue /* test030.py:9 */,
+  input a__flags__alpha /* test030.py:13 */,
+  input [1:0] a__flags__mark /* test030.py:14 */,
+  input [5:0] a__green /* test030.py:8 */,
+  input [4:0] a__red /* test030.py:7 */,
+  input [4:0] b__blue /* test030.py:9 */,
+  input b__flags__alpha /* test030.py:13 */,
+  input [1:0] b__flags__mark /* test030.py:14 */,
+  input [5:0] b__green /* test030.py:8 */,
+  input [4:0] b__red /* test030.py:7 */,
+  output [18:0] flat /* test030.py:36 */,
+  input [18:0] packed /* test030.py:33 */,
+  input sel /* test030.py:30 */,
+  output [9:0] wide__blue /* test030.py:20 */,
+  output [1:0] wide__flags__alpha /* test030.py:24 */,
+  output [3:0] wide__flags__mark /* test030.py:25 */,
+  output [11:0] wide__green /* test030.py:19 */,
+  output [9:0] wide__red /* test030.py:18 */,
+  output [4:0] y__blue /* test030.py:9 */,
+  output y__flags__alpha /* test030.py:13 */,
+  output [1:0] y__flags__mark /* test030.py:14 */,
+  output [5:0] y__green /* test030.py:8 */,
+  output [4:0] y__red /* test030.py:7 */
+);
+  wire [4:0] __02bc6866; // test030.py:38
+  wire [4:0] __13345f41; // test030.py:40
+  wire __17416b33; // test030.py:38
+  wire [1:0] __2aea3290; // test030.py:38
+  wire [11:0] __410440fe; // test030.py:39
+  wire [9:0] __788109c6; // test030.py:39
+  wire [1:0] __79afdf0e; // test030.py:39
+  wire [9:0] __816f5366; // test030.py:39
+  wire [5:0] __a2fe5077; // test030.py:40
+  wire [18:0] __b05abee8; // test030.py:40
+  wire [18:0] __b4705f3e; // test030.py:40
+  wire [1:0] __b759f922; // test030.py:40
+  wire [5:0] __b79e0ec9; // test030.py:38
+  wire __c2cfe170; // test030.py:40
+  wire [4:0] __c409ca7e; // test030.py:40
+  wire [4:0] __c98a6331; // test030.py:38
+  wire [18:0] __f004374d; // test030.py:40
+  wire [3:0] __fd007dc2; // test030.py:39
+  reg [18:0] __next__flat; // test030.py:36
+  reg [9:0] __next__wide__blue; // test030.py:20
+  reg [1:0] __next__wide__flags__alpha; // test030.py:24
+  reg [3:0] __next__wide__flags__mark; // test030.py:25
+  reg [11:0] __next__wide__green; // test030.py:19
+  reg [9:0] __next__wide__red; // test030.py:18
+  reg [4:0] __next__y__blue; // test030.py:9
+  reg __next__y__flags__alpha; // test030.py:13
+  reg [1:0] __next__y__flags__mark; // test030.py:14
+  reg [5:0] __next__y__green; // test030.py:8
+  reg [4:0] __next__y__red; // test030.py:7
+  assign __02bc6866 = sel ? a__red : b__red; // test030.py:38
+  assign __13345f41 = packed[7:3]; // test030.py:40
+  assign __17416b33 = sel ? a__flags__alpha : b__flags__alpha; // test030.py:38
+  assign __2aea3290 = sel ? a__flags__mark : b__flags__mark; // test030.py:38
+  assign __410440fe = {a__green,b__green}; // test030.py:39
+  assign __788109c6 = {a__blue,b__blue}; // test030.py:39
+  assign __79afdf0e = {a__flags__alpha,b__flags__alpha}; // test030.py:39
+  assign __816f5366 = {a__red,b__red}; // test030.py:39
+  assign __a2fe5077 = packed[13:8]; // test030.py:40
+  assign __b05abee8 = {b__red,b__green,b__blue,b__flags__alpha,b__flags__mark}; // test030.py:40
+  assign __b4705f3e = {__c409ca7e,__a2fe5077,__13345f41,__c2cfe170,__b759f922}; // test030.py:40
+  assign __b759f922 = packed[1:0]; // test030.py:40
+  assign __b79e0ec9 = sel ? a__green : b__green; // test030.py:38
+  assign __c2cfe170 = packed[2:2]; // test030.py:40
+  assign __c409ca7e = packed[18:14]; // test030.py:40
+  assign __c98a6331 = sel ? a__blue : b__blue; // test030.py:38
+  assign __f004374d = __b4705f3e ^ __b05abee8; // test030.py:40
+  assign __fd007dc2 = {a__flags__mark,b__flags__mark}; // test030.py:39
+  always @* begin
+    __next__y__red = 5'bx; // test030.py:7
+    __next__y__red = __02bc6866; // test030.py:38
+  end
+  always @* begin
+    __next__y__green = 6'bx; // test030.py:8
+    __next__y__green = __b79e0ec9; // test030.py:38
+  end
+  always @* begin
+    __next__y__blue = 5'bx; // test030.py:9
+    __next__y__blue = __c98a6331; // test030.py:38
+  end
+  always @* begin
+    __next__y__flags__alpha = 1'bx; // test030.py:13
+    __next__y__flags__alpha = __17416b33; // test030.py:38
+  end
+  always @* begin
+    __next__y__flags__mark = 2'bx; // test030.py:14
+    __next__y__flags__mark = __2aea3290; // test030.py:38
+  end
+  always @* begin
+    __next__wide__red = 10'bx; // test030.py:18
+    __next__wide__red = __816f5366; // test030.py:39
+  end
+  always @* begin
+    __next__wide__green = 12'bx; // test030.py:19
+    __next__wide__green = __410440fe; // test030.py:39
+  end
+  always @* begin
+    __next__wide__blue = 10'bx; // test030.py:20
+    __next__wide__blue = __788109c6; // test030.py:39
+  end
+  always @* begin
+    __next__wide__flags__alpha = 2'bx; // test030.py:24
+    __next__wide__flags__alpha = __79afdf0e; // test030.py:39
+  end
+  always @* begin
+    __next__wide__flags__mark = 4'bx; // test030.py:25
+    __next__wide__flags__mark = __fd007dc2; // test030.py:39
+  end
+  always @* begin
+    __next__flat = 19'bx; // test030.py:36
+    __next__flat = __f004374d; // test030.py:40
+  end
+  assign y__red = __next__y__red; // test030.py:7
+  assign y__green = __next__y__green; // test030.py:8
+  assign y__blue = __next__y__blue; // test030.py:9
+  assign y__flags__alpha = __next__y__flags__alpha; // test030.py:13
+  assign y__flags__mark = __next__y__flags__mark; // test030.py:14
+  assign wide__red = __next__wide__red; // test030.py:18
+  assign wide__green = __next__wide__green; // test030.py:19
+  assign wide__blue = __next__wide__blue; // test030.py:20
+  assign wide__flags__alpha = __next__wide__flags__alpha; // test030.py:24
+  assign wide__flags__mark = __next__wide__flags__mark; // test030.py:25
+  assign flat = __next__flat; // test030.py:36
+endmodule
+
+module gate_1 (
+  input [4:0] a__blue /* test030.py:9 */,
+  input a__flags__alpha /* test030.py:13 */,
+  input [1:0] a__flags__mark /* test030.py:14 */,
+  input [5:0] a__green /* test030.py:8 */,
+  input [4:0] a__red /* test030.py:7 */,
+  input [4:0] b__blue /* test030.py:9 */,
+  input b__flags__alpha /* test030.py:13 */,
+  input [1:0] b__flags__mark /* test030.py:14 */,
+  input [5:0] b__green /* test030.py:8 */,
+  input [4:0] b__red /* test030.py:7 */,
+  output [18:0] flat /* test030.py:56 */,
+  input [18:0] packed /* test030.py:53 */,
+  input sel /* test030.py:50 */,
+  output [9:0] wide__blue /* test030.py:20 */,
+  output [1:0] wide__flags__alpha /* test030.py:24 */,
+  output [3:0] wide__flags__mark /* test030.py:25 */,
+  output [11:0] wide__green /* test030.py:19 */,
+  output [9:0] wide__red /* test030.py:18 */,
+  output [4:0] y__blue /* test030.py:9 */,
+  output y__flags__alpha /* test030.py:13 */,
+  output [1:0] y__flags__mark /* test030.py:14 */,
+  output [5:0] y__green /* test030.py:8 */,
+  output [4:0] y__red /* test030.py:7 */
+);
+  wire [11:0] __410440fe; // test030.py:72
+  wire [9:0] __788109c6; // test030.py:73
+  wire [1:0] __79afdf0e; // test030.py:74
+  wire [9:0] __816f5366; // test030.py:71
+  wire [18:0] __b05abee8; // test030.py:77
+  wire [18:0] __fb388025; // test030.py:77
+  wire [3:0] __fd007dc2; // test030.py:75
+  reg [18:0] __next__flat; // test030.py:56
+  reg [9:0] __next__wide__blue; // test030.py:20
+  reg [1:0] __next__wide__flags__alpha; // test030.py:24
+  reg [3:0] __next__wide__flags__mark; // test030.py:25
+  reg [11:0] __next__wide__green; // test030.py:19
+  reg [9:0] __next__wide__red; // test030.py:18
+  reg [4:0] __next__y__blue; // test030.py:9
+  reg __next__y__flags__alpha; // test030.py:13
+  reg [1:0] __next__y__flags__mark; // test030.py:14
+  reg [5:0] __next__y__green; // test030.py:8
+  reg [4:0] __next__y__red; // test030.py:7
+  assign __410440fe = {a__green,b__green}; // test030.py:72
+  assign __788109c6 = {a__blue,b__blue}; // test030.py:73
+  assign __79afdf0e = {a__flags__alpha,b__flags__alpha}; // test030.py:74
+  assign __816f5366 = {a__red,b__red}; // test030.py:71
+  assign __b05abee8 = {b__red,b__green,b__blue,b__flags__alpha,b__flags__mark}; // test030.py:77
+  assign __fb388025 = packed ^ __b05abee8; // test030.py:77
+  assign __fd007dc2 = {a__flags__mark,b__flags__mark}; // test030.py:75
+  always @* begin
+    __next__y__red = 5'bx; // test030.py:7
+    __next__y__green = 6'bx; // test030.py:8
+    __next__y__blue = 5'bx; // test030.py:9
+    __next__y__flags__alpha = 1'bx; // test030.py:13
+    __next__y__flags__mark = 2'bx; // test030.py:14
+    if (sel) begin // test030.py:58
+      __next__y__red = a__red; // test030.py:59
+      __next__y__green = a__green; // test030.py:60
+      __next__y__blue = a__blue; // test030.py:61
+      __next__y__flags__alpha = a__flags__alpha; // test030.py:62
+      __next__y__flags__mark = a__flags__mark; // test030.py:63
+    end
+    else begin // test030.py:64
+      __next__y__red = b__red; // test030.py:65
+      __next__y__green = b__green; // test030.py:66
+      __next__y__blue = b__blue; // test030.py:67
+      __next__y__flags__alpha = b__flags__alpha; // test030.py:68
+      __next__y__flags__mark = b__flags__mark; // test030.py:69
+    end
+  end
+  always @* begin
+    __next__wide__red = 10'bx; // test030.py:18
+    __next__wide__red = __816f5366; // test030.py:71
+  end
+  always @* begin
+    __next__wide__green = 12'bx; // test030.py:19
+    __next__wide__green = __410440fe; // test030.py:72
+  end
+  always @* begin
+    __next__wide__blue = 10'bx; // test030.py:20
+    __next__wide__blue = __788109c6; // test030.py:73
+  end
+  always @* begin
+    __next__wide__flags__alpha = 2'bx; // test030.py:24
+    __next__wide__flags__alpha = __79afdf0e; // test030.py:74
+  end
+  always @* begin
+    __next__wide__flags__mark = 4'bx; // test030.py:25
+    __next__wide__flags__mark = __fd007dc2; // test030.py:75
+  end
+  always @* begin
+    __next__flat = 19'bx; // test030.py:56
+    __next__flat = __fb388025; // test030.py:77
+  end
+  assign y__red = __next__y__red; // test030.py:7
+  assign y__green = __next__y__green; // test030.py:8
+  assign y__blue = __next__y__blue; // test030.py:9
+  assign y__flags__alpha = __next__y__flags__alpha; // test030.py:13
+  assign y__flags__mark = __next__y__flags__mark; // test030.py:14
+  assign wide__red = __next__wide__red; // test030.py:18
+  assign wide__green = __next__wide__green; // test030.py:19
+  assign wide__blue = __next__wide__blue; // test030.py:20
+  assign wide__flags__alpha = __next__wide__flags__alpha; // test030.py:24
+  assign wide__flags__mark = __next__wide__flags__mark; // test030.py:25
+  assign flat = __next__flat; // test030.py:56
+endmodule
+
+module errors (
+  input [4:0] a__blue /* test030.py:9 */,
+  input a__flags__alpha /* test030.py:13 */,
+  input [1:0] a__flags__mark /* test030.py:14 */,
+  input [5:0] a__green /* test030.py:8 */,
+  input [4:0] a__red /* test030.py:7 */,
+  input c__alpha /* test030.py:13 */,
+  input [1:0] c__mark /* test030.py:14 */
+);
+endmodule
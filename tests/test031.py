@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+import ast
+import subprocess
+import sys
+
+# `import chipy` and `from chipy import *` must only import the core module, not
+# the optional subsystems (or their dependencies such as asyncio), on Python
+# versions with module __getattr__
+subsystems = ["chipy.analysis", "chipy.transform", "chipy.export", "chipy.aio", "chipy.sim", "chipy.aig", "asyncio"]
+check = """
+import sys
+%s
+print(" ".join(sorted(name for name in sys.modules if name.startswith(("chipy", "asyncio")))))
+"""
+
+def imported(code):
+    out = subprocess.run([sys.executable, "-c", check % code], stdout=subprocess.PIPE,
+            universal_newlines=True, check=True).stdout
+    return out.split()
+
+lazy = sys.version_info >= (3, 7)
+for code in ("import chipy", "from chipy import *", "from chipy.Chipy import *"):
+    assert not lazy or imported(code) == ["chipy", "chipy.Chipy"], code
+modules = imported("from chipy import Simulation")
+assert "chipy.sim" in modules and (not lazy or "chipy.aio" not in modules and "asyncio" not in modules), modules
+
+# without the contextvars module the design state falls back to thread-local storage
+fallback = """
+import sys, threading
+sys.modules["contextvars"] = None
+from chipy.Chipy import *
+AddModule("main")
+thread = threading.Thread(target=lambda: AddModule("other"))
+thread.start()
+thread.join()
+print(" ".join(tls.ChipyModulesDict))
+"""
+out = subprocess.run([sys.executable, "-c", fallback], stdout=subprocess.PIPE, universal_newlines=True, check=True).stdout
+assert out.split() == ["main"], out
+
+import chipy
+
+# the table of lazily imported names must match the public names of each module,
+# except the Chipy* helpers
+for modname, names in chipy._lazy_modules.items():
+    with open("../chipy/%s.py" % modname.split(".")[1]) as f:
+        tree = ast.parse(f.read())
+    public = list()
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            public.append(node.name)
+        elif isinstance(node, ast.Assign):
+            public.extend(target.id for target in node.targets if isinstance(target, ast.Name))
+    assert sorted(names) == sorted(name for name in public if not name.startswith(("_", "Chipy"))), modname
+
+assert not lazy or "chipy.sim" not in sys.modules
+assert chipy.Simulation is sys.modules["chipy.sim"].Simulation
+assert "Simulation" in dir(chipy) and "WriteAIGER" in dir(chipy)
+try:
+    chipy.NoSuchFunction
+    assert False
+except AttributeError:
+    pass
+
+# __all__ is the public API only, without the modules imported by chipy.Chipy and the Chipy* helpers
+assert "AddModule" in chipy.__all__ and "ChipyError" in chipy.__all__ and "CheckEquiv" not in chipy.__all__
+for name in chipy.__all__:
+    assert not isinstance(getattr(chipy, name), type(sys)), name
+    assert not name.startswith("Chipy") or name.endswith(("Error", "Warning")), name
+
+from chipy import *
+
+
+def make_design(name):
+    with AddModule(name):
+        a, b = AddInput("a b", 4)
+        y = AddOutput("y", 4, async_=True)
+        r = AddReg("r", 4, async_=True)
+        r.next = a ^ b
+        y.next = r
+
+
+make_design("gold")
+make_design("gate_1")
+
+with open("test031.v", "w") as f:
+    print("""
+//@ test-sat-equiv-comb gold gate_1
+""", file=f)
+
+    WriteVerilog(f)
@@ -0,0 +1,48 @@
+
+//@ test-sat-equiv-comb gold gate_1
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module gold (
+  input [3:0] a /* test031.py:79 */,
+  input [3:0] b /* test031.py:79 */,
+  output [3:0] y /* test031.py:80 */
+);
+  wire [3:0] __907778d1; // test031.py:82
+  wire [3:0] r; // test031.py:81
+  reg [3:0] __next__r; // test031.py:81
+  reg [3:0] __next__y; // test031.py:80
+  assign __907778d1 = a ^ b; // test031.py:82
+  always @* begin
+    __next__y = 4'bx; // test031.py:80
+    __next__y = r; // test031.py:83
+  end
+  always @* begin
+    __next__r = 4'bx; // test031.py:81
+    __next__r = __907778d1; // test031.py:82
+  end
+  assign y = __next__y; // test031.py:80
+  assign r = __next__r; // test031.py:81
+endmodule
+
+module gate_1 (
+  input [3:0] a /* test031.py:79 */,
+  input [3:0] b /* test031.py:79 */,
+  output [3:0] y /* test031.py:80 */
+);
+  wire [3:0] __907778d1; // test031.py:82
+  wire [3:0] r; // test031.py:81
+  reg [3:0] __next__r; // test031.py:81
+  reg [3:0] __next__y; // test031.py:80
+  assign __907778d1 = a ^ b; // test031.py:82
+  always @* begin
+    __next__y = 4'bx; // test031.py:80
+    __next__y = r; // test031.py:83
+  end
+  always @* begin
+    __next__r = 4'bx; // test031.py:81
+    __next__r = __907778d1; // test031.py:82
+  end
+  assign y = __next__y; // test031.py:80
+  assign r = __next__r; // test031.py:81
+endmodule
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import tempfile
+
+from chipy import *
+from chipy.cli import main
+
+generator = """
+from chipy import *
+
+with AddModule(Param("NAME", "gold")):
+    width = Param("W", 4)
+    a, b = AddInput("a b", width)
+    y = AddOutput("y", width, async_=True)
+    y.next = a + b if Param("OP", "add") == "add" else a ^ b
+"""
+
+# helper modules next to the script are imported again for each job
+romgen = """
+from chipy import *
+import romdata
+
+with AddModule("rom"):
+    addr = AddInput("addr", 2)
+    y = AddOutput("y", 8, async_=True)
+    mem = AddMemory("mem", 8, 4, init=bytes(romdata.DATA))
+    y.next = mem[addr]
+"""
+
+romdata = """
+from chipy import *
+
+DATA = [Param("V", 1)] * 4
+"""
+
+def run(*args):
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        status = main(list(args))
+    return status, out.getvalue().splitlines()
+
+with tempfile.TemporaryDirectory() as tmpdir:
+    script = os.path.join(tmpdir, "gen.py")
+    with open(script, "w") as f:
+        print(generator, file=f)
+    outdir = os.path.join(tmpdir, "out")
+    cache = os.path.join(tmpdir, "cache")
+
+    status, lines = run(script, "-D", "W=4,8", "-D", "OP=add,xor", "-o", outdir, "--cache", cache, "-j", "2")
+    assert status == 0 and len(lines) == 4 and not any(line.endswith("(cached)") for line in lines), lines
+    assert sorted(os.listdir(outdir)) == ["gen_W-4_OP-add.v", "gen_W-4_OP-xor.v", "gen_W-8_OP-add.v", "gen_W-8_OP-xor.v"]
+    with open(os.path.join(outdir, "gen_W-4_OP-add.v")) as f:
+        gold = f.read()
+
+    status, lines = run(script, "-D", "W=4,8", "-D", "OP=add,xor", "-o", outdir, "--cache", cache)
+    assert status == 0 and all(line.endswith("(cached)") for line in lines), lines
+    with open(os.path.join(outdir, "gen_W-4_OP-add.v")) as f:
+        assert f.read() == gold
+
+    status, lines = run(script, "-D", "W=16", "-f", "stats", "-o", outdir, "--no-cache", "-j", "1")
+    with open(os.path.join(outdir, "gen_W-16.stats.json")) as f:
+        stats = json.load(f)
+    assert status == 0 and stats["gold"]["inputs"] == 32 and stats["gold"]["cells"] == {"$add": 1}, stats
+
+    romscript = os.path.join(tmpdir, "rom.py")
+    with open(romscript, "w") as f:
+        print(romgen, file=f)
+    with open(os.path.join(tmpdir, "romdata.py"), "w") as f:
+        print(romdata, file=f)
+    romdir = os.path.join(tmpdir, "rom")
+    for cached, jobs in ((False, "2"), (True, "2"), (True, "1")):
+        shutil.rmtree(romdir, ignore_errors=True)
+        status, lines = run(romscript, "-D", "V=1,2", "-o", romdir, "--cache", cache, "-j", jobs)
+        assert status == 0 and len(lines) == 2 and all(line.endswith("(cached)") == cached for line in lines), lines
+        assert sorted(os.listdir(romdir)) == ["rom_V-1.v", "rom_V-1_rom_mem.hex", "rom_V-2.v", "rom_V-2_rom_mem.hex"]
+        for value in (1, 2):
+            with open(os.path.join(romdir, "rom_V-%d_rom_mem.hex" % value)) as f:
+                assert f.read() == "%02x\n" % value * 4
+            with open(os.path.join(romdir, "rom_V-%d.v" % value)) as f:
+                assert '$readmemh("%s"' % os.path.join(os.path.abspath(romdir), "rom_V-%d_rom_mem.hex" % value) in f.read()
+    assert not os.path.exists("rom_mem.hex")
+
+    # cache entries are not used when a helper module has changed
+    with open(os.path.join(tmpdir, "romdata.py"), "w") as f:
+        print(romdata.replace("[Param", "[0x10 + Param"), file=f)
+    for cached in (False, True):
+        status, lines = run(romscript, "-D", "V=1", "-o", romdir, "--cache", cache, "-j", "1")
+        assert status == 0 and len(lines) == 1 and lines[0].endswith("(cached)") == cached, lines
+        with open(os.path.join(romdir, "rom_V-1_rom_mem.hex")) as f:
+            assert f.read() == "11\n" * 4
+
+    with open(script, "a") as f:
+        print("assert Param('W', 4) != 2", file=f)
+    with contextlib.redirect_stderr(io.StringIO()) as err:
+        status, lines = run(script, "-D", "W=2,3", "-o", outdir, "--cache", cache)
+    assert status == 1 and len(lines) == 1 and "AssertionError" in err.getvalue()
+
+assert Param("W", 4) == 4
+try:
+    Param("W")
+    assert False
+except ChipyError:
+    pass
+
+with AddModule("gate_1"):
+    a, b = AddInput("a b", 4)
+    y = AddOutput("y", 4, async_=True)
+    y.next = b + a
+
+with open("test032.v", "w") as f:
+    print("""
+//@ test-sat-equiv-comb gold gate_1
+""", file=f)
+
+    print(gold, file=f)
+    WriteVerilog(f)
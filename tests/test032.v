@@ -0,0 +1,36 @@
+
+//@ test-sat-equiv-comb gold gate_1
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module gold (
+  input [3:0] a /* gen.py:6 */,
+  input [3:0] b /* gen.py:6 */,
+  output [3:0] y /* gen.py:7 */
+);
+  wire [3:0] __bca3c472; // gen.py:8
+  reg [3:0] __next__y; // gen.py:7
+  assign __bca3c472 = a + b; // gen.py:8
+  always @* begin
+    __next__y = 4'bx; // gen.py:7
+    __next__y = __bca3c472; // gen.py:8
+  end
+  assign y = __next__y; // gen.py:7
+endmodule
+
+// Generated using Chipy (Constructing Hardware In PYthon)
+
+module gate_1 (
+  input [3:0] a /* test032.py:111 */,
+  input [3:0] b /* test032.py:111 */,
+  output [3:0] y /* test032.py:112 */
+);
+  wire [3:0] __ee75f263; // test032.py:113
+  reg [3:0] __next__y; // test032.py:112
+  assign __ee75f263 = b + a; // test032.py:113
+  always @* begin
+    __next__y = 4'bx; // test032.py:112
+    __next__y = __ee75f263; // test032.py:113
+  end
+  assign y = __next__y; // test032.py:112
+endmodule